@@ -0,0 +1,80 @@
+"""
+AST arena benchmark over tests/corpus/valid_tv_pass.
+
+Reports the memory of the parsed trees against the same trees in an
+Arena, the time to collect every FunctionCall name by walking the trees
+and by scanning the arena, and the flatten, serialize and load times.
+
+Usage: python benchmarks/bench_arena.py [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+from pinelint.ast_nodes import FunctionCall
+from pinelint.arena import Arena
+from pinelint.traversal import walk
+
+CORPUS = os.path.join(ROOT, "tests", "corpus", "valid_tv_pass")
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    token_lists = []
+    for path in sorted(glob.glob(os.path.join(CORPUS, "*.pine"))):
+        with open(path, "r") as f:
+            token_lists.append(Lexer(f.read()).tokenize())
+
+    tracemalloc.start()
+    trees = [Parser(tokens).parse() for tokens in token_lists]
+    tree_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    tracemalloc.start()
+    arenas = [Arena.from_tree(tree) for tree in trees]
+    arena_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nodes = sum(len(arena) for arena in arenas)
+    buffers = [arena.to_bytes() for arena in arenas]
+
+    print(f"files: {len(trees)}  nodes: {nodes}")
+    print(f"tree memory:  {tree_memory / 1e6:8.2f} MB  {tree_memory / nodes:6.1f} bytes/node")
+    print(f"arena memory: {arena_memory / 1e6:8.2f} MB  {arena_memory / nodes:6.1f} bytes/node")
+    print(f"serialized:   {sum(map(len, buffers)) / 1e6:8.2f} MB")
+
+    timings = (
+        ("call names (walk)", lambda: [
+            [n.name for n in walk(tree) if n.__class__ is FunctionCall] for tree in trees
+        ]),
+        ("call names (arena)", lambda: [arena.values_of(FunctionCall, "name") for arena in arenas]),
+        ("parse", lambda: [Parser(tokens).parse() for tokens in token_lists]),
+        ("flatten", lambda: [Arena.from_tree(tree) for tree in trees]),
+        ("serialize", lambda: [arena.to_bytes() for arena in arenas]),
+        ("load", lambda: [Arena.from_buffer(buffer).statements() for buffer in buffers]),
+    )
+    for name, fn in timings:
+        print(f"{name:20} {best_of(args.repeat, fn) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
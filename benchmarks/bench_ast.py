@@ -0,0 +1,99 @@
+"""
+AST memory and construction benchmark over tests/corpus/valid_tv_pass.
+
+Parses every script, then reports the memory retained by the resulting
+trees (tracemalloc), the node count and the best-of-N parse time.
+
+--compare REV also measures the parser of git revision REV (checked out
+into a temporary worktree) on the same corpus, printing it first, so a
+change can be compared with its parent with `--compare HEAD~1`.
+
+Usage: python benchmarks/bench_ast.py [--repeat N] [--compare REV]
+"""
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import fields
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# --root is read before the imports below, so a worktree can be measured
+if "--root" in sys.argv:
+    sys.path.insert(0, os.path.abspath(sys.argv[sys.argv.index("--root") + 1]))
+else:
+    sys.path.insert(0, ROOT)
+
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+from pinelint.ast_nodes import ASTNode
+
+CORPUS = os.path.join(ROOT, "tests", "corpus", "valid_tv_pass")
+
+
+def count_nodes(obj) -> int:
+    if isinstance(obj, ASTNode):
+        return 1 + sum(count_nodes(getattr(obj, f.name)) for f in fields(obj))
+    if isinstance(obj, (list, tuple)):
+        return sum(count_nodes(x) for x in obj)
+    return 0
+
+
+def compare(revision: str, repeat: int):
+    """Runs this benchmark against `revision` in a temporary worktree."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = os.path.join(tmp, "tree")
+        git = ["git", "-C", ROOT, "worktree"]
+        subprocess.run(git + ["add", "--detach", tree, revision], check=True, capture_output=True)
+        try:
+            print(f"== {revision}")
+            sys.stdout.flush()
+            subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--repeat", str(repeat), "--root", tree],
+                check=True,
+            )
+        finally:
+            subprocess.run(git + ["remove", "--force", tree], check=True, capture_output=True)
+    print("== working tree")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", metavar="REV", help="also measure git revision REV")
+    parser.add_argument("--root", default=ROOT, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.compare:
+        compare(args.compare, args.repeat)
+
+    sources = []
+    for path in sorted(glob.glob(os.path.join(CORPUS, "*.pine"))):
+        with open(path, "r") as f:
+            sources.append(f.read())
+    token_lists = [Lexer(s).tokenize() for s in sources]
+
+    tracemalloc.start()
+    trees = [Parser(tokens).parse() for tokens in token_lists]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nodes = count_nodes(trees)
+    del trees
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for tokens in token_lists:
+            Parser(tokens).parse()
+        best = min(best, time.perf_counter() - start)
+
+    print(f"files: {len(sources)}  nodes: {nodes}")
+    print(f"AST memory: {retained / 1e6:8.2f} MB  {retained / nodes:6.1f} bytes/node")
+    print(f"parse time: {best * 1e3:8.1f} ms  {nodes / best / 1e3:6.1f} k nodes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Cold start benchmark: import time and a one-file `pinelint check`.
+
+Every measurement runs in a fresh interpreter, the way each CLI invocation
+or worker process starts. Reports the median over N runs of the in-process
+import time of the lint pipeline, the time of the first builtin lookups,
+and the wall time of `pinelint check` on a small script: without the
+cache, answered from a warm cache, and as a client of a running
+`pinelint daemon`.
+
+Usage: python benchmarks/bench_import.py [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = """
+import time
+start = time.perf_counter()
+import pinelint.engine, pinelint.parser, pinelint.rules
+imported = time.perf_counter()
+from pinelint.pine_spec import PINE_FUNCTIONS, PINE_VARIABLES
+PINE_FUNCTIONS.get("ta.sma"), PINE_VARIABLES.get("close")
+looked_up = time.perf_counter()
+print(imported - start, looked_up - imported)
+"""
+
+SCRIPT = """//@version=5
+indicator("Cold start")
+basis = ta.sma(close, 20)
+plot(basis)
+"""
+
+
+def run(args, env):
+    return subprocess.run(
+        args, env=env, cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    # Compile once so every run measures warm .pyc files
+    run([sys.executable, "-c", "import pinelint.cli"], env)
+
+    imports, lookups = [], []
+    for _ in range(args.repeat):
+        imported, looked_up = map(float, run([sys.executable, "-c", IMPORT_PROBE], env).split())
+        imports.append(imported)
+        lookups.append(looked_up)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, "cold.pine")
+        with open(script, "w") as f:
+            f.write(SCRIPT)
+        checks = []
+        command = [sys.executable, "-m", "pinelint.cli", "check", "--no-cache", script]
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            run(command, env)
+            checks.append(time.perf_counter() - start)
+
+        cached = [c for c in command if c != "--no-cache"]
+        cached[-1:-1] = ["--cache-dir", os.path.join(tmp, "cache")]
+        run(cached, env)
+        cache_hits = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            run(cached, env)
+            cache_hits.append(time.perf_counter() - start)
+
+        socket_path = os.path.join(tmp, "bench.sock")
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "pinelint.cli", "daemon", "--socket", socket_path],
+            env=env, cwd=ROOT, stderr=subprocess.PIPE,
+        )
+        daemon.stderr.readline()  # "listening on ..."
+        daemon_checks = []
+        try:
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                run(command + ["--daemon", "--socket", socket_path], env)
+                daemon_checks.append(time.perf_counter() - start)
+        finally:
+            run([sys.executable, "-m", "pinelint.cli", "daemon", "--stop", "--socket", socket_path], env)
+            daemon.wait()
+
+    print(f"import lint pipeline:   {statistics.median(imports) * 1e3:8.1f} ms")
+    print(f"first spec lookups:     {statistics.median(lookups) * 1e3:8.1f} ms")
+    print(f"pinelint check (cold):  {statistics.median(checks) * 1e3:8.1f} ms")
+    print(f"check (cache hit):      {statistics.median(cache_hits) * 1e3:8.1f} ms")
+    print(f"check --daemon (warm):  {statistics.median(daemon_checks) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
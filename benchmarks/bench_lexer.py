@@ -0,0 +1,83 @@
+"""
+Lexer microbenchmark over tests/corpus/Scripts_Merged.txt.
+
+The merged corpus is split on its file markers (as tools/split_corpus.py
+does) and every script is tokenized. Reports the per-call setup cost on a
+tiny input and the raw/full tokenize throughput over the corpus.
+
+Usage: python benchmarks/bench_lexer.py [--repeat N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pinelint.lexer import Lexer, LexerError
+
+CORPUS = os.path.join(ROOT, "tests", "corpus", "Scripts_Merged.txt")
+MARKER = re.compile(r"##-- File Name: .*? \| File No: \d+ \| (?:Started|Ended) --##")
+
+
+def load_scripts():
+    with open(CORPUS, "r", encoding="utf-8") as f:
+        content = f.read()
+    scripts = []
+    for part in MARKER.split(content):
+        code = re.sub(r"/\* --- FILE: .*? --- \*/", "", part).strip()
+        if not code:
+            continue
+        try:
+            Lexer(code).tokenize()
+        except LexerError:
+            continue  # Only benchmark scripts the lexer accepts
+        scripts.append(code)
+    return scripts
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    scripts = load_scripts()
+    lines = sum(s.count("\n") + 1 for s in scripts)
+    tokens = sum(len(Lexer(s)._generate_raw_tokens()) for s in scripts)
+
+    def setup():
+        for _ in range(1000):
+            Lexer("x = 1\n").tokenize()
+
+    def raw():
+        for s in scripts:
+            Lexer(s)._generate_raw_tokens()
+
+    def full():
+        for s in scripts:
+            Lexer(s).tokenize()
+
+    t_setup = best_of(args.repeat, setup)
+    t_raw = best_of(args.repeat, raw)
+    t_full = best_of(args.repeat, full)
+
+    print(f"scripts: {len(scripts)}  lines: {lines}  raw tokens: {tokens}")
+    print(f"tiny tokenize():   {t_setup * 1e3:8.1f} us/call")
+    print(f"raw tokens:        {t_raw * 1e3:8.1f} ms  {tokens / t_raw / 1e6:6.2f} M tokens/s")
+    print(f"full tokenize():   {t_full * 1e3:8.1f} ms  {lines / t_full / 1e3:6.1f} k lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Parser microbenchmark suite.
+
+Every case is lexed once up front, so only Parser.parse is timed. Cases
+cover the corpus and generated inputs that stress single parser paths:
+
+    corpus          tests/corpus/valid_tv_pass
+    calls           call statements with positional and named arguments
+    long_expr       one long binary expression
+    continued_expr  long lines continued on an indented line
+    nested          deeply nested parentheses and calls
+    blocks          if/else blocks
+    unclosed        call statements missing their `)`
+
+Reports the best-of-N time per case and its token throughput, or with
+--json one object per case, for comparing runs between commits.
+
+Usage: python benchmarks/bench_parser.py [--repeat N] [--json] [case ...]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+
+CORPUS = os.path.join(ROOT, "tests", "corpus", "valid_tv_pass")
+
+
+def corpus():
+    sources = []
+    for path in sorted(glob.glob(os.path.join(CORPUS, "*.pine"))):
+        with open(path, "r") as f:
+            sources.append(f.read())
+    return sources
+
+
+def generated(source: str):
+    return lambda: [source]
+
+
+CASES = {
+    "corpus": corpus,
+    "calls": generated("".join(
+        f"plot(ta.sma(close, {i}), title='s{i}', color=color.red, linewidth=2)\n"
+        for i in range(3000)
+    )),
+    "long_expr": generated(
+        "x = " + " + ".join(f"(a{i} * {i} - b[{i % 10}])" for i in range(5000)) + "\n"
+    ),
+    "continued_expr": generated("".join(
+        f"x{i} = " + " + ".join(f"a{j}" for j in range(20)) + " +\n    b\n"
+        for i in range(1000)
+    )),
+    "nested": generated("".join(
+        f"y{i} = " + "f(" * 50 + "(close)" + ")" * 50 + "\n" for i in range(200)
+    )),
+    "blocks": generated("".join(
+        f"if close > {i}\n    a := {i}\nelse\n    a := -{i}\n" for i in range(2000)
+    )),
+    "unclosed": generated("".join(f"plot(f(close, {i})\n" for i in range(2000))),
+}
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("cases", nargs="*", metavar="case", help=f"One of: {', '.join(CASES)}")
+    args = parser.parse_args()
+    for name in args.cases:
+        if name not in CASES:
+            parser.error(f"unknown case {name!r}")
+
+    results = []
+    for name in args.cases or CASES:
+        token_lists = [Lexer(source).tokenize() for source in CASES[name]()]
+        tokens = sum(len(t) for t in token_lists)
+        best = best_of(args.repeat, lambda: [Parser(t).parse() for t in token_lists])
+        results.append({
+            "case": name,
+            "tokens": tokens,
+            "seconds": best,
+            "tokens_per_second": tokens / best,
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(
+            f"{r['case']:16} {r['tokens']:8} tokens {r['seconds'] * 1e3:9.1f} ms "
+            f"{r['tokens_per_second'] / 1e3:8.1f} k tokens/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Tree traversal benchmark over tests/corpus/valid_tv_pass.
+
+Compares a full-tree walk through ASTVisitor double dispatch (accept ->
+visit_*, recursive) with the explicit-stack walk() and Traversal, and
+analyzes a generated `+` chain far deeper than Python's recursion limit.
+
+Usage: python benchmarks/bench_traversal.py [--repeat N] [--chain N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+from pinelint.ast_nodes import ASTVisitor, CallArgument, ParamDef
+from pinelint.semantic import SemanticAnalyzer
+from pinelint.traversal import CHILDREN, Traversal, kind, walk
+
+CORPUS = os.path.join(ROOT, "tests", "corpus", "valid_tv_pass")
+
+
+def _count(self, node) -> int:
+    count = 1
+    for child in CHILDREN[node.__class__](node):
+        # Argument and parameter nodes do not dispatch to their visitor
+        if child.__class__ in (CallArgument, ParamDef):
+            count += _count(self, child)
+        else:
+            count += child.accept(self)
+    return count
+
+
+# Recursive node counter with one visit_* method per node class
+RecursiveCounter = type(
+    "RecursiveCounter", (ASTVisitor,), {f"visit_{kind(c)}": _count for c in CHILDREN}
+)
+
+
+def _leave(self, node, values) -> int:
+    return 1 + sum(values)
+
+
+# The same counter on Traversal hooks
+TraversalCounter = type(
+    "TraversalCounter", (Traversal,), {f"leave_{kind(c)}": _leave for c in CHILDREN}
+)
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--chain", type=int, default=20000)
+    args = parser.parse_args()
+
+    trees = []
+    for path in sorted(glob.glob(os.path.join(CORPUS, "*.pine"))):
+        with open(path, "r") as f:
+            trees.append(Parser(Lexer(f.read()).tokenize()).parse())
+    statements = [stmt for tree in trees for stmt in tree]
+    recursive, traversal = RecursiveCounter(), TraversalCounter()
+
+    nodes = sum(1 for _ in walk(statements))
+    print(f"files: {len(trees)}  nodes: {nodes}")
+    for name, fn in (
+        ("accept recursion", lambda: [stmt.accept(recursive) for stmt in statements]),
+        ("walk()", lambda: sum(1 for _ in walk(statements))),
+        ("Traversal", lambda: [traversal.run(stmt) for stmt in statements]),
+    ):
+        t = best_of(args.repeat, fn)
+        print(f"{name:18} {t * 1e3:8.1f} ms  {nodes / t / 1e3:7.1f} k nodes/s")
+
+    chain = Parser(Lexer("x = " + " + ".join(["close"] * args.chain) + "\n").tokenize()).parse()
+    analyzer = SemanticAnalyzer()
+    start = time.perf_counter()
+    for stmt in chain:
+        stmt.accept(analyzer)
+    print(
+        f"analysis of a {args.chain}-term chain: {(time.perf_counter() - start) * 1e3:.1f} ms, "
+        f"{len(analyzer.errors)} errors (recursion limit {sys.getrecursionlimit()})"
+    )
+
+
+if __name__ == "__main__":
+    main()
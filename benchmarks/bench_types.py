@@ -0,0 +1,66 @@
+"""
+Type rule cache benchmark over tests/corpus/valid_tv_pass.
+
+Analyzes every script and reports the best-of-N analysis time together
+with the hit and miss counters of the memoized TypeSystem rules.
+
+Usage: python benchmarks/bench_types.py [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+from pinelint.semantic import SemanticAnalyzer, TypeSystem
+
+CORPUS = os.path.join(ROOT, "tests", "corpus", "valid_tv_pass")
+
+
+def analyze(statements):
+    analyzer = SemanticAnalyzer()
+    for stmt in statements:
+        stmt.accept(analyzer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    trees = []
+    for path in sorted(glob.glob(os.path.join(CORPUS, "*.pine"))):
+        with open(path, "r") as f:
+            trees.append(Parser(Lexer(f.read()).tokenize()).parse())
+
+    # Counters of a single cold pass over the corpus
+    TypeSystem.cache_clear()
+    for tree in trees:
+        analyze(tree)
+    info = TypeSystem.cache_info()
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for tree in trees:
+            analyze(tree)
+        best = min(best, time.perf_counter() - start)
+
+    print(f"files: {len(trees)}  analysis time: {best * 1e3:8.1f} ms")
+    for name, stats in info.items():
+        lookups = stats.hits + stats.misses
+        rate = stats.hits / lookups if lookups else 0.0
+        print(
+            f"{name:16} hits: {stats.hits:6}  misses: {stats.misses:5}  "
+            f"hit rate: {rate:6.1%}  entries: {stats.currsize}/{stats.maxsize}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,65 @@
-from .pine_spec import *
-from .lexer import Lexer, TokenType, Token, LexerError
-from .ast_nodes import *
-from .parser import Parser, ParseError
-from .semantic import SemanticAnalyzer, SemanticError
+__version__ = "0.1.0"
+
+import importlib
+
+# The public API is re-exported lazily, so importing one submodule (for
+# instance the CLI as a daemon client) does not load the whole analyzer.
+_EXPORTS = {
+    "TypeQualifier": "pine_spec",
+    "Param": "pine_spec",
+    "BuiltinFunction": "pine_spec",
+    "BuiltinVariable": "pine_spec",
+    "SpecTable": "pine_spec",
+    "PINE_TYPES": "pine_spec",
+    "PINE_KEYWORDS": "pine_spec",
+    "PINE_FUNCTIONS": "pine_spec",
+    "PINE_VARIABLES": "pine_spec",
+    "Lexer": "lexer",
+    "TokenType": "lexer",
+    "Token": "lexer",
+    "LexerError": "lexer",
+    "ASTVisitor": "ast_nodes",
+    "ASTNode": "ast_nodes",
+    "Statement": "ast_nodes",
+    "Expression": "ast_nodes",
+    "Literal": "ast_nodes",
+    "Identifier": "ast_nodes",
+    "BinaryOp": "ast_nodes",
+    "UnaryOp": "ast_nodes",
+    "CallArgument": "ast_nodes",
+    "FunctionCall": "ast_nodes",
+    "TernaryOp": "ast_nodes",
+    "ArrayAccess": "ast_nodes",
+    "ArrayLiteral": "ast_nodes",
+    "Block": "ast_nodes",
+    "VersionDecl": "ast_nodes",
+    "ScriptDecl": "ast_nodes",
+    "VarDecl": "ast_nodes",
+    "Assignment": "ast_nodes",
+    "IfStatement": "ast_nodes",
+    "ForStatement": "ast_nodes",
+    "WhileStatement": "ast_nodes",
+    "SwitchStatement": "ast_nodes",
+    "ParamDef": "ast_nodes",
+    "FunctionDef": "ast_nodes",
+    "TypeDef": "ast_nodes",
+    "ImportDecl": "ast_nodes",
+    "ExpressionStatement": "ast_nodes",
+    "Parser": "parser",
+    "ParseError": "parser",
+    "SemanticAnalyzer": "semantic",
+    "SemanticError": "semantic",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
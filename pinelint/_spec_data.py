@@ -0,0 +1,831 @@
+"""
+Compact Pine Script builtin tables.
+Auto-generated from pineDocs.json; read through the mappings in pine_spec.
+"""
+
+FUNCTIONS = {
+    "alert": ('void', 'Creates an alert event when called during the real-time bar, which will trigger a script alert based on "alert function events" if one was previously created for the indicator or strategy through the ', (('message', 'series string', True), ('freq', 'input string', True)), None),
+    "alertcondition": ('void', 'Creates alert condition, that is available in Create Alert dialog. Please note, that [alertcondition](#fun_alertcondition) does NOT create an alert, it just gives you more options in Create Alert dial', (('condition', 'series bool', True), ('title', 'const string', False), ('message', 'const string', False)), None),
+    "array.abs": ('array<int>|array<float>', 'Returns an array containing the absolute value of each element in the original array.', (), None),
+    "array.avg": ('float|int', 'The function returns the mean of an array\\`s elements.', (), None),
+    "array.binary_search": ('int', 'The function returns the index of the value, or -1 if the value is not found. The array to search must be sorted in ascending order.', (('val', 'series int|float', True),), None),
+    "array.binary_search_leftmost": ('int', 'The function returns the index of the value if it is found. When the value is not found, the function returns the index of the next smallest element to the left of where the value would lie if it was ', (('val', 'series int|float', True),), None),
+    "array.binary_search_rightmost": ('int', 'The function returns the index of the value if it is found. When the value is not found, the function returns the index of the element to the right of where the value would lie if it was in the array.', (('val', 'series int|float', True),), None),
+    "array.clear": ('void', 'The function removes all elements from an array.', (), None),
+    "array.concat": ('void', 'The function is used to merge two arrays. It pushes all elements from the second array to the first array, and returns the first array.', (('id2', 'any[]', True),), None),
+    "array.copy": ('array', 'The function creates a copy of an existing array.', (), None),
+    "array.covariance": ('float', 'The function returns the covariance of two arrays.', (('id2', 'array<int|float>', True), ('biased', 'series bool', False)), None),
+    "array.every": ('bool', 'Returns [true](#op_true) if all elements of the `id` array are [true](#op_true), [false](#op_false) otherwise.', (), None),
+    "array.fill": ('void', 'The function sets elements of an array to a single value. If no index is specified, all elements are set. If only a start index (default 0) is supplied, the elements starting at that index are set. If', (('value', 'any', True), ('index_from', 'series int', False), ('index_to', 'series int', False)), None),
+    "array.first": ('void', 'Returns the array\\`s first element. Throws a runtime error if the array is empty.', (), None),
+    "array.from": ('array<bool>|array<int>|color[]|array<float>|string[]|line[]|label[]|table[]|linefill[]|box[]|array', 'The function takes a variable number of arguments with one of the types: int, float, bool, string, label, line, color, box, table, linefill, and returns an array of the corresponding type.', (('arg0, arg1, ...', 'any', True),), None),
+    "array.get": ('void', 'The function returns the value of the element at the specified index.', (('index', 'series int', True),), None),
+    "array.includes": ('bool', 'The function returns true if the value was found in an array, false otherwise.', (('value', 'any', True),), None),
+    "array.indexof": ('int', 'The function returns the index of the first occurrence of the value, or -1 if the value is not found.', (('value', 'any', True),), None),
+    "array.insert": ('void', 'The function changes the contents of an array by adding new elements in place.', (('index', 'series int', True), ('value', 'any', True)), None),
+    "array.join": ('string', 'The function creates and returns a new string by concatenating all the elements of an array, separated by the specified separator string.', (('separator', 'series string', True),), None),
+    "array.last": ('void', 'Returns the array\\`s last element. Throws a runtime error if the array is empty.', (), None),
+    "array.lastindexof": ('int', 'The function returns the index of the last occurrence of the value, or -1 if the value is not found.', (('value', 'any', True),), None),
+    "array.max": ('float|int', 'The function returns the greatest value, or the nth greatest value in a given array.', (('nth', 'series int', True),), None),
+    "array.median": ('float|int', 'The function returns the median of an array\\`s elements.', (), None),
+    "array.min": ('float|int', 'The function returns the smallest value, or the nth smallest value in a given array.', (('nth', 'series int', True),), None),
+    "array.mode": ('float|int', 'The function returns the mode of an array\\`s elements. If there are several values with the same frequency, it returns the smallest value.', (), None),
+    "array.new<bool>": ('array<bool>', 'The function creates a new array object of bool type elements.', (('size', 'series int', False), ('initial_value', 'series bool', False)), None),
+    "array.new<box>": ('array<box>', 'The function creates a new array object of box type elements.', (('size', 'series int', False), ('initial_value', 'series box', False)), None),
+    "array.new<color>": ('array<color>', 'The function creates a new array object of color type elements.', (('size', 'series int', False), ('initial_value', 'series color', False)), None),
+    "array.new<float>": ('array<float>', 'The function creates a new array object of float type elements.', (('size', 'series int', False), ('initial_value', 'series int|float', False)), None),
+    "array.new<int>": ('array<int>', 'The function creates a new array object of int type elements.', (('size', 'series int', False), ('initial_value', 'series int', False)), None),
+    "array.new<label>": ('array<label>', 'The function creates a new array object of label type elements.', (('size', 'series int', False), ('initial_value', 'series label', False)), None),
+    "array.new<line>": ('array<line>', 'The function creates a new array object of line type elements.', (('size', 'series int', False), ('initial_value', 'series line', False)), None),
+    "array.new<linefill>": ('array<linefill>', 'The function creates a new array object of linefill type elements.', (('size', 'series int', True), ('initial_value', 'series linefill', True)), None),
+    "array.new<string>": ('array<string>', 'The function creates a new array object of string type elements.', (('size', 'series int', False), ('initial_value', 'series string', False)), None),
+    "array.new<table>": ('array<table>', 'The function creates a new array object of table type elements.', (('size', 'series int', False), ('initial_value', 'series table', False)), None),
+    "array.new<type>": ('void', 'The function creates a new array object of <type> elements.', (('size', 'series int', False), ('initial_value', '<array_type>', False)), None),
+    "array.new_bool": ('array<bool>', 'The function creates a new array object of bool type elements.', (('size', 'series int', False), ('initial_value', 'series bool', False)), None),
+    "array.new_box": ('array<box>', 'The function creates a new array object of box type elements.', (('size', 'series int', False), ('initial_value', 'series box', False)), None),
+    "array.new_color": ('array<color>', 'The function creates a new array object of color type elements.', (('size', 'series int', False), ('initial_value', 'series color', False)), None),
+    "array.new_float": ('array<float>', 'The function creates a new array object of float type elements.', (('size', 'series int', False), ('initial_value', 'series int|float', False)), None),
+    "array.new_int": ('array<int>', 'The function creates a new array object of int type elements.', (('size', 'series int', False), ('initial_value', 'series int', False)), None),
+    "array.new_label": ('array<label>', 'The function creates a new array object of label type elements.', (('size', 'series int', False), ('initial_value', 'series label', False)), None),
+    "array.new_line": ('array<line>', 'The function creates a new array object of line type elements.', (('size', 'series int', False), ('initial_value', 'series line', False)), None),
+    "array.new_linefill": ('array<linefill>', 'The function creates a new array object of linefill type elements.', (('size', 'series int', True), ('initial_value', 'series linefill', True)), None),
+    "array.new_string": ('array<string>', 'The function creates a new array object of string type elements.', (('size', 'series int', False), ('initial_value', 'series string', False)), None),
+    "array.new_table": ('array<table>', 'The function creates a new array object of table type elements.', (('size', 'series int', False), ('initial_value', 'series table', False)), None),
+    "array.percentile_linear_interpolation": ('float|int', 'Returns the value for which the specified percentage of array values (percentile) are less than or equal to it, using linear interpolation.', (('percentage', 'series int|float', True),), None),
+    "array.percentile_nearest_rank": ('float|int', 'Returns the value for which the specified percentage of array values (percentile) are less than or equal to it, using the nearest-rank method.', (('percentage', 'series int|float', True),), None),
+    "array.percentrank": ('float|int', 'Returns the percentile rank of the element at the specified `index`.', (('index', 'series int', True),), None),
+    "array.pop": ('void', 'The function removes the last element from an array and returns its value.', (), None),
+    "array.push": ('void', 'The function appends a value to an array.', (('value', 'any', True),), None),
+    "array.range": ('float|int', 'The function returns the difference between the min and max values from a given array.', (), None),
+    "array.remove": ('void', 'The function changes the contents of an array by removing the element with the specified index.', (('index', 'series int', True),), None),
+    "array.reverse": ('void', 'The function reverses an array. The first array element becomes the last, and the last array element becomes the first.', (), None),
+    "array.set": ('void', 'The function sets the value of the element at the specified index.', (('index', 'series int', True), ('value', 'any', True)), None),
+    "array.shift": ('void', 'The function removes an array\\`s first element and returns its value.', (), None),
+    "array.size": ('int', 'The function returns the number of elements in an array.', (), None),
+    "array.slice": ('void', 'The function creates a slice from an existing array. If an object from the slice changes, the changes are applied to both the new and the original arrays.', (('index_from', 'series int', True), ('index_to', 'series int', True)), None),
+    "array.some": ('bool', 'Returns [true](#op_true) if at least one element of the `id` array is [true](#op_true), [false](#op_false) otherwise.', (), None),
+    "array.sort": ('void', 'The function sorts the elements of an array.', (('order', 'simple sort_order', False),), None),
+    "array.sort_indices": ('array<int>', 'Returns an array of indices which, when used to index the original array, will access its elements in their sorted order. It does not modify the original array.', (('order', 'series sort_order', False),), None),
+    "array.standardize": ('array<int>|array<float>', 'The function returns the array of standardized elements.', (), None),
+    "array.stdev": ('float|int', 'The function returns the standard deviation of an array\\`s elements.', (('biased', 'series bool', False),), None),
+    "array.sum": ('float|int', 'The function returns the sum of an array\\`s elements.', (), None),
+    "array.unshift": ('void', 'The function inserts the value at the beginning of the array.', (('value', 'any', True),), None),
+    "array.variance": ('float|int', 'The function returns the variance of an array\\`s elements.', (('biased', 'series bool', False),), None),
+    "barcolor": ('void', 'Set color of bars.', (('color', 'series color', True), ('offset', 'series int', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('title', 'const string', False), ('display', 'input plot_simple_display', False)), None),
+    "bgcolor": ('void', 'Fill background of bars with specified color.', (('color', 'series color', True), ('offset', 'series int', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('title', 'const string', False), ('display', 'input plot_simple_display', False)), None),
+    "bool": ('bool', 'Casts na to bool.', (('x', 'series color', True),), None),
+    "box": ('box', 'Casts na to box.', (('x', 'series box', True),), None),
+    "box.copy": ('box', 'Clones the box object.', (), None),
+    "box.delete": ('void', 'Deletes the specified box object. If it has already been deleted, does nothing.', (), None),
+    "box.get_bottom": ('float', 'Returns the price value of the bottom border of the box.', (), None),
+    "box.get_left": ('int', "Returns the bar index or the UNIX time (depending on the last value used for 'xloc') of the left border of the box.", (), None),
+    "box.get_right": ('int', "Returns the bar index or the UNIX time (depending on the last value used for 'xloc') of the right border of the box.", (), None),
+    "box.get_top": ('float', 'Returns the price value of the top border of the box.', (), None),
+    "box.new": ('box', 'Creates a new box object.', (('left', 'series int', True), ('top', 'series int|float', True), ('right', 'series int', True), ('bottom', 'series int|float', True), ('border_color', 'series color', False), ('border_width', 'series int', False), ('border_style', 'series string', False), ('extend', 'series string', False), ('xloc', 'series string', False), ('bgcolor', 'series color', False), ('text', 'series string', False), ('text_size', 'series string', False), ('text_font_family', 'series string', False), ('text_color', 'series color', False), ('text_halign', 'series string', False), ('text_valign', 'series string', False), ('text_wrap', 'series string', False), ('top_left', 'chart.point', True), ('bottom_right', 'chart.point', True)), None),
+    "box.set_bgcolor": ('void', 'Sets the background color of the box.', (('color', 'series color', True),), None),
+    "box.set_border_color": ('void', 'Sets the border color of the box.', (('color', 'series color', True),), None),
+    "box.set_border_style": ('void', 'Sets the border style of the box.', (('style', 'series string', True),), None),
+    "box.set_border_width": ('void', 'Sets the border width of the box.', (('width', 'series int', True),), None),
+    "box.set_bottom": ('void', 'Sets the bottom coordinate of the box.', (('bottom', 'series int|float', True),), None),
+    "box.set_bottom_right_point": ('void', 'Sets the bottom-right corner location of the `id` box to `point`.', (('point', 'chart.point', True),), None),
+    "box.set_extend": ('void', 'Sets extending type of the border of this box object. When [extend.none](#var_extend.none) is used, the horizontal borders start at the left border and end at the right border.  ', (('extend', 'series string', True),), None),
+    "box.set_left": ('void', 'Sets the left coordinate of the box.', (('left', 'series int', True),), None),
+    "box.set_lefttop": ('void', 'Sets the left and top coordinates of the box.', (('left', 'series int', True), ('top', 'series int|float', True)), None),
+    "box.set_right": ('void', 'Sets the right coordinate of the box.', (('right', 'series int', True),), None),
+    "box.set_rightbottom": ('void', 'Sets the right and bottom coordinates of the box.', (('right', 'series int', True), ('bottom', 'series int|float', True)), None),
+    "box.set_text": ('void', 'The function sets the text in the box.', (('text', 'series string', True),), None),
+    "box.set_text_color": ('void', 'The function sets the color of the text inside the box.', (('text_color', 'series color', True),), None),
+    "box.set_text_font_family": ('void', 'The function sets the font family of the text inside the box.', (('text_font_family', 'series string', True),), None),
+    "box.set_text_formatting": ('void', 'Sets text formatting.', (('id', 'box', True), ('formatting', 'string', True)), '6'),
+    "box.set_text_halign": ('void', 'The function sets the horizontal alignment of the box\\`s text.', (('text_halign', 'series string', True),), None),
+    "box.set_text_size": ('void', 'The function sets the size of the box\\`s text.', (('text_size', 'series string', True),), None),
+    "box.set_text_valign": ('void', 'The function sets the vertical alignment of a box\\`s text.', (('text_valign', 'series string', True),), None),
+    "box.set_text_wrap": ('void', 'The function sets the mode of wrapping of the text inside the box.', (('text_wrap', 'series string', True),), None),
+    "box.set_top": ('void', 'Sets the top coordinate of the box.', (('top', 'series int|float', True),), None),
+    "box.set_top_left_point": ('void', 'Sets the top-left corner location of the `id` box to `point`.', (('point', 'chart.point', True),), None),
+    "chart.point.copy": ('chart.point', 'Creates a copy of a [chart.point](#op_chart.point) object with the specified `id`.', (), None),
+    "chart.point.from_index": ('chart.point', 'Returns a [chart.point](#op_chart.point) object with `index` as its x-coordinate and `price` as its y-coordinate.', (('index', 'series int', True), ('price', 'series int|float', True)), None),
+    "chart.point.from_time": ('chart.point', 'Returns a [chart.point](#op_chart.point) object with `time` as its x-coordinate and `price` as its y-coordinate.', (('time', 'series int', True), ('price', 'series int|float', True)), None),
+    "chart.point.new": ('void', 'Creates a new [chart.point](#op_chart.point) object with the specified `time`, `index`, and `price`.', (('time', 'series int', True), ('index', 'series int', True), ('price', 'series int/float', True)), None),
+    "chart.point.now": ('chart.point', 'Returns a [chart.point](#op_chart.point) object with `price` as the y-coordinate', (('price', 'series int|float', False),), None),
+    "color": ('color', 'Casts na to color', (('x', 'series color', True),), None),
+    "color.b": ('float', 'Retrieves the value of the color\\`s blue component.', (('color', 'series color', True),), None),
+    "color.from_gradient": ('color', 'Based on the relative position of value in the bottom_value to top_value range, the function returns a color from the gradient defined by bottom_color to top_color.', (('value', 'series int|float', True), ('bottom_value', 'series int|float', True), ('top_value', 'series int|float', True), ('bottom_color', 'series color', True), ('top_color', 'series color', True)), None),
+    "color.g": ('float', 'Retrieves the value of the color\\`s green component.', (('color', 'series color', True),), None),
+    "color.new": ('color', 'Function color applies the specified transparency to the given color.', (('color', 'series color', True), ('transp', 'series int|float', True)), None),
+    "color.r": ('float', 'Retrieves the value of the color\\`s red component.', (('color', 'series color', True),), None),
+    "color.rgb": ('color', 'Creates a new color with transparency using the RGB color model.', (('red', 'series int|float', True), ('green', 'series int|float', True), ('blue', 'series int|float', True), ('transp', 'series int|float', False)), None),
+    "color.t": ('float', 'Retrieves the color\\`s transparency.', (('color', 'series color', True),), None),
+    "dayofmonth": ('int', '', (('time', 'series int', True), ('timezone', 'series string', True)), None),
+    "dayofweek": ('int', '', (('time', 'series int', True), ('timezone', 'series string', True)), None),
+    "fill": ('void', 'Fills background between two plots or hlines with a given color.', (('hline1', 'hline', True), ('hline2', 'hline', True), ('plot1', 'plot', True), ('plot2', 'plot', True), ('color', 'series color', False), ('title', 'const string', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('fillgaps', 'const bool', False), ('display', 'input plot_simple_display', False), ('top_value', 'series int|float', True), ('bottom_value', 'series int|float', True), ('top_color', 'series color', True), ('bottom_color', 'series color', True)), None),
+    "fixnan": ('float|color|int|bool', 'For a given series replaces NaN values with previous nearest non-NaN value.', (('source', 'series int|float|bool|color', True),), None),
+    "float": ('float', 'Casts na to float', (('x', 'series float', True),), None),
+    "hline": ('hline', 'Renders a horizontal line at a given fixed price level.', (('price', 'input int|float', True), ('title', 'const string', True), ('color', 'input color', False), ('linestyle', 'input hline_style', False), ('linewidth', 'input int', False), ('editable', 'const bool', False), ('display', 'input plot_simple_display', False)), None),
+    "hour": ('int', '', (('time', 'series int', True), ('timezone', 'series string', True)), None),
+    "indicator": ('void', 'This declaration statement designates the script as an indicator and sets a number of indicator-related properties.', (('title', 'const string', True), ('shorttitle', 'const string', False), ('overlay', 'const bool', False), ('format', 'const string', False), ('precision', 'const int', False), ('scale', 'const scale_type', False), ('max_bars_back', 'const int', False), ('timeframe', 'const string', False), ('timeframe_gaps', 'const bool', False), ('explicit_plot_zorder', 'const bool', False), ('max_lines_count', 'const int', False), ('max_labels_count', 'const int', False), ('max_boxes_count', 'const int', False), ('max_polylines_count', 'const int', False)), None),
+    "input": ('string|int|bool|float|color', "Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function automatically detects the type of the argument used for 'de", (('defval', 'const int|float|bool|string|color|<open|high|low|close|hl2|hlc3|ohlc4|hlcc4>', True), ('title', 'const string', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('display', 'const plot_display', False)), None),
+    "input.bool": ('bool', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds a checkmark to the script\\`s inputs.', (('defval', 'const bool', True), ('title', 'const string', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.color": ('color', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds a color picker that allows the user to select a color ', (('defval', 'const color', True), ('title', 'const string', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.enum": ('any', 'Enum input.', (('defval', 'any', True), ('options', 'any', True)), '6'),
+    "input.float": ('float', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds a field for a float input to the script\\`s inputs.', (('defval', 'const int|float', True), ('title', 'const string', False), ('minval', 'const int|float', False), ('maxval', 'const int|float', False), ('step', 'const int|float', False), ('options', 'const int|float [val1, val2, ...]', True), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.int": ('int', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds a field for an integer input to the script\\`s inputs.', (('defval', 'const int', True), ('title', 'const string', False), ('minval', 'const int', False), ('maxval', 'const int', False), ('step', 'const int', False), ('options', 'const int [val1, val2, ...]', True), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.price": ('float', 'Adds a price input to the script\\`s "Settings/Inputs" tab. Using `confirm = true` activates the interactive input mode where a price is selected by clicking on the chart.', (('defval', 'const int|float', True), ('title', 'const string', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.session": ('string', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds two dropdowns that allow the user to specify the begin', (('defval', 'const string', True), ('title', 'const string', False), ('options', 'const string [val1, val2, ...]', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.source": ('float', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users.  ', (('defval', '<open|high|low|close|hl2|hlc3|ohlc4|hlcc4>', True), ('title', 'const string', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('display', 'const plot_display', False)), None),
+    "input.string": ('string', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds a field for a string input to the script\\`s inputs.', (('defval', 'const string', True), ('title', 'const string', False), ('options', 'const string [val1, val2, ...]', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.symbol": ('string', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds a field that allows the user to select a specific symb', (('defval', 'const string', True), ('title', 'const string', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.text_area": ('string', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds a field for a multiline text input.', (('defval', 'const string', True), ('title', 'const string', False), ('tooltip', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.time": ('int', 'Adds a time input to the script\\`s "Settings/Inputs" tab. This function adds two input widgets on the same line: one for the date and one for the time.  ', (('defval', 'const int', True), ('title', 'const string', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "input.timeframe": ('string', 'Adds an input to the Inputs tab of your script\\`s Settings, which allows you to provide configuration options to script users. This function adds a dropdown that allows the user to select a specific t', (('defval', 'const string', True), ('title', 'const string', False), ('options', 'const string [val1, val2, ...]', False), ('tooltip', 'const string', False), ('inline', 'const string', False), ('group', 'const string', False), ('confirm', 'const bool', False), ('display', 'const plot_display', False)), None),
+    "int": ('int', 'Casts na or truncates float value to int.', (('x', 'series int', True),), None),
+    "label": ('label', 'Casts na to label.', (('x', 'series label', True),), None),
+    "label.copy": ('label', 'Clones the label object.', (), None),
+    "label.delete": ('void', 'Deletes the specified label object. If it has already been deleted, does nothing.', (), None),
+    "label.get_text": ('string', 'Returns the text of this label object.', (), None),
+    "label.get_x": ('int', 'Returns UNIX time or bar index (depending on the last xloc value set) of this label\\`s position.', (), None),
+    "label.get_y": ('float', 'Returns price of this label\\`s position.', (), None),
+    "label.new": ('label', 'Creates new label object.', (('x', 'series int', True), ('y', 'series int|float', True), ('text', 'series string', False), ('xloc', 'series string', False), ('yloc', 'series string', False), ('color', 'series color', False), ('style', 'series string', False), ('textcolor', 'series color', False), ('size', 'series string', False), ('textalign', 'series string', False), ('tooltip', 'series string', False), ('text_font_family', 'series string', False), ('point', 'chart.point', True)), None),
+    "label.set_color": ('void', 'Sets label bgcolor', (('color', 'series color', True),), None),
+    "label.set_point": ('void', 'Sets the location of the `id` label to `point`.', (('point', 'chart.point', True),), None),
+    "label.set_size": ('void', 'Sets arrow and text size of the specified label object.', (('size', 'series string', True),), None),
+    "label.set_style": ('void', 'Sets label style.', (('style', 'series string', True),), None),
+    "label.set_text": ('void', 'Sets label text', (('text', 'series string', True),), None),
+    "label.set_text_font_family": ('void', 'The function sets the font family of the text inside the label.', (('text_font_family', 'series string', True),), None),
+    "label.set_text_formatting": ('void', 'Sets text formatting.', (('id', 'label', True), ('formatting', 'string', True)), '6'),
+    "label.set_textalign": ('void', 'Sets the alignment for the label text.', (('textalign', 'series string', True),), None),
+    "label.set_textcolor": ('void', 'Sets color of the label text.', (('textcolor', 'series color', True),), None),
+    "label.set_tooltip": ('void', 'Sets the tooltip text.', (('tooltip', 'series string', True),), None),
+    "label.set_x": ('void', 'Sets bar index or bar time (depending on the xloc) of the label position.', (('x', 'series int', True),), None),
+    "label.set_xloc": ('void', 'Sets x-location and new bar index/time value.', (('x', 'series int', True), ('xloc', 'series string', True)), None),
+    "label.set_xy": ('void', 'Sets bar index/time and price of the label position.', (('x', 'series int', True), ('y', 'series int|float', True)), None),
+    "label.set_y": ('void', 'Sets price of the label position', (('y', 'series int|float', True),), None),
+    "label.set_yloc": ('void', 'Sets new y-location calculation algorithm.', (('yloc', 'series string', True),), None),
+    "library": ('void', 'Declaration statement identifying a script as a [library](https://www.tradingview.com/pine-script-docs/en/v5/concepts/Libraries.html).', (('title', 'const string', True), ('overlay', 'const bool', False)), None),
+    "line": ('line', 'Casts na to line.', (('x', 'series line', True),), None),
+    "line.copy": ('line', 'Clones the line object.', (), None),
+    "line.delete": ('void', 'Deletes the specified line object. If it has already been deleted, does nothing.', (), None),
+    "line.get_price": ('float', 'Returns the price level of a line at a given bar index.', (('x', 'series int', True),), None),
+    "line.get_x1": ('int', 'Returns UNIX time or bar index (depending on the last xloc value set) of the first point of the line.', (), None),
+    "line.get_x2": ('int', 'Returns UNIX time or bar index (depending on the last xloc value set) of the second point of the line.', (), None),
+    "line.get_y1": ('float', 'Returns price of the first point of the line.', (), None),
+    "line.get_y2": ('float', 'Returns price of the second point of the line.', (), None),
+    "line.new": ('line', 'Creates new line object.', (('x1', 'series int', True), ('y1', 'series int|float', True), ('x2', 'series int', True), ('y2', 'series int|float', True), ('xloc', 'series string', False), ('extend', 'series string', False), ('color', 'series color', False), ('width', 'series int', False), ('style', 'series string', False), ('first_point', 'chart.point', True), ('second_point', 'chart.point', True)), None),
+    "line.set_color": ('void', 'Sets the line color', (('color', 'series color', True),), None),
+    "line.set_extend": ('void', 'Sets extending type of this line object. If extend=[extend.none](#var_extend.none), draws segment starting at point (x1, y1) and ending at point (x2, y2).  ', (('extend', 'series string', True),), None),
+    "line.set_first_point": ('void', 'Sets the first point of the `id` line to `point`.', (('point', 'chart.point', True),), None),
+    "line.set_second_point": ('void', 'Sets the second point of the `id` line to `point`.', (('point', 'chart.point', True),), None),
+    "line.set_style": ('void', 'Sets the line style', (('style', 'series string', True),), None),
+    "line.set_width": ('void', 'Sets the line width.', (('width', 'series int', True),), None),
+    "line.set_x1": ('void', 'Sets bar index or bar time (depending on the xloc) of the first point.', (('x', 'series int', True),), None),
+    "line.set_x2": ('void', 'Sets bar index or bar time (depending on the xloc) of the second point.', (('x', 'series int', True),), None),
+    "line.set_xloc": ('void', 'Sets x-location and new bar index/time values.', (('x1', 'series int', True), ('x2', 'series int', True), ('xloc', 'series string', True)), None),
+    "line.set_xy1": ('void', 'Sets bar index/time and price of the first point.', (('x', 'series int', True), ('y', 'series int|float', True)), None),
+    "line.set_xy2": ('void', 'Sets bar index/time and price of the second point', (('x', 'series int', True), ('y', 'series int|float', True)), None),
+    "line.set_y1": ('void', 'Sets price of the first point', (('y', 'series int|float', True),), None),
+    "line.set_y2": ('void', 'Sets price of the second point.', (('y', 'series int|float', True),), None),
+    "linefill": ('linefill', 'Casts na to linefill.', (('x', 'series linefill', True),), None),
+    "linefill.delete": ('void', 'Deletes the specified linefill object. If it has already been deleted, does nothing.', (), None),
+    "linefill.get_line1": ('line', 'Returns the ID of the first line used in the `id` linefill.', (), None),
+    "linefill.get_line2": ('line', 'Returns the ID of the second line used in the `id` linefill.', (), None),
+    "linefill.new": ('linefill', 'Creates a new linefill object and displays it on the chart, filling the space between `line1` and `line2` with the color specified in `color`.', (('line1', 'series line', True), ('line2', 'series line', True), ('color', 'series color', True)), None),
+    "linefill.set_color": ('void', 'The function sets the color of the linefill object passed to it.', (('color', 'series color', True),), None),
+    "log.error": ('void', 'Converts the formatting string and value(s) into a formatted string, and sends the result to the "Pine Logs" menu tagged with the "error" debug level. The formatting string can contain literal text an', (('formatString', 'series string', True), ('message', 'series string', True), ('arg0, arg1, ...', 'series int|float|bool|string|array<int|float|bool|string>|na', True)), None),
+    "log.info": ('void', 'Converts the formatting string and value(s) into a formatted string, and sends the result to the "Pine Logs" menu tagged with the "info" debug level. The formatting string can contain literal text and', (('formatString', 'series string', True), ('message', 'series string', True), ('arg0, arg1, ...', 'series int|float|bool|string|array<int|float|bool|string>|na', True)), None),
+    "log.warning": ('void', 'Converts the formatting string and value(s) into a formatted string, and sends the result to the "Pine Logs" menu tagged with the "warning" debug level. The formatting string can contain literal text ', (('formatString', 'series string', True), ('message', 'series string', True), ('arg0, arg1, ...', 'series int|float|bool|string|array<int|float|bool|string>|na', True)), None),
+    "map.clear": ('void', 'Clears the map, removing all key-value pairs from it.', (), None),
+    "map.contains": ('bool', 'Returns [true](#op_true) if the `key` was found in the `id` map, [false](#op_false) otherwise.', (('key', 'map<type>', True),), None),
+    "map.copy": ('map', 'Creates a copy of an existing map.', (), None),
+    "map.get": ('', 'Returns the value associated with the specified `key` in the `id` map.', (('key', 'map< *keyType* ,valueType>', True),), None),
+    "map.keys": ('array', 'Returns an array of all the keys in the `id` map. The resulting array is a copy and any changes to it are not reflected in the original map.', (), None),
+    "map.new<type,type>": ('map<keyType, valueType>', 'Creates a new map object: a collection that consists of key-value pairs, where all keys are of the `keyType`, and all values are of the `valueType`.', (), None),
+    "map.put": ('', 'Puts a new key-value pair into the `id` map.', (('key', 'map<type>', True), ('value', 'map<type>', True)), None),
+    "map.put_all": ('void', 'Puts all key-value pairs from the `id2` map into the `id` map.', (('id2', 'map<type>', True),), None),
+    "map.remove": ('', 'Removes a key-value pair from the `id` map.', (('key', 'map<type>', True),), None),
+    "map.size": ('int', 'Returns the number of key-value pairs in the `id` map.', (), None),
+    "map.values": ('array', 'Returns an array of all the values in the `id` map. The resulting array is a copy and any changes to it are not reflected in the original map.', (), None),
+    "math.abs": ('float|int', 'Absolute value of `number` is `number` if `number` >= 0, or if `number` is < 0 `number` is `(-2 * number)`', (('number', 'series int|float', True),), None),
+    "math.acos": ('float', 'The acos function returns the arccosine (in radians) of number such that cos(acos(y)) = y for y in range [-1, 1].', (('angle', 'series int|float', True),), None),
+    "math.asin": ('float', 'The asin function returns the arcsine (in radians) of number such that sin(asin(y)) = y for y in range [-1, 1].', (('angle', 'series int|float', True),), None),
+    "math.atan": ('float', 'The atan function returns the arctangent (in radians) of number such that tan(atan(y)) = y for any y.', (('angle', 'series int|float', True),), None),
+    "math.avg": ('float', 'Calculates average of all given series (elementwise).', (), None),
+    "math.ceil": ('int', 'The ceil function returns the smallest (closest to negative infinity) integer that is greater than or equal to the argument.', (('number', 'series int|float', True),), None),
+    "math.cos": ('float', 'The cos function returns the trigonometric cosine of an angle.', (('angle', 'series int|float', True),), None),
+    "math.exp": ('float', 'The exp function of `number` is e raised to the power of `number`, where e is Euler\\`s number.', (('number', 'series int|float', True),), None),
+    "math.floor": ('int', 'The floor function returns the largest (closest to positive infinity) integer that is less than or equal to the argument.', (('number', 'series int|float', True),), None),
+    "math.log": ('float', 'Natural logarithm of any `number` > 0 is the unique y such that e^y = `number`.', (('number', 'series int|float', True),), None),
+    "math.log10": ('float', 'The common (or base 10) logarithm of `number` is the power to which 10 must be raised to obtain the `number`.  ', (('number', 'series int|float', True),), None),
+    "math.max": ('float|int', 'Returns the greatest of multiple values.', (('arg0, arg1, ...', 'series int|float', True),), None),
+    "math.min": ('float|int', 'Returns the smallest of multiple values.', (('arg0, arg1, ...', 'series int|float', True),), None),
+    "math.pow": ('float', 'Mathematical power function.', (('base', 'series int|float', True), ('exponent', 'series int|float', True)), None),
+    "math.random": ('float', 'Returns a pseudo-random value. The function will generate a different sequence of values for each script execution. Using the same value for the optional seed argument will produce a repeatable sequen', (('min', 'series int|float', False), ('max', 'series int|float', False), ('seed', 'series int', False)), None),
+    "math.round": ('float|int', 'Returns the value of `number` rounded to the nearest integer, with ties rounding up.  ', (('number', 'series int|float', True), ('precision', 'series int', False)), None),
+    "math.round_to_mintick": ('float', 'Returns the value rounded to the symbol\\`s mintick, i.e. the nearest value that can be divided by [syminfo.mintick](#var_syminfo.mintick), without the remainder, with ties rounding up.', (('number', 'series int|float', True),), None),
+    "math.sign": ('float', 'Sign (signum) of `number` is zero if `number` is zero, 1.0 if `number` is greater than zero, -1.0 if `number` is less than zero.', (('number', 'series int|float', True),), None),
+    "math.sin": ('float', 'The sin function returns the trigonometric sine of an angle.', (('angle', 'series int|float', True),), None),
+    "math.sqrt": ('float', 'Square root of any `number` >= 0 is the unique y >= 0 such that y^2 = `number`.', (('number', 'series int|float', True),), None),
+    "math.sum": ('float', 'The sum function returns the sliding sum of last y values of x.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "math.tan": ('float', 'The tan function returns the trigonometric tangent of an angle.', (('angle', 'series int|float', True),), None),
+    "math.todegrees": ('float', 'Returns an approximately equivalent angle in degrees from an angle measured in radians.', (('radians', 'series int|float', True),), None),
+    "math.toradians": ('float', 'Returns an approximately equivalent angle in radians from an angle measured in degrees.', (('degrees', 'series int|float', True),), None),
+    "matrix.add_col": ('void', 'The function adds a column at the `column` index of the `id` matrix. The column can consist of `na` values, or an array can be used to provide values.', (('column', 'series int', False), ('array_id', 'any[]', True)), None),
+    "matrix.add_row": ('void', 'The function adds a row at the `row` index of the `id` matrix. The row can consist of `na` values, or an array can be used to provide values.', (('row', 'series int', False), ('array_id', 'any[]', True)), None),
+    "matrix.avg": ('float|int', 'The function calculates the average of all elements in the matrix.', (), None),
+    "matrix.col": ('array', 'The function creates a one-dimensional array from the elements of a matrix column.', (('column', 'series int', True),), None),
+    "matrix.columns": ('int', 'The function returns the number of columns in the matrix.', (), None),
+    "matrix.concat": ('matrix', 'The function appends the `m2` matrix to the `m1` matrix.', (('id2', 'matrix<any>', True),), None),
+    "matrix.copy": ('matrix', 'The function creates a new matrix which is a copy of the original.', (), None),
+    "matrix.det": ('float|int', 'The function returns the [determinant](https://en.wikipedia.org/wiki/Determinant) of a square matrix.', (), None),
+    "matrix.diff": ('matrix<float>|matrix<int>', 'The function returns a new matrix resulting from the subtraction between matrices `id1` and `id2`, or of matrix `id1` and an `id2` scalar (a numerical value).', (('id2', 'series int|float|matrix<int|float>', True),), None),
+    "matrix.eigenvalues": ('array<int>|array<float>', 'The function returns an array containing the [eigenvalues](https://en.wikipedia.org/wiki/Eigenvalues_and_eigenvectors) of a square matrix.', (), None),
+    "matrix.eigenvectors": ('matrix<float>|matrix<int>', 'Returns a matrix of [eigenvectors](https://en.wikipedia.org/wiki/Eigenvalues_and_eigenvectors), in which each column is an eigenvector of the `id` matrix.', (), None),
+    "matrix.elements_count": ('int', 'The function returns the total number of all matrix elements.', (), None),
+    "matrix.fill": ('void', 'The function fills a rectangular area of the `id` matrix defined by the indices `from_column` to `to_column` (not including it) and `from_row` to `to_row`(not including it) with the `value`.', (('value', 'any', True), ('from_row', 'series int', False), ('to_row', 'series int', False), ('from_column', 'series int', False), ('to_column', 'series int', False)), None),
+    "matrix.get": ('', 'The function returns the element with the specified index of the matrix.', (('row', 'series int', True), ('column', 'series int', True)), None),
+    "matrix.inv": ('matrix<float>|matrix<int>', 'The function returns the [inverse](https://en.wikipedia.org/wiki/Invertible_matrix) of a square matrix.', (), None),
+    "matrix.is_antidiagonal": ('bool', 'The function determines if the matrix is [anti-diagonal](https://en.wikipedia.org/wiki/Anti-diagonal_matrix) (all elements outside the secondary diagonal are zero).', (), None),
+    "matrix.is_antisymmetric": ('bool', 'The function determines if a matrix is [antisymmetric](https://en.wikipedia.org/wiki/Skew-symmetric_matrix) (its [transpose](https://en.wikipedia.org/wiki/Transpose) equals its negative).', (), None),
+    "matrix.is_binary": ('bool', 'The function determines if the matrix is [binary](https://en.wikipedia.org/wiki/Logical_matrix) (when all elements of the matrix are 0 or 1).', (), None),
+    "matrix.is_diagonal": ('bool', 'The function determines if the matrix is [diagonal](https://en.wikipedia.org/wiki/Diagonal_matrix) (all elements outside the main diagonal are zero).', (), None),
+    "matrix.is_identity": ('bool', 'The function determines if a matrix is an [identity matrix](https://en.wikipedia.org/wiki/Identity_matrix) (elements with ones on the [main diagonal](https://en.wikipedia.org/wiki/Main_diagonal) and z', (), None),
+    "matrix.is_square": ('bool', 'The function determines if the matrix is [square](https://en.wikipedia.org/wiki/Square_matrix) (it has the same number of rows and columns).', (), None),
+    "matrix.is_stochastic": ('bool', 'The function determines if the matrix is [stochastic](https://en.wikipedia.org/wiki/Stochastic_matrix).', (), None),
+    "matrix.is_symmetric": ('bool', 'The function determines if a [square matrix](https://en.wikipedia.org/wiki/Square_matrix) is [symmetric](https://en.wikipedia.org/wiki/Symmetric_matrix) (elements are symmetric with respect to the [ma', (), None),
+    "matrix.is_triangular": ('bool', 'The function determines if the matrix is [triangular](https://en.wikipedia.org/wiki/Triangular_matrix) (if all elements above or below the [main diagonal](https://en.wikipedia.org/wiki/Main_diagonal) ', (), None),
+    "matrix.is_zero": ('bool', 'The function determines if all elements of the matrix are zero.', (), None),
+    "matrix.kron": ('matrix<float>|matrix<int>', 'The function returns the [Kronecker product](https://en.wikipedia.org/wiki/Kronecker_product) for the `id1` and `id2` matrices.', (('id2', 'matrix<float|int>', True),), None),
+    "matrix.max": ('float|int', 'The function returns the largest value from the matrix elements.', (), None),
+    "matrix.median": ('float|int', 'The function calculates the [median](https://en.wikipedia.org/wiki/Median) ("the middle" value) of matrix elements.', (), None),
+    "matrix.min": ('float|int', 'The function returns the smallest value from the matrix elements.', (), None),
+    "matrix.mode": ('float|int', 'The function calculates the [mode](https://en.wikipedia.org/wiki/Mode_(statistics)) of the matrix, which is the most frequently occurring value from the matrix elements.  ', (), None),
+    "matrix.mult": ('array<float>|array<int>|matrix<float>|matrix<int>', 'The function returns a new matrix resulting from the [product](https://en.wikipedia.org/wiki/Matrix_multiplication) between the matrices `id1` and `id2`, or between an `id1` matrix and an `id2` scalar', (('id2', 'series int|float|matrix<int|float>|array<int|float>', True),), None),
+    "matrix.new<bool>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<box>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<color>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<float>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<int>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<label>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<line>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<linefill>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<string>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<table>": ('void', 'Create matrix from random values', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.new<type>": ('void', 'The function creates a new matrix object. A matrix is a two-dimensional data structure containing rows and columns. All elements in the matrix must be of the type specified in the type template ("<typ', (('rows', 'series int', False), ('columns', 'series int', False), ('initial_value', 'matrix<type>', False)), None),
+    "matrix.pinv": ('matrix<float>|matrix<int>', 'The function returns the [pseudoinverse](https://en.wikipedia.org/wiki/Moore%E2%80%93Penrose_inverse) of a matrix.', (), None),
+    "matrix.pow": ('matrix<float>|matrix<int>', 'The function calculates the product of the matrix by itself `power` times.', (('power', 'series int', True),), None),
+    "matrix.rank": ('int', 'The function calculates the [rank](https://en.wikipedia.org/wiki/Rank_(linear_algebra)) of the matrix.', (), None),
+    "matrix.remove_col": ('array', 'The function removes the column at `column` index of the `id` matrix and returns an array containing the removed column\\`s values.', (('column', 'series int', False),), None),
+    "matrix.remove_row": ('array', 'The function removes the row at `row` index of the `id` matrix and returns an array containing the removed row\\`s values.', (('row', 'series int', False),), None),
+    "matrix.reshape": ('void', 'The function rebuilds the `id` matrix to `rows` x `cols` dimensions.', (('rows', 'series int', True), ('columns', 'series int', True)), None),
+    "matrix.reverse": ('void', 'The function reverses the order of rows and columns in the matrix `id`. The first row and first column become the last, and the last become the first.', (), None),
+    "matrix.row": ('array', 'The function creates a one-dimensional array from the elements of a matrix row.', (('row', 'series int', True),), None),
+    "matrix.rows": ('int', 'The function returns the number of rows in the matrix.', (), None),
+    "matrix.set": ('void', 'The function assigns `value` to the element at the `row` and `column` of the `id` matrix.', (('row', 'series int', True), ('column', 'series int', True), ('value', 'any', True)), None),
+    "matrix.sort": ('void', 'The function rearranges the rows in the `id` matrix following the sorted order of the values in the `column`.', (('column', 'series int', False), ('order', 'simple sort_order', False)), None),
+    "matrix.submatrix": ('matrix', 'The function extracts a submatrix of the `id` matrix within the specified indices.', (('from_row', 'series int', False), ('to_row', 'series int', False), ('from_column', 'series int', False), ('to_column', 'series int', False)), None),
+    "matrix.sum": ('matrix<float>|matrix<int>', 'The function returns a new matrix resulting from the [sum](https://en.wikipedia.org/wiki/Matrix_addition) of two matrices `id1` and `id2`, or of an `id1` matrix and an `id2` scalar (a numerical value)', (('id2', 'series int|float|matrix<int|float>', True),), None),
+    "matrix.swap_columns": ('void', 'The function swaps the columns at the index `column1` and `column2` in the `id` matrix.', (('column1', 'series int', True), ('column2', 'series int', True)), None),
+    "matrix.swap_rows": ('void', 'The function swaps the rows at the index `row1` and `row2` in the `id` matrix.', (('row1', 'series int', True), ('row2', 'series int', True)), None),
+    "matrix.trace": ('float|int', 'The function calculates the [trace](https://en.wikipedia.org/wiki/Trace_(linear_algebra)) of a matrix (the sum of the main diagonal\\`s elements).', (), None),
+    "matrix.transpose": ('matrix', 'The function creates a new, [transposed](https://en.wikipedia.org/wiki/Transpose#Transpose_of_a_matrix) version of the `id`.  ', (), None),
+    "max_bars_back": ('void', 'Function sets the maximum number of bars that is available for historical reference of a given built-in or user variable.  ', (('var', 'series int|float|bool|color|label|line', True), ('num', 'const int', True)), None),
+    "minute": ('int', '', (('time', 'series int', True), ('timezone', 'series string', True)), None),
+    "month": ('int', '', (('time', 'series int', True), ('timezone', 'series string', True)), None),
+    "na": ('bool', 'Tests if `x` is [na](#var_na).', (('x', 'series any', True),), None),
+    "nz": ('float|color|int|bool', 'Replaces NaN values with zeros (or given value) in a series.', (('source', 'series int|float|bool|color', True), ('replacement', 'series int|float|bool|color', True)), None),
+    "plot": ('plot', 'Plots a series of data on the chart.', (('series', 'series int|float', True), ('title', 'const string', True), ('color', 'series color', False), ('linewidth', 'input int', False), ('style', 'input plot_style', False), ('trackprice', 'input bool', False), ('histbase', 'input int|float', False), ('offset', 'series int', False), ('join', 'input bool', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('display', 'input plot_display', False)), None),
+    "plotarrow": ('void', 'Plots up and down arrows on the chart. Up arrow is drawn at every indicator positive value, down arrow is drawn at every negative value.  ', (('series', 'series int|float', True), ('title', 'const string', True), ('colorup', 'series color', False), ('colordown', 'series color', False), ('offset', 'series int', False), ('minheight', 'input int', False), ('maxheight', 'input int', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('display', 'input plot_display', False)), None),
+    "plotbar": ('void', 'Plots ohlc bars on the chart.', (('open', 'series int|float', True), ('high', 'series int|float', True), ('low', 'series int|float', True), ('close', 'series int|float', True), ('title', 'const string', False), ('color', 'series color', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('display', 'input plot_display', False)), None),
+    "plotcandle": ('void', 'Plots candles on the chart.', (('open', 'series int|float', True), ('high', 'series int|float', True), ('low', 'series int|float', True), ('close', 'series int|float', True), ('title', 'const string', False), ('color', 'series color', False), ('wickcolor', 'series color', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('bordercolor', 'series color', False), ('display', 'input plot_display', False)), None),
+    "plotchar": ('void', 'Plots visual shapes using any given one Unicode character on the chart.', (('series', 'series bool', True), ('title', 'const string', True), ('char', 'input string', True), ('location', 'input string', False), ('color', 'series color', False), ('offset', 'series int', False), ('text', 'const string', True), ('textcolor', 'series color', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('size', 'const string', False), ('display', 'input plot_display', False)), None),
+    "plotshape": ('void', 'Plots visual shapes on the chart.', (('series', 'series bool', True), ('title', 'const string', True), ('style', 'input string', False), ('location', 'input string', True), ('color', 'series color', False), ('offset', 'series int', False), ('text', 'const string', True), ('textcolor', 'series color', False), ('editable', 'const bool', False), ('show_last', 'input int', True), ('size', 'const string', False), ('display', 'input plot_display', False)), None),
+    "polyline.delete": ('void', "Deletes the specified [polyline](#op_polyline) object. It has no effect if the `id` doesn't exist.", (), None),
+    "polyline.new": ('polyline', 'Creates a new [polyline](#op_polyline) instance and displays it on the chart, sequentially connecting all of the points in the `points` array with line segments. The segments in the drawing can be str', (('points', 'chart.point[]', True), ('curved', 'series bool', False), ('closed', 'series bool', False), ('xloc', 'series string', False), ('line_color', 'series color', False), ('fill_color', 'series color', False), ('line_style', 'series string', False), ('line_width', 'series int', False)), None),
+    "request.currency_rate": ('float', 'Provides a daily rate that can be used to convert a value expressed in the `from` currency to another in the `to` currency.', (('from', 'simple string', True), ('to', 'simple string', True), ('ignore_invalid_currency', 'simple bool', False)), None),
+    "request.dividends": ('float', 'Requests dividends data for the specified symbol.', (('ticker', 'simple string', True), ('field', 'simple string', False), ('gaps', 'simple barmerge_gaps', True), ('lookahead', 'simple barmerge_lookahead', False), ('ignore_invalid_symbol', 'input bool', False), ('currency', 'simple string', False)), None),
+    "request.earnings": ('float', 'Requests earnings data for the specified symbol.', (('ticker', 'simple string', True), ('field', 'simple string', True), ('gaps', 'simple barmerge_gaps', True), ('lookahead', 'simple barmerge_lookahead', True), ('ignore_invalid_symbol', 'input bool', False), ('currency', 'simple string', False)), None),
+    "request.economic": ('float', 'Requests economic data for a symbol. Economic data includes information such as the state of a country\\`s economy (GDP, inflation rate, etc.) or of a particular industry (steel production, ICU beds, e', (('country_code', 'simple string', True), ('field', 'simple string', True), ('gaps', 'simple barmerge_gaps', False), ('ignore_invalid_symbol', 'input bool', False)), None),
+    "request.financial": ('float', 'Requests financial series for symbol.', (('symbol', 'simple string', True), ('financial_id', 'simple string', True), ('period', 'simple string', True), ('gaps', 'simple barmerge_gaps', True), ('ignore_invalid_symbol', 'input bool', False), ('currency', 'simple string', False)), None),
+    "request.quandl": ('float', 'Requests [Nasdaq Data Link](https://data.nasdaq.com/) (formerly Quandl) data for a symbol.', (('ticker', 'simple string', True), ('gaps', 'simple barmerge_gaps', True), ('index', 'simple int', True), ('ignore_invalid_symbol', 'input bool', False)), None),
+    "request.security": ('void', 'Requests data from another symbol and/or timeframe.', (('symbol', 'simple string', True), ('timeframe', 'simple string', True), ('expression', '<variable>|<object>|<function>|array|matrix|int|float|bool|string|color|tuple[...]', True), ('gaps', 'simple barmerge_gaps', False), ('lookahead', 'simple barmerge_lookahead', False), ('ignore_invalid_symbol', 'input bool', False), ('currency', 'simple string', False)), None),
+    "request.security_lower_tf": ('void', 'Requests data from a specified symbol from a lower timeframe than the chart\\`s. The function returns an array containing one element for each closed lower timeframe intrabar inside the current chart\\`', (('symbol', 'simple string', True), ('timeframe', 'simple string', True), ('expression', '<variable>|<object>|<function>|array|matrix|int|float|bool|string|color|tuple[...]', True), ('ignore_invalid_symbol', 'const bool', False), ('currency', 'simple string', False)), None),
+    "request.seed": ('void', 'Requests data from a user-maintained GitHub repository and returns it as a series.  ', (('source', 'simple string', True), ('symbol', 'simple string', True), ('expression', '<type>', True)), None),
+    "request.splits": ('float', 'Requests splits data for the specified symbol.', (('ticker', 'simple string', True), ('field', 'simple string', True), ('gaps', 'simple barmerge_gaps', True), ('lookahead', 'simple barmerge_lookahead', True), ('ignore_invalid_symbol', 'input bool', False)), None),
+    "runtime.error": ('void', 'When called, causes a runtime error with the error message specified in the `message` argument.', (('message', 'series string', True),), None),
+    "second": ('int', '', (('time', 'series int', True), ('timezone', 'series string', True)), None),
+    "str.contains": ('bool', 'Returns true if the `source` string contains the `str` substring, false otherwise.', (('source', 'series string', True), ('str', 'series string', True)), None),
+    "str.endswith": ('bool', 'Returns true if the `source` string ends with the substring specified in `str`, false otherwise.', (('source', 'series string', True), ('str', 'series string', True)), None),
+    "str.format": ('string', 'Converts the formatting string and value(s) into a formatted string. The formatting string can contain literal text and one placeholder in curly braces {} for each value to be formatted. Each placehol', (('formatString', 'series string', True), ('arg0, arg1, ...', 'array<[int|float|bool|string]>|na ', True)), None),
+    "str.format_time": ('string', 'Converts the `time` timestamp into a string formatted according to `format` and `timezone`.', (('time', 'series int', True), ('format', 'series string', True), ('timezone', 'series string', False)), None),
+    "str.length": ('int', 'Returns an integer corresponding to the amount of chars in that string.', (('string', 'series string', True),), None),
+    "str.lower": ('string', 'Returns a new string with all letters converted to lowercase.', (('source', 'series string', True),), None),
+    "str.match": ('string', 'Returns the new substring of the `source` string if it matches a `regex` regular expression, an empty string otherwise.', (('source', 'series string', True), ('regex', 'series string', True)), None),
+    "str.pos": ('int', "Returns the position of the first occurrence of the `str` string in the `source` string, 'na' otherwise.", (('source', 'series string', True), ('str', 'series string', True)), None),
+    "str.repeat": ('string', 'Repeats string.', (('source', 'string', True), ('count', 'int', True), ('separator', 'string', False)), '6'),
+    "str.replace": ('string', 'Returns a new string with the Nth occurrence of the `target` string replaced by the `replacement` string, where N is specified in `occurrence`.', (('source', 'series string', True), ('target', 'series string', True), ('replacement', 'series string', True), ('occurrence', 'series int', False)), None),
+    "str.replace_all": ('string', 'Replaces each occurrence of the target string in the source string with the replacement string.', (('source', 'series string', True), ('target', 'series string', True), ('replacement', 'series string', True)), None),
+    "str.split": ('array<string>', 'Divides a string into an array of substrings and returns its array id.', (('string', 'series string', True), ('separator', 'series string', True)), None),
+    "str.startswith": ('bool', 'Returns true if the `source` string starts with the substring specified in `str`, false otherwise.', (('source', 'series string', True), ('str', 'series string', True)), None),
+    "str.substring": ('string', "Returns a new string that is a substring of the `source` string. The substring begins with the character at the index specified by `begin_pos` and extends to 'end_pos - 1' of the `source` string.", (('source', 'series string', True), ('begin_pos', 'series int', True), ('end_pos', 'series int', False)), None),
+    "str.tonumber": ('float', 'Converts a value represented in `string` to its "float" equivalent.', (('string', 'series string', True),), None),
+    "str.tostring": ('string', '', (('value', 'series matrix|array<int|float|bool|string>', True), ('format', 'series string', True)), None),
+    "str.trim": ('string', 'Trims string.', (('source', 'string', True),), '6'),
+    "str.upper": ('string', 'Returns a new string with all letters converted to uppercase.', (('source', 'series string', True),), None),
+    "strategy": ('void', 'This declaration statement designates the script as a strategy and sets a number of strategy-related properties.', (('title', 'const string', True), ('shorttitle', 'const string', False), ('overlay', 'const bool', False), ('format', 'const string', False), ('precision', 'const int', False), ('scale', 'const scale_type', False), ('pyramiding', 'const int', False), ('calc_on_order_fills', 'const bool', False), ('calc_on_every_tick', 'const bool', False), ('max_bars_back', 'const int', False), ('backtest_fill_limits_assumption', 'const int', False), ('default_qty_type', 'const string', False), ('default_qty_value', 'const int|float', False), ('initial_capital', 'const int|float', False), ('currency', 'const string', False), ('slippage', 'const int', False), ('commission_type', 'const string', False), ('commission_value', 'const int|float', False), ('process_orders_on_close', 'const bool', False), ('close_entries_rule', 'const string', False), ('margin_long', 'const int|float', False), ('margin_short', 'const int|float', False), ('explicit_plot_zorder', 'const bool', False), ('max_lines_count', 'const int', False), ('max_labels_count', 'const int', False), ('max_boxes_count', 'const int', False), ('risk_free_rate', 'const int|float', False), ('use_bar_magnifier', 'const bool', False), ('fill_orders_on_standard_ohlc', 'any', False), ('max_polylines_count', 'const int', False)), None),
+    "strategy.cancel": ('void', 'It is a command to cancel/deactivate pending orders by referencing their names, which were generated by the functions: [strategy.order](#fun_strategy.order), [strategy.entry](#fun_strategy.entry) and ', (('id', 'series string', True),), None),
+    "strategy.cancel_all": ('void', 'It is a command to cancel/deactivate all pending orders, which were generated by the functions: [strategy.order](#fun_strategy.order), [strategy.entry](#fun_strategy.entry) and [strategy.exit](#fun_st', (), None),
+    "strategy.close": ('void', 'It is a command to exit from the entry with the specified ID. If there were multiple entry orders with the same ID, all of them are exited at once. If there are no open entries with the specified ID b', (('id', 'series string', True), ('comment', 'series string', False), ('qty', 'series int|float', False), ('qty_percent', 'series int|float', False), ('alert_message', 'series string', False), ('immediately', 'series bool', False), ('disable_alert', 'series bool', False)), None),
+    "strategy.close_all": ('void', 'Exits the current market position, making it flat.', (('comment', 'series string', False), ('alert_message', 'series string', False), ('immediately', 'series bool', False), ('disable_alert', 'series bool', False)), None),
+    "strategy.closedtrades.commission": ('float', 'Returns the sum of entry and exit fees paid in the closed trade.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.entry_bar_index": ('int', 'Returns the bar_index of the closed trade\\`s entry.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.entry_comment": ('string', 'Returns the comment message of the closed trade\\`s entry, or [na](#var_na)', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.entry_id": ('string', 'Returns the id of the closed trade\\`s entry.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.entry_price": ('float', 'Rnumbereturns the price of the closed trade\\`s entry.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.entry_time": ('int', 'Returns the UNIX time of the closed trade\\`s entry.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.exit_bar_index": ('int', 'Returns the bar_index of the closed trade\\`s exit.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.exit_comment": ('string', 'Returns the comment message of the closed trade\\`s exit, or', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.exit_id": ('string', 'Returns the id of the closed trade\\`s exit.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.exit_price": ('float', 'Returns the price of the closed trade\\`s exit.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.exit_time": ('int', 'Returns the UNIX time of the closed trade\\`s exit.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.max_drawdown": ('float', 'Returns the maximum drawdown of the closed trade, i.e., the maximum possible loss during the trade.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.max_drawdown_percent": ('void', 'Returns the maximum drawdown of the closed trade, i.e., the maximum possible loss during the trade, expressed as a percentage and calculated by formula: `Lowest Value During Trade  / (Entry Price x Qu', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.max_runup": ('float', 'Returns the maximum run up of the closed trade, i.e., the maximum possible profit during the trade.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.max_runup_percent": ('void', 'Returns the maximum run-up of the closed trade, i.e., the maximum possible profit during the trade, expressed as a percentage and calculated by formula: `Highest Value During Trade / (Entry Price x Qu', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.profit": ('float', 'Returns the profit/loss of the closed trade. Losses are expressed as negative values.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.profit_percent": ('void', 'Returns the profit/loss value of the closed trade, expressed as a percentage. Losses are expressed as negative values.', (('trade_num', 'series int', True),), None),
+    "strategy.closedtrades.size": ('float', 'Returns the direction and the number of contracts traded in the closed trade. If the value is > 0, the market position was long. If the value is < 0, the market position was short.', (('trade_num', 'series int', True),), None),
+    "strategy.convert_to_account": ('float', 'Converts the value from the currency that the symbol on the chart is traded in ([syminfo.currency](#var_syminfo.currency)) to the currency used by the strategy ([strategy.account_currency](#var_strate', (('value', 'series int|float', True),), None),
+    "strategy.convert_to_symbol": ('float', 'Converts the value from the currency used by the strategy ([strategy.account_currency](#var_strategy.account_currency)) to the currency that the symbol on the chart is traded in ([syminfo.currency](#v', (('value', 'series int|float', True),), None),
+    "strategy.default_entry_qty": ('void', 'Calculates the default quantity, in units, of an entry order from [strategy.entry](#fun_strategy.entry) or [strategy.order](#fun_strategy.order) if it were to fill at the specified `fill_price` value.', (('fill_price', 'series int/float', True),), None),
+    "strategy.entry": ('void', 'It is a command to enter market position. If an order with the same ID is already pending, it is possible to modify the order.  ', (('id', 'series string', True), ('direction', 'series strategy_direction', True), ('qty', 'series int|float', False), ('limit', 'series int|float', False), ('stop', 'series int|float', False), ('oca_name', 'series string', False), ('oca_type', 'input string', False), ('comment', 'series string', False), ('alert_message', 'series string', False), ('disable_alert', 'series bool', False)), None),
+    "strategy.exit": ('void', 'It is a command to exit either a specific entry, or whole market position. If an order with the same ID is already pending, it is possible to modify the order.  ', (('id', 'series string', True), ('from_entry', 'series string', False), ('qty', 'series int|float', False), ('qty_percent', 'series int|float', False), ('profit', 'series int|float', False), ('limit', 'series int|float', False), ('loss', 'series int|float', False), ('stop', 'series int|float', False), ('trail_price', 'series int|float', False), ('trail_points', 'series int|float', False), ('trail_offset', 'series int|float', False), ('oca_name', 'series string', False), ('comment', 'series string', False), ('comment_profit', 'series string', False), ('comment_loss', 'series string', False), ('comment_trailing', 'series string', False), ('alert_message', 'series string', False), ('alert_profit', 'series string', False), ('alert_loss', 'series string', False), ('alert_trailing', 'series string', False), ('disable_alert', 'series bool', False)), None),
+    "strategy.opentrades.commission": ('float', 'Returns the sum of entry and exit fees paid in the open trade.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.entry_bar_index": ('int', 'Returns the bar_index of the open trade\\`s entry.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.entry_comment": ('string', 'Returns the comment message of the open trade\\`s entry, or', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.entry_id": ('string', 'Returns the id of the open trade\\`s entry.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.entry_price": ('float', 'Returns the price of the open trade\\`s entry.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.entry_time": ('int', 'Returns the UNIX time of the open trade\\`s entry.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.max_drawdown": ('float', 'Returns the maximum drawdown of the open trade, i.e., the maximum possible loss during the trade.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.max_drawdown_percent": ('void', 'Returns the maximum drawdown of the open trade, i.e., the maximum possible loss during the trade, expressed as a percentage and calculated by formula: `Lowest Value During Trade  / (Entry Price x Quan', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.max_runup": ('float', 'Returns the maximum run up of the open trade, i.e., the maximum possible profit during the trade.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.max_runup_percent": ('void', 'Returns the maximum run-up of the open trade, i.e., the maximum possible profit during the trade, expressed as a percentage and calculated by formula: `Highest Value During Trade / (Entry Price x Quan', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.profit": ('float', 'Returns the profit/loss of the open trade. Losses are expressed as negative values.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.profit_percent": ('void', 'Returns the profit/loss of the open trade, expressed as a percentage. Losses are expressed as negative values.', (('trade_num', 'series int', True),), None),
+    "strategy.opentrades.size": ('float', 'Returns the direction and the number of contracts traded in the open trade. If the value is > 0, the market position was long. If the value is < 0, the market position was short.', (('trade_num', 'series int', True),), None),
+    "strategy.order": ('void', 'It is a command to place order. If an order with the same ID is already pending, it is possible to modify the order.  ', (('id', 'series string', True), ('direction', 'series strategy_direction', True), ('qty', 'series int|float', False), ('limit', 'series int|float', False), ('stop', 'series int|float', False), ('oca_name', 'series string', False), ('oca_type', 'input string', False), ('comment', 'series string', False), ('alert_message', 'series string', False), ('disable_alert', 'series bool', False)), None),
+    "strategy.risk.allow_entry_in": ('void', 'This function can be used to specify in which market direction the [strategy.entry](#fun_strategy.entry) function is allowed to open positions.', (('value', 'simple string', True),), None),
+    "strategy.risk.max_cons_loss_days": ('void', 'The purpose of this rule is to cancel all pending orders, close all open positions and stop placing orders after a specified number of consecutive days with losses. The rule affects the whole strategy', (('count', 'simple int', True), ('alert_message', 'simple string', False)), None),
+    "strategy.risk.max_drawdown": ('void', 'The purpose of this rule is to determine maximum drawdown. The rule affects the whole strategy. Once the maximum drawdown value is reached, all pending orders are cancelled, all open positions are clo', (('value', 'simple int|float', True), ('displayType', 'simple string', True), ('alert_message', 'simple string', False)), None),
+    "strategy.risk.max_intraday_filled_orders": ('void', 'The purpose of this rule is to determine maximum number of filled orders per 1 day (per 1 bar, if chart resolution is higher than 1 day). The rule affects the whole strategy. Once the maximum number o', (('count', 'simple int', True), ('alert_message', 'simple string', False)), None),
+    "strategy.risk.max_intraday_loss": ('void', 'The maximum loss value allowed during a day. It is specified either in money (base currency), or in percentage of maximum intraday equity (0 -100).', (('value', 'simple int|float', True), ('displayType', 'simple string', True), ('alert_message', 'simple string', False)), None),
+    "strategy.risk.max_position_size": ('void', 'The purpose of this rule is to determine maximum size of a market position. The rule affects the following function: [strategy.entry](#fun_strategy.entry).  ', (('contracts', 'simple int|float', True),), None),
+    "string": ('string', 'Casts na to string.', (('x', 'series color', True),), None),
+    "syminfo.prefix": ('string', 'Returns exchange prefix of the `symbol`, e.g. "NASDAQ".', (('symbol', 'series string', True),), None),
+    "syminfo.ticker": ('string', 'Returns `symbol` name without exchange prefix, e.g. "AAPL".', (('symbol', 'series string', True),), None),
+    "ta.alma": ('float', 'Arnaud Legoux Moving Average. It uses Gaussian distribution as weights for moving average.', (('series', 'series int|float', True), ('length', 'series int', True), ('offset', 'simple int|float', True), ('sigma', 'simple int|float', True), ('floor', 'simple bool', True)), None),
+    "ta.atr": ('float', 'Function atr (average true range) returns the RMA of true range. True range is max(high - low, abs(high - close[1]), abs(low - close[1])).', (('length', 'simple int', True),), None),
+    "ta.barssince": ('int', 'Counts the number of bars since the last time the condition was true.', (('condition', 'series bool', True),), None),
+    "ta.bb": ('[float, float, float]', 'Bollinger Bands. A Bollinger Band is a technical analysis tool defined by a set of lines plotted two standard deviations (positively and negatively) away from a simple moving average (SMA) of the secu', (('series', 'series int|float', True), ('length', 'series int', True), ('mult', 'simple int|float', True)), None),
+    "ta.bbw": ('float', 'Bollinger Bands Width. The Bollinger Band Width is the difference between the upper and the lower Bollinger Bands divided by the middle band.', (('series', 'series int|float', True), ('length', 'series int', True), ('mult', 'simple int|float', True)), None),
+    "ta.cci": ('float', 'The CCI (commodity channel index) is calculated as the difference between the typical price of a commodity and its simple moving average, divided by the mean absolute deviation of the typical price. T', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.change": ('float|int|bool', 'Compares the current `source` value to its value `length` bars ago and returns the difference.', (('source', 'series int|float|bool', True), ('length', 'series int', True)), None),
+    "ta.cmo": ('float', 'Chande Momentum Oscillator. Calculates the difference between the sum of recent gains and the sum of recent losses and then divides the result by the sum of all price movement over the same period.', (('series', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.cog": ('float', 'The cog (center of gravity) is an indicator based on statistics and the Fibonacci golden ratio.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.correlation": ('float', 'Correlation coefficient. Describes the degree to which two series tend to deviate from their [ta.sma](#fun_ta.sma) values.', (('source1', 'series int|float', True), ('source2', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.cross": ('bool', '', (('source1', 'series int|float', True), ('source2', 'series int|float', True)), None),
+    "ta.crossover": ('bool', 'The `source1`-series is defined as having crossed over `source2`-series if, on the current bar, the value of `source1` is greater than the value of `source2`, and on the previous bar, the value of `so', (('source1', 'series int|float', True), ('source2', 'series int|float', True)), None),
+    "ta.crossunder": ('bool', 'The `source1`-series is defined as having crossed under `source2`-series if, on the current bar, the value of `source1` is less than the value of `source2`, and on the previous bar, the value of `sour', (('source1', 'series int|float', True), ('source2', 'series int|float', True)), None),
+    "ta.cum": ('float', 'Cumulative (total) sum of `source`. In other words it\\`s a sum of all elements of `source`.', (('source', 'series int|float', True),), None),
+    "ta.dev": ('float', 'Measure of difference between the series and it\\`s [ta.sma](#fun_ta.sma)', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.dmi": ('[float, float, float]', 'The dmi function returns the directional movement index.', (('diLength', 'simple int', True), ('adxSmoothing', 'simple int', True)), None),
+    "ta.ema": ('float', 'The ema function returns the exponentially weighted moving average. In ema weighting factors decrease exponentially. It calculates by using a formula: EMA = alpha * source + (1 - alpha) * EMA[1], wher', (('source', 'series int|float', True), ('length', 'simple int', True)), None),
+    "ta.falling": ('bool', 'Test if the `source` series is now falling for `length` bars long.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.highest": ('float', 'Highest value for a given number of bars back.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.highestbars": ('int', 'Highest value offset for a given number of bars back.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.hma": ('float', 'The hma function returns the Hull Moving Average.', (('source', 'series int|float', True), ('length', 'simple int', True)), None),
+    "ta.kc": ('[float, float, float]', 'Keltner Channels. Keltner channel is a technical analysis indicator showing a central moving average line plus channel lines at a distance above and below.', (('series', 'series int|float', True), ('length', 'simple int', True), ('mult', 'simple int|float', True), ('useTrueRange', 'simple bool', True)), None),
+    "ta.kcw": ('float', 'Keltner Channels Width. The Keltner Channels Width is the difference between the upper and the lower Keltner Channels divided by the middle channel.', (('series', 'series int|float', True), ('length', 'simple int', True), ('mult', 'simple int|float', True), ('useTrueRange', 'simple bool', True)), None),
+    "ta.linreg": ('float', 'Linear regression curve. A line that best fits the prices specified over a user-defined time period.  ', (('source', 'series int|float', True), ('length', 'series int', True), ('offset', 'simple int', True)), None),
+    "ta.lowest": ('float', 'Lowest value for a given number of bars back.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.lowestbars": ('int', 'Lowest value offset for a given number of bars back.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.macd": ('[float, float, float]', 'MACD (moving average convergence/divergence). It is supposed to reveal changes in the strength, direction, momentum, and duration of a trend in a stock\\`s price.', (('source', 'series int|float', True), ('fastlen', 'simple int', True), ('slowlen', 'simple int', True), ('siglen', 'simple int', True)), None),
+    "ta.max": ('float', 'Returns the all-time high value of `source` from the beginning of the chart up to the current bar.', (('source', 'series int|float', True),), None),
+    "ta.median": ('float|int', 'Returns the median of the series.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.mfi": ('float', 'Money Flow Index. The Money Flow Index (MFI) is a technical oscillator that uses price and volume for identifying overbought or oversold conditions in an asset.', (('series', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.min": ('float', 'Returns the all-time low value of `source` from the beginning of the chart up to the current bar.', (('source', 'series int|float', True),), None),
+    "ta.mode": ('float|int', 'Returns the [mode](https://en.wikipedia.org/wiki/Mode_(statistics)) of the series.  ', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.mom": ('float', 'Momentum of `source` price and `source` price `length` bars ago. This is simply a difference: source - source[length].', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.percentile_linear_interpolation": ('float', 'Calculates percentile using method of linear interpolation between the two nearest ranks.', (('source', 'series int|float', True), ('length', 'series int', True), ('percentage', 'simple int|float', True)), None),
+    "ta.percentile_nearest_rank": ('float', 'Calculates percentile using method of Nearest Rank.', (('source', 'series int|float', True), ('length', 'series int', True), ('percentage', 'simple int|float', True)), None),
+    "ta.percentrank": ('float', 'Percent rank is the percents of how many previous values was less than or equal to the current value of given series.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.pivot_point_levels": ('array<float>', 'Calculates the pivot point levels using the specified `type` and `anchor`.', (('displayType', 'series string', True), ('anchor', 'series bool', True), ('developing', 'series bool', False)), None),
+    "ta.pivothigh": ('float', "This function returns price of the pivot high point. It returns 'NaN', if there was no pivot high point.", (('source', 'series int|float', True), ('leftbars', 'series int|float', True), ('rightbars', 'series int|float', True)), None),
+    "ta.pivotlow": ('float', "This function returns price of the pivot low point. It returns 'NaN', if there was no pivot low point.", (('source', 'series int|float', True), ('leftbars', 'series int|float', True), ('rightbars', 'series int|float', True)), None),
+    "ta.range": ('float|int', 'Returns the difference between the min and max values in a series.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.rci": ('float', 'Rank Correlation Index.', (('source', 'series float', True), ('length', 'simple int', True)), '6'),
+    "ta.rising": ('bool', 'Test if the `source` series is now rising for `length` bars long.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.rma": ('float', 'Moving average used in RSI. It is the exponentially weighted moving average with alpha = 1 / length.', (('source', 'series int|float', True), ('length', 'simple int', True)), None),
+    "ta.roc": ('float', 'Calculates the percentage of change (rate of change) between the current value of `source` and its value `length` bars ago.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.rsi": ('float', 'Relative strength index. It is calculated using the `ta.rma()` of upward and downward changes of `source` over the last `length` bars.', (('source', 'series int|float', True), ('length', 'simple int', True)), None),
+    "ta.sar": ('float', 'Parabolic SAR (parabolic stop and reverse) is a method devised by J. Welles Wilder, Jr., to find potential reversals in the market price direction of traded goods.', (('start', 'simple int|float', True), ('inc', 'simple int|float', True), ('max', 'simple int|float', True)), None),
+    "ta.sma": ('float', 'The sma function returns the moving average, that is the sum of last y values of x, divided by y.', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.stdev": ('float', '', (('source', 'series int|float', True), ('length', 'series int', True), ('biased', 'series bool', False)), None),
+    "ta.stoch": ('float', 'Stochastic. It is calculated by a formula: 100 * (close - lowest(low, length)) / (highest(high, length) - lowest(low, length)).', (('source', 'series int|float', True), ('high', 'series int|float', True), ('low', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.supertrend": ('[float, float]', 'The Supertrend Indicator. The Supertrend is a trend following indicator.', (('factor', 'series int|float', True), ('atrPeriod', 'simple int', True)), None),
+    "ta.swma": ('float', 'Symmetrically weighted moving average with fixed length: 4. Weights: [1/6, 2/6, 2/6, 1/6].', (('source', 'series int|float', True),), None),
+    "ta.tr": ('float', '', (('handle_na', 'simple bool', True),), None),
+    "ta.tsi": ('float', 'True strength index. It uses moving averages of the underlying momentum of a financial instrument.', (('source', 'series int|float', True), ('short_length', 'simple int', True), ('long_length', 'simple int', True)), None),
+    "ta.valuewhen": ('float|color|int|bool', 'Returns the value of the `source` series on the bar where the `condition` was true on the nth most recent occurrence.', (('condition', 'series bool', True), ('source', 'series int|float|bool|color', True), ('occurrence', 'simple int', True)), None),
+    "ta.variance": ('float', 'Variance is the expectation of the squared deviation of a series from its mean ([ta.sma](#fun_ta.sma)), and it informally measures how far a set of numbers are spread out from their mean.', (('source', 'series int|float', True), ('length', 'series int', True), ('biased', 'series bool', False)), None),
+    "ta.vwap": ('float|[float, float, float]', 'Volume weighted average price.', (('source', 'series int|float', True), ('anchor', 'series bool', True), ('stdev_mult', 'series int|float', True)), None),
+    "ta.vwma": ('float', 'The vwma function returns volume-weighted moving average of `source` for `length` bars back.  ', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.wma": ('float', 'The wma function returns weighted moving average of `source` for `length` bars back.  ', (('source', 'series int|float', True), ('length', 'series int', True)), None),
+    "ta.wpr": ('float', "Williams %R. The oscillator shows the current closing price in relation to the high and low of the past 'length' bars.", (('length', 'series int', True),), None),
+    "table": ('table', 'Casts na to table.', (('x', 'series table', True),), None),
+    "table.cell": ('void', 'The function defines a cell in the table and sets its attributes.', (('column', 'series int', True), ('row', 'series int', True), ('text', 'series string', False), ('text_font_family', 'series string', False), ('width', 'series int|float', False), ('height', 'series int|float', False), ('text_color', 'series color', False), ('text_halign', 'series string', False), ('text_valign', 'series string', False), ('text_size', 'series string', False), ('bgcolor', 'series color', False), ('tooltip', 'series string', False)), None),
+    "table.cell_set_bgcolor": ('void', 'The function sets the background color of the cell.', (('column', 'series int', True), ('row', 'series int', True), ('bgcolor', 'series color', False)), None),
+    "table.cell_set_height": ('void', 'The function sets the height of cell.', (('column', 'series int', True), ('row', 'series int', True), ('height', 'series int|float', False)), None),
+    "table.cell_set_text": ('void', 'The function sets the text in the specified cell.', (('column', 'series int', True), ('row', 'series int', True), ('text', 'series string', True)), None),
+    "table.cell_set_text_color": ('void', 'The function sets the color of the text inside the cell.', (('column', 'series int', True), ('row', 'series int', True), ('text_color', 'series color', True)), None),
+    "table.cell_set_text_font_family": ('void', 'The function sets the font family of the text inside the cell.', (('column', 'series int', True), ('row', 'series int', True), ('text_font_family', 'series string', True)), None),
+    "table.cell_set_text_formatting": ('void', 'Sets text formatting.', (('table_id', 'table', True), ('column', 'int', True), ('row', 'int', True), ('formatting', 'string', True)), '6'),
+    "table.cell_set_text_halign": ('void', 'The function sets the horizontal alignment of the cell\\`s text.', (('column', 'series int', True), ('row', 'series int', True), ('text_halign', 'series string', True)), None),
+    "table.cell_set_text_size": ('void', 'The function sets the size of the cell\\`s text.', (('column', 'series int', True), ('row', 'series int', True), ('text_size', 'series string', False)), None),
+    "table.cell_set_text_valign": ('void', 'The function sets the vertical alignment of a cell\\`s text.', (('column', 'series int', True), ('row', 'series int', True), ('text_valign', 'series string', True)), None),
+    "table.cell_set_tooltip": ('void', 'The function sets the tooltip in the specified cell.', (('column', 'series int', True), ('row', 'series int', True), ('tooltip', 'series string', True)), None),
+    "table.cell_set_width": ('void', 'The function sets the width of the cell.', (('column', 'series int', True), ('row', 'series int', True), ('width', 'series int|float', False)), None),
+    "table.clear": ('void', 'The function removes a cell or a sequence of cells from the table. The cells are removed in a rectangle shape where the start_column and start_row specify the top-left corner, and end_column and end_r', (('start_column', 'series int', True), ('start_row', 'series int', True), ('end_column', 'series int', False), ('end_row', 'series int', False)), None),
+    "table.delete": ('void', 'The function deletes a table.', (), None),
+    "table.merge_cells": ('void', 'The function merges a sequence of cells in the table into one cell. The cells are merged in a rectangle shape where the start_column and start_row specify the top-left corner, and end_column and end_r', (('start_column', 'series int', True), ('start_row', 'series int', True), ('end_column', 'series int', True), ('end_row', 'series int', True)), None),
+    "table.new": ('table', 'The function creates a new table.', (('position', 'series string', True), ('columns', 'series int', True), ('rows', 'series int', True), ('bgcolor', 'series color', False), ('frame_color', 'series color', False), ('frame_width', 'series int', False), ('border_color', 'series color', False), ('border_width', 'series int', False)), None),
+    "table.set_bgcolor": ('void', 'The function sets the background color of a table.', (('bgcolor', 'series color', False),), None),
+    "table.set_border_color": ('void', 'The function sets the color of the borders (excluding the outer frame) of the table\\`s cells.', (('border_color', 'series color', False),), None),
+    "table.set_border_width": ('void', 'The function sets the width of the borders (excluding the outer frame) of the table\\`s cells.', (('border_width', 'series int', False),), None),
+    "table.set_frame_color": ('void', 'The function sets the color of the outer frame of a table.', (('frame_color', 'series color', False),), None),
+    "table.set_frame_width": ('void', 'The function set the width of the outer frame of a table.', (('frame_width', 'series int', False),), None),
+    "table.set_position": ('void', 'The function sets the position of a table.', (('position', 'series string', True),), None),
+    "ticker.heikinashi": ('string', 'Creates a ticker identifier for requesting Heikin Ashi bar values.', (('symbol', 'simple string', True),), None),
+    "ticker.inherit": ('void', "Constructs a ticker ID for the specified `symbol` with additional parameters inherited from the ticker ID passed into the function call, allowing the script to request a symbol's data using the same m", (('from_tickerid', 'simple string', True), ('symbol', 'simple string', True)), None),
+    "ticker.kagi": ('string', 'Creates a ticker identifier for requesting Kagi values.', (('symbol', 'simple string', True), ('reversal', 'simple int|float', True)), None),
+    "ticker.linebreak": ('string', 'Creates a ticker identifier for requesting Line Break values.', (('symbol', 'simple string', True), ('number_of_lines', 'simple int', True)), None),
+    "ticker.modify": ('string', 'Creates a ticker identifier for requesting additional data for the script.', (('tickerid', 'simple string', True), ('session', 'simple string', False), ('adjustment', 'simple string', False)), None),
+    "ticker.new": ('string', 'Creates a ticker identifier for requesting additional data for the script.', (('prefix', 'simple string', True), ('ticker', 'simple string', True), ('session', 'simple string', False), ('adjustment', 'simple string', False)), None),
+    "ticker.pointfigure": ('string', 'Creates a ticker identifier for requesting Point & Figure values.', (('symbol', 'simple string', True), ('source', 'simple string', True), ('style', 'simple string', True), ('param', 'simple int|float', True), ('reversal', 'simple int', True)), None),
+    "ticker.renko": ('string', 'Creates a ticker identifier for requesting Renko values.', (('symbol', 'simple string', True), ('style', 'simple string', True), ('param', 'simple int|float', True), ('request_wicks', 'simple bool', False), ('source', 'simple string', False)), None),
+    "ticker.standard": ('string', 'Creates a ticker to request data from a standard chart that is unaffected by modifiers like extended session, dividend adjustment, currency conversion, and the calculations of non-standard chart types', (('symbol', 'simple string', False),), None),
+    "time": ('int', 'The time function returns the UNIX time of the current bar for the specified timeframe and session or NaN if the time point is out of session.', (('timeframe', 'series string', True), ('session', 'series string', True), ('timezone', 'series string', True)), None),
+    "time_close": ('int', 'Returns the UNIX time of the current bar\\`s close for the specified timeframe and session, or [na](#var_na) if the time point is outside the session.  ', (('timeframe', 'series string', True), ('session', 'series string', True), ('timezone', 'series string', True)), None),
+    "timeframe.change": ('bool', 'Detects changes in the specified `timeframe`.', (('timeframe', 'series string', True),), None),
+    "timeframe.from_seconds": ('void', 'Converts a number of seconds into a valid timeframe string.  ', (('seconds', 'series int', True),), None),
+    "timeframe.in_seconds": ('int', 'Converts the timeframe passed to the `timeframe` argument into seconds.', (('timeframe', 'series string', False),), None),
+    "timestamp": ('int', 'Function timestamp returns UNIX time of specified date and time.', (('timezone', 'series string', True), ('year', 'series int', True), ('month', 'series int', True), ('day', 'series int', True), ('hour', 'series int', False), ('minute', 'series int', False), ('second', 'series int', False), ('dateString', 'const string', True)), None),
+    "weekofyear": ('int', '', (('time', 'series int', True), ('timezone', 'series string', True)), None),
+    "year": ('int', '', (('time', 'series int', True), ('timezone', 'series string', True)), None),
+}
+
+VARIABLES = {
+    "adjustment.dividends": ('const string', 'Constant for dividends adjustment type (dividends adjustment is applied).', None),
+    "adjustment.none": ('const string', 'Constant for none adjustment type (no adjustment is applied).', None),
+    "adjustment.splits": ('const string', 'Constant for splits adjustment type (splits adjustment is applied).', None),
+    "alert.freq_all": ('const string', 'A named constant for use with the `freq` parameter of the alert() function.', None),
+    "alert.freq_once_per_bar": ('const string', 'A named constant for use with the `freq` parameter of the alert() function.', None),
+    "alert.freq_once_per_bar_close": ('const string', 'A named constant for use with the `freq` parameter of the alert() function.', None),
+    "ask": ('series float', 'Ask price.', '6'),
+    "bar_index": ('series int', 'Current bar index. Numbering is zero-based, index of the first bar is 0.', None),
+    "barmerge.gaps_off": ('const barmerge_gaps', 'Merge strategy for requested data. Data is merged continuously without gaps, all the gaps are filled with the previous nearest existing value.', None),
+    "barmerge.gaps_on": ('const barmerge_gaps', 'Merge strategy for requested data. Data is merged with possible gaps ([na](#var_na) values).', None),
+    "barmerge.lookahead_off": ('const barmerge_lookahead', 'Merge strategy for the requested data position. Requested barset is merged with current barset in the order of sorting bars by their close time. This merge strategy disables effect of getting data fro', None),
+    "barmerge.lookahead_on": ('const barmerge_lookahead', 'Merge strategy for the requested data position. Requested barset is merged with current barset in the order of sorting bars by their opening time. This merge strategy can lead to undesirable effect of', None),
+    "barstate.isconfirmed": ('series bool', 'Returns true if the script is calculating the last (closing) update of the current bar. The next script calculation will be on the new bar data.', None),
+    "barstate.isfirst": ('series bool', 'Returns true if current bar is first bar in barset, false otherwise.', None),
+    "barstate.ishistory": ('series bool', 'Returns true if current bar is a historical bar, false otherwise.', None),
+    "barstate.islast": ('series bool', 'Returns true if current bar is the last bar in barset, false otherwise. This condition is true for all real-time bars in barset.', None),
+    "barstate.islastconfirmedhistory": ('series bool', 'Returns true if script is executing on the dataset\\`s last bar when market is closed, or script is executing on the bar immediately preceding the real-time bar, if market is open. Returns false otherw', None),
+    "barstate.isnew": ('series bool', 'Returns true if script is currently calculating on new bar, false otherwise. This variable is true when calculating on historical bars or on first update of a newly generated real-time bar.', None),
+    "barstate.isrealtime": ('series bool', 'Returns true if current bar is a real-time bar, false otherwise.', None),
+    "bid": ('series float', 'Bid price.', '6'),
+    "box.all": ('box[]', 'Returns an array filled with all the current boxes drawn by the script.', None),
+    "chart.bg_color": ('input color', 'Returns the color of the chart\\`s background from the "Chart settings/Appearance/Background" field. When a gradient is selected, the middle point of the gradient is returned.', None),
+    "chart.fg_color": ('input color', 'Returns a color providing optimal contrast with [chart.bg_color](#var_chart.bg_color).', None),
+    "chart.is_heikinashi": ('simple bool', '', None),
+    "chart.is_kagi": ('simple bool', '', None),
+    "chart.is_linebreak": ('simple bool', '', None),
+    "chart.is_pnf": ('simple bool', '', None),
+    "chart.is_range": ('simple bool', '', None),
+    "chart.is_renko": ('simple bool', '', None),
+    "chart.is_standard": ('simple bool', '', None),
+    "chart.left_visible_bar_time": ('input int', 'The [time](#var_time) of the leftmost bar currently visible on the chart.', None),
+    "chart.right_visible_bar_time": ('input int', 'The [time](#var_time) of the rightmost bar currently visible on the chart.', None),
+    "close": ('series float', 'Close price of the current bar when it has closed, or last traded price of a yet incomplete, realtime bar.', None),
+    "color.aqua": ('const color', 'Is a named constant for #00BCD4 color.  ', None),
+    "color.black": ('const color', 'Is a named constant for #363A45 color.  ', None),
+    "color.blue": ('const color', 'Is a named constant for #2962ff color.  ', None),
+    "color.fuchsia": ('const color', 'Is a named constant for #E040FB color.  ', None),
+    "color.gray": ('const color', 'Is a named constant for #787B86 color.  ', None),
+    "color.green": ('const color', 'Is a named constant for #4CAF50 color.  ', None),
+    "color.lime": ('const color', 'Is a named constant for #00E676 color.  ', None),
+    "color.maroon": ('const color', 'Is a named constant for #880E4F color.  ', None),
+    "color.navy": ('const color', 'Is a named constant for #311B92 color.  ', None),
+    "color.olive": ('const color', 'Is a named constant for #808000 color.  ', None),
+    "color.orange": ('const color', 'Is a named constant for #FF9800 color.  ', None),
+    "color.purple": ('const color', 'Is a named constant for #9C27B0 color.  ', None),
+    "color.red": ('const color', 'Is a named constant for #FF5252 color.  ', None),
+    "color.silver": ('const color', 'Is a named constant for #B2B5BE color.  ', None),
+    "color.teal": ('const color', 'Is a named constant for #00897B color.  ', None),
+    "color.white": ('const color', 'Is a named constant for #FFFFFF color.  ', None),
+    "color.yellow": ('const color', 'Is a named constant for #FFEB3B color.  ', None),
+    "currency.AUD": ('const string', 'Australian dollar.', None),
+    "currency.BTC": ('const string', 'Bitcoin.', None),
+    "currency.CAD": ('const string', 'Canadian dollar.', None),
+    "currency.CHF": ('const string', 'Swiss franc.', None),
+    "currency.ETH": ('const string', 'Ethereum.', None),
+    "currency.EUR": ('const string', 'Euro.', None),
+    "currency.GBP": ('const string', 'Pound sterling.', None),
+    "currency.HKD": ('const string', 'Hong Kong dollar.', None),
+    "currency.INR": ('const string', 'Indian rupee.', None),
+    "currency.JPY": ('const string', 'Japanese yen.', None),
+    "currency.KRW": ('const string', 'South Korean won.', None),
+    "currency.MYR": ('const string', 'Malaysian ringgit.', None),
+    "currency.NOK": ('const string', 'Norwegian krone.', None),
+    "currency.NONE": ('const string', 'Unspecified currency.', None),
+    "currency.NZD": ('const string', 'New Zealand dollar.', None),
+    "currency.RUB": ('const string', 'Russian ruble.', None),
+    "currency.SEK": ('const string', 'Swedish krona.', None),
+    "currency.SGD": ('const string', 'Singapore dollar.', None),
+    "currency.TRY": ('const string', 'Turkish lira.', None),
+    "currency.USD": ('const string', 'United States dollar.', None),
+    "currency.USDT": ('const string', 'Tether.', None),
+    "currency.ZAR": ('const string', 'South African rand.', None),
+    "dayofmonth": ('series int', 'Date of current bar time in exchange timezone.', None),
+    "dayofweek": ('series int', 'Day of week for current bar time in exchange timezone.', None),
+    "dayofweek.friday": ('const int', 'Is a named constant for return value of [dayofweek](#fun_dayofweek) function and value of [dayofweek](#var_dayofweek) variable.', None),
+    "dayofweek.monday": ('const int', 'Is a named constant for return value of [dayofweek](#fun_dayofweek) function and value of [dayofweek](#var_dayofweek) variable.', None),
+    "dayofweek.saturday": ('const int', 'Is a named constant for return value of [dayofweek](#fun_dayofweek) function and value of [dayofweek](#var_dayofweek) variable.', None),
+    "dayofweek.sunday": ('const int', 'Is a named constant for return value of [dayofweek](#fun_dayofweek) function and value of [dayofweek](#var_dayofweek) variable.', None),
+    "dayofweek.thursday": ('const int', 'Is a named constant for return value of [dayofweek](#fun_dayofweek) function and value of [dayofweek](#var_dayofweek) variable.', None),
+    "dayofweek.tuesday": ('const int', 'Is a named constant for return value of [dayofweek](#fun_dayofweek) function and value of [dayofweek](#var_dayofweek) variable.', None),
+    "dayofweek.wednesday": ('const int', 'Is a named constant for return value of [dayofweek](#fun_dayofweek) function and value of [dayofweek](#var_dayofweek) variable.', None),
+    "display.all": ('const plot_simple_display', 'A named constant for use with the `display` parameter of `plot*()` and `input*()` functions.  ', None),
+    "display.data_window": ('const plot_display', 'A named constant for use with the `display` parameter of `plot*()` and `input*()` functions.  ', None),
+    "display.none": ('const plot_simple_display', 'A named constant for use with the `display` parameter of `plot*()` and `input*()` functions. `plot*()` functions using this will not display their plotted values anywhere.  ', None),
+    "display.pane": ('const plot_display', 'A named constant for use with the `display` parameter of `plot*()` functions. Displays plotted values in the chart pane used by the script.', None),
+    "display.price_scale": ('const plot_display', 'A named constant for use with the `display` parameter of `plot*()` functions. Displays the plot’s label and value on the price scale if the chart\\`s settings allow it.', None),
+    "display.status_line": ('const plot_display', 'A named constant for use with the `display` parameter of `plot*()` and `input*()` functions.  ', None),
+    "dividends.future_amount": ('series float', "Returns the payment amount of the upcoming dividend in the currency of the current instrument, or [na](#var_na) if this data isn't available.", None),
+    "dividends.future_ex_date": ('series int', "Returns the Ex-dividend date (Ex-date) of the current instrument's next dividend payment, or [na](#var_na) if this data isn't available. Ex-dividend date signifies when investors are no longer entitle", None),
+    "dividends.future_pay_date": ('series int', "Returns the Payment date (Pay date) of the current instrument's next dividend payment, or [na](#var_na) if this data isn't available. Payment date signifies the day when eligible investors will receiv", None),
+    "dividends.gross": ('const string', 'A named constant for the [request.dividends](#fun_request.dividends) function.  ', None),
+    "dividends.net": ('const string', 'A named constant for the [request.dividends](#fun_request.dividends) function.  ', None),
+    "earnings.actual": ('const string', 'A named constant for the [request.earnings](#fun_request.earnings) function.  ', None),
+    "earnings.estimate": ('const string', 'A named constant for the [request.earnings](#fun_request.earnings) function.  ', None),
+    "earnings.future_eps": ('series float', "Returns the estimated Earnings per Share of the next earnings report in the currency of the instrument, or [na](#var_na) if this data isn't available.", None),
+    "earnings.future_period_end_time": ('series float', "Checks the data for the next earnings report and returns the UNIX timestamp of the day when the financial period covered by those earnings ends, or [na](#var_na) if this data isn't available.", None),
+    "earnings.future_revenue": ('series float', "Returns the estimated Revenue of the next earnings report in the currency of the instrument, or [na](#var_na) if this data isn't available.", None),
+    "earnings.future_time": ('series float', "Returns a UNIX timestamp indicating the expected time of the next earnings report, or [na](#var_na) if this data isn't available.", None),
+    "earnings.standardized": ('const string', 'A named constant for the [request.earnings](#fun_request.earnings) function.  ', None),
+    "extend.both": ('const string', 'A named constant for [line.new](#fun_line.new) and [line.set_extend](#fun_line.set_extend) functions.', None),
+    "extend.left": ('const string', 'A named constant for [line.new](#fun_line.new) and [line.set_extend](#fun_line.set_extend) functions.', None),
+    "extend.none": ('const string', 'A named constant for [line.new](#fun_line.new) and [line.set_extend](#fun_line.set_extend) functions.', None),
+    "extend.right": ('const string', 'A named constant for [line.new](#fun_line.new) and [line.set_extend](#fun_line.set_extend) functions.', None),
+    "font.family_default": ('const string', 'Default text font for [box.new](#fun_box.new), [box.set_text_font_family](#fun_box.set_text_font_family), [label.new](#fun_label.new), [label.set_text_font_family](#fun_label.set_text_font_family), [t', None),
+    "font.family_monospace": ('const string', 'Monospace text font for [box.new](#fun_box.new), [box.set_text_font_family](#fun_box.set_text_font_family), [label.new](#fun_label.new), [label.set_text_font_family](#fun_label.set_text_font_family), ', None),
+    "format.inherit": ('const string', 'Is a named constant for selecting the formatting of the script output values from the parent series in the [indicator](#fun_indicator) function.', None),
+    "format.mintick": ('const string', 'Is a named constant to use with the [str.tostring](#fun_str.tostring) function.  ', None),
+    "format.percent": ('const string', 'Is a named constant for selecting the formatting of the script output values as a percentage in the indicator function. It adds a percent sign after values.', None),
+    "format.price": ('const string', 'Is a named constant for selecting the formatting of the script output values as prices in the [indicator](#fun_indicator) function.', None),
+    "format.volume": ('const string', "Is a named constant for selecting the formatting of the script output values as volume in the [indicator](#fun_indicator) function, e.g. '5183' will be formatted as '5.183K'.", None),
+    "high": ('series float', 'Current high price.', None),
+    "hl2": ('series float', 'Is a shortcut for (high + low)/2', None),
+    "hlc3": ('series float', 'Is a shortcut for (high + low + close)/3', None),
+    "hlcc4": ('series float', 'Is a shortcut for (high + low + close + close)/4', None),
+    "hline.style_dashed": ('const hline_style', 'Is a named constant for dashed linestyle of [hline](#fun_hline) function.', None),
+    "hline.style_dotted": ('const hline_style', 'Is a named constant for dotted linestyle of [hline](#fun_hline) function.', None),
+    "hline.style_solid": ('const hline_style', 'Is a named constant for solid linestyle of [hline](#fun_hline) function.', None),
+    "hour": ('series int', 'Current bar hour in exchange timezone.', None),
+    "label.all": ('label[]', 'Returns an array filled with all the current labels drawn by the script.', None),
+    "label.style_arrowdown": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_arrowup": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_circle": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_cross": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_diamond": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_flag": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_center": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_down": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_left": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_lower_left": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_lower_right": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_right": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_up": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_upper_left": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_label_upper_right": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_none": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_square": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_text_outline": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_triangledown": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_triangleup": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "label.style_xcross": ('const string', 'Label style for [label.new](#fun_label.new) and [label.set_style](#fun_label.set_style) functions.', None),
+    "last_bar_index": ('series int', 'Bar index of the last chart bar. Bar indices begin at zero on the first bar.', None),
+    "last_bar_time": ('series int', 'Time in UNIX format of the last chart bar. It is the number of milliseconds that have elapsed since 00:00:00 UTC, 1 January 1970.', None),
+    "line.all": ('line[]', 'Returns an array filled with all the current lines drawn by the script.', None),
+    "line.style_arrow_both": ('const string', 'Line style for [line.new](#fun_line.new) and [line.set_style](#fun_line.set_style) functions.  ', None),
+    "line.style_arrow_left": ('const string', 'Line style for [line.new](#fun_line.new) and [line.set_style](#fun_line.set_style) functions.  ', None),
+    "line.style_arrow_right": ('const string', 'Line style for [line.new](#fun_line.new) and [line.set_style](#fun_line.set_style) functions.  ', None),
+    "line.style_dashed": ('const string', 'Line style for [line.new](#fun_line.new) and [line.set_style](#fun_line.set_style) functions.', None),
+    "line.style_dotted": ('const string', 'Line style for [line.new](#fun_line.new) and [line.set_style](#fun_line.set_style) functions.', None),
+    "line.style_solid": ('const string', 'Line style for [line.new](#fun_line.new) and [line.set_style](#fun_line.set_style) functions.', None),
+    "linefill.all": ('linefill[]', 'Returns an array filled with all the current linefill objects drawn by the script.', None),
+    "location.abovebar": ('const string', 'Location value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "location.absolute": ('const string', 'Location value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "location.belowbar": ('const string', 'Location value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "location.bottom": ('const string', 'Location value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "location.top": ('const string', 'Location value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "low": ('series float', 'Current low price.', None),
+    "math.e": ('const float', 'Is a named constant for [Euler\\`s number](https://en.wikipedia.org/wiki/E_(mathematical_constant)).  ', None),
+    "math.phi": ('const float', 'Is a named constant for the [golden ratio](https://en.wikipedia.org/wiki/Golden_ratio).  ', None),
+    "math.pi": ('const float', "Is a named constant for [Archimedes' constant](https://en.wikipedia.org/wiki/Pi).  ", None),
+    "math.rphi": ('const float', 'Is a named constant for the [golden ratio conjugate](https://en.wikipedia.org/wiki/Golden_ratio#Golden_ratio_conjugate).  ', None),
+    "minute": ('series int', 'Current bar minute in exchange timezone.', None),
+    "month": ('series int', 'Current bar month in exchange timezone.', None),
+    "na": ('null', 'A keyword signifying "not available", indicating that a variable has no assigned value.', None),
+    "ohlc4": ('series float', 'Is a shortcut for (open + high + low + close)/4', None),
+    "open": ('series float', 'Current open price.', None),
+    "order.ascending": ('const sort_order', 'Determines the sort order of the array from the smallest to the largest value.', None),
+    "order.descending": ('const sort_order', 'Determines the sort order of the array from the largest to the smallest value.', None),
+    "plot.style_area": ('const plot_style', "A named constant for the 'Area' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.", None),
+    "plot.style_areabr": ('const plot_style', "A named constant for the 'Area With Breaks' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.  ", None),
+    "plot.style_circles": ('const plot_style', "A named constant for the 'Circles' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.", None),
+    "plot.style_columns": ('const plot_style', "A named constant for the 'Columns' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.", None),
+    "plot.style_cross": ('const plot_style', "A named constant for the 'Cross' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.", None),
+    "plot.style_histogram": ('const plot_style', "A named constant for the 'Histogram' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.", None),
+    "plot.style_line": ('const plot_style', "A named constant for the 'Line' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.", None),
+    "plot.style_linebr": ('const plot_style', "A named constant for the 'Line With Breaks' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.  ", None),
+    "plot.style_stepline": ('const plot_style', "A named constant for the 'Step Line' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.", None),
+    "plot.style_stepline_diamond": ('const plot_style', "A named constant for the 'Step Line With Diamonds' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.  ", None),
+    "plot.style_steplinebr": ('const plot_style', "A named constant for the 'Step line with Breaks' style, to be used as an argument for the `style` parameter in the [plot](#fun_plot) function.", None),
+    "polyline.all": ('polyline[]', 'Returns an array containing all current [polyline](#op_polyline) instances drawn by the script.', None),
+    "position.bottom_center": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "position.bottom_left": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "position.bottom_right": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "position.middle_center": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "position.middle_left": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "position.middle_right": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "position.top_center": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "position.top_left": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "position.top_right": ('const string', 'Table position is used in [table.new](#fun_table.new), [table.cell](#fun_table.cell) functions.', None),
+    "scale.left": ('const scale_type', 'Scale value for [indicator](#fun_indicator) function.  ', None),
+    "scale.none": ('const scale_type', 'Scale value for [indicator](#fun_indicator) function.  ', None),
+    "scale.right": ('const scale_type', 'Scale value for [indicator](#fun_indicator) function.  ', None),
+    "second": ('series int', 'Current bar second in exchange timezone.', None),
+    "session.extended": ('const string', 'Constant for extended session type (with extended hours data).', None),
+    "session.isfirstbar": ('series bool', 'Returns [true](#op_true) if the current bar is the first bar of the day\\`s session, `false` otherwise.  ', None),
+    "session.isfirstbar_regular": ('series bool', 'Returns [true](#op_true) on the first regular session bar of the day, `false` otherwise.  ', None),
+    "session.islastbar": ('series bool', 'Returns [true](#op_true) if the current bar is the last bar of the day\\`s session, `false` otherwise.  ', None),
+    "session.islastbar_regular": ('series bool', 'Returns [true](#op_true) on the last regular session bar of the day, `false` otherwise.  ', None),
+    "session.ismarket": ('series bool', 'Returns true if the current bar is a part of the regular trading hours (i.e. market hours), false otherwise', None),
+    "session.ispostmarket": ('series bool', 'Returns true if the current bar is a part of the post-market, false otherwise. On non-intraday charts always returns false.', None),
+    "session.ispremarket": ('series bool', 'Returns true if the current bar is a part of the pre-market, false otherwise. On non-intraday charts always returns false.', None),
+    "session.regular": ('const string', 'Constant for regular session type (no extended hours data).', None),
+    "shape.arrowdown": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.arrowup": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.circle": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.cross": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.diamond": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.flag": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.labeldown": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.labelup": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.square": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.triangledown": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.triangleup": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "shape.xcross": ('const string', 'Shape style for [plotshape](#fun_plotshape) function.', None),
+    "size.auto": ('const string', 'Size value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "size.huge": ('const string', 'Size value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "size.large": ('const string', 'Size value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "size.normal": ('const string', 'Size value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "size.small": ('const string', 'Size value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "size.tiny": ('const string', 'Size value for [plotshape](#fun_plotshape), [plotchar](#fun_plotchar) functions.  ', None),
+    "splits.denominator": ('const string', 'A named constant for the [request.splits](#fun_request.splits) function.  ', None),
+    "splits.numerator": ('const string', 'A named constant for the [request.splits](#fun_request.splits) function.  ', None),
+    "strategy.account_currency": ('simple string', 'Returns the currency used to calculate results, which can be set in the strategy\\`s properties.', None),
+    "strategy.cash": ('const string', 'This is one of the arguments that can be supplied to the `default_qty_type` parameter in the [strategy](#fun_strategy) declaration statement.  ', None),
+    "strategy.closedtrades": ('series int', 'Number of trades, which were closed for the whole trading interval.', None),
+    "strategy.commission.cash_per_contract": ('const string', 'Commission type for an order. Money displayed in the account currency per contract.', None),
+    "strategy.commission.cash_per_order": ('const string', 'Commission type for an order. Money displayed in the account currency per order.', None),
+    "strategy.commission.percent": ('const string', 'Commission type for an order. A percentage of the cash volume of order.', None),
+    "strategy.direction.all": ('const string', 'It allows strategy to open both long and short positions.', None),
+    "strategy.direction.long": ('const string', 'It allows strategy to open only long positions.', None),
+    "strategy.direction.short": ('const string', 'It allows strategy to open only short positions.', None),
+    "strategy.equity": ('series float', 'Current equity ([strategy.initial_capital](#var_strategy.initial_capital) + [strategy.netprofit](#var_strategy.netprofit) + [strategy.openprofit](#var_strategy.openprofit)).', None),
+    "strategy.eventrades": ('series int', 'Number of breakeven trades for the whole trading interval.', None),
+    "strategy.fixed": ('const string', 'This is one of the arguments that can be supplied to the `default_qty_type` parameter in the [strategy](#fun_strategy) declaration statement.  ', None),
+    "strategy.grossloss": ('series float', 'Total currency value of all completed losing trades.', None),
+    "strategy.grossloss_percent": ('series float', 'The total value of all completed losing trades, expressed as a percentage of the initial capital.', None),
+    "strategy.grossprofit": ('series float', 'Total currency value of all completed winning trades.', None),
+    "strategy.grossprofit_percent": ('series float', 'The total currency value of all completed winning trades, expressed as a percentage of the initial capital.', None),
+    "strategy.initial_capital": ('series float', 'The amount of initial capital set in the strategy properties.', None),
+    "strategy.long": ('const strategy_direction', 'Long position entry.', None),
+    "strategy.losstrades": ('series int', 'Number of unprofitable trades for the whole trading interval.', None),
+    "strategy.margin_liquidation_price": ('series float', 'When margin is used in a strategy, returns the price point where a simulated margin call will occur and liquidate enough of the position to meet the margin requirements.', None),
+    "strategy.max_contracts_held_all": ('series float', 'Maximum number of contracts/shares/lots/units in one trade for the whole trading interval.', None),
+    "strategy.max_contracts_held_long": ('series float', 'Maximum number of contracts/shares/lots/units in one long trade for the whole trading interval.', None),
+    "strategy.max_contracts_held_short": ('series float', 'Maximum number of contracts/shares/lots/units in one short trade for the whole trading interval.', None),
+    "strategy.max_drawdown": ('series float', 'Maximum equity drawdown value for the whole trading interval.', None),
+    "strategy.max_drawdown_percent": ('series float', 'The maximum equity drawdown value for the whole trading interval, expressed as a percentage and calculated by formula: `Lowest Value During Trade / (Entry Price x Quantity) * 100`.', None),
+    "strategy.max_runup": ('series float', 'Maximum equity run-up value for the whole trading interval.', None),
+    "strategy.max_runup_percent": ('series float', 'The maximum equity run-up value for the whole trading interval, expressed as a percentage and calculated by formula: `Highest Value During Trade / (Entry Price x Quantity) * 100`.', None),
+    "strategy.netprofit": ('series float', 'Total currency value of all completed trades.', None),
+    "strategy.netprofit_percent": ('series float', 'The total value of all completed trades, expressed as a percentage of the initial capital.', None),
+    "strategy.oca.cancel": ('const string', 'OCA type value for strategy\\`s functions. The parameter determines that an order should belong to an OCO group, where as soon as an order is filled, all other orders of the same group are cancelled. N', None),
+    "strategy.oca.none": ('const string', 'OCA type value for strategy\\`s functions. The parameter determines that an order should not belong to any particular OCO group.', None),
+    "strategy.oca.reduce": ('const string', 'OCA type value for strategy\\`s functions. The parameter determines that an order should belong to an OCO group, where if X number of contracts of an order is filled, number of contracts for each other', None),
+    "strategy.openprofit": ('series float', 'Current unrealized profit or loss for all open positions.', None),
+    "strategy.openprofit_percent": ('series float', 'The current unrealized profit or loss for all open positions, expressed as a percentage and calculated by formula: `openPL / realizedEquity * 100`.', None),
+    "strategy.opentrades": ('series int', 'Number of market position entries, which were not closed and remain opened. If there is no open market position, 0 is returned.', None),
+    "strategy.percent_of_equity": ('const string', 'This is one of the arguments that can be supplied to the `default_qty_type` parameter in the [strategy](#fun_strategy) declaration statement.  ', None),
+    "strategy.position_avg_price": ('series float', "Average entry price of current market position. If the market position is flat, 'NaN' is returned.", None),
+    "strategy.position_entry_name": ('series string', 'Name of the order that initially opened current market position.', None),
+    "strategy.position_size": ('series float', 'Direction and size of the current market position. If the value is > 0, the market position is long. If the value is < 0, the market position is short. The absolute value is the number of contracts/sh', None),
+    "strategy.short": ('const strategy_direction', 'Short position entry.', None),
+    "strategy.wintrades": ('series int', 'Number of profitable trades for the whole trading interval.', None),
+    "syminfo.basecurrency": ('simple string', "Base currency for the symbol. For the symbol 'BTCUSD' returns 'BTC'.", None),
+    "syminfo.country": ('simple string', 'Returns the two-letter code of the country where the symbol is traded, in the [ISO 3166-1 alpha-2](https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2) format, or [na](#var_na) if the exchange is not dir', None),
+    "syminfo.currency": ('simple string', "Currency for the current symbol. Returns currency code: 'USD', 'EUR', etc.", None),
+    "syminfo.current_contract": ('series string', 'Current contract.', '6'),
+    "syminfo.description": ('simple string', 'Description for the current symbol.', None),
+    "syminfo.employees": ('simple int', 'The number of employees the company has.', None),
+    "syminfo.expiration_date": ('series int', 'Expiration date.', '6'),
+    "syminfo.industry": ('simple string', 'Returns the industry of the symbol, or [na](#var_na) if the symbol has no industry.  ', None),
+    "syminfo.main_tickerid": ('simple string', 'Main ticker ID.', '6'),
+    "syminfo.mincontract": ('simple float', 'Min contract.', '6'),
+    "syminfo.minmove": ('simple int', 'Returns a whole number used to calculate the smallest increment between a symbol\\`s price movements ([syminfo.mintick](#var_syminfo.mintick)).  ', None),
+    "syminfo.mintick": ('simple float', 'Min tick value for the current symbol.', None),
+    "syminfo.pointvalue": ('simple float', 'Point value for the current symbol.', None),
+    "syminfo.prefix": ('simple string', "Prefix of current symbol name (i.e. for 'CME_EOD:TICKER' prefix is 'CME_EOD').", None),
+    "syminfo.pricescale": ('simple int', 'Returns a whole number used to calculate the smallest increment between a symbol\\`s price movements ([syminfo.mintick](#var_syminfo.mintick)).  ', None),
+    "syminfo.recommendations_buy": ('series int', 'The number of analysts who gave the current symbol a "Buy" rating.', None),
+    "syminfo.recommendations_buy_strong": ('series int', 'The number of analysts who gave the current symbol a "Strong Buy" rating.', None),
+    "syminfo.recommendations_date": ('series int', 'The starting date of the last set of recommendations for the current symbol.', None),
+    "syminfo.recommendations_hold": ('series int', 'The number of analysts who gave the current symbol a "Hold" rating.', None),
+    "syminfo.recommendations_sell": ('series int', 'The number of analysts who gave the current symbol a "Sell" rating.', None),
+    "syminfo.recommendations_sell_strong": ('series int', 'The number of analysts who gave the current symbol a "Strong Sell" rating.', None),
+    "syminfo.recommendations_total": ('series int', 'The total number of recommendations for the current symbol.', None),
+    "syminfo.root": ('simple string', 'Root for derivatives like futures contract. For other symbols returns the same value as [syminfo.ticker](#var_syminfo.ticker).', None),
+    "syminfo.sector": ('simple string', 'Returns the sector of the symbol, or [na](#var_na) if the symbol has no sector.  ', None),
+    "syminfo.session": ('simple string', 'Session type of the chart main series. Possible values are [session.regular](#const_session.regular), [session.extended](#const_session.extended).', None),
+    "syminfo.shareholders": ('simple int', 'The number of shareholders the company has.', None),
+    "syminfo.shares_outstanding_float": ('simple float', 'The total number of shares outstanding a company has available, excluding any of its restricted shares.', None),
+    "syminfo.shares_outstanding_total": ('simple int', 'The total number of shares outstanding a company has available, including restricted shares held by insiders, major shareholders, and employees.', None),
+    "syminfo.target_price_average": ('series float', 'The average of the last yearly price targets for the symbol predicted by analysts.', None),
+    "syminfo.target_price_date": ('series int', 'The starting date of the last price target prediction for the current symbol.', None),
+    "syminfo.target_price_estimates": ('series float', 'The latest total number of price target predictions for the current symbol.', None),
+    "syminfo.target_price_high": ('series float', 'The last highest yearly price target for the symbol predicted by analysts.', None),
+    "syminfo.target_price_low": ('series float', 'The last lowest yearly price target for the symbol predicted by analysts.', None),
+    "syminfo.target_price_median": ('series float', 'The median of the last yearly price targets for the symbol predicted by analysts.', None),
+    "syminfo.ticker": ('simple string', "Symbol name without exchange prefix, e.g. 'MSFT'.", None),
+    "syminfo.tickerid": ('simple string', 'Returns the full form of the ticker ID representing a symbol, for use as an argument in functions with a `ticker` or `symbol` parameter.  ', None),
+    "syminfo.timezone": ('simple string', 'Timezone of the exchange of the chart main series. Possible values see in [timestamp](#fun_timestamp).', None),
+    "syminfo.type": ('simple string', 'Type of the current symbol. Possible values are stock, futures, index, forex, crypto, fund, dr.', None),
+    "syminfo.volumetype": ('simple string', 'Volume type of the current symbol. Possible values are: "base" for base currency, "quote" for quote currency, "tick" for the number of transactions, and "n/a" when there is no volume or its type is no', None),
+    "ta.accdist": ('series float', 'Accumulation/distribution index.', None),
+    "ta.iii": ('series float', 'Intraday Intensity Index.', None),
+    "ta.nvi": ('series float', 'Negative Volume Index.', None),
+    "ta.obv": ('series float', 'On Balance Volume.', None),
+    "ta.pvi": ('series float', 'Positive Volume Index.', None),
+    "ta.pvt": ('series float', 'Price-Volume Trend.', None),
+    "ta.tr": ('series float', 'True range. Same as tr(false). It is max(high - low, abs(high - close[1]), abs(low - close[1]))', None),
+    "ta.vwap": ('series float', 'Volume Weighted Average Price. It uses [hlc3](#var_hlc3) as its source series.', None),
+    "ta.wad": ('series float', 'Williams Accumulation/Distribution.', None),
+    "ta.wvad": ('series float', 'Williams Variable Accumulation/Distribution.', None),
+    "table.all": ('table[]', 'Returns an array filled with all the current tables drawn by the script.', None),
+    "text.align_bottom": ('const string', 'Vertical text alignment for [box.new](#fun_box.new), [box.set_text_valign](#fun_box.set_text_valign), [table.cell](#fun_table.cell) and [table.cell_set_text_valign](#fun_table.cell_set_text_valign) fu', None),
+    "text.align_center": ('const string', 'Text alignment for [box.new](#fun_box.new), [box.set_text_halign](#fun_box.set_text_halign), [box.set_text_valign](#fun_box.set_text_valign), [label.new](#fun_label.new) and [label.set_textalign](#fun', None),
+    "text.align_left": ('const string', 'Horizontal text alignment for [box.new](#fun_box.new), [box.set_text_halign](#fun_box.set_text_halign), [label.new](#fun_label.new) and [label.set_textalign](#fun_label.set_textalign) functions.', None),
+    "text.align_right": ('const string', 'Horizontal text alignment for [box.new](#fun_box.new), [box.set_text_halign](#fun_box.set_text_halign), [label.new](#fun_label.new) and [label.set_textalign](#fun_label.set_textalign) functions.', None),
+    "text.align_top": ('const string', 'Vertical text alignment for [box.new](#fun_box.new), [box.set_text_valign](#fun_box.set_text_valign), [table.cell](#fun_table.cell) and [table.cell_set_text_valign](#fun_table.cell_set_text_valign) fu', None),
+    "text.format_bold": ('const string', 'Bold format.', '6'),
+    "text.format_italic": ('const string', 'Italic format.', '6'),
+    "text.format_none": ('const string', 'No format.', '6'),
+    "text.wrap_auto": ('const string', 'Automatic wrapping mode for [box.new](#fun_box.new) and [box.set_text_wrap](#fun_box.set_text_wrap) functions.', None),
+    "text.wrap_none": ('const string', 'Disabled wrapping mode for [box.new](#fun_box.new) and [box.set_text_wrap](#fun_box.set_text_wrap) functions.', None),
+    "time": ('series int', 'Current bar time in UNIX format. It is the number of milliseconds that have elapsed since 00:00:00 UTC, 1 January 1970.', None),
+    "time_close": ('series int', 'The time of the current bar\\`s close in UNIX format. It represents the number of milliseconds elapsed since 00:00:00 UTC, 1 January 1970.  ', None),
+    "time_tradingday": ('series int', 'The beginning time of the trading day the current bar belongs to, in UNIX format (the number of milliseconds that have elapsed since 00:00:00 UTC, 1 January 1970).', None),
+    "timeframe.isdaily": ('simple bool', 'Returns true if current resolution is a daily resolution, false otherwise.', None),
+    "timeframe.isdwm": ('simple bool', 'Returns true if current resolution is a daily or weekly or monthly resolution, false otherwise.', None),
+    "timeframe.isintraday": ('simple bool', 'Returns true if current resolution is an intraday (minutes or seconds) resolution, false otherwise.', None),
+    "timeframe.isminutes": ('simple bool', 'Returns true if current resolution is a minutes resolution, false otherwise.', None),
+    "timeframe.ismonthly": ('simple bool', 'Returns true if current resolution is a monthly resolution, false otherwise.', None),
+    "timeframe.isseconds": ('simple bool', 'Returns true if current resolution is a seconds resolution, false otherwise.', None),
+    "timeframe.isticks": ('simple bool', 'Is ticks.', '6'),
+    "timeframe.isweekly": ('simple bool', 'Returns true if current resolution is a weekly resolution, false otherwise.', None),
+    "timeframe.main_period": ('simple string', 'Main period.', '6'),
+    "timeframe.multiplier": ('simple int', "Multiplier of resolution, e.g. '60' - 60, 'D' - 1, '5D' - 5, '12M' - 12.", None),
+    "timeframe.period": ('simple string', 'A string representation of the chart\\`s timeframe. The returned string\\`s format is "[<quantity>][<units>]", where <quantity> and <units> are in some cases absent. <quantity> is the number of units, b', None),
+    "timenow": ('series int', 'Current time in UNIX format. It is the number of milliseconds that have elapsed since 00:00:00 UTC, 1 January 1970.', None),
+    "volume": ('series float', 'Current bar volume.', None),
+    "weekofyear": ('series int', 'Week number of current bar time in exchange timezone.', None),
+    "xloc.bar_index": ('const string', 'A named constant that specifies the algorithm of interpretation of x-value in functions [line.new](#fun_line.new) and [label.new](#fun_label.new).  ', None),
+    "xloc.bar_time": ('const string', 'A named constant that specifies the algorithm of interpretation of x-value in functions [line.new](#fun_line.new) and [label.new](#fun_label.new).  ', None),
+    "year": ('series int', 'Current bar year in exchange timezone.', None),
+    "yloc.abovebar": ('const string', 'A named constant that specifies the algorithm of interpretation of y-value in function [label.new](#fun_label.new).', None),
+    "yloc.belowbar": ('const string', 'A named constant that specifies the algorithm of interpretation of y-value in function [label.new](#fun_label.new).', None),
+    "yloc.price": ('const string', 'A named constant that specifies the algorithm of interpretation of y-value in function [label.new](#fun_label.new).', None),
+}
@@ -1,8 +1,6 @@
 import streamlit as st
 import traceback
-from pinelint.lexer import Lexer, LexerError, TokenType
-from pinelint.parser import Parser, ParseError
-from pinelint.rules import RuleRunner
+from pinelint.incremental import Document
 from pinelint.diagnostics import Severity
 
 st.set_page_config(page_title="PineLint", layout="wide", page_icon="🌲")
@@ -32,22 +30,21 @@ with col2:
         else:
             with st.spinner("Analyzing..."):
                 try:
-                    lexer = Lexer(code)
-                    tokens = lexer.tokenize()
-                    
-                    parser = Parser(tokens)
-                    ast = parser.parse()
-                    
-                    # Parser Errors
-                    if parser.errors:
-                        st.error(f"Found {len(parser.errors)} syntax error(s).")
-                        for e in parser.errors:
+                    # Kept across reruns so unchanged statements are not re-analyzed
+                    if "document" not in st.session_state:
+                        st.session_state.document = Document(file_path="editor.pine")
+                    document = st.session_state.document
+                    document.set_text(code)
+                    diagnostics = document.diagnostics()
+                    syntax_errors = [d for d in diagnostics if d.code in ("E001", "E002")]
+
+                    # Lexer / Parser Errors
+                    if syntax_errors:
+                        st.error(f"Found {len(syntax_errors)} syntax error(s).")
+                        for e in syntax_errors:
                             with st.expander(f"Line {e.line}: Syntax Error", expanded=True):
-                                st.write(f"**Error**: {e}")
+                                st.write(f"**Error**: {e.message}")
                     else:
-                        runner = RuleRunner()
-                        diagnostics = runner.run(code, ast, "editor.pine")
-                        
                         # Filtering
                         filtered_diags = []
                         for d in diagnostics:
@@ -62,16 +59,8 @@ with col2:
                         st.markdown("#### Statistics")
                         cols = st.columns(2)
                         cols[0].metric("Lines of Code", len(code.splitlines()))
-                        # Function count approx
-                        func_count = 0
-                        # Check AST for FunctionDef if possible, or tokens
-                        # AST root is list of statements.
-                        if isinstance(ast, list):
-                             # Recursive count?
-                             pass
-                        
-                        cols[1].metric("Tokens", len(tokens))
-                        
+                        cols[1].metric("Statements", len(document.statements))
+
                         st.markdown("---")
                         
                         if errors:
@@ -89,8 +78,6 @@ with col2:
                         if not errors and not warnings:
                             st.success("✅ Clean Code! No issues found.")
                             
-                except LexerError as e:
-                    st.error(f"Lexer Error: {e}")
                 except Exception as e:
                     st.error(f"Internal Error: {e}")
                     st.text(traceback.format_exc())
@@ -0,0 +1,497 @@
+"""
+Flat AST Arena.
+
+An Arena stores whole syntax trees in a few parallel arrays instead of one
+object per node, for bulk analysis of large files:
+
+    kinds        class code of each node (index into NODE_CLASSES)
+    lines        line of each node
+    columns      column of each node
+    ends         index one past the last node of each node's subtree
+    first_slots  index of each node's first slot
+    slots        the fields of each node after line and column, in
+                 dataclass order: a value index for plain fields, a node
+                 index (or NONE) for node fields, and (first item, count)
+                 for node lists
+    items        node indices of list elements; switch cases take two
+                 items, the case expression (or NONE) and the block
+    roots        node indices of the top-level statements
+
+Nodes are numbered in pre-order, so the subtree of node i is the index
+range [i, ends[i]), and scans such as "every FunctionCall name" are loops
+over `kinds` and `slots` that never touch a node object. Plain field
+values (names, operators, literal values) are stored once in `values`.
+
+`view()` gives a NodeView, which reads fields from the arrays on access;
+`node()` and `statements()` rebuild the usual ast_nodes objects, equal to
+the ones the arena was built from.
+
+`to_bytes()` serializes an arena and `Arena.from_buffer()` reads it back.
+The arrays are then memoryviews over the buffer, so an mmap of a
+serialized arena is shared between processes without copying. Layout
+(little endian): a header with magic, format version and (offset, count)
+per section, followed by the sections above plus the value table (a tag
+and a UTF-8 text span per value), each aligned to 4 bytes.
+"""
+
+import struct
+import sys
+from array import array
+from dataclasses import fields
+from itertools import compress
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .ast_nodes import (
+    ASTNode,
+    ArrayAccess,
+    ArrayLiteral,
+    Assignment,
+    BinaryOp,
+    Block,
+    CallArgument,
+    ExpressionStatement,
+    ForStatement,
+    FunctionCall,
+    FunctionDef,
+    Identifier,
+    IfStatement,
+    ImportDecl,
+    Literal,
+    ParamDef,
+    ScriptDecl,
+    SwitchStatement,
+    TernaryOp,
+    TypeDef,
+    UnaryOp,
+    VarDecl,
+    VersionDecl,
+    WhileStatement,
+)
+
+MAGIC = b"PINEAST\0"
+# Bump when the layout or NODE_CLASSES changes; older buffers are rejected.
+FORMAT_VERSION = 1
+
+NONE = 0xFFFFFFFF
+
+# Field shapes: a plain value, a node (or None), a list of nodes, and the
+# (case expression or None, block) pairs of a switch
+VALUE, NODE, NODES, CASES = range(4)
+
+# Shapes of the fields after line and column, in dataclass order
+_SHAPES: Dict[type, Tuple[int, ...]] = {
+    Literal: (VALUE, VALUE),
+    Identifier: (VALUE,),
+    BinaryOp: (NODE, VALUE, NODE),
+    UnaryOp: (VALUE, NODE),
+    CallArgument: (NODE, VALUE),
+    FunctionCall: (VALUE, NODES),
+    TernaryOp: (NODE, NODE, NODE),
+    ArrayAccess: (NODE, NODES),
+    ArrayLiteral: (NODES,),
+    Block: (NODES,),
+    VersionDecl: (VALUE,),
+    ScriptDecl: (VALUE, NODES),
+    VarDecl: (VALUE, NODE, VALUE, VALUE, VALUE),
+    Assignment: (VALUE, NODE),
+    IfStatement: (NODE, NODE, NODE),
+    ForStatement: (VALUE, NODE, NODE, NODE, NODE),
+    WhileStatement: (NODE, NODE),
+    SwitchStatement: (NODE, CASES),
+    ParamDef: (VALUE, VALUE, NODE),
+    FunctionDef: (VALUE, NODES, NODE, VALUE, VALUE, VALUE),
+    TypeDef: (VALUE, NODES, VALUE),
+    ImportDecl: (VALUE, VALUE),
+    ExpressionStatement: (NODE,),
+}
+
+# Class codes are indices into this tuple
+NODE_CLASSES: Tuple[type, ...] = tuple(_SHAPES)
+_CODES = {cls: code for code, cls in enumerate(NODE_CLASSES)}
+
+# (field name, shape, slot offset) of each class, by class code
+_FIELDS: List[Tuple[Tuple[str, int, int], ...]] = []
+for _cls, _shapes in _SHAPES.items():
+    _names = [f.name for f in fields(_cls)][2:]
+    assert len(_names) == len(_shapes), _cls
+    _offsets = [0]
+    for _shape in _shapes:
+        _offsets.append(_offsets[-1] + (1 if _shape <= NODE else 2))
+    _FIELDS.append(tuple(zip(_names, _shapes, _offsets)))
+
+# Sections of a serialized arena, in header order, with their array types
+_SECTIONS = (
+    ("kinds", "B"),
+    ("lines", "I"),
+    ("columns", "I"),
+    ("ends", "I"),
+    ("first_slots", "I"),
+    ("slots", "I"),
+    ("items", "I"),
+    ("roots", "I"),
+    ("value_tags", "B"),
+    ("value_spans", "I"),
+    ("value_data", "B"),
+)
+_HEADER = struct.Struct("<8sHH" + "II" * len(_SECTIONS))
+
+# Value tags, and how to rebuild a value from its text
+_VALUE_TYPES = (type(None), bool, int, float, str)
+_VALUE_DECODERS = (lambda text: None, bool, int, float, str)
+
+Buffer = Union[bytes, bytearray, memoryview, Any]
+
+
+class ArenaError(Exception):
+    """The buffer is not a serialized arena, or is truncated or corrupt."""
+
+# What decoding corrupt arrays can raise (UnicodeDecodeError is a ValueError)
+_DECODE_ERRORS = (IndexError, KeyError, TypeError, ValueError, OverflowError)
+
+
+def _value_key(value: Any) -> Tuple[type, Any]:
+    # Values are interned by type as well, so 1, 1.0 and True stay apart;
+    # floats go by repr, so 0.0 and -0.0 do too
+    cls = value.__class__
+    return (cls, repr(value) if cls is float else value)
+
+
+class Arena:
+    """
+    Syntax trees in parallel arrays. Build one with Arena.from_tree() or
+    Arena.from_buffer().
+    """
+
+    def __init__(
+        self,
+        kinds: Sequence[int],
+        lines: Sequence[int],
+        columns: Sequence[int],
+        ends: Sequence[int],
+        first_slots: Sequence[int],
+        slots: Sequence[int],
+        items: Sequence[int],
+        roots: Sequence[int],
+        values: List[Any],
+    ):
+        self.kinds = kinds
+        self.lines = lines
+        self.columns = columns
+        self.ends = ends
+        self.first_slots = first_slots
+        self.slots = slots
+        self.items = items
+        self.roots = roots
+        self.values = values
+
+    @classmethod
+    def from_tree(cls, roots: Union[ASTNode, Iterable[ASTNode]]) -> "Arena":
+        """Flattens one tree or a list of trees (a parsed script)."""
+        roots = [roots] if isinstance(roots, ASTNode) else list(roots)
+        kinds, lines, columns = array("B"), array("I"), array("I")
+        ends, first_slots = array("I"), array("I")
+        slots, items = array("I"), array("I")
+        root_indices = array("I", [0] * len(roots))
+        values: List[Any] = []
+        value_index: Dict[Tuple[type, Any], int] = {}
+
+        # (node, array, position) to store the node's index at, or
+        # (None, None, index) to close the subtree of node `index`
+        stack: List[Tuple[Any, Any, int]] = [
+            (root, root_indices, i) for i, root in reversed(list(enumerate(roots)))
+        ]
+        while stack:
+            node, target, position = stack.pop()
+            if target is None:
+                ends[position] = len(kinds)
+                continue
+            index = len(kinds)
+            target[position] = index
+            code = _CODES[node.__class__]
+            kinds.append(code)
+            lines.append(node.line)
+            columns.append(node.column)
+            ends.append(0)
+            first_slots.append(len(slots))
+            stack.append((None, None, index))
+
+            pending = []
+            for name, shape, _ in _FIELDS[code]:
+                value = getattr(node, name)
+                if shape == VALUE:
+                    key = _value_key(value)
+                    slot = value_index.get(key)
+                    if slot is None:
+                        slot = value_index[key] = len(values)
+                        values.append(value)
+                    slots.append(slot)
+                elif shape == NODE:
+                    if value is None:
+                        slots.append(NONE)
+                    else:
+                        pending.append((value, slots, len(slots)))
+                        slots.append(0)
+                else:
+                    slots.append(len(items))
+                    slots.append(len(value))
+                    for child in value if shape == NODES else (n for case in value for n in case):
+                        if child is None:
+                            items.append(NONE)
+                        else:
+                            pending.append((child, items, len(items)))
+                            items.append(0)
+            stack.extend(reversed(pending))
+
+        return cls(kinds, lines, columns, ends, first_slots, slots, items, root_indices, values)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the node arrays in bytes (the value table excluded)."""
+        return sum(
+            len(getattr(self, name)) * (1 if typecode == "B" else 4)
+            for name, typecode in _SECTIONS[:8]
+        )
+
+    def node_class(self, index: int) -> type:
+        return NODE_CLASSES[self.kinds[index]]
+
+    def subtree(self, index: int) -> range:
+        """Indices of the nodes under node `index`, itself included."""
+        return range(index, self.ends[index])
+
+    def find(self, node_class: type, within: Optional[int] = None) -> List[int]:
+        """
+        Indices of the nodes of `node_class`, in pre-order, in the whole
+        arena or in the subtree of node `within`.
+        """
+        start, end = (0, len(self.kinds)) if within is None else (within, self.ends[within])
+        return list(compress(range(start, end), map(_CODES[node_class].__eq__, self.kinds[start:end])))
+
+    def field(self, index: int, name: str) -> Any:
+        """
+        A field of node `index`: the value of plain fields, a NodeView (or
+        None) for node fields, and lists of NodeViews (or of case pairs).
+        """
+        for field_name, shape, offset in _FIELDS[self.kinds[index]]:
+            if field_name == name:
+                return self._field(self.first_slots[index] + offset, shape, self.view)
+        raise AttributeError(f"{self.node_class(index).__name__} has no field {name!r}")
+
+    def values_of(self, node_class: type, name: str) -> List[Any]:
+        """The field `name` of every node of `node_class`, in pre-order."""
+        for field_name, shape, offset in _FIELDS[_CODES[node_class]]:
+            if field_name == name:
+                break
+        else:
+            raise AttributeError(f"{node_class.__name__} has no field {name!r}")
+        indices = self.find(node_class)
+        if shape == VALUE:
+            values, slots, first_slots = self.values, self.slots, self.first_slots
+            return [values[slots[first_slots[i] + offset]] for i in indices]
+        return [self._field(self.first_slots[i] + offset, shape, self.view) for i in indices]
+
+    def shifted(self, lines: int) -> "Arena":
+        """A copy of the arena with every node moved down by `lines` lines."""
+        return Arena(
+            self.kinds,
+            array("I", [line + lines for line in self.lines]),
+            self.columns,
+            self.ends,
+            self.first_slots,
+            self.slots,
+            self.items,
+            self.roots,
+            self.values,
+        )
+
+    def view(self, index: int) -> "NodeView":
+        return NodeView(self, index)
+
+    def node(self, index: int) -> ASTNode:
+        """Rebuilds node `index` and its subtree as ast_nodes objects."""
+        return self._build(index, self.ends[index])[0]
+
+    def statements(self) -> List[ASTNode]:
+        """
+        Rebuilds the trees the arena was made from. Raises ArenaError when
+        the arrays do not describe valid trees.
+        """
+        if not self.roots:
+            return []
+        try:
+            built = self._build(0, len(self.kinds))
+            return [built[i] for i in self.roots]
+        except _DECODE_ERRORS as e:
+            raise ArenaError(f"AST arena is corrupt: {e}") from e
+
+    def _field(self, slot: int, shape: int, node: Any) -> Any:
+        slots = self.slots
+        if shape == VALUE:
+            return self.values[slots[slot]]
+        if shape == NODE:
+            index = slots[slot]
+            return None if index == NONE else node(index)
+        first, count = slots[slot], slots[slot + 1]
+        if shape == NODES:
+            return [None if i == NONE else node(i) for i in self.items[first:first + count]]
+        pairs = self.items[first:first + 2 * count]
+        return [
+            (None if expr == NONE else node(expr), node(block))
+            for expr, block in zip(pairs[::2], pairs[1::2])
+        ]
+
+    def _build(self, start: int, end: int) -> List[ASTNode]:
+        # Children come after their parent in pre-order, so building in
+        # reverse order finds every child already built
+        built: List[Any] = [None] * (end - start)
+        kinds, lines, columns, first_slots = self.kinds, self.lines, self.columns, self.first_slots
+        slots, items, values = self.slots, self.items, self.values
+        for index in range(end - 1, start - 1, -1):
+            code = kinds[index]
+            slot = first_slots[index]
+            args = [lines[index], columns[index]]
+            for _, shape, offset in _FIELDS[code]:
+                if shape == VALUE:
+                    args.append(values[slots[slot + offset]])
+                elif shape == NODE:
+                    child = slots[slot + offset]
+                    args.append(None if child == NONE else built[child - start])
+                else:
+                    first = slots[slot + offset]
+                    children = [
+                        None if i == NONE else built[i - start]
+                        for i in items[first:first + slots[slot + offset + 1] * (shape - 1)]
+                    ]
+                    # Switch cases are pairs of items
+                    args.append(children if shape == NODES else list(zip(children[::2], children[1::2])))
+            built[index - start] = NODE_CLASSES[code](*args)
+        return built
+
+    def to_bytes(self) -> bytes:
+        """Serializes the arena; see the module docstring for the layout."""
+        tags, spans, data = array("B"), array("I"), bytearray()
+        for value in self.values:
+            tag = _VALUE_TYPES.index(value.__class__) if value.__class__ in _VALUE_TYPES else -1
+            if tag < 0:
+                raise TypeError(f"Cannot serialize AST field value {value!r}")
+            text = "1" if value is True else "" if value is False or value is None else (
+                repr(value) if tag == 3 else str(value)
+            )
+            encoded = text.encode("utf-8", "surrogatepass")
+            tags.append(tag)
+            spans.append(len(data))
+            spans.append(len(encoded))
+            data += encoded
+
+        columns = {"value_tags": tags, "value_spans": spans, "value_data": data}
+        chunks, header_fields = [], []
+        offset = _HEADER.size
+        for name, typecode in _SECTIONS:
+            column = columns[name] if name in columns else getattr(self, name)
+            chunk = _little_endian(column, typecode)
+            chunk += b"\0" * (-len(chunk) % 4)
+            header_fields += [offset, len(column)]
+            chunks.append(chunk)
+            offset += len(chunk)
+        return _HEADER.pack(MAGIC, FORMAT_VERSION, 0, *header_fields) + b"".join(chunks)
+
+    @classmethod
+    def from_buffer(cls, buffer: Buffer) -> "Arena":
+        """
+        Reads a serialized arena. The node arrays are views over `buffer`
+        (bytes, or for sharing between processes a read-only mmap), which
+        must stay alive and unchanged while the arena is used.
+        """
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ArenaError("AST arena is truncated.")
+        magic, version, _, *header_fields = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise ArenaError("Not a serialized AST arena.")
+        if version != FORMAT_VERSION:
+            raise ArenaError(f"Unsupported AST arena version {version}.")
+
+        sections = {}
+        for i, (name, typecode) in enumerate(_SECTIONS):
+            offset, count = header_fields[2 * i], header_fields[2 * i + 1]
+            size = 1 if typecode == "B" else 4
+            if offset + count * size > len(view):
+                raise ArenaError("AST arena is truncated.")
+            sections[name] = _column(view[offset:offset + count * size], typecode)
+
+        tags, spans, data = sections.pop("value_tags"), sections.pop("value_spans"), sections.pop("value_data")
+        values = []
+        try:
+            for i, tag in enumerate(tags):
+                start = spans[2 * i]
+                text = str(data[start:start + spans[2 * i + 1]], "utf-8", "surrogatepass")
+                values.append(_VALUE_DECODERS[tag](text))
+        except _DECODE_ERRORS as e:
+            raise ArenaError(f"AST arena is corrupt: {e}") from e
+        return cls(values=values, **sections)
+
+
+def _little_endian(column: Any, typecode: str) -> bytes:
+    if typecode == "B" or sys.byteorder == "little":
+        return bytes(column)
+    swapped = array(typecode, column)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _column(view: memoryview, typecode: str) -> Sequence[int]:
+    if typecode == "B":
+        return view
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    swapped = array(typecode, view.tobytes())
+    swapped.byteswap()
+    return swapped
+
+
+class NodeView:
+    """
+    A node of an Arena, read from the arrays on access: `view.name` or
+    `view.left` work as on the node itself, with node fields given as
+    views. `node()` rebuilds the node.
+    """
+
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: Arena, index: int):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def node_class(self) -> type:
+        return self.arena.node_class(self.index)
+
+    @property
+    def line(self) -> int:
+        return self.arena.lines[self.index]
+
+    @property
+    def column(self) -> int:
+        return self.arena.columns[self.index]
+
+    def __getattr__(self, name: str) -> Any:
+        if name in NodeView.__slots__:
+            raise AttributeError(name)
+        return self.arena.field(self.index, name)
+
+    def node(self) -> ASTNode:
+        return self.arena.node(self.index)
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, NodeView) and other.arena is self.arena and other.index == self.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self) -> str:
+        return f"<{self.node_class.__name__} view {self.index}>"
@@ -1,6 +1,6 @@
 """
 Pine Script Abstract Syntax Tree (AST) Nodes.
-Defined as immutable dataclasses.
+Defined as immutable, slotted dataclasses.
 """
 
 from __future__ import annotations
@@ -87,7 +87,7 @@ class ASTVisitor(ABC):
 # ==============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ASTNode(ABC):
     line: int
     column: int
@@ -97,12 +97,12 @@ class ASTNode(ABC):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Statement(ASTNode):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Expression(ASTNode):
     pass
 
@@ -112,7 +112,7 @@ class Expression(ASTNode):
 # ==============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Literal(Expression):
     value: Union[int, float, str, bool, None]
     type_name: str  # 'int', 'float', 'string', 'bool', 'color', 'na'
@@ -121,7 +121,7 @@ class Literal(Expression):
         return visitor.visit_literal(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Identifier(Expression):
     name: str
 
@@ -129,7 +129,7 @@ class Identifier(Expression):
         return visitor.visit_identifier(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinaryOp(Expression):
     left: Expression
     operator: str
@@ -139,7 +139,7 @@ class BinaryOp(Expression):
         return visitor.visit_binary_op(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnaryOp(Expression):
     operator: str
     operand: Expression
@@ -148,7 +148,7 @@ class UnaryOp(Expression):
         return visitor.visit_unary_op(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallArgument(ASTNode):
     """
     Represents an argument in a function call.
@@ -163,7 +163,7 @@ class CallArgument(ASTNode):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionCall(Expression):
     name: str
     args: List[CallArgument]
@@ -172,7 +172,7 @@ class FunctionCall(Expression):
         return visitor.visit_function_call(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TernaryOp(Expression):
     condition: Expression
     true_expr: Expression
@@ -182,7 +182,7 @@ class TernaryOp(Expression):
         return visitor.visit_ternary_op(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArrayAccess(Expression):
     array: Expression
     indices: List[Expression]  # Support a[x, y]
@@ -191,7 +191,7 @@ class ArrayAccess(Expression):
         return visitor.visit_array_access(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArrayLiteral(Expression):
     elements: List[Expression]
 
@@ -204,7 +204,7 @@ class ArrayLiteral(Expression):
 # ==============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Block(Statement):
     statements: List[Statement]
 
@@ -212,7 +212,7 @@ class Block(Statement):
         return visitor.visit_block(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VersionDecl(Statement):
     version: int
 
@@ -220,7 +220,7 @@ class VersionDecl(Statement):
         return visitor.visit_version_decl(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScriptDecl(Statement):
     """
     Represents indicator(), strategy(), or library() declaration.
@@ -233,7 +233,7 @@ class ScriptDecl(Statement):
         return visitor.visit_script_decl(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VarDecl(Statement):
     """
     Variable declaration.
@@ -250,7 +250,7 @@ class VarDecl(Statement):
         return visitor.visit_var_decl(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Assignment(Statement):
     """
     Reassignment using :=
@@ -269,7 +269,7 @@ class Assignment(Statement):
 # We might need to check instance if we really care about Statement vs Expression.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IfStatement(Expression):
     condition: Expression
     then_block: Block
@@ -279,7 +279,7 @@ class IfStatement(Expression):
         return visitor.visit_if_statement(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForStatement(Expression):
     """
     for i = 0 to 10 by 2
@@ -295,7 +295,7 @@ class ForStatement(Expression):
         return visitor.visit_for_statement(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WhileStatement(Expression):
     condition: Expression
     body: Block
@@ -304,7 +304,7 @@ class WhileStatement(Expression):
         return visitor.visit_while_statement(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwitchStatement(Expression):
     expression: Optional[Expression]  # switch x
     cases: List[
@@ -315,7 +315,7 @@ class SwitchStatement(Expression):
         return visitor.visit_switch_statement(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParamDef(ASTNode):
     name: str
     type_name: Optional[str]
@@ -324,7 +324,7 @@ class ParamDef(ASTNode):
     def accept(self, visitor: ASTVisitor) -> Any:
         pass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionDef(Statement):
     name: str
     params: List[ParamDef]
@@ -336,7 +336,7 @@ class FunctionDef(Statement):
     def accept(self, visitor: ASTVisitor) -> Any:
         return visitor.visit_function_def(self)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeDef(Statement):
     name: str
     fields: List[VarDecl]
@@ -345,7 +345,7 @@ class TypeDef(Statement):
     def accept(self, visitor: ASTVisitor) -> Any:
         return visitor.visit_type_def(self)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportDecl(Statement):
     path: str
     alias: Optional[str] = None
@@ -353,7 +353,7 @@ class ImportDecl(Statement):
     def accept(self, visitor: ASTVisitor) -> Any:
         return visitor.visit_import_decl(self)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExpressionStatement(Statement):
     """
     An expression used as a statement (e.g., function call 'plot(close)')
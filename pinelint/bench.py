@@ -0,0 +1,208 @@
+"""
+Corpus Benchmark.
+
+Times every stage of the lint pipeline over a corpus of scripts, file by
+file, and reports per stage the throughput in lines and files per second
+and the p50/p95/p99 latency of a single file:
+
+    lex        raw tokens from the source
+    indent     comment removal and INDENT/DEDENT/NEWLINE injection
+    parse      the token list into an AST
+    semantic   the shared SemanticAnalyzer pass
+    rule:<R>   each rule of the RuleRunner, given the analyzed context
+    total      the sum of the stages of a file
+
+The stages run separately rather than streamed into each other as
+`check` does, so each can be timed on its own. `check` only analyzes
+files that parse cleanly, which few corpus files do yet; the analysis
+and rule stages therefore also run on the partial AST of files with
+syntax errors unless `clean_only` is set. Files the lexer rejects stop
+after the lex stage.
+
+The default corpus is the one bundled with the tests: the scripts of
+tests/corpus/Scripts_Merged.txt, split on their file markers, and the
+valid_tv_pass, v5_v6 and invalid directories. Results are a JSON
+document meant to be diffed between commits.
+"""
+
+import json
+import math
+import os
+import platform
+import re
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from . import __version__
+from .context import AnalysisContext
+from .lexer import Lexer, LexerError
+from .parser import Parser
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "corpus")
+CORPUS_SETS = ("Scripts_Merged.txt", "valid_tv_pass", "v5_v6", "invalid")
+
+# Boundaries of the scripts in a merged corpus file
+MERGED_MARKER = re.compile(r"##-- File Name: .*? \| File No: \d+ \| (?:Started|Ended) --##")
+MERGED_HEADER = re.compile(r"/\* --- FILE: .*? --- \*/")
+
+PERCENTILES = (50, 95, 99)
+
+
+def split_merged(name: str, content: str) -> List[Tuple[str, str]]:
+    """
+    The scripts of a merged corpus file as (name#n, source) pairs, or the
+    file itself when it has no file markers.
+    """
+    if not MERGED_MARKER.search(content):
+        return [(name, content)]
+    scripts = []
+    for part in MERGED_MARKER.split(content):
+        code = MERGED_HEADER.sub("", part).strip()
+        if code:
+            scripts.append((f"{name}#{len(scripts) + 1}", code))
+    return scripts
+
+
+def load_sources(files: Iterable[str]) -> List[Tuple[str, str]]:
+    """
+    Reads files into (name, source) pairs, splitting merged corpus files
+    into their scripts.
+    """
+    from .engine import decode_source
+
+    sources = []
+    for path in files:
+        with open(path, "rb") as f:
+            sources.extend(split_merged(path, decode_source(f.read())))
+    return sources
+
+
+def default_paths() -> List[str]:
+    """The bundled corpus sets that exist in this checkout."""
+    paths = (os.path.join(CORPUS_DIR, name) for name in CORPUS_SETS)
+    return [p for p in paths if os.path.exists(p)]
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    return ordered[max(1, math.ceil(len(ordered) * p / 100)) - 1]
+
+
+class StageTimes:
+    """Per-file latencies of one stage."""
+
+    __slots__ = ("seconds", "lines")
+
+    def __init__(self):
+        self.seconds: List[float] = []
+        self.lines = 0
+
+    def add(self, seconds: float, lines: int):
+        self.seconds.append(seconds)
+        self.lines += lines
+
+    def summary(self) -> Dict[str, float]:
+        total = sum(self.seconds)
+        ordered = sorted(self.seconds)
+        summary = {
+            "files": len(ordered),
+            "lines": self.lines,
+            "seconds": total,
+            "files_per_second": len(ordered) / total if total else 0.0,
+            "lines_per_second": self.lines / total if total else 0.0,
+        }
+        for p in PERCENTILES:
+            summary[f"p{p}_ms"] = percentile(ordered, p) * 1e3 if ordered else 0.0
+        return summary
+
+
+def _timed(times: Dict[str, float], stage: str, fn: Callable, *args):
+    """Calls fn(*args) and records its time under `stage`, even if it raises."""
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        times[stage] = time.perf_counter() - start
+
+
+def time_file(source: str, name: str, clean_only: bool = False) -> Dict[str, float]:
+    """
+    Runs the pipeline over one source and returns the seconds spent in each
+    stage it reached, including the one that rejected it.
+    """
+    from .engine import _get_runner
+
+    times: Dict[str, float] = {}
+    lexer = Lexer(source)
+    try:
+        raw = _timed(times, "lex", lexer._generate_raw_tokens)
+        tokens = _timed(times, "indent", lexer._process_indentation_and_comments, raw)
+    except LexerError:
+        return times
+
+    parser = Parser(tokens)
+    statements = _timed(times, "parse", parser.parse)
+    if parser.errors and clean_only:
+        return times
+
+    context = AnalysisContext(source, statements, name, tokens)
+    _timed(times, "semantic", context.analyze)
+    for rule in _get_runner().rules:
+        _timed(times, f"rule:{type(rule).__name__}", rule.check, context)
+    return times
+
+
+def run(
+    sources: List[Tuple[str, str]],
+    repeat: int = 1,
+    clean_only: bool = False,
+) -> Dict[str, object]:
+    """
+    Benchmarks the pipeline over (name, source) pairs. Each file runs
+    `repeat` times and keeps its fastest time per stage. Returns the
+    JSON-ready results.
+    """
+    from .engine import warm_up
+
+    warm_up()
+    stages: Dict[str, StageTimes] = {}
+    lines = 0
+    for name, source in sources:
+        file_lines = len(source.splitlines())
+        lines += file_lines
+        best: Dict[str, float] = {}
+        for _ in range(max(1, repeat)):
+            for stage, seconds in time_file(source, name, clean_only).items():
+                best[stage] = min(seconds, best.get(stage, seconds))
+        best["total"] = sum(best.values())
+        for stage, seconds in best.items():
+            stages.setdefault(stage, StageTimes()).add(seconds, file_lines)
+
+    order = [stage for stage in stages if stage != "total"] + ["total"]
+    return {
+        "pinelint": __version__,
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "clean_only": clean_only,
+        "files": len(sources),
+        "lines": lines,
+        "stages": {stage: stages[stage].summary() for stage in order if stage in stages},
+    }
+
+
+def to_json(results: Dict[str, object]) -> str:
+    return json.dumps(results, indent=2)
+
+
+def format_text(results: Dict[str, object]) -> str:
+    lines = [
+        f"{results['files']} files, {results['lines']} lines, best of {results['repeat']}",
+        f"{'stage':28} {'files':>6} {'files/s':>9} {'lines/s':>10} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}",
+    ]
+    for stage, s in results["stages"].items():
+        lines.append(
+            f"{stage:28} {s['files']:6} {s['files_per_second']:9.1f} {s['lines_per_second']:10.0f} "
+            f"{s['p50_ms']:8.2f} {s['p95_ms']:8.2f} {s['p99_ms']:8.2f}"
+        )
+    return "\n".join(lines)
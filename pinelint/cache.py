@@ -0,0 +1,259 @@
+"""
+Persistent on-disk result cache.
+
+Entries hold the serialized diagnostics of one source text. They are keyed
+by a hash of the source bytes, the PineLint version, the pine_spec
+fingerprint and the enabled rule set, so any change to one of those misses.
+
+The `ast/` subdirectory holds parse results: the statements of a source
+that parses without errors as a serialized arena (see arena.py), or else
+its syntax error diagnostics. Their key leaves out the rule set, so after a
+rule configuration change the rules run again on the cached trees instead
+of re-parsing.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+from typing import List, Optional, Tuple
+
+from . import __version__
+from .diagnostics import Diagnostic
+
+DEFAULT_CACHE_DIR = ".pinelint_cache"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Bump when the entry layout changes.
+CACHE_FORMAT = 1
+
+# Subdirectory of the parsed-AST entries
+AST_DIR = "ast"
+
+# Files the language specification is loaded from
+SPEC_MODULES = ("pinelint.pine_spec", "pinelint._spec_data")
+SPEC_ARTIFACT = "pine_spec.bin"
+
+_spec_fingerprint: Optional[str] = None
+
+
+def spec_fingerprint() -> str:
+    """
+    Returns a stable hash of the language specification files. They are
+    located without being imported, so a cache hit does not load them.
+    """
+    global _spec_fingerprint
+    if _spec_fingerprint is None:
+        paths = [importlib.util.find_spec(name).origin for name in SPEC_MODULES]
+        paths.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), SPEC_ARTIFACT))
+        digest = hashlib.sha256()
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                continue  # The artifact is optional
+        _spec_fingerprint = digest.hexdigest()
+    return _spec_fingerprint
+
+
+def rule_set_fingerprint(rules) -> str:
+    return ",".join(f"{type(r).__module__}.{type(r).__qualname__}" for r in rules)
+
+
+# rule_set_fingerprint(RuleRunner().rules), spelled out so that keying an
+# entry does not import the rule engine (tests check they agree)
+DEFAULT_RULE_SET = (
+    "pinelint.rules.VersionCheckRule,pinelint.rules.SecurityRule,pinelint.rules.SemanticCheckRule"
+)
+
+
+class ResultCache:
+    """
+    Content-addressed diagnostics cache with size-bounded LRU eviction.
+
+    Writes go through a temporary file and os.replace, so concurrent
+    workers never observe partial entries. Hits refresh the entry's mtime,
+    which is the recency used by prune(). `writes` counts the entries
+    written since the last prune (engine.lint_files adds those of its
+    worker processes), so runs that only hit the cache skip it.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        rule_set: Optional[str] = None,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rule_set = rule_set
+        self._salt: Optional[bytes] = None
+        self._ast_salt: Optional[bytes] = None
+        self.writes = 0
+
+    def _get_salt(self) -> bytes:
+        if self._salt is None:
+            if self.rule_set is None:
+                self.rule_set = DEFAULT_RULE_SET
+            self._salt = "\0".join(
+                [str(CACHE_FORMAT), __version__, spec_fingerprint(), self.rule_set]
+            ).encode("utf-8")
+        return self._salt
+
+    def key(self, source: bytes) -> str:
+        h = hashlib.sha256(self._get_salt())
+        h.update(b"\0")
+        h.update(source)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def ast_key(self, source: bytes) -> str:
+        if self._ast_salt is None:
+            from .arena import FORMAT_VERSION
+
+            self._ast_salt = "\0".join(
+                [str(CACHE_FORMAT), AST_DIR, str(FORMAT_VERSION), __version__, spec_fingerprint()]
+            ).encode("utf-8")
+        h = hashlib.sha256(self._ast_salt)
+        h.update(b"\0")
+        h.update(source)
+        return h.hexdigest()
+
+    def _ast_path(self, key: str) -> str:
+        return os.path.join(self.directory, AST_DIR, key[:2], key + ".ast")
+
+    def get(self, key: str, file_path: str) -> Optional[List[Diagnostic]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            diagnostics = [Diagnostic.from_dict(d, file_path) for d in data["diagnostics"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None  # Missing or damaged entries are misses
+        self._touch(path)
+        return diagnostics
+
+    def put(self, key: str, diagnostics: List[Diagnostic]):
+        try:
+            payload = self._payload(diagnostics)
+        except (TypeError, ValueError):
+            return  # Not serializable; the result is still returned uncached
+        self._write(self._path(key), payload)
+
+    def get_parse(
+        self, key: str, file_path: str
+    ) -> Optional[Tuple[Optional[List], List[Diagnostic]]]:
+        """
+        The engine.parse_source() result stored under an ast_key(): the
+        statements, equal to the parser's, and no diagnostics; or None and
+        the syntax error diagnostics.
+        """
+        from .arena import MAGIC, Arena, ArenaError
+
+        path = self._ast_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if data.startswith(MAGIC):
+                parsed = Arena.from_buffer(data).statements(), []
+            else:
+                entries = json.loads(data)["diagnostics"]
+                parsed = None, [Diagnostic.from_dict(d, file_path) for d in entries]
+        except (OSError, ValueError, KeyError, TypeError, ArenaError):
+            return None  # Missing or damaged entries are misses, and re-parsed
+        self._touch(path)
+        return parsed
+
+    def put_parse(self, key: str, statements: Optional[List], diagnostics: List[Diagnostic]):
+        from .arena import Arena
+
+        try:
+            if statements is None:
+                payload = self._payload(diagnostics)
+            else:
+                payload = Arena.from_tree(statements).to_bytes()
+        except Exception:
+            return  # A tree the arena cannot encode is re-parsed next time
+        self._write(self._ast_path(key), payload)
+
+    @staticmethod
+    def _touch(path: str):
+        """Marks an entry as recently used; read-only caches keep old times."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _payload(diagnostics: List[Diagnostic]) -> bytes:
+        entries = []
+        for d in diagnostics:
+            entry = d.to_dict()
+            del entry["location"]["file"]
+            entries.append(entry)
+        return json.dumps({"diagnostics": entries}, separators=(",", ":")).encode("utf-8")
+
+    def _write(self, path: str, payload: bytes):
+        import tempfile  # Only needed on a miss
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+                self.writes += 1
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass  # The cache is best effort; linting must not fail because of it.
+
+    def prune(self):
+        """
+        Evicts least recently used entries until the cache fits in max_bytes.
+        Does nothing when no entry was written since the last prune.
+        """
+        if not self.writes:
+            return
+        self.writes = 0
+        entries = self._entries(self.directory) + self._entries(
+            os.path.join(self.directory, AST_DIR)
+        )
+        total = sum(size for _, size, _ in entries)
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    @staticmethod
+    def _entries(directory: str) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of the entries in the shards of `directory`."""
+        entries = []
+        try:
+            shards = list(os.scandir(directory))
+        except OSError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir() or shard.name == AST_DIR:
+                continue
+            try:
+                for entry in os.scandir(shard.path):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+            except OSError:
+                continue  # Entry removed by a concurrent prune
+        return entries
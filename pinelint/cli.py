@@ -3,57 +3,140 @@ PineLint CLI.
 """
 
 import argparse
-import sys
 import os
-from typing import List
+import sys
+from typing import List, Optional
 
-from .lexer import Lexer, LexerError
-from .parser import Parser, ParseError
-from .rules import RuleRunner
-from .diagnostics import Report, Diagnostic, Severity
+from .cache import ResultCache, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+from .diagnostics import Diagnostic, Report
 
 
 def check_file(filepath: str, format_type: str):
-    if not os.path.exists(filepath):
-        print(f"File not found: {filepath}", file=sys.stderr)
-        sys.exit(2)
+    check_paths([filepath], format_type)
 
-    with open(filepath, "r") as f:
-        source = f.read()
 
-    report = Report()
+def check_paths(
+    patterns: List[str],
+    format_type: str,
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+    timings: bool = False,
+    profile: Optional[str] = None,
+    allocations: bool = False,
+):
+    """
+    Lints the files and prints the report. With `timings` the report gets
+    the wall time of each stage and rule, and with `allocations` also the
+    memory they allocate. With `profile` a cProfile of the run is written
+    to that path as pstats data. Instrumented runs lint in this process.
+    """
+    # Imported here so `check --daemon` does not load the lint pipeline.
+    from .engine import expand_paths, lint_paths
 
-    # 1. Lexer
-    try:
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-    except LexerError as e:
-        # We can't proceed to parse if lexer fails drastically, or we can try?
-        # Assuming e has message.
-        # LexerError might be simple exception.
-        report.add(Diagnostic(Severity.ERROR, "E001", str(e), 1, 1, filepath))
-        _print_report(report, format_type)
-        sys.exit(1)
+    files, missing = expand_paths(patterns)
+    _exit_if_missing(missing)
 
-    # 2. Parser
-    parser = Parser(tokens)
-    ast_root = parser.parse()  # Returns List[Statement]
+    if not (timings or allocations or profile is not None):
+        report = lint_paths(files, jobs, cache)
+    else:
+        report = _instrumented_lint(files, cache, timings or allocations, profile, allocations)
+
+    _print_report(report, format_type)
+    _exit_with_status(report)
 
-    # Collect parser errors
-    for e in parser.errors:
-        report.add(
-            Diagnostic(Severity.ERROR, "E002", str(e), e.line, e.column, filepath)
-        )
 
-    # 3. Rule Engine
-    if not parser.errors:  # Only run rules if parse succeeded (or try anyway?)
-        runner = RuleRunner()
-        rule_diagnostics = runner.run(source, ast_root, filepath)
-        for d in rule_diagnostics:
-            report.add(d)
+def _instrumented_lint(
+    files: List[str],
+    cache: Optional[ResultCache],
+    timings: bool,
+    profile: Optional[str],
+    allocations: bool,
+) -> Report:
+    import cProfile
+    from contextlib import ExitStack
+    from .engine import lint_paths
+    from .timings import Timings
+
+    with ExitStack() as stack:
+        stage_timings = stack.enter_context(Timings(allocations)) if timings else None
+        profiler = None
+        if profile is not None:
+            profiler = cProfile.Profile()
+            stack.callback(profiler.dump_stats, profile)
+            stack.enter_context(profiler)
+        report = lint_paths(files, 1, cache, stage_timings)
+    report.timings = stage_timings
+    return report
+
+
+def check_paths_with_daemon(
+    patterns: List[str],
+    format_type: str,
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+    socket_path: Optional[str] = None,
+):
+    """
+    Sends the check to a running daemon. Returns without output when no
+    daemon answers, so the caller can lint locally instead.
+    """
+    from . import daemon
+
+    message = {
+        "command": "check",
+        "cwd": os.getcwd(),
+        "paths": patterns,
+        "jobs": jobs,
+        "cache": None,
+    }
+    if cache is not None:
+        message["cache"] = {
+            "dir": os.path.abspath(cache.directory),
+            "max_bytes": cache.max_bytes,
+        }
+    response = daemon.request(message, socket_path)
+    if response is None or not response.get("ok"):
+        if response is not None:
+            print(f"pinelint daemon: {response.get('error')}; linting locally", file=sys.stderr)
+        return
+
+    _exit_if_missing(response["missing"])
+
+    report = Report()
+    for entry in response["files"]:
+        report.extend(Diagnostic.from_dict(d) for d in entry["diagnostics"])
 
     _print_report(report, format_type)
+    _exit_with_status(report)
+
 
+def bench_paths(patterns: List[str], format_type: str, repeat: int = 1, clean_only: bool = False):
+    from . import bench
+    from .engine import expand_paths
+
+    if not patterns:
+        patterns = bench.default_paths()
+        if not patterns:
+            print("No paths given and the bundled corpus was not found", file=sys.stderr)
+            sys.exit(2)
+    files, missing = expand_paths(patterns)
+    _exit_if_missing(missing)
+
+    results = bench.run(bench.load_sources(files), repeat, clean_only)
+    if format_type == "json":
+        print(bench.to_json(results))
+    else:
+        print(bench.format_text(results))
+
+
+def _exit_if_missing(missing: List[str]):
+    if missing:
+        for pattern in missing:
+            print(f"File not found: {pattern}", file=sys.stderr)
+        sys.exit(2)
+
+
+def _exit_with_status(report: Report):
     if report.has_errors():
         sys.exit(1)
     else:
@@ -74,16 +157,154 @@ def main():
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
     # Check command
-    check_parser = subparsers.add_parser("check", help="Check a Pine Script file")
-    check_parser.add_argument("file", help="Path to .pine file")
+    check_parser = subparsers.add_parser(
+        "check", help="Check Pine Script files, directories or glob patterns"
+    )
+    check_parser.add_argument(
+        "files", nargs="+", metavar="file", help="Paths, directories or globs"
+    )
     check_parser.add_argument(
         "--format", choices=["text", "json"], default="text", help="Output format"
     )
+    check_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes (0 = one per CPU)",
+    )
+    check_parser.add_argument(
+        "--no-cache", action="store_true", help="Disable the on-disk result cache"
+    )
+    check_parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Result cache directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    check_parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        metavar="MB",
+        help="Evict least recently used cache entries beyond this size",
+    )
+    check_parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Use a running `pinelint daemon` if there is one",
+    )
+    check_parser.add_argument(
+        "--socket", default=None, help="Daemon socket path (default: in a per-user temp directory)"
+    )
+    check_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report the wall time of each stage and rule "
+        "(lints in this process; cache lookups are stages of their own)",
+    )
+    check_parser.add_argument(
+        "--allocations",
+        action="store_true",
+        help="--timings plus the memory each stage allocates, traced with tracemalloc "
+        "(slows the run)",
+    )
+    check_parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="FILE",
+        help="Write a cProfile of the run to FILE as pstats data (lints in this process)",
+    )
+
+    # Benchmark
+    bench_parser = subparsers.add_parser(
+        "bench", help="Time each lint stage over a corpus (default: the bundled test corpus)"
+    )
+    bench_parser.add_argument(
+        "files", nargs="*", metavar="file", help="Paths, directories or globs"
+    )
+    bench_parser.add_argument(
+        "--format", choices=["text", "json"], default="json", help="Output format"
+    )
+    bench_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Runs per file; the fastest time of each stage is kept",
+    )
+    bench_parser.add_argument(
+        "--clean-only",
+        action="store_true",
+        help="Only analyze files without syntax errors, as `check` does",
+    )
+
+    # Daemon
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Serve lint requests from a resident process on a Unix socket"
+    )
+    daemon_parser.add_argument(
+        "--socket", default=None, help="Socket path (default: in a per-user temp directory)"
+    )
+    daemon_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Exit after this long without requests (default: 600)",
+    )
+    daemon_parser.add_argument(
+        "--max-memory",
+        type=int,
+        default=None,
+        metavar="MB",
+        help="Exit once resident memory exceeds this size (default: 512)",
+    )
+    daemon_parser.add_argument(
+        "--stop", action="store_true", help="Stop the daemon listening on the socket"
+    )
+
+    # Language server
+    lsp_parser = subparsers.add_parser(
+        "lsp", help="Run a Language Server Protocol server on stdin/stdout"
+    )
+    lsp_parser.add_argument(
+        "--debounce",
+        type=int,
+        default=None,
+        metavar="MS",
+        help="Delay after the last edit before a document is analyzed (default: 200)",
+    )
 
     args = parser.parse_args()
 
-    if args.command == "check":
-        check_file(args.file, args.format)
+    if args.command == "lsp":
+        # The server is imported on demand to keep `check` startup lean.
+        from . import lsp
+
+        debounce = lsp.DEFAULT_DEBOUNCE if args.debounce is None else args.debounce / 1000
+        sys.exit(lsp.serve(debounce))
+    elif args.command == "daemon":
+        from . import daemon
+
+        if args.stop:
+            stopped = daemon.request({"command": "shutdown"}, args.socket) is not None
+            sys.exit(0 if stopped else 1)
+        idle_timeout = daemon.DEFAULT_IDLE_TIMEOUT if args.idle_timeout is None else args.idle_timeout
+        max_memory = daemon.DEFAULT_MAX_MEMORY
+        if args.max_memory is not None:
+            max_memory = args.max_memory * 1024 * 1024
+        sys.exit(daemon.serve(args.socket, idle_timeout, max_memory))
+    elif args.command == "bench":
+        bench_paths(args.files, args.format, args.repeat, args.clean_only)
+    elif args.command == "check":
+        cache = None
+        if not args.no_cache:
+            cache = ResultCache(args.cache_dir, args.cache_max_size * 1024 * 1024)
+        instrumented = args.timings or args.allocations or args.profile is not None
+        if args.daemon and not instrumented:
+            check_paths_with_daemon(args.files, args.format, args.jobs, cache, args.socket)
+        check_paths(
+            args.files, args.format, args.jobs, cache, args.timings, args.profile, args.allocations
+        )
     else:
         parser.print_help()
 
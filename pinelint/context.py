@@ -0,0 +1,94 @@
+"""
+Per-file Analysis Context shared by all rules.
+"""
+
+import traceback
+from typing import List, Optional, Union, Dict
+
+from .lexer import Lexer, Token
+from .ast_nodes import ASTNode, Statement
+from .semantic import SemanticAnalyzer, Scope, Symbol
+from .spec_registry import script_version
+
+
+class AnalysisContext:
+    """
+    Holds the tokens, the AST and the semantic model of one file.
+
+    Semantic analysis runs at most once per context, the first time a rule
+    asks for it, so adding a rule only costs that rule's own work.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        ast_root: Optional[Union[ASTNode, List[Statement]]],
+        file_path: str,
+        tokens: Optional[List[Token]] = None,
+    ):
+        self.source = source
+        self.ast_root = ast_root
+        self.file_path = file_path
+        self._tokens = tokens
+        self.analysis_error: Optional[Exception] = None
+        self._analyzer: Optional[SemanticAnalyzer] = None
+        self._pine_version: Optional[int] = None
+        self._pine_version_read = False
+
+    @property
+    def tokens(self) -> List[Token]:
+        """
+        The file's tokens. When the parser consumed a token stream, they are
+        re-lexed on first access.
+        """
+        if self._tokens is None:
+            self._tokens = Lexer(self.source).tokenize()
+        return self._tokens
+
+    @property
+    def pine_version(self) -> Optional[int]:
+        """
+        The version declared by the script's `//@version` directive, or None
+        when it has none or several.
+        """
+        if not self._pine_version_read:
+            self._pine_version = script_version(self.source)
+            self._pine_version_read = True
+        return self._pine_version
+
+    @property
+    def statements(self) -> List[ASTNode]:
+        if isinstance(self.ast_root, list):
+            return self.ast_root
+        if isinstance(self.ast_root, ASTNode):
+            return [self.ast_root]
+        return []
+
+    def analyze(self) -> SemanticAnalyzer:
+        """
+        Runs the semantic analyzer over the AST once, with the builtins of
+        the script's Pine version, and returns it. Internal analyzer failures
+        are recorded in `analysis_error`.
+        """
+        if self._analyzer is None:
+            self._analyzer = SemanticAnalyzer(self.pine_version)
+            try:
+                for stmt in self.statements:
+                    stmt.accept(self._analyzer)
+            except Exception as e:
+                traceback.print_exc()
+                self.analysis_error = e
+        return self._analyzer
+
+    @property
+    def analyzer(self) -> SemanticAnalyzer:
+        return self.analyze()
+
+    @property
+    def scopes(self) -> List[Scope]:
+        return self.analyze().all_scopes
+
+    @property
+    def symbols(self) -> Dict[str, Symbol]:
+        """Symbols declared in the global scope."""
+        return self.analyze().global_scope.symbols
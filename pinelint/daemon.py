@@ -0,0 +1,293 @@
+"""
+Lint Daemon.
+
+`pinelint daemon` keeps the spec tables, the lexer, the parser and the rule
+runner warm in one resident process and serves lint requests on a Unix
+domain socket, so repeated `pinelint check --daemon` calls skip Python
+startup and the spec import.
+
+Protocol: the client connects, sends one JSON request terminated by a
+newline and reads one JSON response line. Every request carries the
+protocol and the client's pinelint version:
+
+    {"protocol": 1, "version": "x.y.z", "command": "ping"}
+    {"protocol": 1, "version": "x.y.z", "command": "shutdown"}
+    {"protocol": 1, "version": "x.y.z", "command": "check", "cwd": "/repo",
+     "paths": ["src", "*.pine"],                      # files, dirs or globs
+     "sources": [{"path": "a.pine", "text": "..."}],  # inline sources
+     "jobs": 1, "cache": {"dir": "/repo/.pinelint_cache", "max_bytes": N}}
+
+A check response is {"ok": true, "missing": [...], "files": [{"path": ...,
+"diagnostics": [...]}]} with diagnostics in the JSON report format; failed
+requests get {"ok": false, "error": "..."}. A daemon of another pinelint
+version refuses checks, so the client lints locally instead of mixing in
+results of other rules; ping and shutdown work across versions.
+
+The default socket lives in a per-user directory of mode 0700 under the
+temp directory. The client only connects to sockets owned by the current
+user and closed to everyone else.
+
+Requests are handled one at a time. Paths are resolved against the
+request's `cwd`, so results match a local `pinelint check` run. The daemon
+exits after `idle_timeout` seconds without requests, or once its resident
+memory exceeds `max_memory` bytes after a request.
+
+This module imports the lint machinery only when a daemon starts, so the
+client side stays cheap to import.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import __version__
+
+PROTOCOL_VERSION = 1
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+DEFAULT_MAX_MEMORY = 512 * 1024 * 1024
+# A wedged daemon makes the client fall back to linting locally after this
+DEFAULT_REQUEST_TIMEOUT = 300.0
+
+
+SOCKET_NAME = "daemon.sock"
+
+
+def _uid() -> int:
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+def default_socket_path() -> str:
+    """
+    Per-user socket path; PINELINT_SOCKET overrides it.
+    """
+    path = os.environ.get("PINELINT_SOCKET")
+    if path:
+        return path
+    return os.path.join(tempfile.gettempdir(), f"pinelint-{_uid()}", SOCKET_NAME)
+
+
+def _is_private(path: str) -> bool:
+    """Whether `path` is owned by the current user and closed to others."""
+    info = os.lstat(path)
+    return info.st_uid == _uid() and not info.st_mode & 0o077
+
+
+def _make_socket_dir(directory: str):
+    """
+    Creates the per-user socket directory with mode 0700, or checks that an
+    existing one is private.
+    """
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        if not os.path.isdir(directory) or os.path.islink(directory) or not _is_private(directory):
+            raise OSError(f"{directory} is not a private directory of the current user.")
+
+
+# -- Client ---------------------------------------------------------------
+
+
+def request(
+    message: Dict[str, Any],
+    socket_path: Optional[str] = None,
+    timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT,
+) -> Optional[Dict[str, Any]]:
+    """
+    Sends one request and returns the response, or None when no daemon is
+    listening on the socket, the socket is not private to the current
+    user, or the exchange fails or times out.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    socket_path = socket_path or default_socket_path()
+    try:
+        if not _is_private(socket_path):
+            return None
+    except FileNotFoundError:
+        return None
+    message = dict(message, protocol=PROTOCOL_VERSION, version=__version__)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        return json.loads(line.decode("utf-8")) if line else None
+    except (OSError, ValueError):
+        return None  # Timeouts, resets and truncated replies all mean no daemon
+
+
+def is_running(socket_path: Optional[str] = None) -> bool:
+    return request({"command": "ping"}, socket_path, timeout=5) is not None
+
+
+# -- Server ---------------------------------------------------------------
+
+
+def _rss_bytes() -> int:
+    """Current resident set size, or the peak where that is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            response = self.server.respond(json.loads(line.decode("utf-8")))
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n")
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    _ServerBase = socketserver.UnixStreamServer
+else:  # pragma: no cover - platforms without Unix sockets
+    _ServerBase = socketserver.BaseServer
+
+
+class LintDaemon(_ServerBase):
+    """
+    Single-threaded lint server on a Unix domain socket.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+        max_memory: Optional[int] = DEFAULT_MAX_MEMORY,
+    ):
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("The daemon needs Unix domain sockets.")
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = idle_timeout
+        self.max_memory = max_memory
+        self.stop_reason: Optional[str] = None
+        self.requests = 0
+
+        if socket_path is None and "PINELINT_SOCKET" not in os.environ:
+            _make_socket_dir(os.path.dirname(self.socket_path))
+        if os.path.lexists(self.socket_path):
+            if is_running(self.socket_path):
+                raise OSError(f"A daemon is already listening on {self.socket_path}.")
+            os.unlink(self.socket_path)  # Left behind by a daemon that died
+        # Created without group or other access rather than fixed up later
+        umask = os.umask(0o177)
+        try:
+            super().__init__(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(umask)
+
+        # Imported here: clients of this module never need the lint machinery.
+        from . import engine
+        from .cache import ResultCache
+
+        self._engine = engine
+        self._cache_type = ResultCache
+        self._caches: Dict[Tuple[str, int], Any] = {}
+        engine.warm_up()
+
+    def serve(self) -> str:
+        """
+        Serves requests until shutdown, the idle timeout or the memory
+        ceiling, removes the socket and returns the reason for stopping.
+        """
+        try:
+            while self.stop_reason is None:
+                self.handle_request()
+        finally:
+            self.server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+        return self.stop_reason
+
+    def handle_timeout(self):
+        self.stop_reason = f"idle for {self.timeout:g} seconds"
+
+    def process_request(self, request, client_address):
+        super().process_request(request, client_address)
+        self.requests += 1
+        if self.max_memory is not None and _rss_bytes() > self.max_memory:
+            self.stop_reason = f"memory ceiling of {self.max_memory // (1024 * 1024)} MB reached"
+
+    def respond(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        if message.get("protocol") != PROTOCOL_VERSION:
+            return {"ok": False, "error": f"Unsupported protocol: {message.get('protocol')}"}
+        command = message.get("command")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid(), "version": __version__}
+        if command == "shutdown":
+            self.stop_reason = "shutdown requested"
+            return {"ok": True}
+        if command == "check":
+            if message.get("version") != __version__:
+                return {
+                    "ok": False,
+                    "error": f"daemon runs pinelint {__version__}, client {message.get('version')}",
+                }
+            return self.check(message)
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+    def check(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        engine = self._engine
+        cache = self._cache(message.get("cache"))
+        files: List[Dict[str, Any]] = []
+
+        previous_cwd = os.getcwd()
+        os.chdir(message.get("cwd") or previous_cwd)
+        try:
+            paths, missing = engine.expand_paths(message.get("paths") or [])
+            for path, diagnostics in engine.lint_files(paths, message.get("jobs", 1), cache):
+                files.append({"path": path, "diagnostics": [d.to_dict() for d in diagnostics]})
+            if cache is not None and paths:
+                cache.prune()
+        finally:
+            os.chdir(previous_cwd)
+
+        for source in message.get("sources") or []:
+            diagnostics = engine.lint_source(source["text"], source["path"])
+            files.append({"path": source["path"], "diagnostics": [d.to_dict() for d in diagnostics]})
+
+        return {"ok": True, "missing": missing, "files": files}
+
+    def _cache(self, options: Optional[Dict[str, Any]]):
+        if not options:
+            return None
+        key = (options["dir"], options["max_bytes"])
+        cache = self._caches.get(key)
+        if cache is None:
+            cache = self._caches[key] = self._cache_type(*key)
+        return cache
+
+
+def serve(
+    socket_path: Optional[str] = None,
+    idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+    max_memory: Optional[int] = DEFAULT_MAX_MEMORY,
+) -> int:
+    """Runs a daemon in the foreground until it stops."""
+    try:
+        daemon = LintDaemon(socket_path, idle_timeout, max_memory)
+    except OSError as e:
+        print(f"pinelint daemon: {e}", file=sys.stderr)
+        return 1
+    print(f"pinelint daemon: listening on {daemon.socket_path}", file=sys.stderr)
+    reason = daemon.serve()
+    print(f"pinelint daemon: stopping, {reason}", file=sys.stderr)
+    return 0
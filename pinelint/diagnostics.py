@@ -7,6 +7,8 @@ from enum import Enum
 from typing import List, Optional, Any, Dict
 import json
 
+from .timings import Timings
+
 
 class Severity(Enum):
     ERROR = "error"
@@ -38,6 +40,19 @@ class Diagnostic:
             "suggestion": self.suggestion,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], file_path: Optional[str] = None) -> "Diagnostic":
+        location = data["location"]
+        return cls(
+            Severity(data["severity"]),
+            data["code"],
+            data["message"],
+            location["line"],
+            location["column"],
+            location.get("file", "") if file_path is None else file_path,
+            data.get("suggestion"),
+        )
+
     def __str__(self):
         return f"{self.file_path}:{self.line}:{self.column}: {self.severity.value.upper()}[{self.code}]: {self.message}"
 
@@ -45,27 +60,32 @@ class Diagnostic:
 class Report:
     def __init__(self):
         self.diagnostics: List[Diagnostic] = []
+        # Stage timings of the run, reported when set
+        self.timings: Optional[Timings] = None
 
     def add(self, diagnostic: Diagnostic):
         self.diagnostics.append(diagnostic)
 
+    def extend(self, diagnostics: List[Diagnostic]):
+        self.diagnostics.extend(diagnostics)
+
     def has_errors(self) -> bool:
         return any(d.severity == Severity.ERROR for d in self.diagnostics)
 
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "valid": not self.has_errors(),
-                "error_count": sum(
-                    1 for d in self.diagnostics if d.severity == Severity.ERROR
-                ),
-                "warning_count": sum(
-                    1 for d in self.diagnostics if d.severity == Severity.WARNING
-                ),
-                "diagnostics": [d.to_dict() for d in self.diagnostics],
-            },
-            indent=2,
-        )
+        data = {
+            "valid": not self.has_errors(),
+            "error_count": sum(
+                1 for d in self.diagnostics if d.severity == Severity.ERROR
+            ),
+            "warning_count": sum(
+                1 for d in self.diagnostics if d.severity == Severity.WARNING
+            ),
+            "diagnostics": [d.to_dict() for d in self.diagnostics],
+        }
+        if self.timings is not None:
+            data["timings"] = self.timings.to_dict()
+        return json.dumps(data, indent=2)
 
     def to_text(self) -> str:
         lines = []
@@ -74,4 +94,6 @@ class Report:
 
         summary = f"\nFound {sum(1 for d in self.diagnostics if d.severity == Severity.ERROR)} errors, {sum(1 for d in self.diagnostics if d.severity == Severity.WARNING)} warnings."
         lines.append(summary)
+        if self.timings is not None:
+            lines.append(self.timings.to_text())
         return "\n".join(lines)
@@ -0,0 +1,271 @@
+"""
+Lint Engine.
+
+Runs the lexer, parser and rule pipeline over sources and files without
+touching the process state, so it can be shared by the CLI, the test
+harness and worker processes.
+
+The pipeline modules are imported on first use, so a run that is
+answered entirely from the result cache never loads them.
+"""
+
+import glob
+import io
+import os
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .diagnostics import Report, Diagnostic, Severity
+from .cache import ResultCache
+from .timings import Timings
+
+PINE_EXTENSIONS = (".pine",)
+
+# Per-process RuleRunner, created lazily so workers pay for it once.
+_runner = None
+
+
+def _get_runner():
+    global _runner
+    if _runner is None:
+        from .rules import RuleRunner
+
+        _runner = RuleRunner()
+    return _runner
+
+
+def parse_source(
+    source: str, filepath: str, timings: Optional[Timings] = None
+) -> Tuple[Optional[List], List[Diagnostic]]:
+    """
+    Lexes and parses a source string. Returns its statements, or None when
+    it has syntax errors, and the E001/E002 diagnostics of those errors.
+    """
+    from .lexer import Lexer, LexerError
+    from .parser import Parser
+
+    diagnostics: List[Diagnostic] = []
+
+    try:
+        if timings is None:
+            # Tokens are streamed into the parser, so only its lookahead
+            # window is held in memory.
+            parser = Parser(Lexer(source).iter_tokens())
+            ast_root = parser.parse()
+        else:
+            # Lexed up front so the two stages are measured apart
+            with timings.stage("lex"):
+                tokens = Lexer(source).tokenize()
+            parser = Parser(tokens)
+            with timings.stage("parse"):
+                ast_root = parser.parse()
+    except LexerError as e:
+        diagnostics.append(Diagnostic(Severity.ERROR, "E001", str(e), 1, 1, filepath))
+        return None, diagnostics
+
+    for e in parser.errors:
+        diagnostics.append(
+            Diagnostic(Severity.ERROR, "E002", str(e), e.line, e.column, filepath)
+        )
+    return (None if parser.errors else ast_root), diagnostics
+
+
+def lint_source(
+    source: str,
+    filepath: str,
+    ast_root: Optional[List] = None,
+    timings: Optional[Timings] = None,
+) -> List[Diagnostic]:
+    """
+    Lints a single source string and returns its diagnostics. `ast_root`
+    is the error-free parse of `source` when the caller already has it
+    (from the AST cache), which skips lexing and parsing. `timings`, if
+    given, records the stages that run.
+    """
+    # 1. Lexer + 2. Parser
+    if ast_root is None:
+        ast_root, diagnostics = parse_source(source, filepath, timings)
+        if ast_root is None:
+            return diagnostics
+
+    # 3. Rule Engine (only if parse succeeded)
+    return _get_runner().run(source, ast_root, filepath, timings=timings)
+
+
+def decode_source(data: bytes) -> str:
+    # Same decoding and newline handling as open(path, "r").
+    return io.TextIOWrapper(io.BytesIO(data)).read()
+
+
+def lint_file(
+    filepath: str, cache: Optional[ResultCache] = None, timings: Optional[Timings] = None
+) -> List[Diagnostic]:
+    """
+    Lints a file on disk. With a cache, a file whose content key is already
+    stored skips lexing, parsing and analysis, and a file whose parse result
+    is stored (the rules changed since it was linted) skips lexing and
+    parsing. `timings`, if given, records the cache lookups and the stages
+    that run.
+
+    Unexpected failures are reported as E999 so a single bad file cannot
+    abort a batch run.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            data = f.read()
+        if timings is not None:
+            timings.files += 1
+
+        if cache is None:
+            return lint_source(decode_source(data), filepath, timings=timings)
+
+        key = cache.key(data)
+        if timings is None:
+            cached = cache.get(key, filepath)
+        else:
+            cached = timings.lookup("cache", cache.get, key, filepath)
+        if cached is not None:
+            return cached
+
+        source = decode_source(data)
+        ast_key = cache.ast_key(data)
+        if timings is None:
+            parsed = cache.get_parse(ast_key, filepath)
+        else:
+            parsed = timings.lookup("ast", cache.get_parse, ast_key, filepath)
+        if parsed is None:
+            parsed = parse_source(source, filepath, timings)
+            cache.put_parse(ast_key, *parsed)
+        ast_root, diagnostics = parsed
+        if ast_root is not None:
+            diagnostics = lint_source(source, filepath, ast_root, timings)
+        cache.put(key, diagnostics)
+        return diagnostics
+    except Exception as e:
+        return [
+            Diagnostic(
+                Severity.ERROR,
+                "E999",
+                f"Internal Error: {type(e).__name__}: {e}",
+                1,
+                1,
+                filepath,
+            )
+        ]
+
+
+def expand_paths(patterns: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """
+    Expands files, directories and glob patterns into a sorted, de-duplicated
+    list of files. Directories are searched recursively for .pine files.
+
+    Returns (files, missing) where `missing` lists patterns that matched nothing.
+    """
+    files: List[str] = []
+    missing: List[str] = []
+    seen = set()
+
+    def add(path: str):
+        key = os.path.normpath(path)
+        if key not in seen:
+            seen.add(key)
+            files.append(path)
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            found = []
+            for root, dirs, names in os.walk(pattern):
+                dirs.sort()
+                for name in names:
+                    if name.endswith(PINE_EXTENSIONS):
+                        found.append(os.path.join(root, name))
+            for path in sorted(found):
+                add(path)
+        elif os.path.isfile(pattern):
+            add(pattern)
+        else:
+            matches = sorted(
+                p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p)
+            )
+            if not matches:
+                missing.append(pattern)
+            for path in matches:
+                add(path)
+
+    return files, missing
+
+
+def warm_up():
+    """
+    Loads the spec tables and builds the rule runner, so long-lived
+    processes pay for them before their first file.
+    """
+    from .pine_spec import PINE_FUNCTIONS, PINE_VARIABLES
+
+    len(PINE_FUNCTIONS), len(PINE_VARIABLES)
+    _get_runner()
+
+
+def _lint_file_counting_writes(filepath: str, cache: ResultCache) -> Tuple[List[Diagnostic], int]:
+    writes = cache.writes
+    diagnostics = lint_file(filepath, cache)
+    return diagnostics, cache.writes - writes
+
+
+def lint_files(
+    paths: List[str],
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+    timings: Optional[Timings] = None,
+) -> Iterator[Tuple[str, List[Diagnostic]]]:
+    """
+    Lints files and yields (path, diagnostics) in input order.
+
+    With jobs > 1 the files are distributed over a single ProcessPoolExecutor
+    that lives for the whole batch. jobs <= 0 uses one worker per CPU.
+    With `timings` the files are linted in this process, whatever `jobs`.
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(paths)) if paths else 1
+
+    if jobs == 1 or timings is not None:
+        for path in paths:
+            yield path, lint_file(path, cache, timings)
+        return
+
+    # Imported here: the process pool machinery is only needed for batches.
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Large chunks amortise IPC overhead; keep enough chunks to balance load.
+    chunksize = max(1, len(paths) // (jobs * 8))
+    if cache is None:
+        worker = partial(lint_file, cache=cache)
+        with ProcessPoolExecutor(max_workers=jobs, initializer=warm_up) as pool:
+            yield from zip(paths, pool.map(worker, paths, chunksize=chunksize))
+        return
+
+    # Workers write through their own copies of the cache; their write
+    # counts are added here so the caller knows whether to prune.
+    worker = partial(_lint_file_counting_writes, cache=cache)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=warm_up) as pool:
+        for path, (diagnostics, writes) in zip(paths, pool.map(worker, paths, chunksize=chunksize)):
+            cache.writes += writes
+            yield path, diagnostics
+
+
+def lint_paths(
+    paths: List[str],
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+    timings: Optional[Timings] = None,
+) -> Report:
+    """
+    Lints files and merges all diagnostics into a single Report.
+    """
+    report = Report()
+    for _, diagnostics in lint_files(paths, jobs, cache, timings):
+        report.extend(diagnostics)
+    if cache is not None:
+        cache.prune()
+    return report
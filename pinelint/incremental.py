@@ -0,0 +1,706 @@
+"""
+Incremental Document Model.
+
+Keeps the diagnostics of an editor buffer up to date while it is being
+edited. The buffer is split into top-level chunks, each starting at a line
+that begins a top-level statement. Chunks are lexed and parsed on their own
+and cached by their text, so an edit only re-tokenizes and re-parses the
+chunks it touches; every other chunk keeps its statement subtrees.
+
+Semantic results are cached per chunk together with the script's Pine
+version, the global names the chunk looked up and the types it found for
+them. A chunk is re-analyzed only when one of those names now resolves
+differently, e.g. because an earlier statement changed a variable's type
+or removed it, or when the `//@version` directive changes.
+
+Positions inside a chunk are relative to the chunk's first line and are
+translated when diagnostics are assembled. Parse errors are recovered per
+chunk, so in broken code their positions can differ slightly from a full
+`pinelint check`; for code that parses, the diagnostics are the same.
+"""
+
+import traceback
+import re
+from dataclasses import dataclass
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .lexer import Lexer, LexerError
+from .parser import Parser
+from .arena import Arena
+from .ast_nodes import Statement
+from .semantic import SemanticAnalyzer, Symbol
+from .pine_types import PineType
+from .rules import RuleRunner, SemanticCheckRule
+from .context import AnalysisContext
+from .diagnostics import Diagnostic, Severity
+from .engine import lint_source
+
+# Semantic results kept per chunk for differing global environments, e.g.
+# for identical statements at several places in the buffer.
+MAX_ANALYSES_PER_CHUNK = 4
+
+# Candidate chunks whose brackets and last token are memoized, enough for
+# buffers of several thousand top-level statements
+SEGMENT_CACHE_SIZE = 16384
+
+# Node reprs embedded in names and messages carry their line numbers.
+_POSITION = "line="
+_POSITION_RE = re.compile(r"\bline=(\d+)")
+
+# First characters of lines that never start a top-level statement
+_CONTINUATION_CHARS = frozenset(" \t)]}/")
+
+# What changes the bracket depth or hides brackets from it: comment
+# openers, strings (possibly unclosed) and brackets
+_LINE_TOKEN = re.compile(r"""//|/\*|"(?:[^"\\]|\\.)*"?|'(?:[^'\\]|\\.)*'?|[()\[\]]""")
+# Characters that can hide brackets or operators: quotes and comments
+_HIDING_CHARS = re.compile(r"""["'/]""")
+# A line ending with one of these continues on the next line. Compound
+# operators end with one of the characters.
+_CONTINUING = frozenset(["+", "-", "*", "/", "%", "<", ">", "=", "?", ":", ",", ".", "and", "or", "not"])
+_OPENING = frozenset("([")
+_CLOSING = frozenset(")]")
+
+
+class AnalysisCancelled(Exception):
+    """Raised by Document.diagnostics() when its cancel check fires."""
+
+
+def _never() -> bool:
+    return False
+
+
+@dataclass
+class TextEdit:
+    """
+    Replaces the text between two positions with `text`.
+
+    Lines and columns are 0-based and the end position is exclusive, as in
+    the Language Server Protocol. Columns count code points; see
+    `Document.apply_edits` for UTF-16 columns.
+    """
+
+    start_line: int
+    start_column: int
+    end_line: int
+    end_column: int
+    text: str
+
+
+@dataclass
+class UpdateStats:
+    """Work done by the last call to Document.diagnostics()."""
+
+    chunks: int = 0
+    parsed: int = 0
+    analyzed: int = 0
+
+
+def utf16_to_column(line: str, units: int) -> int:
+    """The code point column of the UTF-16 offset `units` in `line`."""
+    if line.isascii():
+        return units
+    count = 0
+    for column, char in enumerate(line):
+        if count >= units:
+            return column
+        count += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def column_to_utf16(line: str, column: int) -> int:
+    """The UTF-16 offset of the code point column `column` in `line`."""
+    if line.isascii():
+        return column
+    return column + sum(1 for char in line[:column] if ord(char) > 0xFFFF)
+
+
+def _normalize_newlines(text: str) -> str:
+    # Same newline handling as reading the file in text mode.
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _opens_comment(line: str, start: int) -> bool:
+    """Whether `line` leaves a block comment open after column `start`."""
+    pos = line.find("/*", start)
+    while pos >= 0:
+        if "//" in line[start:pos]:
+            return False
+        end = line.find("*/", pos + 2)
+        if end < 0:
+            return True
+        start = end + 2
+        pos = line.find("/*", start)
+    return False
+
+
+def _is_else(line: str) -> bool:
+    return line.startswith("else") and (
+        len(line) == 4 or not (line[4].isalnum() or line[4] == "_")
+    )
+
+
+def _line_starts(lines: List[str]) -> List[int]:
+    """
+    The lines with code in their first column, except comment lines, `else`
+    branches, lines starting with a closing bracket or a slash, and lines
+    inside block comments.
+    """
+    starts = []
+    in_comment = False
+    for i, line in enumerate(lines):
+        if in_comment:
+            end = line.find("*/")
+            if end >= 0:
+                in_comment = _opens_comment(line, end + 2)
+            continue
+
+        first = line[:1]
+        if first and first not in _CONTINUATION_CHARS and not (first == "e" and _is_else(line)):
+            starts.append(i)
+        if "/*" in line:
+            in_comment = _opens_comment(line, 0)
+    return starts
+
+
+def _last_token(line: str, start: int, end: int) -> Optional[str]:
+    """
+    The last word of line[start:end] if it is a keyword operator, else its
+    last character; None if the span is blank.
+    """
+    words = line[start:end].rsplit(None, 1)
+    if not words:
+        return None
+    last = words[-1]
+    return last if last in _CONTINUING else last[-1]
+
+
+def _scan_line(line: str, pos: int, closes: int, opens: int) -> Tuple[int, int, bool, Optional[str]]:
+    """
+    Scans `line` from `pos`, adding its brackets to the `closes` brackets
+    closed and the `opens` left open so far. Returns the new counts,
+    whether the line leaves a block comment open and its last token
+    outside comments as `_last_token` gives it.
+    """
+    # The last token is in the code after the last block comment, or before
+    # it if nothing follows
+    last = None
+    start = pos
+    end = len(line)
+    match = _LINE_TOKEN.search(line, pos)
+    while match:
+        token = match.group()
+        if token == "//":
+            end = match.start()
+            break
+        if token == "/*":
+            last = _last_token(line, start, match.start()) or last
+            close = line.find("*/", match.end())
+            if close < 0:
+                return closes, opens, True, last
+            start = close + 2
+            match = _LINE_TOKEN.search(line, start)
+            continue
+        if token in _OPENING:
+            opens += 1
+        elif token in _CLOSING:
+            if opens:
+                opens -= 1
+            else:
+                closes += 1
+        match = _LINE_TOKEN.search(line, match.end())
+    return closes, opens, False, _last_token(line, start, end) or last
+
+
+@lru_cache(maxsize=SEGMENT_CACHE_SIZE)
+def _segment_brackets(text: str) -> Tuple[int, int, Optional[bool]]:
+    """
+    Returns how many brackets `text` closes that were open before it, how
+    many it leaves open, and whether its last token continues the statement
+    on the next line (None if it has no code).
+    """
+    if not _HIDING_CHARS.search(text):
+        # No strings or comments: every bracket and the last word count
+        opens = text.count("(") + text.count("[")
+        closes = text.count(")") + text.count("]")
+        last = _last_token(text, 0, len(text))
+        return max(0, closes - opens), max(0, opens - closes), last and last in _CONTINUING
+
+    closes = opens = 0
+    last = None
+    in_comment = False
+    for line in text.split("\n"):
+        pos = 0
+        if in_comment:
+            end = line.find("*/")
+            if end < 0:
+                continue
+            pos = end + 2
+        closes, opens, in_comment, token = _scan_line(line, pos, closes, opens)
+        last = token or last
+    return closes, opens, last and last in _CONTINUING
+
+
+def chunk_starts(lines: List[str]) -> List[int]:
+    """
+    Returns the indexes of the lines that start a top-level chunk.
+
+    A chunk starts at a line with code in its first column, unless the
+    statement before it is still open: inside brackets, or after a line
+    ending with an operator or a comma. Comment lines, `else` branches,
+    lines starting with a closing bracket or a slash, and lines inside
+    block comments continue the current chunk. The first chunk always
+    starts at line 0.
+    """
+    candidates = _line_starts(lines)
+    if not candidates or candidates[0]:
+        candidates.insert(0, 0)
+    starts = []
+    depth = 0
+    continued = False
+    for start, end in zip(candidates, candidates[1:] + [len(lines)]):
+        if not depth and not continued:
+            starts.append(start)
+        closes, opens, continues = _segment_brackets("\n".join(lines[start:end]))
+        depth = max(0, depth - closes) + opens
+        if continues is not None:
+            continued = continues
+    return starts
+
+
+_NO_DIAGNOSTICS: Tuple[List[Diagnostic], ...] = ([], [], [])
+
+
+class _GlobalSymbols(dict):
+    """
+    Global scope symbols of one chunk.
+
+    Names the chunk does not define itself are looked up in the global
+    types left by the preceding chunks. Each such lookup is recorded
+    together with the type it found (None if the name was undefined), and
+    the chunk gets its own copy of the symbol so usage is counted per chunk.
+    """
+
+    def __init__(self, types: Dict[str, PineType]):
+        super().__init__()
+        self.types = types
+        self.deps: Dict[str, Optional[PineType]] = {}
+        self.imported: Dict[str, Symbol] = {}
+
+    def __contains__(self, name) -> bool:
+        return dict.__contains__(self, name) or self._lookup(name) is not None
+
+    def __missing__(self, name) -> Symbol:
+        sym = self._lookup(name)
+        if sym is None:
+            raise KeyError(name)
+        return sym
+
+    def _lookup(self, name: str) -> Optional[Symbol]:
+        if _POSITION in name:
+            # Destructuring targets are named after their node's repr, which
+            # includes its position, so they are never shared by chunks.
+            return None
+        sym = self.imported.get(name)
+        if sym is None and name not in self.deps:
+            type_ = self.deps[name] = self.types.get(name)
+            if type_ is not None:
+                sym = self.imported[name] = Symbol(name, type_, None)
+        return sym
+
+
+class _ChunkAnalysis:
+    """Semantic results of one chunk, with chunk-relative lines."""
+
+    __slots__ = (
+        "version", "dep_names", "dep_types", "internal_errors", "diagnostics",
+        "uses", "defs", "offset", "shifted",
+    )
+
+    def __init__(self, version: Optional[int], deps: Dict[str, Optional[PineType]]):
+        self.version = version
+        self.dep_names = tuple(deps)
+        self.dep_types = tuple(deps.values())
+        self.internal_errors: List[Diagnostic] = []
+        # Errors, warnings and unused variables of the inner scopes
+        self.diagnostics: Tuple[List[Diagnostic], ...] = _NO_DIAGNOSTICS
+        # Globals of earlier chunks used by this chunk
+        self.uses: List[str] = []
+        # (name, type, line, used) for each global defined here; line is
+        # None for symbols that are never reported as unused
+        self.defs: List[Tuple[str, PineType, Optional[int], bool]] = []
+        # Diagnostics moved to the chunk's last position
+        self.offset = 0
+        self.shifted = self.diagnostics
+
+    def matches(self, version: Optional[int], types: Dict[str, PineType]) -> bool:
+        if version != self.version:
+            return False
+        names = self.dep_names
+        return not names or tuple(map(types.get, names)) == self.dep_types
+
+    def at(self, offset: int) -> Tuple[List[Diagnostic], ...]:
+        if offset != self.offset and self.shifted is not _NO_DIAGNOSTICS:
+            self.shifted = tuple(_shifted(d, offset) for d in self.diagnostics)
+            self.offset = offset
+        return self.shifted
+
+
+class _Chunk:
+    """Parse result of one chunk."""
+
+    __slots__ = ("statements", "parse_errors", "lexer_error", "analyses", "_arena", "_placed")
+
+    def __init__(self, text: str):
+        self.statements: List[Statement] = []
+        # (message, line, column)
+        self.parse_errors: List[Tuple[str, int, int]] = []
+        self.lexer_error = False
+        self.analyses: List[_ChunkAnalysis] = []
+        self._arena: Optional[Arena] = None
+        # (start line, statements with file positions) of the last placement
+        self._placed: Optional[Tuple[int, List[Statement]]] = None
+
+        parser = Parser(Lexer(text).iter_tokens())
+        try:
+            self.statements = parser.parse()
+        except LexerError:
+            self.lexer_error = True
+            return
+        self.parse_errors = [(str(e), e.line, e.column) for e in parser.errors]
+
+    def statements_at(self, start: int) -> List[Statement]:
+        """The statements with their positions moved to start at line `start`."""
+        if not start:
+            return self.statements
+        if self._placed is None or self._placed[0] != start:
+            if self._arena is None:
+                self._arena = Arena.from_tree(self.statements)
+            self._placed = (start, self._arena.shifted(start).statements())
+        return self._placed[1]
+
+
+class Document:
+    """
+    An editor buffer that is re-linted incrementally.
+
+    Apply edits with apply_edits() (or replace the whole text with
+    set_text(), which still reuses every unchanged chunk) and call
+    diagnostics() for the current results. Diagnostics are computed lazily
+    and memoized until the next change.
+    """
+
+    def __init__(
+        self,
+        text: str = "",
+        file_path: str = "editor.pine",
+        version: int = 0,
+        runner: Optional[RuleRunner] = None,
+    ):
+        self.file_path = file_path
+        self.version = version
+        self.runner = runner if runner is not None else RuleRunner()
+        self.stats = UpdateStats()
+        self._lines: List[str] = _normalize_newlines(text).split("\n")
+        self._chunks: Dict[str, _Chunk] = {}
+        # Chunks that dropped out of the layout, oldest first, kept for when
+        # the text returns to them: an unclosed bracket while typing merges
+        # the rest of the buffer into one chunk until it is closed. At most
+        # as many as the largest layout seen.
+        self._retired: Dict[str, _Chunk] = {}
+        self._peak_chunks = 0
+        # Layout of the last analysis as (chunk, start line, text), its start
+        # lines, and the first line changed since; the layout before it is
+        # kept as it is.
+        self._layout: List[Tuple[_Chunk, int, str]] = []
+        self._starts: List[int] = []
+        self._dirty = 0
+        self._statements: List[Statement] = []
+        self._diagnostics: Optional[List[Diagnostic]] = None
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._lines)
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    def line(self, index: int) -> str:
+        return self._lines[index]
+
+    def set_text(self, text: str, version: Optional[int] = None):
+        lines = _normalize_newlines(text).split("\n")
+        same = 0
+        for old, new in zip(self._lines, lines):
+            if old != new:
+                break
+            same += 1
+        self._lines = lines
+        self._dirty = min(self._dirty, same)
+        self._changed(version)
+
+    def apply_edit(self, edit: TextEdit, version: Optional[int] = None):
+        self.apply_edits([edit], version)
+
+    def apply_edits(
+        self, edits: Iterable[TextEdit], version: Optional[int] = None, utf16: bool = False
+    ):
+        """
+        Applies edits in order; each edit's positions refer to the text left
+        by the previous one. With `utf16`, columns count UTF-16 code units,
+        as Language Server Protocol clients send them by default.
+
+        The edits apply together: if one is out of range, a ValueError is
+        raised and the document is left unchanged.
+        """
+        lines = list(self._lines)
+        dirty = self._dirty
+        for edit in edits:
+            if not 0 <= edit.start_line <= edit.end_line < len(lines):
+                raise ValueError(
+                    f"Edit range {edit.start_line}-{edit.end_line} is outside "
+                    f"the document ({len(lines)} lines)."
+                )
+            start_line, end_line = lines[edit.start_line], lines[edit.end_line]
+            start_column, end_column = edit.start_column, edit.end_column
+            if utf16:
+                start_column = utf16_to_column(start_line, start_column)
+                end_column = utf16_to_column(end_line, end_column)
+            replacement = (
+                start_line[:start_column] + _normalize_newlines(edit.text) + end_line[end_column:]
+            )
+            lines[edit.start_line : edit.end_line + 1] = replacement.split("\n")
+            dirty = min(dirty, edit.start_line)
+        self._lines = lines
+        self._dirty = dirty
+        self._changed(version)
+
+    def _retire(self, old: Dict[str, _Chunk], chunks: Dict[str, _Chunk]):
+        retired = self._retired
+        for text in retired.keys() & chunks.keys():
+            del retired[text]
+        for text in old.keys() - chunks.keys():
+            retired.pop(text, None)
+            retired[text] = old[text]
+        self._peak_chunks = max(self._peak_chunks, len(chunks))
+        while len(retired) > self._peak_chunks:
+            del retired[next(iter(retired))]
+
+    def _changed(self, version: Optional[int]):
+        if version is not None:
+            self.version = version
+        self._diagnostics = None
+
+    @property
+    def statements(self) -> List[Statement]:
+        """
+        Top-level statements of the last analysis. Their positions are
+        relative to the chunk they were parsed from.
+        """
+        self.diagnostics()
+        return self._statements
+
+    def diagnostics(self, cancelled: Optional[Callable[[], bool]] = None) -> List[Diagnostic]:
+        """
+        Returns the diagnostics of the current text.
+
+        `cancelled` is polled between chunks; once it returns True the run
+        stops with AnalysisCancelled. Work finished so far stays cached.
+        """
+        if self._diagnostics is None:
+            self._diagnostics = self._lint(cancelled or _never)
+        return self._diagnostics
+
+    def _lint(self, cancelled: Callable[[], bool]) -> List[Diagnostic]:
+        lines = self._lines
+        file_path = self.file_path
+        stats = UpdateStats()
+
+        # Chunks that end before the line ahead of the first change keep
+        # their place: whether a line starts a chunk depends only on the
+        # lines before it. The scan restarts at the chunk holding that line.
+        keep = max(0, bisect_left(self._starts, self._dirty) - 1)
+        rescan = self._starts[keep] if keep else 0
+        starts = self._starts[:keep] + [start + rescan for start in chunk_starts(lines[rescan:])]
+        layout = self._layout[:keep]
+        old = self._chunks
+        chunks = {text: chunk for chunk, _, text in layout}
+        for start, end in zip(starts[keep:], starts[keep + 1:] + [len(lines)]):
+            text = "\n".join(lines[start:end])
+            chunk = chunks.get(text) or old.get(text) or self._retired.get(text)
+            if chunk is None:
+                if cancelled():
+                    raise AnalysisCancelled()
+                # Kept in the old table too, in case this run is cancelled
+                chunk = old[text] = _Chunk(text)
+                stats.parsed += 1
+            chunks[text] = chunk
+            layout.append((chunk, start, text))
+        self._chunks = chunks
+        self._retire(old, chunks)
+        self._layout = layout
+        self._starts = starts
+        self._dirty = len(lines)
+        stats.chunks = len(layout)
+        self.stats = stats
+        self._statements = [s for chunk, _, _ in layout for s in chunk.statements]
+
+        # 1. Lexer errors abort the whole file. A chunk can also fail to lex
+        # because a token (a string) continues into the next chunk, so the
+        # whole text is linted as in a full run.
+        if any(chunk.lexer_error for chunk, _, _ in layout):
+            return lint_source(self.text, file_path)
+
+        # 2. Parse errors
+        diagnostics = [
+            Diagnostic(Severity.ERROR, "E002", message, line + start, column, file_path)
+            for chunk, start, _ in layout
+            for message, line, column in chunk.parse_errors
+        ]
+        if diagnostics:
+            return diagnostics
+
+        # 3. Rules: source-only rules see the whole text and the semantic
+        # check is assembled from the chunk results. Other rules read the
+        # AST, so they get the statements moved to their file positions and
+        # analyze the whole file again.
+        text = self.text
+        context = AnalysisContext(text, None, file_path)
+        ast_context = None
+        for rule in self.runner.rules:
+            if isinstance(rule, SemanticCheckRule):
+                if self._statements:
+                    diagnostics.extend(self._semantic_diagnostics(
+                        layout, context.pine_version, stats, cancelled
+                    ))
+            elif rule.source_only:
+                diagnostics.extend(rule.check(context))
+            else:
+                if ast_context is None:
+                    statements = [s for chunk, start, _ in layout for s in chunk.statements_at(start)]
+                    ast_context = AnalysisContext(text, statements, file_path)
+                diagnostics.extend(rule.check(ast_context))
+        return diagnostics
+
+    def _semantic_diagnostics(
+        self,
+        layout,
+        version: Optional[int],
+        stats: UpdateStats,
+        cancelled: Callable[[], bool],
+    ) -> List[Diagnostic]:
+        # Global symbols in first-definition order, like a single global
+        # scope: their types, the declaration line of reportable variables,
+        # and whether they have been used.
+        types: Dict[str, PineType] = {}
+        declared: Dict[str, Optional[int]] = {}
+        used: Dict[str, bool] = {}
+
+        internal_errors: List[Diagnostic] = []
+        errors: List[Diagnostic] = []
+        warnings: List[Diagnostic] = []
+        unused: List[Diagnostic] = []
+
+        for chunk, start, _ in layout:
+            if not chunk.statements:
+                continue
+
+            analysis = None
+            for candidate in chunk.analyses:
+                if candidate.matches(version, types):
+                    analysis = candidate
+                    break
+            if analysis is None:
+                if cancelled():
+                    raise AnalysisCancelled()
+                analysis = self._analyze(chunk, version, types)
+                chunk.analyses.insert(0, analysis)
+                del chunk.analyses[MAX_ANALYSES_PER_CHUNK:]
+                stats.analyzed += 1
+
+            if analysis.internal_errors:
+                internal_errors += analysis.internal_errors
+            if analysis.diagnostics is not _NO_DIAGNOSTICS:
+                chunk_errors, chunk_warnings, chunk_unused = analysis.at(start)
+                errors += chunk_errors
+                warnings += chunk_warnings
+                unused += chunk_unused
+
+            for name in analysis.uses:
+                used[name] = True
+            for name, type_, line, was_used in analysis.defs:
+                if _POSITION in name:
+                    name = _shifted_text(name, start)
+                types[name] = type_
+                declared[name] = None if line is None else line + start
+                used[name] = was_used
+
+        global_unused = [
+            SemanticCheckRule.unused_diagnostic(name, declared[name], self.file_path)
+            for name in types
+            if declared[name] is not None and not used[name] and not name.startswith("_")
+        ]
+        return internal_errors + errors + warnings + global_unused + unused
+
+    def _analyze(
+        self, chunk: _Chunk, version: Optional[int], types: Dict[str, PineType]
+    ) -> _ChunkAnalysis:
+        file_path = self.file_path
+        analyzer = SemanticAnalyzer(version)
+        symbols = _GlobalSymbols(types)
+        analyzer.global_scope.symbols = symbols
+
+        internal_errors = []
+        try:
+            for stmt in chunk.statements:
+                stmt.accept(analyzer)
+        except Exception as e:
+            traceback.print_exc()
+            internal_errors.append(SemanticCheckRule.internal_error_diagnostic(e, file_path))
+
+        analysis = _ChunkAnalysis(version, symbols.deps)
+        analysis.internal_errors = internal_errors
+        diagnostics = (
+            [SemanticCheckRule.error_diagnostic(err, file_path) for err in analyzer.errors],
+            [SemanticCheckRule.warning_diagnostic(w, file_path) for w in analyzer.warnings],
+            [
+                d
+                for scope in analyzer.all_scopes[1:]
+                for d in SemanticCheckRule.unused_diagnostics(scope, file_path)
+            ],
+        )
+        if any(diagnostics):
+            analysis.diagnostics = analysis.shifted = diagnostics
+        analysis.uses = [name for name, sym in symbols.imported.items() if sym.usage_count]
+        for name, sym in dict.items(symbols):
+            reportable = sym.is_mutable and sym.declared_at is not None
+            analysis.defs.append((
+                name,
+                sym.type,
+                sym.declared_at.line if reportable else None,
+                sym.usage_count > 0,
+            ))
+        return analysis
+
+
+def _shifted_text(text: str, offset: int) -> str:
+    return _POSITION_RE.sub(lambda m: f"{_POSITION}{int(m.group(1)) + offset}", text)
+
+
+def _shifted(diagnostics: List[Diagnostic], offset: int) -> List[Diagnostic]:
+    if not offset:
+        return diagnostics
+    shifted = []
+    for d in diagnostics:
+        message, suggestion = d.message, d.suggestion
+        if _POSITION in message:
+            message = _shifted_text(message, offset)
+            if suggestion:
+                suggestion = _shifted_text(suggestion, offset)
+        shifted.append(Diagnostic(
+            d.severity, d.code, message, d.line + offset, d.column, d.file_path, suggestion
+        ))
+    return shifted
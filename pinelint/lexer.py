@@ -4,13 +4,15 @@ Pine Script Lexer.
 
 import re
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import List, Optional, Generator, Tuple
+from enum import IntEnum, auto
+from typing import List, Optional, Iterable, Iterator, Tuple
 
 from .pine_spec import PINE_KEYWORDS
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    """Token kinds, as small ints so the parser can index tables by them."""
+
     # Structural
     EOF = auto()
     NEWLINE = auto()
@@ -48,7 +50,7 @@ class TokenType(Enum):
     ERROR = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: TokenType
     value: str
@@ -61,6 +63,71 @@ class LexerError(Exception):
     pass
 
 
+# Token rules, tried in order at every position.
+# Note: Order matters! Patterns must not contain capturing groups, the
+# master pattern maps each rule to its group index.
+TOKEN_RULES: List[Tuple[str, TokenType]] = [
+    # Comments: We handle them separately or as a high priority rule
+    (r"//[^\n]*", TokenType.COMMENT),
+    (r"/\*[\s\S]*?\*/", TokenType.COMMENT),
+    # Strings
+    (r"'(?:[^'\\]|\\.)*'", TokenType.LITERAL_STRING),
+    (r'"(?:[^"\\]|\\.)*"', TokenType.LITERAL_STRING),
+    # Colors (Hex)
+    (r"#[0-9A-Fa-f]{6}(?:[0-9A-Fa-f]{2})?", TokenType.LITERAL_COLOR),
+    # Numbers
+    (r"\d+\.\d+(?:[eE][+-]?\d+)?", TokenType.LITERAL_FLOAT),
+    (r"\.\d+(?:[eE][+-]?\d+)?", TokenType.LITERAL_FLOAT),
+    (r"\d+[eE][+-]?\d+", TokenType.LITERAL_FLOAT),
+    (r"\d+", TokenType.LITERAL_INTEGER),
+    
+    # Operators (Multi-char first)
+    (r"==|!=|<=|>=|:=|=>", TokenType.OPERATOR),
+    (r"\+|-|\*|/|%", TokenType.OPERATOR), # Removed ? from here
+    (r"!=", TokenType.OPERATOR),
+    (r"<|>", TokenType.OPERATOR),
+    (r"=", TokenType.OPERATOR),
+    (r"\?", TokenType.QUESTION), # Explicit ?
+    (r":", TokenType.COLON),     # Explicit :
+    
+    # Delimiters
+    (r"\(", TokenType.LPAREN),
+    (r"\)", TokenType.RPAREN),
+    (r"\[", TokenType.LBRACKET),
+    (r"\]", TokenType.RBRACKET),
+    (r"\{", TokenType.LBRACE),
+    (r"\}", TokenType.RBRACE),
+    (r",", TokenType.COMMA),
+    # Dot is tricky. It's a delimiter/access operator.
+    (r"\.", TokenType.DOT),
+    # Identifiers (and keywords)
+    (r"[a-zA-Z_][a-zA-Z0-9_]*", TokenType.IDENTIFIER),
+    # Newline (we handle indentation on newlines)
+    (r"\n", TokenType.NEWLINE),
+    # Whitespace (skip)
+    (r"[ \t]+", TokenType.WHITESPACE),
+]
+
+# Compiled once per process. Group i + 1 is rule i, so `match.lastindex`
+# indexes straight into GROUP_TYPES.
+MASTER_PATTERN = re.compile("|".join(f"({pattern})" for pattern, _ in TOKEN_RULES))
+GROUP_TYPES: Tuple[Optional[TokenType], ...] = (None,) + tuple(
+    type_ for _, type_ in TOKEN_RULES
+)
+
+# Keyword and operator spellings, interned so every occurrence shares one string.
+KEYWORDS = {kw: kw for kw in PINE_KEYWORDS + ["and", "or", "not"]}
+OPERATORS = {
+    op: op
+    for op in ["==", "!=", "<=", ">=", ":=", "=>", "+", "-", "*", "/", "%", "<", ">", "="]
+}
+
+# Only these token types can span lines.
+_MULTILINE_TYPES = frozenset(
+    (TokenType.NEWLINE, TokenType.COMMENT, TokenType.LITERAL_STRING)
+)
+
+
 class Lexer:
     """
     Stateful tokenizer for Pine Script.
@@ -71,199 +138,165 @@ class Lexer:
         self.tokens: List[Token] = []
         self.indent_stack: List[int] = [0]
         self.line_num = 1
-
-        # Regex Patterns
-        # Note: Order matters!
-        self.rules = [
-            # Comments: We handle them separately or as a high priority rule
-            (r"//[^\n]*", TokenType.COMMENT),
-            (r"/\*[\s\S]*?\*/", TokenType.COMMENT),
-            # Strings
-            (r"'([^'\\]|\\.)*'", TokenType.LITERAL_STRING),
-            (r'"([^"\\]|\\.)*"', TokenType.LITERAL_STRING),
-            # Colors (Hex)
-            (r"#[0-9A-Fa-f]{6}([0-9A-Fa-f]{2})?", TokenType.LITERAL_COLOR),
-            # Numbers
-            (r"\d+\.\d+([eE][+-]?\d+)?", TokenType.LITERAL_FLOAT),
-            (r"\.\d+([eE][+-]?\d+)?", TokenType.LITERAL_FLOAT),
-            (r"\d+[eE][+-]?\d+", TokenType.LITERAL_FLOAT),
-            (r"\d+", TokenType.LITERAL_INTEGER),
-            
-            # Operators (Multi-char first)
-            (r"==|!=|<=|>=|:=|=>", TokenType.OPERATOR),
-            (r"\+|-|\*|/|%", TokenType.OPERATOR), # Removed ? from here
-            (r"!=", TokenType.OPERATOR),
-            (r"<|>", TokenType.OPERATOR),
-            (r"=", TokenType.OPERATOR),
-            (r"\?", TokenType.QUESTION), # Explicit ?
-            (r":", TokenType.COLON),     # Explicit :
-            
-            # Delimiters
-            (r"\(", TokenType.LPAREN),
-            (r"\)", TokenType.RPAREN),
-            (r"\[", TokenType.LBRACKET),
-            (r"\]", TokenType.RBRACKET),
-            (r"\{", TokenType.LBRACE),
-            (r"\}", TokenType.RBRACE),
-            (r",", TokenType.COMMA),
-            # Dot is tricky. It's a delimiter/access operator.
-            (r"\.", TokenType.DOT),
-            # Identifiers (and keywords)
-            (r"[a-zA-Z_][a-zA-Z0-9_]*", TokenType.IDENTIFIER),
-            # Newline (we handle indentation on newlines)
-            (r"\n", TokenType.NEWLINE),
-            # Whitespace (skip)
-            (r"[ \t]+", TokenType.WHITESPACE),
-        ]
+        self.rules = TOKEN_RULES
 
     def tokenize(self) -> List[Token]:
         """
-        Main entry point.
+        Main entry point. Materializes the token stream as a list.
         """
-        raw_tokens = self._generate_raw_tokens()
-        processed_tokens = self._process_indentation_and_comments(raw_tokens)
-        self.tokens = processed_tokens
+        self.tokens = list(self.iter_tokens())
         return self.tokens
 
+    def iter_tokens(self) -> Iterator[Token]:
+        """
+        Streams the final tokens (comments removed, INDENT/DEDENT/NEWLINE
+        injected) without building intermediate lists. LexerError is raised
+        lazily, when the offending input is reached.
+        """
+        return self._iter_indentation_and_comments(self._iter_raw_tokens())
+
     def _generate_raw_tokens(self) -> List[Token]:
-        tokens = []
+        return list(self._iter_raw_tokens())
+
+    def _process_indentation_and_comments(self, raw_tokens: Iterable[Token]) -> List[Token]:
+        return list(self._iter_indentation_and_comments(raw_tokens))
+
+    def _iter_raw_tokens(self) -> Iterator[Token]:
+        source = self.source
+        group_types = GROUP_TYPES
+        multiline = _MULTILINE_TYPES
+        keywords = KEYWORDS
+        operators = OPERATORS
+        # Identifier spellings seen in this file, so repeated names share one string
+        names = {}
         pos = 0
         line = 1
-        col = 1
-
-        regex_parts = []
-        for idx, (pattern, type_) in enumerate(self.rules):
-            group_name = f"GROUP_{idx}"
-            regex_parts.append(f"(?P<{group_name}>{pattern})")
-
-        master_pattern = re.compile("|".join(regex_parts))
+        line_start = 0  # Absolute position of the current line's first char
 
-        while pos < len(self.source):
-            match = master_pattern.match(self.source, pos)
-            if not match:
+        for match in MASTER_PATTERN.finditer(source):
+            if match.start() != pos:
+                # finditer skipped input that no rule matches
                 raise LexerError(
-                    f"Unexpected character at line {line}, column {col}: {self.source[pos]}"
+                    f"Unexpected character at line {line}, column {pos - line_start + 1}: {source[pos]}"
                 )
 
-            # Find which group matched
-            kind = match.lastgroup
-            value = match.group(kind)
-            idx = int(kind.split("_")[1])
-            token_type = self.rules[idx][1]
-
-            # Calculate token position data
-            token = Token(token_type, value, line, col, pos)
-            tokens.append(token)
-
-            newlines = value.count("\n")
-            if newlines > 0:
-                line += newlines
-                last_newline_idx = value.rfind("\n")
-                col = len(value) - last_newline_idx
-            else:
-                col += len(value)
+            token_type = group_types[match.lastindex]
+            value = match.group()
 
-            pos += len(value)
+            if token_type is TokenType.IDENTIFIER:
+                if value in keywords:
+                    token_type = TokenType.KEYWORD
+                    value = keywords[value]
+                else:
+                    value = names.setdefault(value, value)
+            elif token_type is TokenType.OPERATOR:
+                value = operators[value]
+
+            yield Token(token_type, value, line, pos - line_start + 1, pos)
+
+            pos = match.end()
+            if token_type in multiline:
+                newlines = value.count("\n")
+                if newlines > 0:
+                    line += newlines
+                    line_start = match.start() + value.rfind("\n") + 1
+
+        if pos < len(source):
+            raise LexerError(
+                f"Unexpected character at line {line}, column {pos - line_start + 1}: {source[pos]}"
+            )
 
-        return tokens
+    def _iter_indentation_and_comments(self, raw_tokens: Iterable[Token]) -> Iterator[Token]:
+        # Only the tokens of the current physical line are buffered.
+        line_tokens: List[Token] = []
+        last: Optional[Token] = None
 
-    def _process_indentation_and_comments(self, raw_tokens: List[Token]) -> List[Token]:
-        final_tokens = []
-        clean_tokens = []
         for t in raw_tokens:
             if t.type == TokenType.COMMENT:
-                if "\n" in t.value:
-                    clean_tokens.append(
-                        Token(TokenType.NEWLINE, "\n", t.line, t.column, t.position)
-                    )
+                # A block comment spanning lines acts as a line break
+                if "\n" not in t.value:
+                    continue
+            elif t.type != TokenType.NEWLINE:
+                line_tokens.append(t)
                 continue
-            clean_tokens.append(t)
 
-        current_line_tokens = []
-        lines_of_tokens = []
+            if line_tokens:
+                out = self._process_line(line_tokens)
+                if out:
+                    yield from out
+                    last = out[-1]
+                line_tokens = []
 
-        for t in clean_tokens:
-            if t.type == TokenType.NEWLINE:
-                lines_of_tokens.append(current_line_tokens)
-                current_line_tokens = []
-            else:
-                current_line_tokens.append(t)
+        if line_tokens:
+            out = self._process_line(line_tokens)
+            if out:
+                yield from out
+                last = out[-1]
 
-        if current_line_tokens:
-            lines_of_tokens.append(current_line_tokens)
+        pos = last.position if last else 0
+        line = last.line if last else 1
 
-        final_output = []
-
-        for line_tokens in lines_of_tokens:
-            if not line_tokens:
-                continue
+        dedent = Token(TokenType.DEDENT, "", line, 1, pos)
+        while len(self.indent_stack) > 1:
+            self.indent_stack.pop()
+            yield dedent
 
-            indent_level = 0
-            content_start_idx = 0
+        yield Token(TokenType.EOF, "", line, 1, pos)
 
-            for i, t in enumerate(line_tokens):
-                if t.type == TokenType.WHITESPACE:
-                    # Treat tabs as 4 spaces
-                    expanded = t.value.replace("\t", "    ")
-                    indent_level += len(expanded)
-                else:
-                    content_start_idx = i
-                    break
+    def _process_line(self, line_tokens: List[Token]) -> List[Token]:
+        """
+        Returns the output tokens for one non-empty physical line.
+        """
+        indent_level = 0
+        content_start_idx = 0
+
+        for i, t in enumerate(line_tokens):
+            if t.type == TokenType.WHITESPACE:
+                # Treat tabs as 4 spaces
+                expanded = t.value.replace("\t", "    ")
+                indent_level += len(expanded)
             else:
-                continue
+                content_start_idx = i
+                break
+        else:
+            return []
+
+        output = []
+        current_indent = self.indent_stack[-1]
+
+        if indent_level > current_indent:
+            self.indent_stack.append(indent_level)
+            first_tok = line_tokens[content_start_idx]
+            output.append(
+                Token(TokenType.INDENT, "", first_tok.line, 1, first_tok.position)
+            )
 
-            current_indent = self.indent_stack[-1]
+        elif indent_level < current_indent:
+            # Consecutive DEDENTs share a position, so they share one token
+            first_tok = line_tokens[content_start_idx]
+            dedent = Token(TokenType.DEDENT, "", first_tok.line, 1, first_tok.position)
+            while indent_level < self.indent_stack[-1]:
+                self.indent_stack.pop()
+                output.append(dedent)
 
-            if indent_level > current_indent:
-                self.indent_stack.append(indent_level)
-                first_tok = line_tokens[content_start_idx]
-                final_output.append(
-                    Token(TokenType.INDENT, "", first_tok.line, 1, first_tok.position)
+            if indent_level != self.indent_stack[-1]:
+                raise LexerError(
+                    f"Indentation error at line {line_tokens[content_start_idx].line}"
                 )
 
-            elif indent_level < current_indent:
-                while indent_level < self.indent_stack[-1]:
-                    self.indent_stack.pop()
-                    first_tok = line_tokens[content_start_idx]
-                    final_output.append(
-                        Token(
-                            TokenType.DEDENT, "", first_tok.line, 1, first_tok.position
-                        )
-                    )
-
-                if indent_level != self.indent_stack[-1]:
-                    raise LexerError(
-                        f"Indentation error at line {line_tokens[content_start_idx].line}"
-                    )
-
-            for t in line_tokens[content_start_idx:]:
-                if t.type == TokenType.WHITESPACE:
-                    continue
-
-                if t.type == TokenType.IDENTIFIER:
-                    if t.value in PINE_KEYWORDS or t.value in ["and", "or", "not"]:
-                        t.type = TokenType.KEYWORD
-
-                final_output.append(t)
-
-            last_tok = line_tokens[-1]
-            final_output.append(
-                Token(
-                    TokenType.NEWLINE,
-                    "\n",
-                    last_tok.line,
-                    last_tok.column,
-                    last_tok.position,
-                )
+        # Keywords were already classified when the raw tokens were produced
+        for t in line_tokens[content_start_idx:]:
+            if t.type is not TokenType.WHITESPACE:
+                output.append(t)
+
+        last_tok = line_tokens[-1]
+        output.append(
+            Token(
+                TokenType.NEWLINE,
+                "\n",
+                last_tok.line,
+                last_tok.column,
+                last_tok.position,
             )
-
-        pos = final_output[-1].position if final_output else 0
-        line = final_output[-1].line if final_output else 1
-
-        while len(self.indent_stack) > 1:
-            self.indent_stack.pop()
-            final_output.append(Token(TokenType.DEDENT, "", line, 1, pos))
-
-        final_output.append(Token(TokenType.EOF, "", line, 1, pos))
-
-        return final_output
+        )
+        return output
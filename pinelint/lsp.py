@@ -0,0 +1,352 @@
+"""
+Language Server.
+
+Serves diagnostics over the Language Server Protocol on stdin/stdout. The
+process stays resident, so the spec tables, the rule runner and every open
+document, with its parsed and analyzed chunks, stay warm between edits.
+
+Edits are queued by the reader thread and applied by a single analysis
+thread, which owns the documents. Analysis starts once a document has been
+quiet for the debounce delay, and a run is abandoned as soon as a newer
+edit for the same document arrives.
+
+Positions are in UTF-16 code units, the protocol's default, unless the
+client offers "utf-32" in its positionEncodings; then they are code points,
+which the linter uses internally, and need no conversion.
+"""
+
+import json
+import sys
+import threading
+import time
+import traceback
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+from . import __version__
+from .diagnostics import Diagnostic, Severity
+from .incremental import AnalysisCancelled, Document, TextEdit, column_to_utf16
+from .rules import RuleRunner
+
+# Seconds a document must stay unchanged before it is analyzed.
+DEFAULT_DEBOUNCE = 0.2
+
+# Protocol constants
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+_SEVERITIES = {
+    Severity.ERROR: 1,
+    Severity.WARNING: 2,
+    Severity.INFO: 3,
+    Severity.HINT: 4,
+}
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Reads one `Content-Length` framed message. Returns None at end of stream.
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+
+    if length is None:
+        raise ValueError("Message without Content-Length header.")
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return json.loads(body.decode("utf-8"))
+
+
+def write_message(stream: BinaryIO, message: Dict[str, Any]):
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> str:
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return uri
+    return url2pathname(unquote(parsed.path))
+
+
+def to_lsp_diagnostic(diag: Diagnostic, line_text: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Converts a diagnostic. Given the text of its line, the column is
+    converted to UTF-16 code units.
+    """
+    character = max(diag.column - 1, 0)
+    if line_text is not None:
+        character = column_to_utf16(line_text, character)
+    position = {"line": max(diag.line - 1, 0), "character": character}
+    message = diag.message
+    if diag.suggestion:
+        message += f"\n{diag.suggestion}"
+    return {
+        "range": {"start": position, "end": position},
+        "severity": _SEVERITIES[diag.severity],
+        "code": diag.code,
+        "source": "pinelint",
+        "message": message,
+    }
+
+
+def to_text_edit(change: Dict[str, Any]) -> Optional[TextEdit]:
+    """
+    Converts a content change event; None means the whole text is replaced.
+    """
+    if "range" not in change:
+        return None
+    start, end = change["range"]["start"], change["range"]["end"]
+    return TextEdit(
+        start["line"], start["character"], end["line"], end["character"], change["text"]
+    )
+
+
+class LanguageServer:
+    def __init__(
+        self,
+        reader: BinaryIO,
+        writer: BinaryIO,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.debounce = debounce
+        self.runner = RuleRunner()
+        # Whether positions are UTF-16 code units, until a client offers utf-32
+        self.utf16 = True
+        # Owned by the analysis thread
+        self.documents: Dict[str, Document] = {}
+        # Counters, mostly for tests
+        self.published = 0
+        self.cancelled = 0
+
+        self._write_lock = threading.Lock()
+        self._changed = threading.Condition()
+        # Guarded by _changed: queued operations and analysis deadlines per URI
+        self._queued: Dict[str, List[Tuple[str, Any, Optional[int]]]] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._running = False
+        self._shutdown_requested = False
+        self._worker = threading.Thread(
+            target=self._analysis_loop, name="pinelint-analysis", daemon=True
+        )
+
+        self._requests = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+        }
+        self._notifications = {
+            "initialized": lambda params: None,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didClose": self.did_close,
+            "textDocument/didSave": lambda params: None,
+        }
+
+    # -- Main loop ---------------------------------------------------------
+
+    def serve(self) -> int:
+        """
+        Handles messages until `exit` or end of input and returns the exit
+        code: 0 after a clean shutdown, 1 otherwise.
+        """
+        self._running = True
+        self._worker.start()
+        try:
+            while True:
+                message = read_message(self.reader)
+                if message is None or message.get("method") == "exit":
+                    break
+                self._dispatch(message)
+        finally:
+            with self._changed:
+                self._running = False
+                self._changed.notify()
+            self._worker.join()
+        return 0 if self._shutdown_requested else 1
+
+    def _dispatch(self, message: Dict[str, Any]):
+        method = message.get("method")
+        params = message.get("params") or {}
+        request_id = message.get("id")
+
+        if request_id is None:
+            handler = self._notifications.get(method)
+            if handler is not None:
+                try:
+                    handler(params)
+                except Exception:
+                    traceback.print_exc()
+            return
+
+        handler = self._requests.get(method)
+        if handler is None:
+            self._send_error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+            return
+        if self._shutdown_requested:
+            self._send_error(request_id, INVALID_REQUEST, "Server is shutting down.")
+            return
+        try:
+            result = handler(params)
+        except Exception as e:
+            traceback.print_exc()
+            self._send_error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+            return
+        self._send({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def _send(self, message: Dict[str, Any]):
+        with self._write_lock:
+            write_message(self.writer, message)
+
+    def _send_error(self, request_id, code: int, message: str):
+        self._send({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        })
+
+    # -- Requests and notifications -----------------------------------------
+
+    def initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        general = (params.get("capabilities") or {}).get("general") or {}
+        self.utf16 = "utf-32" not in (general.get("positionEncodings") or [])
+        return {
+            "capabilities": {
+                "positionEncoding": "utf-16" if self.utf16 else "utf-32",
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": TEXT_DOCUMENT_SYNC_INCREMENTAL,
+                },
+            },
+            "serverInfo": {"name": "pinelint", "version": __version__},
+        }
+
+    def shutdown(self, params: Dict[str, Any]) -> None:
+        self._shutdown_requested = True
+        return None
+
+    def did_open(self, params: Dict[str, Any]):
+        doc = params["textDocument"]
+        self._queue(doc["uri"], "open", doc["text"], doc.get("version"), self.debounce)
+
+    def did_change(self, params: Dict[str, Any]):
+        doc = params["textDocument"]
+        self._queue(
+            doc["uri"], "change", params["contentChanges"], doc.get("version"), self.debounce
+        )
+
+    def did_close(self, params: Dict[str, Any]):
+        self._queue(params["textDocument"]["uri"], "close", None, None, 0.0)
+
+    def _queue(self, uri: str, kind: str, payload: Any, version: Optional[int], delay: float):
+        with self._changed:
+            self._queued.setdefault(uri, []).append((kind, payload, version))
+            self._deadlines[uri] = time.monotonic() + delay
+            self._changed.notify()
+
+    # -- Analysis thread ------------------------------------------------------
+
+    def _analysis_loop(self):
+        while True:
+            with self._changed:
+                uri = None
+                while self._running:
+                    now = time.monotonic()
+                    due = [u for u, deadline in self._deadlines.items() if deadline <= now]
+                    if due:
+                        uri = min(due, key=self._deadlines.__getitem__)
+                        del self._deadlines[uri]
+                        operations = self._queued.pop(uri, [])
+                        break
+                    timeout = None
+                    if self._deadlines:
+                        timeout = min(self._deadlines.values()) - now
+                    self._changed.wait(timeout)
+                if uri is None:
+                    return
+
+            try:
+                self._analyze(uri, operations)
+            except Exception:
+                traceback.print_exc()
+
+    def _analyze(self, uri: str, operations: List[Tuple[str, Any, Optional[int]]]):
+        document = self.documents.get(uri)
+        for kind, payload, version in operations:
+            if kind == "open":
+                document = Document(payload, uri_to_path(uri), version or 0, self.runner)
+                self.documents[uri] = document
+            elif kind == "close":
+                self.documents.pop(uri, None)
+                document = None
+            elif document is not None:
+                edits = []
+                for change in payload:
+                    edit = to_text_edit(change)
+                    if edit is None:
+                        if edits:
+                            document.apply_edits(edits, utf16=self.utf16)
+                            edits = []
+                        document.set_text(change["text"])
+                    else:
+                        edits.append(edit)
+                document.apply_edits(edits, version, self.utf16)
+
+        if document is None:
+            self._publish(uri, None, [])
+            return
+
+        try:
+            diagnostics = document.diagnostics(cancelled=lambda: uri in self._deadlines)
+        except AnalysisCancelled:
+            self.cancelled += 1
+            return
+        if uri in self._deadlines:
+            # A newer edit arrived while the results were assembled
+            self.cancelled += 1
+            return
+        self._publish(uri, document.version, diagnostics, document)
+
+    def _publish(
+        self,
+        uri: str,
+        version: Optional[int],
+        diagnostics: List[Diagnostic],
+        document: Optional[Document] = None,
+    ):
+        converted = []
+        for diag in diagnostics:
+            line_text = None
+            if self.utf16 and document is not None and 0 < diag.line <= document.line_count:
+                line_text = document.line(diag.line - 1)
+            converted.append(to_lsp_diagnostic(diag, line_text))
+        params: Dict[str, Any] = {"uri": uri, "diagnostics": converted}
+        if version is not None:
+            params["version"] = version
+        self._send({
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": params,
+        })
+        self.published += 1
+
+
+def serve(debounce: float = DEFAULT_DEBOUNCE) -> int:
+    """Runs a language server on stdin/stdout."""
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer, debounce)
+    return server.serve()
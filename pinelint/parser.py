@@ -2,10 +2,11 @@
 Pine Script Recursive Descent Parser.
 """
 
-from typing import List, Optional, Callable, Dict
+from typing import List, Optional, Callable, Dict, Iterable
 from enum import IntEnum, auto
 
 from .lexer import Token, TokenType
+from .token_stream import TokenStream
 from .ast_nodes import (
     ASTNode,
     Statement,
@@ -58,15 +59,46 @@ class ParseError(Exception):
         self.column = token.column
 
 
+# Consumed tokens are released from the lookahead buffer in batches of this size.
+RELEASE_INTERVAL = 1024
+
+_EOF = TokenType.EOF
+_INDENT = TokenType.INDENT
+_DEDENT = TokenType.DEDENT
+_OPERATOR = TokenType.OPERATOR
+_KEYWORD = TokenType.KEYWORD
+
+
+def token_table(entries: Dict[TokenType, object], default=None) -> list:
+    """A list indexed by TokenType value, `default` for the missing kinds."""
+    table = [default] * (max(TokenType) + 1)
+    for type_, entry in entries.items():
+        table[type_] = entry
+    return table
+
+
+# Precedence of the infix tokens other than operators and keywords
+_TYPE_PRECEDENCE = token_table(
+    {
+        TokenType.LPAREN: Precedence.CALL,
+        TokenType.LBRACKET: Precedence.CALL,
+        TokenType.DOT: Precedence.CALL,
+        TokenType.QUESTION: Precedence.TERNARY,
+    },
+    Precedence.LOWEST,
+)
+
+
 class Parser:
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
+    def __init__(self, tokens: Iterable[Token]):
+        # Accepts a token list or a lazy stream such as Lexer.iter_tokens()
+        self.tokens = TokenStream(tokens)
         self.current = 0
         self.errors: List[ParseError] = []
         self.indent_level = 0
 
-        # Pratt Parsing Dispatch Tables
-        self.prefix_parse_fns: Dict[TokenType, Callable[[], Expression]] = {
+        # Pratt Parsing Dispatch Tables, indexed by token type
+        self.prefix_parse_fns: List[Optional[Callable[[], Expression]]] = token_table({
             TokenType.IDENTIFIER: self.parse_identifier,
             TokenType.LITERAL_INTEGER: self.parse_literal,
             TokenType.LITERAL_FLOAT: self.parse_literal,
@@ -76,16 +108,16 @@ class Parser:
             TokenType.LBRACKET: self.parse_array_literal,
             TokenType.OPERATOR: self.parse_unary,  # For - and +
             TokenType.KEYWORD: self.parse_keyword_prefix,  # For true, false, na, var?, not, if, switch
-        }
+        })
 
-        self.infix_parse_fns: Dict[TokenType, Callable[[Expression], Expression]] = {
+        self.infix_parse_fns: List[Optional[Callable[[Expression], Expression]]] = token_table({
             TokenType.OPERATOR: self.parse_binary,
             TokenType.KEYWORD: self.parse_binary,  # and, or
             TokenType.LPAREN: self.parse_call,
             TokenType.LBRACKET: self.parse_array_access,
             TokenType.DOT: self.parse_method_call,
             TokenType.QUESTION: self.parse_ternary,
-        }
+        })
 
         # Precedence map for operators
         self.precedences: Dict[str, int] = {
@@ -112,8 +144,7 @@ class Parser:
         return self.tokens[self.current]
 
     def peek_at(self, offset: int) -> Token:
-        if self.current + offset >= len(self.tokens):
-            return self.tokens[-1]
+        # Past the end the stream keeps returning EOF
         return self.tokens[self.current + offset]
 
     def previous(self) -> Token:
@@ -123,30 +154,33 @@ class Parser:
         return self.peek().type == TokenType.EOF
 
     def check(self, type_: TokenType) -> bool:
-        if self.is_at_end():
-            return False
-        return self.peek().type == type_
+        # Nothing matches at the end, not even EOF
+        found = self.tokens[self.current].type
+        return found == type_ and found is not _EOF
 
     def match(self, *types: TokenType) -> bool:
-        for type_ in types:
-            if self.check(type_):
-                if type_ == TokenType.INDENT: self.indent_level += 1
-                if type_ == TokenType.DEDENT: self.indent_level -= 1
-                self.advance()
-                return True
-        return False
+        found = self.tokens[self.current].type
+        if found not in types or found is _EOF:
+            return False
+        if found is _INDENT: self.indent_level += 1
+        elif found is _DEDENT: self.indent_level -= 1
+        self.advance()
+        return True
 
     def advance(self) -> Token:
-        if not self.is_at_end():
+        if self.tokens[self.current].type is not _EOF:
             self.current += 1
-        return self.previous()
+            if self.current - self.tokens.base > RELEASE_INTERVAL:
+                # Keep previous() reachable, drop everything before it
+                self.tokens.release(self.current - 1)
+        return self.tokens[self.current - 1]
 
     def consume(self, type_: TokenType, message: str) -> Token:
-        if self.check(type_):
-            if type_ == TokenType.INDENT: self.indent_level += 1
-            if type_ == TokenType.DEDENT: self.indent_level -= 1
+        found = self.tokens[self.current]
+        if found.type == type_ and type_ is not _EOF:
+            if type_ is _INDENT: self.indent_level += 1
+            elif type_ is _DEDENT: self.indent_level -= 1
             return self.advance()
-        found = self.peek()
         raise self.error(found, f"{message} Found {found.type.name} '{found.value}'")
 
     def error(self, token: Token, message: str) -> ParseError:
@@ -168,6 +202,15 @@ class Parser:
                 
             self.advance()
 
+    def skip_to(self, index: int):
+        """
+        Consumes the NEWLINE and INDENT tokens before position `index`.
+        """
+        while self.current < index:
+            if self.peek().type == TokenType.INDENT:
+                self.indent_level += 1
+            self.advance()
+
     def skip_newlines(self):
         while self.match(TokenType.NEWLINE, TokenType.INDENT):
             pass
@@ -249,9 +292,9 @@ class Parser:
 
             if self.check(TokenType.IDENTIFIER):
                 if self.peek().value in PINE_TYPES:
-                    if self.current + 1 < len(self.tokens) and self.tokens[self.current+1].type == TokenType.IDENTIFIER:
-                        peek3 = self.tokens[self.current+2] if self.current+2 < len(self.tokens) else None
-                        if peek3 and peek3.type == TokenType.LPAREN:
+                    if self.tokens[self.current+1].type == TokenType.IDENTIFIER:
+                        peek3 = self.tokens[self.current+2]
+                        if peek3.type == TokenType.LPAREN:
                             return self.parse_function_def(False, False)
                         
                         type_name = self.advance().value
@@ -317,28 +360,18 @@ class Parser:
         return val
 
     def is_function_def_lookahead(self) -> bool:
-        if self.current + 1 >= len(self.tokens): return False
+        # `name(...) =>`, with the closing parenthesis from the match table
         if self.tokens[self.current+1].type != TokenType.LPAREN: return False
-        
-        idx = self.current + 2
-        depth = 1
-        while idx < len(self.tokens):
-            t = self.tokens[idx]
-            if t.type == TokenType.LPAREN: depth += 1
-            elif t.type == TokenType.RPAREN:
-                depth -= 1
-                if depth == 0:
-                    if idx + 1 < len(self.tokens):
-                        next_t = self.tokens[idx+1]
-                        return next_t.type == TokenType.OPERATOR and next_t.value == '=>'
-                    return False
-            idx += 1
-        return False
+
+        close = self.tokens.matching(self.current + 1)
+        if close < 0: return False
+        next_t = self.tokens[close + 1]
+        return next_t.type == TokenType.OPERATOR and next_t.value == '=>'
 
     def parse_function_def(self, is_export: bool, is_method: bool) -> FunctionDef:
         return_type = None
         if self.peek().value in PINE_TYPES:
-            if self.current + 1 < len(self.tokens) and self.tokens[self.current+1].type == TokenType.IDENTIFIER:
+            if self.tokens[self.current+1].type == TokenType.IDENTIFIER:
                  return_type = self.advance().value
         
         name_tok = self.consume(TokenType.IDENTIFIER, "Expect function name.")
@@ -484,7 +517,7 @@ class Parser:
              # Check if followed by INDENT
              idx = 1
              has_indent = False
-             while self.current + idx < len(self.tokens) and self.tokens[self.current+idx].type == TokenType.INDENT:
+             while self.tokens[self.current+idx].type == TokenType.INDENT:
                  has_indent = True
                  idx += 1
              
@@ -498,10 +531,7 @@ class Parser:
         
         token = self.peek()
         
-        handler = None
-        if token.type in self.prefix_parse_fns:
-            handler = self.prefix_parse_fns[token.type]
-        
+        handler = self.prefix_parse_fns[token.type]
         if not handler:
             raise self.error(
                 token, f"Expect expression. Found {token.type.name} '{token.value}'"
@@ -511,44 +541,25 @@ class Parser:
         left = handler()
 
         # Infix
+        tokens = self.tokens
         while True:
-            # Determine if we should continue (must be same line or indented)
-            lookahead = 0
-            while self.peek_at(lookahead).type == TokenType.NEWLINE:
-                lookahead += 1
-            
-            is_continuation = True
-            if lookahead > 0:
-                # We have newlines. Must be followed by INDENT to be a continuation.
-                if self.peek_at(lookahead).type == TokenType.INDENT:
-                    is_continuation = True
-                else:
-                    is_continuation = False
-            
-            if not is_continuation:
+            # Continue on the same line, or past line breaks into an indented
+            # line; target_idx is the next token that is not NEWLINE/INDENT
+            target_idx = tokens.continuation(self.current)
+            if target_idx < 0:
                 break
-            
-            # Skip NLs and INDENTs to find the next meaningful token
-            target_idx = lookahead
-            while self.peek_at(target_idx).type in (TokenType.NEWLINE, TokenType.INDENT):
-                target_idx += 1
-            
-            target = self.peek_at(target_idx)
+            target = tokens[target_idx]
             if target.type == TokenType.EOF: break
-            
+
             # Special handling for Generic Function Call: ID < Type > (
             if target.type == TokenType.OPERATOR and target.value == '<':
-                 t1 = self.peek_at(target_idx + 1)
-                 t2 = self.peek_at(target_idx + 2)
-                 t3 = self.peek_at(target_idx + 3)
-                 
+                 t2 = tokens[target_idx + 2]
+                 t3 = tokens[target_idx + 3]
+
                  if t2.type == TokenType.OPERATOR and t2.value == '>' and t3.type == TokenType.LPAREN:
                       # Consume whitespace up to <
-                      while self.peek() != target:
-                          if self.check(TokenType.INDENT): self.indent_level += 1
-                          if self.check(TokenType.DEDENT): self.indent_level -= 1
-                          self.advance()
-                      
+                      self.skip_to(target_idx)
+
                       self.advance() # <
                       self.advance() # Type
                       self.advance() # >
@@ -557,22 +568,19 @@ class Parser:
             # Check Precedence of the target token
             if self.get_precedence(target) <= precedence:
                 break
-            
+
             # Check if target is a valid infix operator
-            infix_handler = self.infix_parse_fns.get(target.type)
+            infix_handler = self.infix_parse_fns[target.type]
             if not infix_handler:
                 break
-                
+
             # It IS a continuation. Consume the whitespace we skipped.
-            while self.peek() != target:
-                if self.check(TokenType.INDENT): self.indent_level += 1
-                if self.check(TokenType.DEDENT): self.indent_level -= 1
-                self.advance()
-            
+            self.skip_to(target_idx)
+
             # Now consume the operator
             self.advance()
             left = infix_handler(left)
-            
+
         # Cleanup Indents
         while self.indent_level > start_level:
             if self.check(TokenType.NEWLINE):
@@ -583,19 +591,10 @@ class Parser:
         return left
 
     def get_precedence(self, token: Token) -> int:
-        if token.type == TokenType.OPERATOR:
-            return self.precedences.get(token.value, Precedence.LOWEST)
-        if token.type == TokenType.LPAREN:
-            return Precedence.CALL
-        if token.type == TokenType.LBRACKET:
-            return Precedence.CALL
-        if token.type == TokenType.DOT:
-            return Precedence.CALL
-        if token.type == TokenType.QUESTION:
-            return Precedence.TERNARY
-        if token.type == TokenType.KEYWORD:
+        type_ = token.type
+        if type_ is _OPERATOR or type_ is _KEYWORD:
             return self.precedences.get(token.value, Precedence.LOWEST)
-        return Precedence.LOWEST
+        return _TYPE_PRECEDENCE[type_]
 
     def parse_identifier(self) -> Expression:
         return Identifier(
@@ -0,0 +1,137 @@
+"""
+Pine Script Type Representation.
+
+Types are hash-consed: PineType.of() parses a type string once and returns
+the same PineType for every later occurrence of that string, so the
+analyzer compares and combines types by identity and attribute access
+instead of splitting strings. PineType is a str subclass holding the type's
+text, so it compares, hashes and prints like the type string it replaced.
+
+Interning stops at MAX_INTERNED_TYPES distinct types, enough for the spec
+and the scripts of a long editor or daemon session; later types are parsed
+per call and compare by text.
+"""
+
+import re
+from enum import IntEnum
+from typing import Dict, Optional, Tuple, Union
+
+# Distinct types kept interned. Scripts can spell new types (UDTs, generic
+# arguments), so the table is bounded for resident processes.
+MAX_INTERNED_TYPES = 4096
+
+
+class Qualifier(IntEnum):
+    """Type qualifiers, ordered from the most to the least constant."""
+
+    CONST = 0
+    INPUT = 1
+    SIMPLE = 2
+    SERIES = 3
+
+    @classmethod
+    def of(cls, name: str) -> "Qualifier":
+        """The qualifier named `name`; unknown names count as series."""
+        return _QUALIFIERS.get(name, cls.SERIES)
+
+
+_QUALIFIERS = {q.name.lower(): q for q in Qualifier}
+
+# The element type of the first `array<...>` in a type string
+_ARRAY_ELEMENT_RE = re.compile(r"array<(.+)>")
+
+
+def _split_args(text: str) -> Tuple[str, ...]:
+    """Splits the arguments of a generic type at its top-level commas."""
+    args, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch == "<":
+            depth += 1
+        elif ch == ">":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            args.append(text[start:i].strip())
+            start = i + 1
+    args.append(text[start:].strip())
+    return tuple(args)
+
+
+class PineType(str):
+    """
+    An interned Pine type: the type string, with its parts parsed. Create
+    instances with PineType.of().
+
+    `qualifier_name` and `base` are the two halves of the type string (the
+    qualifier defaults to "series"); `qualifier` is the rank used for
+    compatibility checks, SERIES for unknown qualifiers. `name` and `args`
+    split a generic base such as "array<float>" into "array" and
+    ("float",), and `element` is the element type of an array access.
+    """
+
+    _interned: Dict[str, "PineType"] = {}
+    _qualified: Dict[Tuple[Qualifier, str], "PineType"] = {}
+
+    def __init__(self, text: str):
+        self.text = str(text)
+        parts = text.split(" ")
+        if len(parts) == 1:
+            self.qualifier_name, self.base = "series", parts[0]
+        else:
+            self.qualifier_name, self.base = parts[0], " ".join(parts[1:])
+        self.qualifier = Qualifier.of(self.qualifier_name)
+
+        # Generic arguments may contain spaces, so only a known qualifier
+        # is stripped here
+        head, _, rest = text.partition(" ")
+        structure = rest if rest and head in _QUALIFIERS else text
+        name, _, generic = structure.partition("<")
+        self.name = name
+        self.args = _split_args(generic[:-1]) if generic.endswith(">") else ()
+
+        self.element: Optional[str] = None
+        if "array<" in text:
+            m = _ARRAY_ELEMENT_RE.search(text)
+            if m:
+                self.element = m.group(1)
+
+    @classmethod
+    def of(cls, text: Union[str, "PineType"]) -> "PineType":
+        """Returns the interned type for a type string (or a PineType)."""
+        t = cls._interned.get(text)
+        if t is None:
+            t = text if type(text) is cls else cls(text)
+            if len(cls._interned) < MAX_INTERNED_TYPES:
+                cls._interned[t] = t
+        return t
+
+    @classmethod
+    def qualified(cls, qualifier: Qualifier, base: str) -> "PineType":
+        """Returns the interned type "<qualifier> <base>"."""
+        key = (qualifier, base)
+        t = cls._qualified.get(key)
+        if t is None:
+            t = cls.of(f"{qualifier.name.lower()} {base}")
+            if len(cls._qualified) < MAX_INTERNED_TYPES:
+                cls._qualified[key] = t
+        return t
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"PineType({self.text!r})"
+
+    def __reduce__(self):
+        # Unpickled types are interned again
+        return (PineType.of, (self.text,))
+
+
+# Types the analyzer produces itself
+ANY = PineType.of("any")
+NA = PineType.of("na")
+VOID = PineType.of("void")
+SERIES_ANY = PineType.of("series any")
+SERIES_ARRAY_ANY = PineType.of("series array<any>")
+SIMPLE_INT = PineType.of("simple int")
+FUNCTION = PineType.of("function")
+NAMESPACE = PineType.of("namespace")
@@ -4,18 +4,23 @@ Rule Engine.
 
 from abc import ABC, abstractmethod
 from typing import List, Optional
-import re
 
+from .lexer import Token
 from .ast_nodes import ASTNode
 from .diagnostics import Diagnostic, Severity
-from .semantic import SemanticAnalyzer, SemanticError
+from .semantic import SemanticError, Scope
+from .context import AnalysisContext
+from .timings import Timings
+from .spec_registry import SUPPORTED_VERSIONS, version_directives
 
 
 class Rule(ABC):
+    # Rules that only read the source text and never the AST; editors can
+    # run them without rebuilding the tree with file positions.
+    source_only = False
+
     @abstractmethod
-    def check(
-        self, source: str, ast_root: Optional[ASTNode], file_path: str
-    ) -> List[Diagnostic]:
+    def check(self, context: AnalysisContext) -> List[Diagnostic]:
         pass
 
 
@@ -25,14 +30,13 @@ class VersionCheckRule(Rule):
     R003: Version number must be 4, 5, or 6.
     """
 
-    def check(
-        self, source: str, ast_root: Optional[ASTNode], file_path: str
-    ) -> List[Diagnostic]:
+    source_only = True
+
+    def check(self, context: AnalysisContext) -> List[Diagnostic]:
+        source, file_path = context.source, context.file_path
         diagnostics = []
-        # Regex search for //@version
         # Note: Lexer stripped comments, so we search raw source.
-        # Assuming simple grep style
-        matches = list(re.finditer(r"^//@version=(\d+)", source, re.MULTILINE))
+        matches = version_directives(source)
 
         if not matches:
             diagnostics.append(
@@ -59,7 +63,7 @@ class VersionCheckRule(Rule):
         else:
             v_str = matches[0].group(1)
             v_num = int(v_str)
-            if v_num not in [4, 5, 6]:
+            if v_num not in SUPPORTED_VERSIONS:
                 line_num = source[: matches[0].start()].count("\n") + 1
                 diagnostics.append(
                     Diagnostic(
@@ -79,9 +83,15 @@ class SecurityRule(Rule):
     """
     SEC01: Scan for malicious Python keywords or patterns.
     """
-    def check(self, source: str, ast_root: Optional[ASTNode], file_path: str) -> List[Diagnostic]:
+
+    source_only = True
+    def check(self, context: AnalysisContext) -> List[Diagnostic]:
+        source, file_path = context.source, context.file_path
         diagnostics = []
         suspicious = ['import os', 'import sys', 'exec(', 'eval(', '__import__']
+        suspicious = [s for s in suspicious if s in source]
+        if not suspicious:
+            return diagnostics
         lines = source.split('\n')
         for i, line in enumerate(lines):
             for s in suspicious:
@@ -94,85 +104,69 @@ class SecurityRule(Rule):
 
 class SemanticCheckRule(Rule):
     """
-    Runs the Semantic Analyzer.
+    Reports the findings of the shared Semantic Analyzer.
     """
 
-    def check(
-        self, source: str, ast_root: Optional[ASTNode], file_path: str
-    ) -> List[Diagnostic]:
-        if not ast_root:
-            return []  # Can't check
+    @staticmethod
+    def internal_error_diagnostic(error: Exception, file_path: str) -> Diagnostic:
+        return Diagnostic(
+            Severity.ERROR, "E999", f"Internal Analyzer Error: {str(error)}", 1, 1, file_path
+        )
+
+    @staticmethod
+    def error_diagnostic(err: SemanticError, file_path: str) -> Diagnostic:
+        # Mapping SemanticError to Diagnostic
+        code = "R200"  # General semantic
+        if "Undefined" in str(err):
+            code = "R201"
+        elif "Type mismatch" in str(err):
+            code = "R202"
+        return Diagnostic(Severity.ERROR, code, str(err), err.line, err.column, file_path)
+
+    @staticmethod
+    def warning_diagnostic(w: SemanticError, file_path: str) -> Diagnostic:
+        return Diagnostic(Severity.WARNING, "W001", str(w), w.line, w.column, file_path)
+
+    @staticmethod
+    def unused_diagnostic(name: str, line: int, file_path: str) -> Diagnostic:
+        return Diagnostic(
+            Severity.WARNING, "W002",
+            f"Variable '{name}' is declared but never used.",
+            line, 1, file_path,
+            suggestion=f"Remove '{name}' or prefix with '_'."
+        )
+
+    @classmethod
+    def unused_diagnostics(cls, scope: Scope, file_path: str) -> List[Diagnostic]:
+        diagnostics = []
+        for name, sym in scope.symbols.items():
+            if sym.is_mutable and sym.declared_at is not None and sym.usage_count == 0:
+                if name.startswith('_'): continue
+                diagnostics.append(cls.unused_diagnostic(name, sym.declared_at.line, file_path))
+        return diagnostics
 
-        analyzer = SemanticAnalyzer()
-        # Run visitor
-        # AST is a list of statements from Parser.parse() which returns List[Statement], not single ASTNode.
-        # Wait, Parser.parse() returns List[Statement].
-        # SemanticAnalyzer.visit_block expects Block.
-        # I should wrap statements in a pseudo-Block?
+    def check(self, context: AnalysisContext) -> List[Diagnostic]:
+        if not context.ast_root:
+            return []  # Can't check
 
-        # Helper to run on list
+        file_path = context.file_path
+        analyzer = context.analyze()
         diagnostics = []
 
-        try:
-            # We treat the list of statements as a top-level block body
-            # But we don't have a Block node.
-            # SemanticAnalyzer has `visit_script_decl`, etc.
-            # I'll iterate.
-            if isinstance(ast_root, list):
-                for stmt in ast_root:
-                    stmt.accept(analyzer)
-            elif isinstance(ast_root, ASTNode):
-                ast_root.accept(analyzer)
-
-        except Exception as e:
-            # Should catch internal errors
-            import traceback
-
-            traceback.print_exc()
-            diagnostics.append(
-                Diagnostic(
-                    Severity.ERROR,
-                    "E999",
-                    f"Internal Analyzer Error: {str(e)}",
-                    1,
-                    1,
-                    file_path,
-                )
-            )
+        if context.analysis_error is not None:
+            diagnostics.append(self.internal_error_diagnostic(context.analysis_error, file_path))
 
         # Collect errors from analyzer
         for err in analyzer.errors:
-            # Mapping SemanticError to Diagnostic
-            # Code? We need to categorize.
-            code = "R200"  # General semantic
-            if "Undefined" in str(err):
-                code = "R201"
-            elif "Type mismatch" in str(err):
-                code = "R202"
+            diagnostics.append(self.error_diagnostic(err, file_path))
 
-            diagnostics.append(
-                Diagnostic(
-                    Severity.ERROR, code, str(err), err.line, err.column, file_path
-                )
-            )
-            
         # Collect warnings
         for w in analyzer.warnings:
-            diagnostics.append(Diagnostic(Severity.WARNING, "W001", str(w), w.line, w.column, file_path))
-            
+            diagnostics.append(self.warning_diagnostic(w, file_path))
+
         # Unused Variables
         for scope in analyzer.all_scopes:
-            for name, sym in scope.symbols.items():
-                if sym.is_mutable and sym.declared_at is not None and sym.usage_count == 0:
-                    if name.startswith('_'): continue
-                    
-                    line = sym.declared_at.line
-                    diagnostics.append(Diagnostic(
-                        Severity.WARNING, "W002",
-                        f"Variable '{name}' is declared but never used.",
-                        line, 1, file_path,
-                        suggestion=f"Remove '{name}' or prefix with '_'."
-                    ))
+            diagnostics.extend(self.unused_diagnostics(scope, file_path))
 
         return diagnostics
 
@@ -186,9 +180,30 @@ class RuleRunner:
         ]
 
     def run(
-        self, source: str, ast_root: Optional[ASTNode], file_path: str
+        self,
+        source: str,
+        ast_root: Optional[ASTNode],
+        file_path: str,
+        tokens: Optional[List[Token]] = None,
+        timings: Optional[Timings] = None,
+    ) -> List[Diagnostic]:
+        context = AnalysisContext(source, ast_root, file_path, tokens)
+        return self.run_context(context, timings)
+
+    def run_context(
+        self, context: AnalysisContext, timings: Optional[Timings] = None
     ) -> List[Diagnostic]:
         results = []
+        if timings is None:
+            for rule in self.rules:
+                results.extend(rule.check(context))
+            return results
+
+        # Analyzed up front, so the rules that use it are timed on their own
+        if context.ast_root:
+            with timings.stage("semantic"):
+                context.analyze()
         for rule in self.rules:
-            results.extend(rule.check(source, ast_root, file_path))
+            with timings.stage(f"rule:{type(rule).__name__}"):
+                results.extend(rule.check(context))
         return results
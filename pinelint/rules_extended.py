@@ -1,20 +1,14 @@
-from typing import List, Optional
-from .rules import Rule, SemanticAnalyzer, Diagnostic, Severity
-from .ast_nodes import ASTNode
+from typing import List
+from .rules import Rule, AnalysisContext, Diagnostic, Severity
 
 class ExtendedRule(Rule):
-    def check(self, source: str, ast_root: Optional[ASTNode], file_path: str) -> List[Diagnostic]:
+    def check(self, context: AnalysisContext) -> List[Diagnostic]:
         diagnostics = []
-        if not ast_root: return []
+        if not context.ast_root: return []
+        file_path = context.file_path
         
-        analyzer = SemanticAnalyzer()
-        try:
-            if isinstance(ast_root, list):
-                for stmt in ast_root:
-                    stmt.accept(analyzer)
-            else:
-                ast_root.accept(analyzer)
-        except Exception: pass
+        # Reuses the context's single analysis pass
+        analyzer = context.analyze()
         
         # W002: Unused variable
         for scope in analyzer.all_scopes:
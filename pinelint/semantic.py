@@ -2,15 +2,14 @@
 Pine Script Semantic Analyzer.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Mapping
+from collections import Counter
 from dataclasses import dataclass
-from enum import Enum
+from functools import lru_cache, partial
 
 from .ast_nodes import (
-    ASTVisitor,
     ASTNode,
     Block,
-    VersionDecl,
     ScriptDecl,
     VarDecl,
     Assignment,
@@ -27,27 +26,39 @@ from .ast_nodes import (
     TernaryOp,
     ArrayAccess,
     ArrayLiteral,
-    CallArgument,
     FunctionDef,
     TypeDef,
     ImportDecl,
+    ParamDef,
 )
-from .pine_spec import (
-    PINE_VARIABLES,
-    PINE_FUNCTIONS,
-    TypeQualifier,
-    BuiltinFunction,
-    BuiltinVariable,
+from .traversal import Done, Traversal
+from .pine_spec import BuiltinVariable
+from .spec_registry import SPEC_REGISTRY, LATEST_VERSION
+from .pine_types import (
+    PineType,
+    Qualifier,
+    ANY,
+    NA,
+    VOID,
+    SERIES_ANY,
+    SERIES_ARRAY_ANY,
+    SIMPLE_INT,
+    FUNCTION,
+    NAMESPACE,
 )
 
 
 @dataclass
 class Symbol:
     name: str
-    type: str  # Full type string, e.g., "series int"
+    type: PineType  # Interned full type, e.g., "series int"; strings are converted
     declared_at: ASTNode
     is_mutable: bool = False
     usage_count: int = 0
+    is_builtin: bool = False
+
+    def __post_init__(self):
+        self.type = PineType.of(self.type)
 
 
 class Scope:
@@ -66,6 +77,166 @@ class Scope:
         return None
 
 
+class BuiltinSymbols(Mapping):
+    """
+    Read-only symbols for the builtin variables. A symbol is created the
+    first time its name is looked up.
+    """
+
+    def __init__(self, variables: Mapping[str, BuiltinVariable]):
+        self._variables = variables
+        self._symbols: Dict[str, Symbol] = {}
+
+    def __getitem__(self, name: str) -> Symbol:
+        sym = self._symbols.get(name)
+        if sym is None:
+            var = self._variables[name]
+            sym = self._symbols[name] = Symbol(
+                name, PineType.of(var.type), None, is_mutable=False, is_builtin=True
+            )
+        return sym
+
+    def get(self, name: str, default=None) -> Optional[Symbol]:
+        sym = self._symbols.get(name)
+        if sym is None:
+            if name not in self._variables:
+                return default
+            sym = self[name]
+        return sym
+
+    def __contains__(self, name) -> bool:
+        return name in self._symbols or name in self._variables
+
+    def __iter__(self):
+        return iter(self._variables)
+
+    def __len__(self) -> int:
+        return len(self._variables)
+
+
+class BuiltinScope(Scope):
+    """
+    Immutable root scope holding the builtin variables of one Pine version.
+
+    Created once per version and shared as the parent of every analyzer's
+    global scope. Its symbols are built lazily and never mutated; analyzers
+    count builtin usage separately.
+    """
+
+    def __init__(self, symbols: Mapping[str, Symbol]):
+        super().__init__(None)
+        self.symbols: Mapping[str, Symbol] = symbols
+
+    def define(self, name: str, symbol: Symbol):
+        raise TypeError(f"Cannot define '{name}' in the immutable builtin scope.")
+
+
+_BUILTIN_SCOPES: Dict[int, BuiltinScope] = {}
+
+
+def builtin_scope(version: Optional[int] = None) -> BuiltinScope:
+    """Returns the shared builtin scope of a Pine version."""
+    version = SPEC_REGISTRY.resolve(version)
+    scope = _BUILTIN_SCOPES.get(version)
+    if scope is None:
+        scope = _BUILTIN_SCOPES[version] = BuiltinScope(
+            BuiltinSymbols(SPEC_REGISTRY.variables(version))
+        )
+    return scope
+
+
+BUILTIN_SCOPE = builtin_scope(LATEST_VERSION)
+
+
+class SymbolTable:
+    """
+    Flattened view of an analyzer's scope chain.
+
+    Names bound in the open local scopes map to a stack of their symbols,
+    innermost last; every local scope keeps an undo log of the names it
+    pushed, which exit() pops. Resolving a name and detecting that a
+    declaration shadows an outer one are O(1) whatever the nesting depth:
+    the top of the name's stack, then the global symbols, then the
+    builtins.
+
+    The Scope objects are still created and filled, so callers can report
+    on every scope after the analysis. Global symbols are only kept in
+    `global_scope.symbols`, which may be replaced by any mapping.
+    """
+
+    def __init__(self, global_scope: Scope):
+        self.global_scope = global_scope
+        self.builtins: Mapping[str, Symbol] = global_scope.parent.symbols
+        self.scope = global_scope
+        self._stacks: Dict[str, List[Symbol]] = {}
+        self._undo: List[List[str]] = []
+
+    @property
+    def in_global(self) -> bool:
+        return self.scope is self.global_scope
+
+    def enter(self) -> Scope:
+        """Opens a local scope nested in the current one and returns it."""
+        self.scope = Scope(self.scope)
+        self._undo.append([])
+        return self.scope
+
+    def exit(self):
+        """Closes the current local scope, unbinding the names it defined."""
+        stacks = self._stacks
+        for name in self._undo.pop():
+            stack = stacks[name]
+            stack.pop()
+            if not stack:
+                del stacks[name]
+        self.scope = self.scope.parent
+
+    def define(self, name: str, symbol: Symbol):
+        scope = self.scope
+        if scope is not self.global_scope:
+            stack = self._stacks.get(name)
+            if stack is None:
+                stack = self._stacks[name] = []
+            if name in scope.symbols:
+                stack[-1] = symbol  # Redefinition in the same scope
+            else:
+                stack.append(symbol)
+                self._undo[-1].append(name)
+        scope.define(name, symbol)
+
+    def resolve(self, name: str) -> Optional[Symbol]:
+        stack = self._stacks.get(name)
+        if stack:
+            return stack[-1]
+        # resolve_global(), inlined as this runs for every identifier
+        symbols = self.global_scope.symbols
+        if name in symbols:
+            return symbols[name]
+        return self.builtins.get(name)
+
+    def resolve_global(self, name: str) -> Optional[Symbol]:
+        """Resolves a name in the global scope and the builtins only."""
+        symbols = self.global_scope.symbols
+        if name in symbols:
+            return symbols[name]
+        return self.builtins.get(name)
+
+    def is_declared_here(self, name: str) -> bool:
+        """Whether the current scope already declares `name`."""
+        if name in self.scope.symbols:
+            return True
+        return self.in_global and name in self.builtins
+
+    def shadows(self, name: str) -> bool:
+        """Whether declaring `name` in the current local scope shadows an outer symbol."""
+        if self.in_global:
+            return False
+        outer = len(self._stacks.get(name, ()))
+        if name in self.scope.symbols:
+            outer -= 1
+        return outer > 0 or name in self.global_scope.symbols or name in self.builtins
+
+
 class SemanticError(Exception):
     def __init__(self, message: str, node: ASTNode):
         super().__init__(message)
@@ -74,124 +245,161 @@ class SemanticError(Exception):
         self.column = node.column
 
 
+# Entries per memoized type rule. The rules are pure functions of interned
+# types, so the tables only bound memory, not correctness.
+TYPE_CACHE_SIZE = 4096
+
+
 class TypeSystem:
+    """
+    Type rules over interned PineTypes. Every method also accepts type
+    strings, which are interned on the way in.
+
+    is_compatible and infer_binary_op are memoized in bounded LRU tables
+    keyed on their arguments (the analyzer passes interned types);
+    cache_info() reports their hits and misses.
+    """
+
     # Hierarchy: const -> input -> simple -> series
     QUALIFIERS = ["const", "input", "simple", "series"]
     BASE_TYPES = ["int", "float", "bool", "string", "color", "void", "na"]
 
+    ARITHMETIC_OPERATORS = frozenset(["+", "-", "*", "/", "%"])
+    COMPARISON_OPERATORS = frozenset(["==", "!=", "<", ">", "<=", ">="])
+    LOGICAL_OPERATORS = frozenset(["and", "or"])
+
+    # (target base, source base) pairs of implicit conversions
+    IMPLICIT_CONVERSIONS = frozenset([("float", "int")])
+
     @staticmethod
-    def parse_type(type_str: str) -> tuple[str, str]:
+    def parse_type(type_str: Union[str, PineType]) -> tuple[str, str]:
         """Returns (qualifier, base_type)."""
-        parts = type_str.split(" ")
-        if len(parts) == 1:
-            if parts[0] in TypeSystem.BASE_TYPES:
-                return ("series", parts[0])  # Default to series
-            return ("series", parts[0])  # Objects, etc.
-        return (parts[0], " ".join(parts[1:]))
+        t = PineType.of(type_str)
+        return (t.qualifier_name, t.base)
 
     @staticmethod
     def get_qualifier_rank(q: str) -> int:
-        if q in TypeSystem.QUALIFIERS:
-            return TypeSystem.QUALIFIERS.index(q)
-        return 3  # Assume series
+        return Qualifier.of(q)
+
+    @staticmethod
+    def cache_info() -> Dict[str, Any]:
+        """Hit and miss counters of the memo tables, as functools CacheInfo."""
+        return {
+            "is_compatible": TypeSystem.is_compatible.cache_info(),
+            "infer_binary_op": TypeSystem.infer_binary_op.cache_info(),
+        }
 
     @staticmethod
-    def is_compatible(target_type: str, source_type: str) -> bool:
-        if target_type == "any" or source_type == "any":
+    def cache_clear():
+        TypeSystem.is_compatible.cache_clear()
+        TypeSystem.infer_binary_op.cache_clear()
+
+    @staticmethod
+    @lru_cache(maxsize=TYPE_CACHE_SIZE)
+    def is_compatible(
+        target_type: Union[str, PineType], source_type: Union[str, PineType]
+    ) -> bool:
+        target = PineType.of(target_type)
+        source = PineType.of(source_type)
+        if target is ANY or source is ANY:
             return True
-        if source_type == "na":
+        if source is NA:
             return True  # na is compatible with everything (nullable)
 
-        t_qual, t_base = TypeSystem.parse_type(target_type)
-        s_qual, s_base = TypeSystem.parse_type(source_type)
-
-        if TypeSystem.get_qualifier_rank(s_qual) > TypeSystem.get_qualifier_rank(
-            t_qual
-        ):
+        if source.qualifier > target.qualifier:
             return False
 
-        # Base type check
-        if t_base == s_base:
-            return True
-        if t_base == "float" and s_base == "int":
-            return True  # Implicit int->float
-        return False
+        # Base type check, including implicit int->float
+        return (
+            target.base == source.base
+            or (target.base, source.base) in TypeSystem.IMPLICIT_CONVERSIONS
+        )
 
     @staticmethod
-    def infer_binary_op(left_type: str, operator: str, right_type: str) -> str:
-        l_qual, l_base = TypeSystem.parse_type(left_type)
-        r_qual, r_base = TypeSystem.parse_type(right_type)
+    @lru_cache(maxsize=TYPE_CACHE_SIZE)
+    def infer_binary_op(
+        left_type: Union[str, PineType], operator: str, right_type: Union[str, PineType]
+    ) -> PineType:
+        left = PineType.of(left_type)
+        right = PineType.of(right_type)
+        l_base, r_base = left.base, right.base
 
         # Result qualifier is max of operands
-        res_rank = max(
-            TypeSystem.get_qualifier_rank(l_qual), TypeSystem.get_qualifier_rank(r_qual)
-        )
-        res_qual = TypeSystem.QUALIFIERS[res_rank]
+        qualifier = max(left.qualifier, right.qualifier)
 
         # Result base
-        if operator in ["+", "-", "*", "/", "%"]:
+        if operator in TypeSystem.ARITHMETIC_OPERATORS:
             if l_base == "float" or r_base == "float":
-                return f"{res_qual} float"
+                return PineType.qualified(qualifier, "float")
             if l_base == "int" and r_base == "int":
-                return f"{res_qual} int"
+                return PineType.qualified(qualifier, "int")
             # String concat
             if l_base == "string" or r_base == "string":
                 if operator == "+":
-                    return f"{res_qual} string"
+                    return PineType.qualified(qualifier, "string")
 
-        if operator in ["==", "!=", "<", ">", "<=", ">="]:
-            return f"{res_qual} bool"
+        if operator in TypeSystem.COMPARISON_OPERATORS:
+            return PineType.qualified(qualifier, "bool")
 
-        if operator in ["and", "or"]:
-            return f"{res_qual} bool"
+        if operator in TypeSystem.LOGICAL_OPERATORS:
+            return PineType.qualified(qualifier, "bool")
 
-        return f"{res_qual} {l_base}"  # Fallback
+        return PineType.qualified(qualifier, l_base)  # Fallback
 
 
-class SemanticAnalyzer(ASTVisitor):
-    def __init__(self):
-        self.global_scope = Scope()
-        self.current_scope = self.global_scope
+class SemanticAnalyzer(Traversal):
+    def __init__(self, version: Optional[int] = None):
+        # Builtins of the script's Pine version; None means the latest
+        self.version = SPEC_REGISTRY.resolve(version)
+        self.functions = SPEC_REGISTRY.functions(self.version)
+        self.builtin_scope = builtin_scope(self.version)
+        self.global_scope = Scope(self.builtin_scope)
+        self.symbol_table = SymbolTable(self.global_scope)
         self.all_scopes: List[Scope] = [self.global_scope]
         self.errors: List[SemanticError] = []
         self.warnings: List[SemanticError] = []
+        # Usage of shared builtin symbols, kept here so BUILTIN_SCOPE stays immutable
+        self.builtin_usage: Counter = Counter()
+        # Return types of the builtin functions called, by name
+        self._return_types: Dict[str, PineType] = {}
 
-        self._init_builtins()
+    @property
+    def current_scope(self) -> Scope:
+        return self.symbol_table.scope
 
-    def _init_builtins(self):
-        # Variables
-        for name, var in PINE_VARIABLES.items():
-            self.global_scope.define(
-                name, Symbol(name, var.type, None, is_mutable=False)
-            )
+    def enter_scope(self) -> Scope:
+        scope = self.symbol_table.enter()
+        self.all_scopes.append(scope)
+        return scope
+
+    def exit_scope(self):
+        self.symbol_table.exit()
 
-    def visit_version_decl(self, node: VersionDecl) -> Any:
-        pass
+    # Nodes are analyzed by Traversal hooks: enter_<kind> runs before a
+    # node's children, leave_<kind> gets their types and returns the node's.
 
-    def visit_script_decl(self, node: ScriptDecl) -> Any:
-        for arg in node.args:
-            arg.accept(self)
+    def enter_script_decl(self, node: ScriptDecl) -> Any:
+        # Declaration arguments are not analyzed
+        return Done()
 
-    def visit_block(self, node: Block) -> Any:
-        parent = self.current_scope
-        self.current_scope = Scope(parent)
-        self.all_scopes.append(self.current_scope)
+    def enter_block(self, node: Block) -> Any:
+        self.enter_scope()
 
-        last_type = "void"
-        for stmt in node.statements:
-            res = stmt.accept(self)
+    def leave_block(self, node: Block, types: List[PineType]) -> Any:
+        self.exit_scope()
+        last_type = VOID
+        for res in types:
             if res:
                 last_type = res
-
-        self.current_scope = parent
         return last_type
 
-    def visit_var_decl(self, node: VarDecl) -> Any:
-        val_type = node.value.accept(self)
+    def leave_var_decl(self, node: VarDecl, types: List[PineType]) -> Any:
+        val_type = types[0]
 
         final_type = val_type
         if node.type_hint:
-            target = f"series {node.type_hint}"  # Default to series for safety
+            # Default to series for safety
+            target = PineType.qualified(Qualifier.SERIES, node.type_hint)
             if not TypeSystem.is_compatible(target, val_type):
                 self.error(
                     node,
@@ -199,28 +407,25 @@ class SemanticAnalyzer(ASTVisitor):
                 )
             final_type = target
 
-        # Redefinition check
-        if node.name in self.current_scope.symbols:
+        # Redefinition check (builtins count as part of the global scope)
+        table = self.symbol_table
+        if table.is_declared_here(node.name):
             self.error(
                 node, f"Variable '{node.name}' already declared in this scope."
             )
         
         # Shadowing check
-        p = self.current_scope.parent
-        while p:
-            if node.name in p.symbols:
-                self.warn(node, f"Shadowing variable '{node.name}' from outer scope.")
-                break
-            p = p.parent
-
-        self.current_scope.define(
+        if table.shadows(node.name):
+            self.warn(node, f"Shadowing variable '{node.name}' from outer scope.")
+
+        table.define(
             node.name, Symbol(node.name, final_type, node, is_mutable=True)
         )
         return final_type
 
-    def visit_assignment(self, node: Assignment) -> Any:
-        val_type = node.value.accept(self)
-        sym = self.current_scope.resolve(node.target)
+    def leave_assignment(self, node: Assignment, types: List[PineType]) -> Any:
+        val_type = types[0]
+        sym = self.symbol_table.resolve(node.target)
         if not sym:
             self.error(node, f"Undefined variable '{node.target}'")
             return
@@ -233,18 +438,21 @@ class SemanticAnalyzer(ASTVisitor):
 
         return val_type
 
-    def visit_identifier(self, node: Identifier) -> Any:
-        sym = self.current_scope.resolve(node.name)
+    def leave_identifier(self, node: Identifier, types: List[PineType]) -> Any:
+        sym = self.symbol_table.resolve(node.name)
         if not sym:
             self.error(node, f"Undefined identifier '{node.name}'")
-            return "series any"
-        sym.usage_count += 1
+            return SERIES_ANY
+        if sym.is_builtin:
+            self.builtin_usage[node.name] += 1
+        else:
+            sym.usage_count += 1
         return sym.type
 
-    def visit_literal(self, node: Literal) -> Any:
-        return f"const {node.type_name}"
+    def leave_literal(self, node: Literal, types: List[PineType]) -> Any:
+        return PineType.qualified(Qualifier.CONST, node.type_name)
 
-    def visit_binary_op(self, node: BinaryOp) -> Any:
+    def enter_binary_op(self, node: BinaryOp) -> Any:
         if node.operator == '.':
             # Try to resolve dotted name (e.g. strategy.long)
             def get_name(n):
@@ -257,30 +465,29 @@ class SemanticAnalyzer(ASTVisitor):
             
             full_name = get_name(node)
             if full_name:
-                sym = self.global_scope.resolve(full_name)
+                sym = self.symbol_table.resolve_global(full_name)
                 if sym:
-                    return sym.type
+                    return Done(sym.type)
+        return (node.left, node.right)
 
-        l_type = node.left.accept(self)
-        r_type = node.right.accept(self)
-        return TypeSystem.infer_binary_op(l_type, node.operator, r_type)
+    def leave_binary_op(self, node: BinaryOp, types: List[PineType]) -> Any:
+        return TypeSystem.infer_binary_op(types[0], node.operator, types[1])
 
-    def visit_unary_op(self, node: UnaryOp) -> Any:
-        operand_type = node.operand.accept(self)
-        return operand_type
+    def leave_unary_op(self, node: UnaryOp, types: List[PineType]) -> Any:
+        return types[0]
 
-    def visit_function_call(self, node: FunctionCall) -> Any:
-        func_def = PINE_FUNCTIONS.get(node.name)
+    def enter_function_call(self, node: FunctionCall) -> Any:
+        func_def = self.functions.get(node.name)
         if not func_def:
             # Check if it's a user-defined function in scope
-            sym = self.current_scope.resolve(node.name)
-            if sym and sym.type == "function":
+            sym = self.symbol_table.resolve(node.name)
+            if sym and sym.type is FUNCTION:
                 # User defined function. Check args?
                 # ASTNode for func def is in sym.declared_at
-                return "series any" # TODO: infer return type from Def
+                return Done(SERIES_ANY) # TODO: infer return type from Def
                 
             self.error(node, f"Unknown function '{node.name}'")
-            return "series any"
+            return Done(SERIES_ANY)
 
         # Check arguments count
         params = func_def.params
@@ -289,107 +496,79 @@ class SemanticAnalyzer(ASTVisitor):
         if not is_variadic and len(node.args) > len(params):
             self.error(node, f"Too many arguments for '{node.name}'")
 
-        for arg in node.args:
-            arg.value.accept(self)
+        self._return_types[node.name] = PineType.of(func_def.return_type)
+        return [arg.value for arg in node.args]
 
-        return func_def.return_type
+    def leave_function_call(self, node: FunctionCall, types: List[PineType]) -> Any:
+        return self._return_types[node.name]
 
-    def visit_expression_statement(self, node: ExpressionStatement) -> Any:
-        return node.expression.accept(self)
+    def leave_expression_statement(self, node: ExpressionStatement, types: List[PineType]) -> Any:
+        return types[0]
 
-    def visit_if_statement(self, node: IfStatement) -> Any:
-        node.condition.accept(self)
-        then_type = node.then_block.accept(self)
-        if node.else_block:
-            node.else_block.accept(self)
-        return then_type
+    def leave_if_statement(self, node: IfStatement, types: List[PineType]) -> Any:
+        # The type of the then block
+        return types[1]
 
-    def visit_for_statement(self, node: ForStatement) -> Any:
-        parent = self.current_scope
-        self.current_scope = Scope(parent)
-        self.all_scopes.append(self.current_scope)
+    def enter_for_statement(self, node: ForStatement) -> Any:
+        self.enter_scope()
 
-        self.current_scope.define(
-            node.var_name, Symbol(node.var_name, "simple int", node)
+        self.symbol_table.define(
+            node.var_name, Symbol(node.var_name, SIMPLE_INT, node)
         )
 
-        node.start_expr.accept(self)
-        node.end_expr.accept(self)
-        if node.step_expr:
-            node.step_expr.accept(self)
-
-        node.body.accept(self)
-
-        self.current_scope = parent
-        return "void"
-
-    def visit_while_statement(self, node: WhileStatement) -> Any:
-        node.condition.accept(self)
-        node.body.accept(self)
-        return "void"
-
-    def visit_switch_statement(self, node: SwitchStatement) -> Any:
-        if node.expression:
-            node.expression.accept(self)
-        for case_expr, block in node.cases:
-            if case_expr:
-                case_expr.accept(self)
-            block.accept(self)
-        return "void"
-
-    def visit_ternary_op(self, node: TernaryOp) -> Any:
-        node.condition.accept(self)
-        t = node.true_expr.accept(self)
-        f = node.false_expr.accept(self)
-        return t
-
-    def visit_array_access(self, node: ArrayAccess) -> Any:
-        arr_type = node.array.accept(self)
-        for idx in node.indices:
-            idx.accept(self)
-        if "array<" in arr_type:
-            import re
-            m = re.search(r"array<(.+)>", arr_type)
-            if m:
-                return f"series {m.group(1)}"
-        return "series any"
-
-    def visit_array_literal(self, node: ArrayLiteral) -> Any:
-        for el in node.elements:
-            el.accept(self)
-        return "series array<any>"
-
-    def visit_function_def(self, node: FunctionDef) -> Any:
-        parent = self.current_scope
-        self.current_scope = Scope(parent)
-        self.all_scopes.append(self.current_scope)
+    def leave_for_statement(self, node: ForStatement, types: List[PineType]) -> Any:
+        self.exit_scope()
+        return VOID
+
+    def leave_while_statement(self, node: WhileStatement, types: List[PineType]) -> Any:
+        return VOID
+
+    def leave_switch_statement(self, node: SwitchStatement, types: List[PineType]) -> Any:
+        return VOID
+
+    def leave_ternary_op(self, node: TernaryOp, types: List[PineType]) -> Any:
+        return types[1]
+
+    def leave_array_access(self, node: ArrayAccess, types: List[PineType]) -> Any:
+        element = PineType.of(types[0]).element
+        if element is not None:
+            return PineType.qualified(Qualifier.SERIES, element)
+        return SERIES_ANY
+
+    def leave_array_literal(self, node: ArrayLiteral, types: List[PineType]) -> Any:
+        return SERIES_ARRAY_ANY
+
+    def enter_function_def(self, node: FunctionDef) -> Any:
+        self.enter_scope()
         
+        # Each parameter is defined before its default value is analyzed
+        steps = []
         for param in node.params:
-            p_type = param.type_name if param.type_name else "series any"
-            self.current_scope.define(param.name, Symbol(param.name, p_type, param))
+            steps.append(partial(self._define_param, param))
             if param.default:
-                param.default.accept(self)
-        
-        body_type = "void"
-        if isinstance(node.body, ASTNode):
-             body_type = node.body.accept(self)
-        else:
-             body_type = node.body.accept(self)
-             
-        parent.define(node.name, Symbol(node.name, "function", node))
-        
-        self.current_scope = parent
-        return "void"
+                steps.append(param.default)
+        steps.append(node.body)
+        return steps
+
+    def _define_param(self, param: ParamDef):
+        p_type = PineType.of(param.type_name) if param.type_name else SERIES_ANY
+        self.symbol_table.define(param.name, Symbol(param.name, p_type, param))
+
+    def leave_function_def(self, node: FunctionDef, types: List[PineType]) -> Any:
+        # The function is bound in the enclosing scope once its body is done
+        self.exit_scope()
+        self.symbol_table.define(node.name, Symbol(node.name, FUNCTION, node))
+        return VOID
 
-    def visit_type_def(self, node: TypeDef) -> Any:
+    def enter_type_def(self, node: TypeDef) -> Any:
         # Register type constructor?
         # For now just valid.
-        return "void"
+        return Done(VOID)
 
-    def visit_import_decl(self, node: ImportDecl) -> Any:
+    def leave_import_decl(self, node: ImportDecl, types: List[PineType]) -> Any:
         if node.alias:
-            self.global_scope.define(node.alias, Symbol(node.alias, "namespace", node))
-        return "void"
+            self.global_scope.define(node.alias, Symbol(node.alias, NAMESPACE, node))
+        return VOID
 
     def error(self, node: ASTNode, message: str):
         self.errors.append(SemanticError(message, node))
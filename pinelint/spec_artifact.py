@@ -0,0 +1,253 @@
+"""
+Binary Pine spec artifact.
+
+`pine_spec.bin` holds the builtin tables in a compact read-only layout that
+is memory-mapped instead of being compiled and executed, so every process
+shares one page-cache copy of it. It is written by
+tools/generate_spec_data.py and read through the mappings in pine_spec.
+
+Layout (little endian):
+
+    header     magic, format version, then (offset, count) per section
+    strings    (offset, length) into the UTF-8 string data; every name,
+               type and description is stored once and referenced by index
+    functions  name, return type, description, version added, first param,
+               param count
+    params     name, type, required
+    variables  name, type, description, version added
+    types      name
+
+A missing version is stored as NO_STRING.
+
+Records are decoded on lookup and return the same tuples as _spec_data.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b"PINESPEC"
+# Bump when the layout changes; older artifacts are then ignored.
+FORMAT_VERSION = 2
+
+ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pine_spec.bin")
+
+# Sections, in header order
+_SECTIONS = ("strings", "string_data", "functions", "params", "variables", "types")
+
+_HEADER = struct.Struct("<8sHH" + "II" * len(_SECTIONS))
+_STRING = struct.Struct("<II")
+_FUNCTION = struct.Struct("<IIIIII")
+_PARAM = struct.Struct("<II?3x")
+_VARIABLE = struct.Struct("<IIII")
+_TYPE = struct.Struct("<I")
+
+NO_STRING = 0xFFFFFFFF
+
+FunctionRecord = Tuple[str, str, Tuple[Tuple[str, str, bool], ...], Optional[str]]
+VariableRecord = Tuple[str, str, Optional[str]]
+
+
+class ArtifactError(Exception):
+    """The artifact is missing, truncated or has an unknown format."""
+
+
+def write_artifact(
+    path: str,
+    functions: Iterable[Tuple[str, FunctionRecord]],
+    variables: Iterable[Tuple[str, VariableRecord]],
+    types: Iterable[str],
+):
+    """
+    Writes the artifact. Records use the _spec_data layout: functions are
+    (return_type, description, ((param, type, required), ...), version_added)
+    and variables are (type, description, version_added).
+    """
+    strings: Dict[str, int] = {}
+
+    def intern(s: Optional[str]) -> int:
+        if s is None:
+            return NO_STRING
+        index = strings.get(s)
+        if index is None:
+            index = strings[s] = len(strings)
+        return index
+
+    function_rows, param_rows = [], []
+    for name, (return_type, description, params, version_added) in functions:
+        function_rows.append(_FUNCTION.pack(
+            intern(name), intern(return_type), intern(description), intern(version_added),
+            len(param_rows), len(params),
+        ))
+        for param, type_, required in params:
+            param_rows.append(_PARAM.pack(intern(param), intern(type_), required))
+    variable_rows = [
+        _VARIABLE.pack(intern(name), intern(type_), intern(description), intern(version_added))
+        for name, (type_, description, version_added) in variables
+    ]
+    type_rows = [_TYPE.pack(intern(name)) for name in types]
+
+    string_rows, string_data = [], bytearray()
+    for s in strings:
+        encoded = s.encode("utf-8")
+        string_rows.append(_STRING.pack(len(string_data), len(encoded)))
+        string_data += encoded
+
+    sections = [
+        (b"".join(string_rows), len(string_rows)),
+        (bytes(string_data), len(string_data)),
+        (b"".join(function_rows), len(function_rows)),
+        (b"".join(param_rows), len(param_rows)),
+        (b"".join(variable_rows), len(variable_rows)),
+        (b"".join(type_rows), len(type_rows)),
+    ]
+    header_fields: List[int] = []
+    offset = _HEADER.size
+    for data, count in sections:
+        header_fields += [offset, count]
+        offset += len(data)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, *header_fields))
+        for data, _ in sections:
+            f.write(data)
+    os.replace(tmp_path, path)
+
+
+class RecordTable(Mapping):
+    """
+    Read-only name -> record view over one fixed-width table.
+    """
+
+    def __init__(self, names: Dict[str, int], decode: Callable[[int], tuple]):
+        self._names = names
+        self._decode = decode
+
+    def __getitem__(self, name: str):
+        return self._decode(self._names[name])
+
+    def get(self, name: str, default=None):
+        index = self._names.get(name)
+        if index is None:
+            return default
+        return self._decode(index)
+
+    def __contains__(self, name) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class SpecArtifact:
+    """
+    Decoded view of an artifact buffer, usually a read-only mmap.
+    """
+
+    def __init__(self, buffer):
+        if len(buffer) < _HEADER.size:
+            raise ArtifactError("Spec artifact is truncated.")
+        magic, version, _, *fields = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ArtifactError("Not a Pine spec artifact.")
+        if version != FORMAT_VERSION:
+            raise ArtifactError(f"Unsupported spec artifact version {version}.")
+
+        self._buffer = buffer
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        for i, section in enumerate(_SECTIONS):
+            self._sections[section] = (fields[2 * i], fields[2 * i + 1])
+        sizes = {
+            "strings": _STRING.size, "string_data": 1, "functions": _FUNCTION.size,
+            "params": _PARAM.size, "variables": _VARIABLE.size, "types": _TYPE.size,
+        }
+        for section, (offset, count) in self._sections.items():
+            if offset + count * sizes[section] > len(buffer):
+                raise ArtifactError("Spec artifact is truncated.")
+
+        self._strings: List[Optional[str]] = [None] * self._sections["strings"][1]
+        self.functions = RecordTable(self._index("functions", _FUNCTION), self._function)
+        self.variables = RecordTable(self._index("variables", _VARIABLE), self._variable)
+
+    @classmethod
+    def open(cls, path: str = ARTIFACT_PATH) -> "SpecArtifact":
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ArtifactError(f"Cannot map spec artifact: {e}") from e
+        return cls(buffer)
+
+    def string(self, index: int) -> Optional[str]:
+        if index == NO_STRING:
+            return None
+        s = self._strings[index]
+        if s is None:
+            offset, length = _STRING.unpack_from(
+                self._buffer, self._sections["strings"][0] + index * _STRING.size
+            )
+            start = self._sections["string_data"][0] + offset
+            s = self._strings[index] = str(self._buffer[start:start + length], "utf-8")
+        return s
+
+    def types(self) -> List[str]:
+        offset, count = self._sections["types"]
+        return [
+            self.string(index)
+            for (index,) in _TYPE.iter_unpack(self._buffer[offset:offset + count * _TYPE.size])
+        ]
+
+    def _index(self, section: str, record: struct.Struct) -> Dict[str, int]:
+        # Only the first field (the name) of each record is decoded here
+        offset, count = self._sections[section]
+        string = self.string
+        return {
+            string(struct.unpack_from("<I", self._buffer, offset + i * record.size)[0]): i
+            for i in range(count)
+        }
+
+    def _function(self, index: int) -> FunctionRecord:
+        _, return_type, description, version_added, first, count = _FUNCTION.unpack_from(
+            self._buffer, self._sections["functions"][0] + index * _FUNCTION.size
+        )
+        base = self._sections["params"][0]
+        params = tuple(
+            (self.string(param), self.string(type_), required)
+            for param, type_, required in (
+                _PARAM.unpack_from(self._buffer, base + i * _PARAM.size)
+                for i in range(first, first + count)
+            )
+        )
+        string = self.string
+        return string(return_type), string(description), params, string(version_added)
+
+    def _variable(self, index: int) -> VariableRecord:
+        _, type_, description, version_added = _VARIABLE.unpack_from(
+            self._buffer, self._sections["variables"][0] + index * _VARIABLE.size
+        )
+        return self.string(type_), self.string(description), self.string(version_added)
+
+
+_artifact: Optional[SpecArtifact] = None
+_artifact_loaded = False
+
+
+def load_artifact() -> Optional[SpecArtifact]:
+    """
+    Returns the packaged artifact, or None when it is missing or unreadable
+    so callers fall back to _spec_data. Opened once per process.
+    """
+    global _artifact, _artifact_loaded
+    if not _artifact_loaded:
+        _artifact_loaded = True
+        try:
+            _artifact = SpecArtifact.open()
+        except ArtifactError:
+            _artifact = None
+    return _artifact
@@ -0,0 +1,113 @@
+"""
+Versioned Pine spec registry.
+
+PINE_FUNCTIONS and PINE_VARIABLES hold every builtin of every supported
+Pine version. The registry serves one read-only view per version that only
+exposes the builtins available in it, according to their `version_added`.
+Each view is created once per process and shared by every analyzer; it
+filters the shared tables on lookup, so lookups stay O(1).
+"""
+
+import re
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+from .pine_spec import PINE_FUNCTIONS, PINE_VARIABLES, BuiltinFunction, BuiltinVariable
+
+SUPPORTED_VERSIONS = (4, 5, 6)
+LATEST_VERSION = SUPPORTED_VERSIONS[-1]
+
+_VERSION_DIRECTIVE = re.compile(r"^//@version=(\d+)", re.MULTILINE)
+
+
+def version_directives(source: str) -> List["re.Match[str]"]:
+    """Returns the `//@version=N` directives of a script, in order."""
+    return list(_VERSION_DIRECTIVE.finditer(source))
+
+
+def script_version(source: str) -> Optional[int]:
+    """
+    Returns the version declared by a script's only `//@version` directive,
+    or None when it has none or several.
+    """
+    directives = version_directives(source)
+    if len(directives) != 1:
+        return None
+    return int(directives[0].group(1))
+
+
+def is_available(entry: Any, version: int) -> bool:
+    return entry.version_added is None or int(entry.version_added) <= version
+
+
+class VersionedTable(Mapping):
+    """
+    Read-only view of a spec table with the entries available in `version`.
+    """
+
+    def __init__(self, table: Mapping, version: int):
+        self.table = table
+        self.version = version
+        self._names: Optional[List[str]] = None
+
+    def get(self, name: str, default=None):
+        entry = self.table.get(name)
+        if entry is None or not is_available(entry, self.version):
+            return default
+        return entry
+
+    def __getitem__(self, name: str):
+        entry = self.get(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry
+
+    def __contains__(self, name) -> bool:
+        return self.get(name) is not None
+
+    def _available_names(self) -> List[str]:
+        if self._names is None:
+            self._names = [name for name in self.table if name in self]
+        return self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._available_names())
+
+    def __len__(self) -> int:
+        return len(self._available_names())
+
+
+class SpecRegistry:
+    """
+    Per-version builtin tables, created on first use and cached.
+
+    Unsupported or missing versions resolve to the latest version, whose
+    tables contain every builtin.
+    """
+
+    def __init__(self, functions: Mapping = PINE_FUNCTIONS, variables: Mapping = PINE_VARIABLES):
+        self._functions = functions
+        self._variables = variables
+        self._function_tables: Dict[int, VersionedTable] = {}
+        self._variable_tables: Dict[int, VersionedTable] = {}
+
+    @staticmethod
+    def resolve(version: Optional[int]) -> int:
+        return version if version in SUPPORTED_VERSIONS else LATEST_VERSION
+
+    def functions(self, version: Optional[int] = None) -> Mapping[str, BuiltinFunction]:
+        version = self.resolve(version)
+        table = self._function_tables.get(version)
+        if table is None:
+            table = self._function_tables[version] = VersionedTable(self._functions, version)
+        return table
+
+    def variables(self, version: Optional[int] = None) -> Mapping[str, BuiltinVariable]:
+        version = self.resolve(version)
+        table = self._variable_tables.get(version)
+        if table is None:
+            table = self._variable_tables[version] = VersionedTable(self._variables, version)
+        return table
+
+
+SPEC_REGISTRY = SpecRegistry()
@@ -0,0 +1,147 @@
+"""
+Pipeline Instrumentation.
+
+`Timings` collects, for each stage of the lint pipeline (lex, parse,
+semantic analysis and every rule), how often it ran and its wall time.
+With `allocations` it also traces memory with tracemalloc: the largest
+amount a single call allocated on top of what was held before it
+(peak_bytes), and the sum of what calls still held when they returned
+(retained_bytes, negative when a stage frees earlier garbage).
+Allocations are measured in bytes, not counted: tracemalloc only counts
+blocks in snapshots, which cost time in proportion to everything traced
+and would dwarf the stages themselves.
+
+Cache lookups are stages of their own, named by outcome (cache:hit,
+cache:miss, and ast:hit/ast:miss for parse results), so a run served
+from the cache still accounts for its files.
+
+The pipeline functions take an optional Timings and only branch on it
+once per file, so linting without one runs the uninstrumented code.
+Tracing allocations slows Python down several times over, which
+inflates the wall times of the same run.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+
+class StageStats:
+    """Totals of one stage over a run."""
+
+    __slots__ = ("calls", "seconds", "retained_bytes", "peak_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.retained_bytes = 0
+        self.peak_bytes = 0
+
+    def to_dict(self, allocations: bool) -> Dict[str, float]:
+        if not allocations:
+            return {"calls": self.calls, "seconds": self.seconds}
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Timings:
+    """
+    Per-stage wall time, and allocations if `allocations` is set. Use as a
+    context manager around the run, which times it and traces allocations
+    from enter to exit, and wrap each stage in `stage(name)`. Stages must
+    not nest.
+    """
+
+    def __init__(self, allocations: bool = False):
+        self.allocations = allocations
+        self.stages: Dict[str, StageStats] = {}
+        self.files = 0
+        self.seconds = 0.0
+        self._started_tracing = False
+        self._start = 0.0
+
+    def __enter__(self) -> "Timings":
+        # Imported on use: tracemalloc pulls in modules `check` does not need
+        import tracemalloc
+
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        import tracemalloc
+
+        self.seconds += time.perf_counter() - self._start
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Adds the time and allocations of the block to stage `name`."""
+        started = self._begin()
+        try:
+            yield
+        finally:
+            self._end(name, started)
+
+    def lookup(self, name: str, fn: Callable[..., Any], *args) -> Any:
+        """
+        Calls the cache lookup fn(*args) as stage `name:hit`, or `name:miss`
+        when it returns None.
+        """
+        started = self._begin()
+        result = None
+        try:
+            result = fn(*args)
+            return result
+        finally:
+            self._end(f"{name}:{'miss' if result is None else 'hit'}", started)
+
+    def _begin(self) -> Tuple[float, Optional[int]]:
+        before = None
+        if self.allocations:
+            import tracemalloc
+
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+        return time.perf_counter(), before
+
+    def _end(self, name: str, started: Tuple[float, Optional[int]]):
+        start, before = started
+        seconds = time.perf_counter() - start
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        stats.seconds += seconds
+        stats.calls += 1
+        if before is not None:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            stats.retained_bytes += current - before
+            stats.peak_bytes = max(stats.peak_bytes, peak - before)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "files": self.files,
+            "seconds": self.seconds,
+            "allocations": self.allocations,
+            "stages": {
+                name: stats.to_dict(self.allocations) for name, stats in self.stages.items()
+            },
+        }
+
+    def to_text(self) -> str:
+        header = f"{'stage':28} {'calls':>6} {'seconds':>9}"
+        if self.allocations:
+            header += f" {'retained KiB':>13} {'peak KiB':>9}"
+        lines = [f"\nTimings: {self.files} files in {self.seconds:.3f}s", header]
+        for name, s in self.stages.items():
+            line = f"{name:28} {s.calls:6} {s.seconds:9.3f}"
+            if self.allocations:
+                line += f" {s.retained_bytes / 1024:13.1f} {s.peak_bytes / 1024:9.1f}"
+            lines.append(line)
+        return "\n".join(lines)
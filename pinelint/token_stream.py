@@ -0,0 +1,151 @@
+"""
+Lookahead buffer between the streaming lexer and the parser.
+"""
+
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+
+from .lexer import Token, TokenType
+
+# Tokens pulled from the source per refill.
+FILL_CHUNK = 256
+
+_NEWLINE = TokenType.NEWLINE
+_INDENT = TokenType.INDENT
+_LPAREN = TokenType.LPAREN
+_RPAREN = TokenType.RPAREN
+_EOF = TokenType.EOF
+
+
+class TokenStream:
+    """
+    Indexable window over a token iterator.
+
+    Tokens are addressed by their absolute position, like a list, but are
+    pulled from the source only when first indexed and dropped again by
+    release(). Memory therefore depends on the parser's lookahead window,
+    not on the file size. Indexing past the end returns the final (EOF)
+    token.
+
+    continuation() answers the parser's "does the expression go on past
+    this line break" question from a table filled once per token, and
+    matching() finds closing parentheses from a table of bracket pairs
+    filled as they are scanned, up to the end of the statement.
+    """
+
+    def __init__(self, tokens: Iterable[Token]):
+        self._source = iter(tokens)
+        self._buffer: List[Token] = []
+        # continuation() results by buffer position, None until computed
+        self._continuations: List[Optional[int]] = []
+        # Position of each scanned LPAREN -> position of its RPAREN, or -1
+        self._matches: Dict[int, int] = {}
+        self._eof: Optional[Token] = None
+        # Absolute position of self._buffer[0]
+        self.base = 0
+
+    def __getitem__(self, index: int) -> Token:
+        i = index - self.base
+        if 0 <= i < len(self._buffer):
+            return self._buffer[i]
+        return self._fill(index)
+
+    def _fill(self, index: int) -> Token:
+        i = index - self.base
+        if i < 0:
+            raise IndexError(f"Token {index} has already been released.")
+
+        buffer = self._buffer
+        while self._eof is None and len(buffer) <= i:
+            filled = len(buffer)
+            buffer.extend(islice(self._source, FILL_CHUNK))
+            if len(buffer) - filled < FILL_CHUNK or buffer[-1].type == TokenType.EOF:
+                if not buffer:
+                    raise IndexError("Token stream is empty.")
+                self._eof = buffer[-1]
+        self._continuations.extend([None] * (len(buffer) - len(self._continuations)))
+
+        if i < len(buffer):
+            return buffer[i]
+        return self._eof
+
+    def release(self, index: int):
+        """
+        Drops every buffered token before absolute position `index`.
+        """
+        n = min(index - self.base, len(self._buffer))
+        if n > 0:
+            del self._buffer[:n]
+            del self._continuations[:n]
+            self.base += n
+            if self._matches:
+                base = self.base
+                self._matches = {o: c for o, c in self._matches.items() if o >= base}
+
+    def continuation(self, index: int) -> int:
+        """
+        Position of the token an expression ending before `index` may
+        continue with, skipping NEWLINE and INDENT tokens, or -1 when a line
+        break at `index` ends it because the next line is not indented.
+        """
+        i = index - self.base
+        continuations = self._continuations
+        if 0 <= i < len(continuations):
+            target = continuations[i]
+            if target is not None:
+                return target
+
+        target = index
+        while self[target].type is _NEWLINE:
+            target += 1
+        if target > index and self[target].type is not _INDENT:
+            target = -1
+        else:
+            while self[target].type is _NEWLINE or self[target].type is _INDENT:
+                target += 1
+
+        if 0 <= i < len(continuations):
+            continuations[i] = target
+        return target
+
+    def matching(self, index: int) -> int:
+        """
+        Position of the RPAREN closing the LPAREN at `index`, or -1 when the
+        statement or the stream ends first. Every pair found on the way is
+        recorded, so the tokens between two parentheses are scanned once per
+        stream, and an unclosed parenthesis buffers no further than the end
+        of its statement.
+        """
+        matches = self._matches
+        close = matches.get(index)
+        if close is not None:
+            return close
+
+        opened = [index]
+        position = index + 1
+        while opened:
+            type_ = self[position].type
+            if type_ is _LPAREN:
+                close = matches.get(position)
+                if close is not None:
+                    # Skip a group matched by an earlier scan
+                    if close < 0:
+                        break
+                    position = close
+                else:
+                    opened.append(position)
+            elif type_ is _RPAREN:
+                matches[opened.pop()] = position
+            elif type_ is _NEWLINE:
+                if self.continuation(position) < 0:
+                    break
+            elif type_ is _EOF:
+                break
+            position += 1
+        for unclosed in opened:
+            matches[unclosed] = -1
+        return matches[index]
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
@@ -0,0 +1,263 @@
+"""
+Iterative AST Traversal.
+
+Walks syntax trees with an explicit stack instead of recursing through
+`accept`, so expression depth is bounded by memory rather than by Python's
+recursion limit (a generated `a + b + ... + z` chain is a left-deep tree
+as deep as it is long).
+
+`children()` gives a node's child nodes in evaluation order and `walk()`
+yields a whole tree in pre-order. `Traversal` runs per-node hooks over a
+tree; subclasses define any of
+
+    enter_<kind>(node)          before the children are visited
+    leave_<kind>(node, values)  after them, with the values of the visited
+                                children in order; its return value is the
+                                node's value
+
+where <kind> is the snake_case node class name (`binary_op` for BinaryOp),
+as in ASTVisitor's visit_<kind> methods. An enter hook returns None to
+visit the node's default children, a sequence of steps to visit instead,
+or Done(value) to skip the children. A step is a node, whose value is
+collected, or a callable, which is called when the traversal reaches it.
+Nodes without a leave hook have the value None.
+
+Traversal implements ASTVisitor, so `node.accept(traversal)` runs the
+traversal from that node.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .ast_nodes import (
+    ASTNode,
+    ASTVisitor,
+    ArrayAccess,
+    ArrayLiteral,
+    Assignment,
+    BinaryOp,
+    Block,
+    CallArgument,
+    ExpressionStatement,
+    ForStatement,
+    FunctionCall,
+    FunctionDef,
+    Identifier,
+    IfStatement,
+    ImportDecl,
+    Literal,
+    ParamDef,
+    ScriptDecl,
+    SwitchStatement,
+    TernaryOp,
+    TypeDef,
+    UnaryOp,
+    VarDecl,
+    VersionDecl,
+    WhileStatement,
+)
+
+_NO_CHILDREN: Tuple[ASTNode, ...] = ()
+
+
+def _if_children(node: IfStatement) -> Tuple[ASTNode, ...]:
+    if node.else_block is None:
+        return (node.condition, node.then_block)
+    return (node.condition, node.then_block, node.else_block)
+
+
+def _for_children(node: ForStatement) -> Tuple[ASTNode, ...]:
+    if node.step_expr is None:
+        return (node.start_expr, node.end_expr, node.body)
+    return (node.start_expr, node.end_expr, node.step_expr, node.body)
+
+
+def _switch_children(node: SwitchStatement) -> Tuple[ASTNode, ...]:
+    nodes = [] if node.expression is None else [node.expression]
+    for case_expr, block in node.cases:
+        if case_expr is not None:
+            nodes.append(case_expr)
+        nodes.append(block)
+    return tuple(nodes)
+
+
+def _function_def_children(node: FunctionDef) -> Tuple[ASTNode, ...]:
+    return (*node.params, node.body)
+
+
+# Child nodes of each node class, in evaluation order
+CHILDREN: Dict[type, Callable[[Any], Sequence[ASTNode]]] = {
+    Literal: lambda n: _NO_CHILDREN,
+    Identifier: lambda n: _NO_CHILDREN,
+    BinaryOp: lambda n: (n.left, n.right),
+    UnaryOp: lambda n: (n.operand,),
+    CallArgument: lambda n: (n.value,),
+    FunctionCall: lambda n: n.args,
+    TernaryOp: lambda n: (n.condition, n.true_expr, n.false_expr),
+    ArrayAccess: lambda n: (n.array, *n.indices),
+    ArrayLiteral: lambda n: n.elements,
+    Block: lambda n: n.statements,
+    VersionDecl: lambda n: _NO_CHILDREN,
+    ScriptDecl: lambda n: n.args,
+    VarDecl: lambda n: (n.value,),
+    Assignment: lambda n: (n.value,),
+    IfStatement: _if_children,
+    ForStatement: _for_children,
+    WhileStatement: lambda n: (n.condition, n.body),
+    SwitchStatement: _switch_children,
+    ParamDef: lambda n: _NO_CHILDREN if n.default is None else (n.default,),
+    FunctionDef: _function_def_children,
+    TypeDef: lambda n: n.fields,
+    ImportDecl: lambda n: _NO_CHILDREN,
+    ExpressionStatement: lambda n: (n.expression,),
+}
+
+
+def kind(node_class: type) -> str:
+    """The snake_case hook suffix of a node class, e.g. "binary_op"."""
+    name = node_class.__name__
+    return "".join("_" + c.lower() if c.isupper() else c for c in name).lstrip("_")
+
+
+def children(node: ASTNode) -> Sequence[ASTNode]:
+    """The child nodes of `node`, in evaluation order."""
+    return CHILDREN[node.__class__](node)
+
+
+def walk(roots: Union[ASTNode, Iterable[ASTNode]]) -> Iterator[ASTNode]:
+    """Yields every node of one tree or a list of trees, in pre-order."""
+    stack = [roots] if isinstance(roots, ASTNode) else list(roots)[::-1]
+    table = CHILDREN
+    while stack:
+        node = stack.pop()
+        yield node
+        nodes = table[node.__class__](node)
+        if nodes:
+            stack.extend(reversed(nodes))
+
+
+class Done:
+    """Returned by an enter hook to skip the node's children."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any = None):
+        self.value = value
+
+
+# Node classes that never have children
+LEAVES = frozenset([Literal, Identifier, VersionDecl, ImportDecl])
+
+# (enter hook, leave hook, default children)
+_Handler = Tuple[Optional[Callable], Optional[Callable], Callable]
+
+
+def _no_value(self, node: ASTNode, values: Sequence[Any]) -> None:
+    return None
+
+
+def _handlers(cls: type) -> Dict[type, Union[_Handler, Callable]]:
+    """
+    The hooks of a Traversal subclass by node class: an (enter, leave,
+    default children) handler, or for leaf classes without an enter hook
+    just the function giving their value, as they are never entered.
+    """
+    handlers = {}
+    for node_class, child_nodes in CHILDREN.items():
+        enter = getattr(cls, f"enter_{kind(node_class)}", None)
+        leave = getattr(cls, f"leave_{kind(node_class)}", None)
+        if enter is None and node_class in LEAVES:
+            handlers[node_class] = leave or _no_value
+        else:
+            handlers[node_class] = (enter, leave, child_nodes)
+    return handlers
+
+
+class Traversal(ASTVisitor):
+    """
+    Explicit-stack tree traversal with enter and leave hooks.
+    """
+
+    _handlers: Dict[type, Union[_Handler, Callable]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._handlers = _handlers(cls)
+
+    def run(self, root: ASTNode) -> Any:
+        """Traverses the tree under `root` and returns the value of `root`."""
+        handlers = self._handlers
+        handler = handlers[root.__class__]
+        if handler.__class__ is not tuple:
+            return handler(self, root, ())
+        # Frames of the nodes whose children are being visited:
+        # (node, leave hook, iterator over its steps, child values)
+        stack = []
+        node = root
+        while True:
+            # Enter `node`. Its steps run up to the first child that is not
+            # a leaf, which gets a frame; leaves and callables are handled in
+            # place, so nodes with leaf children only never touch the stack.
+            enter, leave, child_nodes = handler
+            if enter is None:
+                steps = child_nodes(node)
+            else:
+                steps = enter(self, node)
+                if steps is None:
+                    steps = child_nodes(node)
+            if steps.__class__ is Done:
+                value = steps.value
+            elif not steps:
+                value = None if leave is None else leave(self, node, ())
+            else:
+                parent = node
+                steps = iter(steps)
+                values = []
+                for node in steps:
+                    handler = handlers.get(node.__class__)
+                    if handler is None:
+                        if node is not None:
+                            node()
+                    elif handler.__class__ is tuple:
+                        stack.append((parent, leave, steps, values))
+                        break
+                    else:
+                        values.append(handler(self, node, ()))
+                else:
+                    node = None
+                    value = None if leave is None else leave(self, parent, values)
+                if node is not None:
+                    continue
+
+            # Hand `value` to the enclosing frames until one has a child
+            # left to enter (same step loop as above)
+            while True:
+                if not stack:
+                    return value
+                parent, leave, steps, values = stack[-1]
+                values.append(value)
+                for node in steps:
+                    handler = handlers.get(node.__class__)
+                    if handler is None:
+                        if node is not None:
+                            node()
+                    elif handler.__class__ is tuple:
+                        break
+                    else:
+                        values.append(handler(self, node, ()))
+                else:
+                    stack.pop()
+                    value = None if leave is None else leave(self, parent, values)
+                    continue
+                break
+
+    # ASTVisitor: accepting a traversal runs it from the accepting node
+    visit_version_decl = visit_script_decl = visit_block = visit_var_decl = run
+    visit_assignment = visit_if_statement = visit_for_statement = run
+    visit_while_statement = visit_expression_statement = visit_binary_op = run
+    visit_unary_op = visit_function_call = visit_identifier = visit_literal = run
+    visit_ternary_op = visit_array_access = visit_array_literal = run
+    visit_switch_statement = visit_function_def = visit_type_def = run
+    visit_import_decl = run
+
+
+Traversal._handlers = _handlers(Traversal)
@@ -5,6 +5,7 @@ setup(
     version="0.1.0",
     description="Static analyzer for TradingView Pine Script",
     packages=find_packages(),
+    package_data={'pinelint': ['pine_spec.bin']},
     entry_points={
         'console_scripts': [
             'pinelint=pinelint.cli:main',
@@ -1,10 +1,13 @@
+# Run from the repository root: python -m tests.harness [directory] [jobs]
 import os
+import sys
 import glob
-import subprocess
-import json
 from dataclasses import dataclass
 from typing import List
 
+from pinelint.engine import lint_files
+from pinelint.diagnostics import Report, Severity
+
 @dataclass
 class TestResult:
     filename: str
@@ -13,31 +16,25 @@ class TestResult:
     warnings: int
     output: str
 
-def run_harness(directory):
-    files = glob.glob(os.path.join(directory, "*.pine"))
+def run_harness(directory, jobs=1):
+    files = sorted(glob.glob(os.path.join(directory, "*.pine")))
     results = []
     
     print(f"Running harness on {len(files)} files in {directory}...")
     
-    for fpath in files:
-        # Run pinelint via module
-        cmd = ["python3", "-m", "pinelint.cli", "check", fpath, "--format", "json"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        try:
-            data = json.loads(result.stdout)
-            err_count = data.get("error_count", 0)
-            warn_count = data.get("warning_count", 0)
-        except json.JSONDecodeError:
-            err_count = -1
-            warn_count = -1
+    # Lint in-process (or on a worker pool) instead of one CLI subprocess per file
+    for fpath, diagnostics in lint_files(files, jobs):
+        report = Report()
+        report.extend(diagnostics)
+        err_count = sum(1 for d in diagnostics if d.severity == Severity.ERROR)
+        warn_count = sum(1 for d in diagnostics if d.severity == Severity.WARNING)
             
         results.append(TestResult(
             filename=os.path.basename(fpath),
-            exit_code=result.returncode,
+            exit_code=1 if report.has_errors() else 0,
             errors=err_count,
             warnings=warn_count,
-            output=result.stdout
+            output=report.to_json()
         ))
         
     # Analyze
@@ -64,8 +61,7 @@ def run_harness(directory):
             count += 1
             if count >= 10: break
 
-import sys
-
 if __name__ == "__main__":
     path = sys.argv[1] if len(sys.argv) > 1 else "tests/corpus/valid_tv_pass"
-    run_harness(path)
+    jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    run_harness(path, jobs)
@@ -0,0 +1,143 @@
+import unittest
+import glob
+import mmap
+import os
+import random
+import tempfile
+
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+from pinelint.ast_nodes import (
+    BinaryOp, Block, ExpressionStatement, FunctionCall, Identifier, Literal, SwitchStatement, VarDecl,
+)
+from pinelint.arena import _HEADER, Arena, ArenaError, NodeView
+from pinelint.traversal import walk
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+SOURCE = """//@version=5
+indicator("Arena", overlay=true)
+len = input.int(14, "Length")
+float ma = ta.sma(close, len)
+f(x) => x * 2
+for i = 0 to 10 by 2
+    ma := ma[1] + i
+if ma > 0
+    plot(ma)
+else
+    plot(f(close), color=color.red)
+"""
+
+
+def parse(source):
+    return Parser(Lexer(source).tokenize()).parse()
+
+
+class TestArena(unittest.TestCase):
+    def test_round_trip(self):
+        statements = parse(SOURCE)
+        arena = Arena.from_tree(statements)
+        self.assertEqual(len(arena), sum(1 for _ in walk(statements)))
+        self.assertEqual(arena.statements(), statements)
+        self.assertEqual(Arena.from_buffer(arena.to_bytes()).statements(), statements)
+        self.assertEqual(arena.node(arena.roots[2]), statements[2])
+        self.assertEqual(Arena.from_tree([]).statements(), [])
+
+        block = Block(2, 5, [ExpressionStatement(2, 5, Literal(2, 5, 1, "int"))])
+        switch = SwitchStatement(1, 1, None, [(Identifier(2, 1, "a"), block), (None, block)])
+        self.assertEqual(Arena.from_buffer(Arena.from_tree(switch).to_bytes()).node(0), switch)
+
+    def test_corpus_round_trip(self):
+        for path in sorted(glob.glob(os.path.join(CORPUS, "valid_tv_pass", "*.pine")))[:20]:
+            with open(path, "r") as f:
+                statements = parse(f.read())
+            with self.subTest(path=os.path.basename(path)):
+                loaded = Arena.from_buffer(Arena.from_tree(statements).to_bytes())
+                self.assertEqual(loaded.statements(), statements)
+
+    def test_values_keep_their_types(self):
+        values = [1, 1.0, True, -0.0, 0.0, None, "1", "ü\U0001f600"]
+        stmt = VarDecl(1, 1, "x", Literal(1, 5, values, "list"))
+        tree = [VarDecl(1, 1, "v", Literal(1, 5, v, "t")) for v in values]
+        loaded = Arena.from_buffer(Arena.from_tree(tree).to_bytes()).statements()
+        self.assertEqual([repr(s.value.value) for s in loaded], [repr(v) for v in values])
+        with self.assertRaises(TypeError):
+            Arena.from_tree(stmt).to_bytes()
+
+    def test_scans(self):
+        statements = parse(SOURCE)
+        arena = Arena.from_tree(statements)
+        calls = [n for n in walk(statements) if isinstance(n, FunctionCall)]
+        self.assertEqual(arena.values_of(FunctionCall, "name"), [c.name for c in calls])
+        self.assertEqual([arena.node(i) for i in arena.find(FunctionCall)], calls)
+
+        if_index = arena.roots[-1]
+        self.assertEqual(
+            [arena.field(i, "name") for i in arena.find(FunctionCall, within=if_index)],
+            ["plot", "plot", "f"],
+        )
+        self.assertEqual(arena.subtree(arena.roots[0]), range(0, arena.roots[1]))
+        leaf = arena.find(Literal)[0]
+        self.assertEqual(list(arena.subtree(leaf)), [leaf])
+        with self.assertRaises(AttributeError):
+            arena.field(if_index, "name")
+
+    def test_views(self):
+        arena = Arena.from_tree(parse("x = a + f(b, n=1)\n"))
+        view = arena.view(arena.roots[0])
+        self.assertIs(view.node_class, VarDecl)
+        self.assertEqual((view.line, view.name, view.type_hint), (1, "x", None))
+        expr = view.value
+        self.assertIsInstance(expr, NodeView)
+        self.assertEqual((expr.node_class, expr.operator, expr.left.name), (BinaryOp, "+", "a"))
+        args = expr.right.args
+        self.assertEqual([(a.name, a.value.node_class) for a in args], [(None, Identifier), ("n", Literal)])
+        self.assertEqual(expr.node(), arena.statements()[0].value)
+        self.assertEqual(expr, arena.view(expr.index))
+
+    def test_deep_tree(self):
+        depth = 20000
+        tree = Literal(1, 1, 1, "int")
+        for _ in range(depth):
+            tree = BinaryOp(1, 1, tree, "+", Literal(1, 1, 1, "int"))
+        arena = Arena.from_tree(VarDecl(1, 1, "x", tree))
+        self.assertEqual(len(arena), 2 * depth + 2)
+        self.assertEqual(arena.ends[0], len(arena))
+        self.assertEqual(len(arena.find(BinaryOp)), depth)
+        self.assertIsInstance(arena.statements()[0].value.left.left, BinaryOp)
+
+    def test_mmap_buffer(self):
+        statements = parse(SOURCE)
+        with tempfile.TemporaryFile() as f:
+            f.write(Arena.from_tree(statements).to_bytes())
+            f.flush()
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            arena = Arena.from_buffer(buffer)
+            self.assertEqual(arena.statements(), statements)
+            self.assertIsInstance(arena.slots, memoryview)
+            del arena
+
+    def test_rejects_bad_buffers(self):
+        data = Arena.from_tree(parse(SOURCE)).to_bytes()
+        with self.assertRaises(ArenaError):
+            Arena.from_buffer(b"NOTANAST" + data[8:])
+        with self.assertRaises(ArenaError):
+            Arena.from_buffer(data[:8] + b"\xff\xff" + data[10:])
+        with self.assertRaises(ArenaError):
+            Arena.from_buffer(data[: len(data) // 2])
+
+    def test_corrupt_buffers_raise_arena_error(self):
+        data = Arena.from_tree(parse(SOURCE)).to_bytes()
+        rng = random.Random(0)
+        for _ in range(300):
+            corrupt = bytearray(data)
+            for _ in range(rng.randint(1, 4)):
+                corrupt[rng.randrange(_HEADER.size, len(data))] = rng.randrange(256)
+            try:
+                Arena.from_buffer(bytes(corrupt)).statements()
+            except ArenaError:
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
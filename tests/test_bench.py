@@ -0,0 +1,83 @@
+import unittest
+import contextlib
+import io
+import json
+import os
+import tempfile
+
+from pinelint import bench
+from pinelint.cli import bench_paths
+
+VALID = """//@version=5
+indicator("Test")
+var int x = 10
+plot(x)
+"""
+
+SYNTAX_ERROR = """//@version=5
+indicator("Test")
+x = (1 +
+"""
+
+MERGED = """##-- File Name: a.pine | File No: 1 | Started --##
+/* --- FILE: a.pine --- */
+//@version=5
+plot(close)
+##-- File Name: a.pine | File No: 1 | Ended --##
+##-- File Name: b.pine | File No: 2 | Started --##
+//@version=5
+plot(open)
+##-- File Name: b.pine | File No: 2 | Ended --##
+"""
+
+RULES = ["rule:VersionCheckRule", "rule:SecurityRule", "rule:SemanticCheckRule"]
+
+
+class TestBench(unittest.TestCase):
+    def test_split_merged(self):
+        self.assertEqual(
+            bench.split_merged("m.txt", MERGED),
+            [("m.txt#1", "//@version=5\nplot(close)"), ("m.txt#2", "//@version=5\nplot(open)")],
+        )
+        self.assertEqual(bench.split_merged("a.pine", VALID), [("a.pine", VALID)])
+
+    def test_percentile(self):
+        ordered = [float(i) for i in range(1, 101)]
+        self.assertEqual([bench.percentile(ordered, p) for p in (50, 95, 99)], [50.0, 95.0, 99.0])
+        self.assertEqual(bench.percentile([3.0], 99), 3.0)
+
+    def test_stages(self):
+        sources = [("valid", VALID), ("syntax", SYNTAX_ERROR), ("lex", "x = `\n")]
+        results = bench.run(sources, repeat=2)
+        stages = results["stages"]
+        self.assertEqual(list(stages), ["lex", "indent", "parse", "semantic", *RULES, "total"])
+        self.assertEqual((results["files"], results["lines"]), (3, 8))
+        self.assertEqual(stages["lex"]["files"], 3)
+        self.assertEqual(stages["semantic"]["files"], 2)
+        self.assertEqual(stages["total"]["files"], 3)
+        for summary in stages.values():
+            self.assertLessEqual(summary["p50_ms"], summary["p95_ms"])
+            self.assertLessEqual(summary["p95_ms"], summary["p99_ms"])
+
+        clean = bench.run(sources, clean_only=True)["stages"]
+        self.assertEqual((clean["parse"]["files"], clean["semantic"]["files"]), (2, 1))
+
+    def test_bench_paths(self):
+        with tempfile.TemporaryDirectory() as root:
+            for name, code in [("a.pine", VALID), ("merged.txt", MERGED)]:
+                with open(os.path.join(root, name), "w") as f:
+                    f.write(code)
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                bench_paths([root, os.path.join(root, "merged.txt")], "json")
+            results = json.loads(out.getvalue())
+            self.assertEqual(results["files"], 3)
+            self.assertIn("lines_per_second", results["stages"]["parse"])
+
+            with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as cm:
+                bench_paths([os.path.join(root, "missing.pine")], "text")
+            self.assertEqual(cm.exception.code, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
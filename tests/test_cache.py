@@ -0,0 +1,207 @@
+import unittest
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+from pinelint import engine
+from pinelint.arena import Arena
+from pinelint.cache import DEFAULT_RULE_SET, ResultCache, rule_set_fingerprint
+from pinelint.diagnostics import Diagnostic, Severity
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+INVALID = """//@version=5
+indicator("Test")
+plot(y)
+"""
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        self.script = os.path.join(self.tmp.name, "a.pine")
+        with open(self.script, "w") as f:
+            f.write(INVALID)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        cache = ResultCache(self.cache_dir)
+        diags = [
+            Diagnostic(Severity.WARNING, "W002", "msg", 3, 4, "x.pine", suggestion="fix")
+        ]
+        key = cache.key(b"source")
+        self.assertIsNone(cache.get(key, "y.pine"))
+        cache.put(key, diags)
+
+        loaded = cache.get(key, "y.pine")
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded[0].code, "W002")
+        self.assertEqual(loaded[0].suggestion, "fix")
+        self.assertEqual(loaded[0].file_path, "y.pine")
+
+    def test_key_depends_on_source_and_rule_set(self):
+        a = ResultCache(self.cache_dir, rule_set="A")
+        b = ResultCache(self.cache_dir, rule_set="B")
+        self.assertEqual(a.key(b"x"), ResultCache(self.cache_dir, rule_set="A").key(b"x"))
+        self.assertNotEqual(a.key(b"x"), a.key(b"y"))
+        self.assertNotEqual(a.key(b"x"), b.key(b"x"))
+
+    def test_hit_skips_pipeline(self):
+        cache = ResultCache(self.cache_dir)
+        first = engine.lint_file(self.script, cache)
+        self.assertTrue(any(d.code == "R201" for d in first))
+
+        with mock.patch.object(engine, "lint_source") as lint_source:
+            second = engine.lint_file(self.script, cache)
+            lint_source.assert_not_called()
+        self.assertEqual([d.to_dict() for d in first], [d.to_dict() for d in second])
+
+        with open(self.script, "a") as f:
+            f.write("plot(z)\n")
+        third = engine.lint_file(self.script, cache)
+        self.assertEqual(len(third), len(first) + 1)
+
+    def test_ast_round_trip(self):
+        cache = ResultCache(self.cache_dir)
+        statements, diagnostics = engine.parse_source(INVALID, "a.pine")
+        self.assertEqual(diagnostics, [])
+        key = cache.ast_key(INVALID.encode())
+        self.assertEqual(key, ResultCache(self.cache_dir, rule_set="other").ast_key(INVALID.encode()))
+        self.assertNotEqual(key, cache.ast_key(b"plot(close)\n"))
+
+        self.assertIsNone(cache.get_parse(key, "a.pine"))
+        cache.put_parse(key, statements, diagnostics)
+        self.assertEqual(cache.get_parse(key, "a.pine"), (statements, []))
+
+        with open(cache._ast_path(key), "r+b") as f:
+            f.write(b"garbage!")
+        self.assertIsNone(cache.get_parse(key, "a.pine"))
+
+        # Truncated and damaged entries are misses too
+        data = Arena.from_tree(statements).to_bytes()
+        for payload in [data[: len(data) - 9], data[:-40] + b"\xff" * 40, b'{"diagnostics": [{}]}']:
+            cache._write(cache._ast_path(key), payload)
+            self.assertIsNone(cache.get_parse(key, "a.pine"))
+
+    def test_rule_change_reuses_ast(self):
+        first = engine.lint_file(self.script, ResultCache(self.cache_dir, rule_set="A"))
+
+        with mock.patch.object(engine, "parse_source") as parse_source:
+            second = engine.lint_file(self.script, ResultCache(self.cache_dir, rule_set="B"))
+            parse_source.assert_not_called()
+        self.assertEqual([d.to_dict() for d in first], [d.to_dict() for d in second])
+
+    def test_syntax_errors_are_cached(self):
+        with open(self.script, "w") as f:
+            f.write("//@version=5\nx = (1 +\n")
+        first = engine.lint_file(self.script, ResultCache(self.cache_dir, rule_set="A"))
+        self.assertTrue(first)
+        self.assertTrue(all(d.code == "E002" for d in first))
+
+        with mock.patch.object(engine, "parse_source") as parse_source:
+            second = engine.lint_file(self.script, ResultCache(self.cache_dir, rule_set="B"))
+            parse_source.assert_not_called()
+        self.assertEqual([d.to_dict() for d in first], [d.to_dict() for d in second])
+
+    def test_prune_evicts_least_recently_used(self):
+        cache = ResultCache(self.cache_dir, max_bytes=0)
+        keys = [cache.key(str(i).encode()) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, [])
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+
+        # Touching the oldest entry makes it the most recently used.
+        self.assertEqual(cache.get(keys[0], "a.pine"), [])
+
+        size = os.path.getsize(cache._path(keys[0]))
+        cache.max_bytes = size
+        cache.prune()
+        self.assertTrue(os.path.exists(cache._path(keys[0])))
+        self.assertFalse(os.path.exists(cache._path(keys[1])))
+        self.assertFalse(os.path.exists(cache._path(keys[2])))
+
+    def test_prune_covers_ast_entries(self):
+        cache = ResultCache(self.cache_dir)
+        engine.lint_file(self.script, cache)
+        with open(self.script, "rb") as f:
+            data = f.read()
+        ast_path = cache._ast_path(cache.ast_key(data))
+        self.assertTrue(os.path.exists(ast_path))
+        os.utime(ast_path, (1000, 1000))
+
+        cache.max_bytes = os.path.getsize(cache._path(cache.key(data)))
+        cache.prune()
+        self.assertFalse(os.path.exists(ast_path))
+        self.assertTrue(os.path.exists(cache._path(cache.key(data))))
+
+    def test_damaged_entries_are_misses(self):
+        cache = ResultCache(self.cache_dir)
+        key = cache.key(b"x")
+        for payload in [b'{}', b'{"diagnostics": [{"code": "W002"}]}', b'{"diagnostics": 1}']:
+            cache._write(cache._path(key), payload)
+            self.assertIsNone(cache.get(key, "a.pine"))
+
+    def test_unwritable_mtime_still_hits(self):
+        cache = ResultCache(self.cache_dir)
+        first = engine.lint_file(self.script, cache)
+        with mock.patch("os.utime", side_effect=PermissionError), \
+                mock.patch.object(engine, "lint_source") as lint_source:
+            self.assertIsNotNone(cache.get_parse(cache.ast_key(INVALID.encode()), self.script))
+            second = engine.lint_file(self.script, cache)
+            lint_source.assert_not_called()
+        self.assertEqual([d.to_dict() for d in first], [d.to_dict() for d in second])
+
+    def test_unencodable_results_are_not_cached(self):
+        expected = engine.lint_file(self.script)
+        cache = ResultCache(self.cache_dir)
+        with mock.patch.object(Arena, "from_tree", side_effect=TypeError), \
+                mock.patch.object(ResultCache, "_payload", side_effect=ValueError):
+            actual = engine.lint_file(self.script, cache)
+        self.assertEqual([d.to_dict() for d in expected], [d.to_dict() for d in actual])
+        self.assertEqual(cache.writes, 0)
+
+    def test_prune_skipped_without_writes(self):
+        engine.lint_paths([self.script], cache=ResultCache(self.cache_dir))
+        cache = ResultCache(self.cache_dir, max_bytes=0)
+        with mock.patch("os.scandir") as scandir:
+            engine.lint_paths([self.script], cache=cache)
+            scandir.assert_not_called()
+        self.assertTrue(os.path.exists(cache._path(cache.key(INVALID.encode()))))
+
+        # Entries written by pool workers count too (a.pine is already cached)
+        cache = ResultCache(self.cache_dir)
+        with open(os.path.join(self.tmp.name, "b.pine"), "w") as f:
+            f.write(INVALID + "x = 1\n")
+        list(engine.lint_files([self.script, os.path.join(self.tmp.name, "b.pine")], 2, cache))
+        self.assertEqual(cache.writes, 2)
+
+    def test_default_rule_set(self):
+        from pinelint.rules import RuleRunner
+
+        self.assertEqual(DEFAULT_RULE_SET, rule_set_fingerprint(RuleRunner().rules))
+
+    def test_hit_loads_no_pipeline(self):
+        engine.lint_file(self.script, ResultCache(self.cache_dir))
+        probe = (
+            "import sys\n"
+            "from pinelint import engine\n"
+            "from pinelint.cache import ResultCache\n"
+            f"engine.lint_file({self.script!r}, ResultCache({self.cache_dir!r}))\n"
+            "print(sorted(m for m in sys.modules if m.startswith('pinelint.')))\n"
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+        out = subprocess.run(
+            [sys.executable, "-c", probe], env=env, capture_output=True, text=True, check=True
+        ).stdout
+        for module in ["lexer", "parser", "ast_nodes", "rules", "pine_spec", "_spec_data"]:
+            self.assertNotIn(f"'pinelint.{module}'", out)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+import unittest
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from unittest import mock
+
+from pinelint import daemon
+from pinelint.daemon import LintDaemon
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+VALID = """//@version=5
+indicator("Valid")
+plot(close)
+"""
+
+INVALID = """//@version=5
+indicator("Invalid")
+plot(y)
+"""
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix domain sockets")
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.socket_path = os.path.join(self.tmp.name, "d.sock")
+        for name, source in (("valid.pine", VALID), ("invalid.pine", INVALID)):
+            with open(os.path.join(self.tmp.name, name), "w") as f:
+                f.write(source)
+
+    def start(self, **kwargs) -> threading.Thread:
+        self.server = LintDaemon(self.socket_path, **kwargs)
+        self.result = {}
+        thread = threading.Thread(
+            target=lambda: self.result.update(reason=self.server.serve()), daemon=True
+        )
+        thread.start()
+        return thread
+
+    def request(self, **message):
+        return daemon.request(message, self.socket_path, timeout=10)
+
+    def test_no_daemon(self):
+        self.assertIsNone(self.request(command="ping"))
+        self.assertFalse(daemon.is_running(self.socket_path))
+
+    def test_check_paths_and_sources(self):
+        thread = self.start()
+        self.assertEqual(self.request(command="ping")["pid"], os.getpid())
+
+        response = self.request(
+            command="check",
+            cwd=self.tmp.name,
+            paths=["*.pine", "missing.pine"],
+            sources=[{"path": "inline.pine", "text": VALID + "z = 1\n"}],
+        )
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["missing"], ["missing.pine"])
+        self.assertEqual(
+            [f["path"] for f in response["files"]],
+            ["invalid.pine", "valid.pine", "inline.pine"],
+        )
+        self.assertEqual(
+            [[d["code"] for d in f["diagnostics"]] for f in response["files"]],
+            [["R201"], [], ["W002"]],
+        )
+        self.assertEqual(response["files"][0]["diagnostics"][0]["location"]["file"], "invalid.pine")
+
+        self.assertFalse(self.request(command="bogus")["ok"])
+        self.assertFalse(self._raw({"command": "ping", "protocol": 0})["ok"])
+
+        self.assertTrue(self.request(command="shutdown")["ok"])
+        thread.join(10)
+        self.assertEqual(self.result["reason"], "shutdown requested")
+        self.assertFalse(os.path.exists(self.socket_path))
+
+    def _raw(self, message):
+        with socket.socket(socket.AF_UNIX) as sock:
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                return json.loads(f.readline())
+
+    def test_version_mismatch(self):
+        self.start()
+        message = {"protocol": daemon.PROTOCOL_VERSION, "version": "0.0.0"}
+        response = self._raw(dict(message, command="check", paths=["."]))
+        self.assertFalse(response["ok"])
+        self.assertIn("0.0.0", response["error"])
+        self.assertTrue(self._raw(dict(message, command="ping"))["ok"])
+        self.assertTrue(self._raw(dict(message, command="shutdown"))["ok"])
+
+    def test_private_socket(self):
+        self.start()
+        self.assertEqual(os.stat(self.socket_path).st_mode & 0o777, 0o600)
+        os.chmod(self.socket_path, 0o666)
+        self.assertIsNone(self.request(command="ping"))
+        os.chmod(self.socket_path, 0o600)
+        self.request(command="shutdown")
+
+    def test_broken_exchange(self):
+        with socket.socket(socket.AF_UNIX) as server:
+            server.bind(self.socket_path)
+            os.chmod(self.socket_path, 0o600)
+            server.listen()
+
+            # A daemon that never answers times out
+            self.assertIsNone(daemon.request({"command": "ping"}, self.socket_path, timeout=0.2))
+            server.accept()[0].close()
+
+            def reply(data):
+                conn, _ = server.accept()
+                with conn:
+                    conn.makefile("rb").readline()
+                    conn.sendall(data)
+
+            for data in [b'{"ok": tr', b""]:
+                thread = threading.Thread(target=reply, args=(data,))
+                thread.start()
+                self.assertIsNone(self.request(command="ping"))
+                thread.join(10)
+
+    def test_default_socket_directory(self):
+        with mock.patch.dict(os.environ), mock.patch("tempfile.tempdir", self.tmp.name):
+            os.environ.pop("PINELINT_SOCKET", None)
+            path = daemon.default_socket_path()
+            self.assertEqual(os.path.dirname(os.path.dirname(path)), self.tmp.name)
+            server = LintDaemon(None)
+            server.server_close()
+            self.assertEqual(os.stat(os.path.dirname(path)).st_mode & 0o777, 0o700)
+
+            os.chmod(os.path.dirname(path), 0o755)
+            with self.assertRaises(OSError):
+                LintDaemon(None)
+
+    def test_idle_timeout(self):
+        thread = self.start(idle_timeout=0.1)
+        thread.join(10)
+        self.assertEqual(self.result["reason"], "idle for 0.1 seconds")
+        self.assertFalse(os.path.exists(self.socket_path))
+
+    def test_memory_ceiling(self):
+        thread = self.start(max_memory=1024 * 1024)
+        self.assertTrue(self.request(command="ping")["ok"])
+        thread.join(10)
+        self.assertIn("memory ceiling", self.result["reason"])
+
+    def test_refuses_second_daemon(self):
+        self.start()
+        with self.assertRaises(OSError):
+            LintDaemon(self.socket_path)
+        self.request(command="shutdown")
+
+    def test_check_client(self):
+        self.start()
+        env = dict(os.environ)
+        env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+        command = [
+            sys.executable, "-m", "pinelint.cli", "check", "--no-cache",
+            "--daemon", "--socket", self.socket_path, "--format", "json",
+        ]
+        via_daemon = subprocess.run(
+            command + ["."], cwd=self.tmp.name, env=env, capture_output=True, text=True
+        )
+        self.assertEqual(self.server.requests, 1)
+        self.request(command="shutdown")
+        local = subprocess.run(
+            command + ["."], cwd=self.tmp.name, env=env, capture_output=True, text=True
+        )
+        self.assertEqual(via_daemon.returncode, 1)
+        self.assertEqual(via_daemon.stdout, local.stdout)
+        self.assertEqual(local.returncode, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
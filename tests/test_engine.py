@@ -0,0 +1,90 @@
+import unittest
+import os
+import io
+import tempfile
+import contextlib
+
+from pinelint.engine import expand_paths, lint_files, lint_paths, lint_source
+from pinelint.cli import check_paths
+from pinelint.diagnostics import Severity
+
+VALID = """//@version=5
+indicator("Test")
+var int x = 10
+plot(x)
+"""
+
+INVALID = """//@version=5
+indicator("Test")
+plot(y)
+"""
+
+
+class TestEngine(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        os.makedirs(os.path.join(root, "sub"))
+        self.files = {
+            "a.pine": VALID,
+            "b.pine": INVALID,
+            os.path.join("sub", "c.pine"): VALID,
+            "notes.txt": "not pine",
+        }
+        for name, code in self.files.items():
+            with open(os.path.join(root, name), "w") as f:
+                f.write(code)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_expand_directory(self):
+        files, missing = expand_paths([self.tmp.name])
+        self.assertEqual(missing, [])
+        self.assertEqual(
+            files, [self.path("a.pine"), self.path("b.pine"), self.path("sub/c.pine")]
+        )
+
+    def test_expand_glob_and_duplicates(self):
+        files, missing = expand_paths(
+            [self.path("*.pine"), self.path("a.pine"), self.path("nope*.pine")]
+        )
+        self.assertEqual(files, [self.path("a.pine"), self.path("b.pine")])
+        self.assertEqual(missing, [self.path("nope*.pine")])
+
+    def test_lint_source_matches_file(self):
+        diags = lint_source(INVALID, "b.pine")
+        self.assertTrue(any(d.code == "R201" for d in diags))
+
+    def test_pool_matches_serial(self):
+        files, _ = expand_paths([self.tmp.name])
+        serial = [(p, [d.to_dict() for d in ds]) for p, ds in lint_files(files, 1)]
+        pooled = [(p, [d.to_dict() for d in ds]) for p, ds in lint_files(files, 2)]
+        self.assertEqual(serial, pooled)
+
+        report = lint_paths(files, jobs=2)
+        errors = [d for d in report.diagnostics if d.severity == Severity.ERROR]
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].file_path, self.path("b.pine"))
+
+    def test_check_paths_exit_codes(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), self.assertRaises(SystemExit) as cm:
+            check_paths([self.path("a.pine"), self.path("sub")], "json")
+        self.assertEqual(cm.exception.code, 0)
+
+        with contextlib.redirect_stdout(out), self.assertRaises(SystemExit) as cm:
+            check_paths([self.tmp.name], "text", jobs=2)
+        self.assertEqual(cm.exception.code, 1)
+
+        err = io.StringIO()
+        with contextlib.redirect_stderr(err), self.assertRaises(SystemExit) as cm:
+            check_paths([self.path("missing.pine")], "text")
+        self.assertEqual(cm.exception.code, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
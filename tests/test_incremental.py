@@ -0,0 +1,212 @@
+import unittest
+import time
+
+from pinelint.engine import lint_source
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+from pinelint.rules import RuleRunner
+from pinelint.rules_extended import ExtendedRule
+from pinelint.incremental import AnalysisCancelled, Document, TextEdit, chunk_starts
+
+SOURCE = """//@version=5
+indicator("Test")
+length = input.int(14)
+// comment
+basis = ta.sma(close, length)
+if basis > close
+    hi = high
+else
+    lo = low
+f(x) =>
+    x * 2
+unused = f(basis)
+plot(basis)
+"""
+
+
+# Statements continued on lines starting in the first column
+CONTINUED = """//@version=5
+indicator("Continued")
+plot(close,
+color=color.red)
+a = array.from(1,
+2)
+x = close +
+open
+y = close > open ?
+1 : 2
+b = close > open and
+close > 1
+label.new(bar_index, high, "(" + str.tostring(x)) // (
+plot(x + y + array.get(a, 0))
+"""
+
+
+def as_dicts(diagnostics):
+    return [d.to_dict() for d in diagnostics]
+
+
+def big_script(blocks=500):
+    lines = ["//@version=5", 'indicator("Big")']
+    for i in range(blocks):
+        lines += [
+            f"// block {i}",
+            f"v{i} = ta.sma(close, {i + 2})",
+            f"if v{i} > open",
+            f"    w{i} = v{i} * 2",
+            f"    plot(w{i})",
+            f"u{i} = v{i} + high",
+            f"plot(u{i})",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+class TestIncrementalDocument(unittest.TestCase):
+    def assertMatchesFullLint(self, doc):
+        self.assertEqual(
+            as_dicts(doc.diagnostics()), as_dicts(lint_source(doc.text, doc.file_path))
+        )
+
+    def test_chunk_starts(self):
+        lines = SOURCE.split("\n")
+        starts = chunk_starts(lines)
+        self.assertEqual([lines[i] for i in starts], [
+            "//@version=5",
+            'indicator("Test")',
+            "length = input.int(14)",
+            "basis = ta.sma(close, length)",
+            "if basis > close",
+            "f(x) =>",
+            "unused = f(basis)",
+            "plot(basis)",
+        ])
+        self.assertEqual(chunk_starts(["a = 1", "/* x", "b = 2 */", "c = 3"]), [0, 3])
+        self.assertEqual(chunk_starts(["plot(close,", "color=color.red)", "x = 1"]), [0, 2])
+        self.assertEqual(chunk_starts(["x = a +", "b", "y = 1"]), [0, 2])
+        self.assertEqual(chunk_starts(['s = "(" // [', "t = 1"]), [0, 1])
+
+    def test_continued_lines_match_full_lint(self):
+        doc = Document(CONTINUED, "test.pine")
+        lines = CONTINUED.split("\n")
+        self.assertEqual([lines[i] for i in chunk_starts(lines)][2:5], [
+            "plot(close,",
+            "a = array.from(1,",
+            "x = close +",
+        ])
+        self.assertMatchesFullLint(doc)
+        self.assertNotIn("E002", [d.code for d in doc.diagnostics()])
+
+    def test_initial_diagnostics_match_full_lint(self):
+        doc = Document(SOURCE, "test.pine")
+        self.assertMatchesFullLint(doc)
+        self.assertIn("W002", [d.code for d in doc.diagnostics()])
+
+    def test_edit_reparses_only_touched_chunk(self):
+        doc = Document(SOURCE, "test.pine")
+        doc.diagnostics()
+        # plot(basis) -> plot(basis2)
+        doc.apply_edit(TextEdit(12, 10, 12, 10, "2"))
+        self.assertMatchesFullLint(doc)
+        self.assertEqual(doc.stats.parsed, 1)
+        self.assertEqual(doc.stats.analyzed, 1)
+        self.assertIn("R201", [d.code for d in doc.diagnostics()])
+
+    def test_changed_global_reanalyzes_dependents(self):
+        doc = Document(SOURCE, "test.pine")
+        doc.diagnostics()
+        # Removing `length` (and its comment) makes its user undefined.
+        doc.apply_edit(TextEdit(2, 0, 4, 0, ""))
+        self.assertMatchesFullLint(doc)
+        self.assertEqual(doc.stats.parsed, 0)
+        self.assertEqual(doc.stats.analyzed, 1)
+
+        doc.apply_edit(TextEdit(2, 0, 2, 0, "length = 10\n"))
+        self.assertMatchesFullLint(doc)
+
+    def test_multiline_edits_and_line_shifts(self):
+        doc = Document(SOURCE, "test.pine")
+        doc.apply_edits([
+            TextEdit(0, 0, 0, 0, "// header\n// more\n"),
+            TextEdit(8, 4, 8, 6, "if lo > 1\n        lo2 = 1"),
+        ])
+        self.assertMatchesFullLint(doc)
+
+    def test_errors(self):
+        doc = Document(SOURCE, "test.pine")
+        doc.apply_edit(TextEdit(4, 0, 4, 0, "x = $\n"))
+        self.assertEqual([d.code for d in doc.diagnostics()], ["E001"])
+        self.assertMatchesFullLint(doc)
+
+        doc.apply_edit(TextEdit(4, 4, 5, 0, "(1\n"))
+        self.assertEqual({d.code for d in doc.diagnostics()}, {"E002"})
+
+        doc.set_text(SOURCE)
+        self.assertMatchesFullLint(doc)
+        self.assertEqual(doc.stats.parsed, 0)
+
+    def test_ast_rules_see_file_positions(self):
+        runner = RuleRunner()
+        runner.rules.append(ExtendedRule())
+
+        def full_lint(text):
+            return as_dicts(runner.run(text, Parser(Lexer(text).tokenize()).parse(), "test.pine"))
+
+        source = '//@version=5\nindicator("Test")\na = 1\nb = 2\nvar c = 3\n'
+        doc = Document(source, "test.pine", runner=runner)
+        self.assertEqual(as_dicts(doc.diagnostics()), full_lint(source))
+        self.assertIn(5, [d.line for d in doc.diagnostics() if d.code == "W002"])
+
+        doc.apply_edit(TextEdit(2, 0, 2, 0, "x = 0\n\n"))
+        self.assertEqual(as_dicts(doc.diagnostics()), full_lint(doc.text))
+
+    def test_apply_edits_is_atomic(self):
+        doc = Document(SOURCE, "test.pine")
+        with self.assertRaises(ValueError):
+            doc.apply_edits([TextEdit(0, 0, 0, 0, "x = 1\n"), TextEdit(99, 0, 99, 0, "y")], 7)
+        self.assertEqual(doc.text, SOURCE)
+        self.assertEqual(doc.version, 0)
+
+    def test_utf16_columns(self):
+        doc = Document('s = "\U0001F600" + y\n', "test.pine")
+        # y starts at code point 10, UTF-16 offset 11
+        doc.apply_edits([TextEdit(0, 11, 0, 12, "close")], utf16=True)
+        self.assertEqual(doc.line(0), 's = "\U0001F600" + close')
+        doc.apply_edits([TextEdit(0, 10, 0, 15, "y")])
+        self.assertEqual(doc.line(0), 's = "\U0001F600" + y')
+
+        doc = Document(SOURCE + "plot(ask)\n", "test.pine")
+        self.assertIn("R201", [d.code for d in doc.diagnostics()])
+        doc.apply_edit(TextEdit(0, 11, 0, 12, "6"))
+        self.assertMatchesFullLint(doc)
+        self.assertNotIn("R201", [d.code for d in doc.diagnostics()])
+        self.assertEqual(doc.stats.parsed, 1)
+
+    def test_cancellation(self):
+        doc = Document(SOURCE, "test.pine")
+        with self.assertRaises(AnalysisCancelled):
+            doc.diagnostics(cancelled=lambda: True)
+        self.assertMatchesFullLint(doc)
+
+    def test_typing_latency(self):
+        source = big_script()
+        doc = Document(source, "big.pine")
+        self.assertMatchesFullLint(doc)
+
+        line = 2 + 8 * 250 + 4
+        column = len(source.split("\n")[line])
+        start = time.perf_counter()
+        for i in range(10):
+            doc.apply_edit(TextEdit(line, column, line, column, " + 1"))
+            doc.diagnostics()
+            column += 4
+        elapsed = (time.perf_counter() - start) / 10
+
+        self.assertEqual(doc.stats.parsed, 1)
+        self.assertMatchesFullLint(doc)
+        # Generous bound; a full re-lint of this file takes several times as long.
+        self.assertLess(elapsed, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
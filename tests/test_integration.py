@@ -68,6 +68,32 @@ plot(y)
         self.assertEqual(len(errors), 2)
         self.assertTrue(any("Type mismatch" in d.message for d in errors))
         self.assertTrue(any("Undefined" in d.message for d in errors))
+    def test_single_analysis_pass(self):
+        from unittest import mock
+        from pinelint.lexer import Lexer
+        from pinelint.parser import Parser
+        from pinelint.rules import RuleRunner
+        from pinelint.rules_extended import ExtendedRule
+        from pinelint import context
+
+        code = """//@version=5
+indicator("Test")
+x = 1
+if true
+    x = 2
+"""
+        tokens = Lexer(code).tokenize()
+        ast = Parser(tokens).parse()
+
+        runner = RuleRunner()
+        runner.rules.append(ExtendedRule())
+        with mock.patch.object(
+            context, "SemanticAnalyzer", wraps=context.SemanticAnalyzer
+        ) as analyzer_cls:
+            diags = runner.run(code, ast, "test.pine", tokens)
+        self.assertEqual(analyzer_cls.call_count, 1)
+        # Both rules report the shadowing warning from the shared pass.
+        self.assertEqual(sum(1 for d in diags if d.code == "W001"), 2)
 
 if __name__ == '__main__':
     unittest.main()
@@ -43,6 +43,22 @@ class TestLexerFixes(unittest.TestCase):
         # Tokens: x, =, 1, NEWLINE, EOF
         self.assertEqual(len(tokens), 5)
         self.assertEqual(tokens[2].value, "1")
+    def test_compact_tokens(self):
+        source = "if close > open\n    if high >= low\n        x = close\ny = 1"
+        tokens = Lexer(source).tokenize()
+
+        self.assertFalse(hasattr(tokens[0], "__dict__"))
+        self.assertEqual(tokens[0].type, TokenType.KEYWORD)
+
+        closes = [t for t in tokens if t.value == "close"]
+        self.assertEqual(len(closes), 2)
+        self.assertIs(closes[0].value, closes[1].value)
+
+        # Both blocks close at 'y', so the two DEDENTs are one shared token
+        dedents = [t for t in tokens if t.type == TokenType.DEDENT]
+        self.assertEqual(len(dedents), 2)
+        self.assertIs(dedents[0], dedents[1])
+        self.assertEqual(dedents[0].line, 4)
 
 if __name__ == '__main__':
     unittest.main()
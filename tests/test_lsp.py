@@ -0,0 +1,192 @@
+import unittest
+import io
+import os
+import queue
+import subprocess
+import sys
+import threading
+
+from pinelint.lsp import read_message, write_message
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+URI = "file:///tmp/script.pine"
+
+SOURCE = """//@version=5
+indicator("Test")
+plot(y)
+"""
+
+# y starts at code point 23 of line 2 and at UTF-16 offset 24
+ASTRAL = """//@version=5
+indicator("Test")
+s = "\U0001F600" + str.tostring(y)
+label.new(bar_index, high, s)
+"""
+
+
+class ScriptedClient:
+    """Drives `pinelint lsp` in a subprocess over its stdin/stdout."""
+
+    def __init__(self, debounce_ms=50):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "pinelint.cli", "lsp", "--debounce", str(debounce_ms)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+        self.messages = queue.Queue()
+        self.next_id = 1
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        while True:
+            message = read_message(self.proc.stdout)
+            if message is None:
+                break
+            self.messages.put(message)
+
+    def notify(self, method, params=None):
+        write_message(self.proc.stdin, {"jsonrpc": "2.0", "method": method, "params": params})
+
+    def request(self, method, params=None):
+        request_id = self.next_id
+        self.next_id += 1
+        write_message(
+            self.proc.stdin,
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params},
+        )
+        while True:
+            message = self.messages.get(timeout=10)
+            if message.get("id") == request_id:
+                return message
+
+    def next_diagnostics(self, timeout=10):
+        while True:
+            message = self.messages.get(timeout=timeout)
+            if message.get("method") == "textDocument/publishDiagnostics":
+                return message["params"]
+
+    def open(self, text, version=1):
+        self.notify("textDocument/didOpen", {
+            "textDocument": {"uri": URI, "languageId": "pine", "version": version, "text": text}
+        })
+
+    def change(self, version, changes):
+        self.notify("textDocument/didChange", {
+            "textDocument": {"uri": URI, "version": version},
+            "contentChanges": changes,
+        })
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.request("shutdown")
+            self.notify("exit")
+        return self.proc.wait(timeout=10)
+
+
+class TestFraming(unittest.TestCase):
+    def test_round_trip(self):
+        stream = io.BytesIO()
+        write_message(stream, {"id": 1, "text": "é"})
+        write_message(stream, {"id": 2})
+        stream.seek(0)
+        self.assertEqual(read_message(stream), {"id": 1, "text": "é"})
+        self.assertEqual(read_message(stream), {"id": 2})
+        self.assertIsNone(read_message(stream))
+
+
+class TestLanguageServer(unittest.TestCase):
+    def setUp(self):
+        self.client = ScriptedClient()
+        self.addCleanup(self.client.proc.kill)
+        response = self.client.request("initialize", {"capabilities": {}})
+        self.capabilities = response["result"]["capabilities"]
+        self.client.notify("initialized", {})
+
+    def test_initialize_and_shutdown(self):
+        self.assertEqual(self.capabilities["textDocumentSync"]["change"], 2)
+        self.assertEqual(self.capabilities["positionEncoding"], "utf-16")
+        self.assertEqual(self.client.close(), 0)
+
+    def test_utf16_positions(self):
+        self.client.open(ASTRAL)
+        [diag] = [d for d in self.client.next_diagnostics()["diagnostics"] if d["code"] == "R201"]
+        self.assertEqual(diag["range"]["start"], {"line": 2, "character": 24})
+
+        self.client.change(2, [{
+            "range": {"start": {"line": 2, "character": 24}, "end": {"line": 2, "character": 25}},
+            "text": "close",
+        }])
+        params = self.client.next_diagnostics()
+        self.assertEqual([d["code"] for d in params["diagnostics"]], [])
+        self.assertEqual(self.client.close(), 0)
+
+    def test_publishes_diagnostics(self):
+        self.client.open(SOURCE)
+        params = self.client.next_diagnostics()
+        self.assertEqual(params["uri"], URI)
+        self.assertEqual(params["version"], 1)
+        [diag] = params["diagnostics"]
+        self.assertEqual(diag["code"], "R201")
+        self.assertEqual(diag["severity"], 1)
+        self.assertEqual(diag["range"]["start"], {"line": 2, "character": 5})
+
+        # Incremental change: plot(y) -> plot(close)
+        self.client.change(2, [{
+            "range": {"start": {"line": 2, "character": 5}, "end": {"line": 2, "character": 6}},
+            "text": "close",
+        }])
+        params = self.client.next_diagnostics()
+        self.assertEqual(params["version"], 2)
+        self.assertEqual(params["diagnostics"], [])
+
+        self.client.notify("textDocument/didClose", {"textDocument": {"uri": URI}})
+        self.assertEqual(self.client.next_diagnostics()["diagnostics"], [])
+        self.assertEqual(self.client.close(), 0)
+
+    def test_stale_versions_are_not_published(self):
+        self.client.open(SOURCE)
+        for version in range(2, 12):
+            self.client.change(version, [{
+                "range": {"start": {"line": 3, "character": 0}, "end": {"line": 3, "character": 0}},
+                "text": f"plot(v{version})\n",
+            }])
+        self.client.change(12, [{"text": SOURCE + "z = 1\n"}])
+
+        params = self.client.next_diagnostics()
+        self.assertEqual(params["version"], 12)
+        self.assertEqual(
+            [d["code"] for d in params["diagnostics"]], ["R201", "W002"]
+        )
+        with self.assertRaises(queue.Empty):
+            self.client.next_diagnostics(timeout=0.3)
+        self.assertEqual(self.client.close(), 0)
+
+    def test_unknown_request(self):
+        response = self.client.request("textDocument/hover", {})
+        self.assertEqual(response["error"]["code"], -32601)
+        self.assertEqual(self.client.close(), 0)
+
+    def test_exit_without_shutdown(self):
+        self.client.notify("exit")
+        self.assertEqual(self.client.proc.wait(timeout=10), 1)
+
+
+class TestPositionEncoding(unittest.TestCase):
+    def test_utf32_positions(self):
+        client = ScriptedClient()
+        self.addCleanup(client.proc.kill)
+        response = client.request(
+            "initialize", {"capabilities": {"general": {"positionEncodings": ["utf-32", "utf-16"]}}}
+        )
+        self.assertEqual(response["result"]["capabilities"]["positionEncoding"], "utf-32")
+        client.open(ASTRAL)
+        [diag] = [d for d in client.next_diagnostics()["diagnostics"] if d["code"] == "R201"]
+        self.assertEqual(diag["range"]["start"], {"line": 2, "character": 23})
+        self.assertEqual(client.close(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
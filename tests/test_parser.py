@@ -69,6 +69,32 @@ else
         self.assertIsInstance(stmt, VarDecl)
         self.assertEqual(stmt.name, "y")
         self.assertEqual(stmt.type_hint, "int")
+    def test_nodes_are_slotted_and_frozen(self):
+        import dataclasses
+        stmts = self.parse("x = 1 + 2")
+        node = stmts[0].value
+        self.assertIsInstance(node, BinaryOp)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            node.operator = "-"
+
+        class Ops(ASTVisitor):
+            pass
+        for name in ASTVisitor.__abstractmethods__:
+            setattr(Ops, name, lambda self, n, name=name: name)
+        Ops.__abstractmethods__ = frozenset()
+        self.assertEqual(node.accept(Ops()), "visit_binary_op")
+
+    def test_dispatch_tables(self):
+        from pinelint.lexer import TokenType
+        from pinelint.parser import ParseError, Precedence
+        parser = Parser(Lexer("x").tokenize())
+        self.assertEqual(len(parser.prefix_parse_fns), max(TokenType) + 1)
+        self.assertEqual(parser.prefix_parse_fns[TokenType.IDENTIFIER], parser.parse_identifier)
+        self.assertIsNone(parser.infix_parse_fns[TokenType.COMMA])
+        with self.assertRaises(ParseError) as ctx:
+            Parser(Lexer(")").tokenize()).parse_expression(Precedence.LOWEST)
+        self.assertIn("Expect expression. Found RPAREN", str(ctx.exception))
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,228 @@
+import unittest
+from unittest import mock
+import os
+import subprocess
+import sys
+
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+from pinelint.pine_spec import PINE_FUNCTIONS, PINE_VARIABLES
+from pinelint.semantic import SemanticAnalyzer, BUILTIN_SCOPE, Symbol, TypeSystem, builtin_scope
+from pinelint.pine_types import PineType, Qualifier
+from pinelint.spec_registry import SPEC_REGISTRY, script_version
+from pinelint.engine import lint_source
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def analyze(source, version=None):
+    analyzer = SemanticAnalyzer(version)
+    for stmt in Parser(Lexer(source).tokenize()).parse():
+        stmt.accept(analyzer)
+    return analyzer
+
+
+class TestBuiltinScope(unittest.TestCase):
+    def test_shared_root_scope(self):
+        a = SemanticAnalyzer()
+        b = SemanticAnalyzer()
+        self.assertIs(a.global_scope.parent, BUILTIN_SCOPE)
+        self.assertIs(b.global_scope.parent, BUILTIN_SCOPE)
+        self.assertEqual(a.global_scope.symbols, {})
+        self.assertIs(a.global_scope.resolve("close"), BUILTIN_SCOPE.symbols["close"])
+
+    def test_builtin_scope_is_immutable(self):
+        with self.assertRaises(TypeError):
+            BUILTIN_SCOPE.define("x", Symbol("x", "int", None))
+        with self.assertRaises(TypeError):
+            BUILTIN_SCOPE.symbols["x"] = Symbol("x", "int", None)
+
+    def test_builtin_usage_tracked_per_analyzer(self):
+        analyzer = analyze("x = close + close\ny = x + open\n")
+        self.assertEqual(analyzer.builtin_usage["close"], 2)
+        self.assertEqual(analyzer.builtin_usage["open"], 1)
+        self.assertEqual(BUILTIN_SCOPE.symbols["close"].usage_count, 0)
+        self.assertEqual(analyzer.global_scope.symbols["x"].usage_count, 1)
+
+    def test_builtin_redeclaration_and_shadowing(self):
+        analyzer = analyze("close = 1\nif true\n    open = 2\n")
+        self.assertEqual(
+            [str(e) for e in analyzer.errors],
+            ["Variable 'close' already declared in this scope."],
+        )
+        self.assertEqual(
+            [str(w) for w in analyzer.warnings],
+            ["Shadowing variable 'open' from outer scope."],
+        )
+
+
+class TestSymbolTable(unittest.TestCase):
+    def test_nested_shadowing_and_scope_exit(self):
+        analyzer = analyze(
+            "x = 1\n"
+            "if true\n"
+            "    y = x\n"
+            "    if true\n"
+            "        y = 2\n"
+            "        y = 3\n"
+            "    z = y\n"
+            "w = y\n"
+        )
+        self.assertEqual(
+            [str(e) for e in analyzer.errors],
+            ["Variable 'y' already declared in this scope.", "Undefined identifier 'y'"],
+        )
+        self.assertEqual(
+            [str(w) for w in analyzer.warnings],
+            ["Shadowing variable 'y' from outer scope."] * 2,
+        )
+        table = analyzer.symbol_table
+        self.assertIs(table.scope, analyzer.global_scope)
+        self.assertIsNone(table.resolve("y"))
+        outer, inner = analyzer.all_scopes[1:]
+        self.assertEqual(outer.symbols["y"].usage_count, 1)
+        self.assertEqual(inner.symbols["y"].declared_at.line, 6)
+
+    def test_function_bound_in_enclosing_scope(self):
+        analyzer = analyze("f(a) =>\n    a + 1\nx = f(2)\nb = a\n")
+        self.assertIn("f", analyzer.global_scope.symbols)
+        self.assertEqual([str(e) for e in analyzer.errors], ["Undefined identifier 'a'"])
+        self.assertIn("a", analyzer.all_scopes[1].symbols)
+
+
+class TestLazySpec(unittest.TestCase):
+    def test_import_does_not_load_tables(self):
+        probe = (
+            "import sys, pinelint.cli, pinelint.lexer, pinelint.semantic\n"
+            "tables = ('pinelint._spec_data', 'pinelint.spec_artifact')\n"
+            "print(any(m in sys.modules for m in tables))\n"
+            "from pinelint.pine_spec import PINE_FUNCTIONS\n"
+            "PINE_FUNCTIONS.get('ta.sma')\n"
+            "print(any(m in sys.modules for m in tables))\n"
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+        out = subprocess.run(
+            [sys.executable, "-c", probe], env=env, check=True, capture_output=True, text=True
+        ).stdout
+        self.assertEqual(out.split(), ["False", "True"])
+
+    def test_package_exports(self):
+        import importlib
+        import pinelint
+
+        for name in pinelint.__all__:
+            module = importlib.import_module(f"pinelint.{pinelint._EXPORTS[name]}")
+            self.assertIs(getattr(pinelint, name), getattr(module, name))
+        with self.assertRaises(AttributeError):
+            pinelint.nope
+        self.assertIs(pinelint.semantic, sys.modules["pinelint.semantic"])
+
+    def test_tables_behave_like_mappings(self):
+        sma = PINE_FUNCTIONS["ta.sma"]
+        self.assertIs(PINE_FUNCTIONS.get("ta.sma"), sma)
+        self.assertEqual(sma.return_type, "float")
+        self.assertEqual([p.name for p in sma.params][:2], ["source", "length"])
+        self.assertIsNone(PINE_FUNCTIONS.get("ta.nope"))
+        self.assertNotIn("ta.nope", PINE_FUNCTIONS)
+        self.assertEqual(len(PINE_VARIABLES), len(list(PINE_VARIABLES)))
+        self.assertIs(BUILTIN_SCOPE.symbols["close"], BUILTIN_SCOPE.symbols["close"])
+
+
+class TestVersionedSpec(unittest.TestCase):
+    def test_script_version(self):
+        self.assertEqual(script_version("// x\n//@version=5\nplot(close)\n"), 5)
+        self.assertIsNone(script_version("plot(close)\n"))
+        self.assertIsNone(script_version("//@version=5\n//@version=6\n"))
+
+    def test_tables_are_cached_per_version(self):
+        self.assertIs(SPEC_REGISTRY.functions(5), SPEC_REGISTRY.functions(5))
+        self.assertIsNot(SPEC_REGISTRY.functions(5), SPEC_REGISTRY.functions(6))
+        self.assertIs(SPEC_REGISTRY.functions(None), SPEC_REGISTRY.functions(6))
+        self.assertIs(builtin_scope(5), builtin_scope(5))
+        self.assertIs(builtin_scope(), BUILTIN_SCOPE)
+        self.assertIs(SemanticAnalyzer(5).builtin_scope, builtin_scope(5))
+
+    def test_lookups_respect_version_added(self):
+        self.assertEqual(PINE_FUNCTIONS["str.trim"].version_added, "6")
+        self.assertNotIn("str.trim", SPEC_REGISTRY.functions(5))
+        self.assertIn("str.trim", SPEC_REGISTRY.functions(6))
+        self.assertIn("ta.sma", SPEC_REGISTRY.functions(4))
+        self.assertNotIn("ask", SPEC_REGISTRY.variables(5))
+        self.assertEqual(len(SPEC_REGISTRY.variables(6)), len(PINE_VARIABLES))
+        self.assertEqual(len(SPEC_REGISTRY.variables(5)), len(PINE_VARIABLES) - 11)
+
+    def test_analyzer_uses_script_version(self):
+        body = 'indicator("V")\nx = str.trim(" a ")\nplot(ask)\nplot(close)\nplot(x)\n'
+        v5 = [d.message for d in lint_source("//@version=5\n" + body, "v5.pine")]
+        self.assertEqual(v5, ["Unknown function 'str.trim'", "Undefined identifier 'ask'"])
+        self.assertEqual(lint_source("//@version=6\n" + body, "v6.pine"), [])
+
+
+class TestTypeSystem(unittest.TestCase):
+    def test_types_are_interned(self):
+        t = PineType.of("series float")
+        self.assertIs(PineType.of("series float"), t)
+        self.assertIs(PineType.of(t), t)
+        self.assertIs(PineType.qualified(Qualifier.SERIES, "float"), t)
+        self.assertEqual(str(t), "series float")
+        self.assertEqual(f"'{t}'", "'series float'")
+        self.assertIs(Symbol("x", "series float", None).type, t)
+
+    def test_types_are_strings(self):
+        t = TypeSystem.infer_binary_op("const int", "+", "series int")
+        self.assertIsInstance(t, str)
+        self.assertEqual(t, "series int")
+        self.assertEqual({"series int": 1}[t], 1)
+        self.assertEqual(Symbol("x", "simple bool", None).type, "simple bool")
+
+    def test_interning_is_bounded(self):
+        full = len(PineType._interned)
+        with mock.patch("pinelint.pine_types.MAX_INTERNED_TYPES", full):
+            t = PineType.of("series NotInterned")
+            self.assertIsNot(PineType.of("series NotInterned"), t)
+            self.assertEqual(PineType.of("series NotInterned"), t)
+            self.assertEqual(t.base, "NotInterned")
+            self.assertEqual(len(PineType._interned), full)
+
+    def test_parsing(self):
+        t = PineType.of("simple array<float>")
+        self.assertEqual((t.qualifier, t.base), (Qualifier.SIMPLE, "array<float>"))
+        self.assertEqual((t.name, t.args, t.element), ("array", ("float",), "float"))
+        self.assertEqual(PineType.of("map<string, array<int>>").args, ("string", "array<int>"))
+        self.assertEqual(TypeSystem.parse_type("float"), ("series", "float"))
+        self.assertEqual(TypeSystem.get_qualifier_rank("input"), 1)
+        self.assertLess(Qualifier.CONST, Qualifier.SERIES)
+
+    def test_compatibility_and_promotion(self):
+        self.assertTrue(TypeSystem.is_compatible("series float", "const int"))
+        self.assertFalse(TypeSystem.is_compatible("simple int", "series int"))
+        self.assertFalse(TypeSystem.is_compatible("series int", "series float"))
+        self.assertTrue(TypeSystem.is_compatible("series bool", "na"))
+        self.assertIs(
+            TypeSystem.infer_binary_op("const int", "*", "simple float"),
+            PineType.of("simple float"),
+        )
+        self.assertEqual(str(TypeSystem.infer_binary_op("const string", "+", "int")), "series string")
+        self.assertEqual(str(TypeSystem.infer_binary_op("input int", "<", "const int")), "input bool")
+        self.assertEqual(str(TypeSystem.infer_binary_op("color", "?", "int")), "series color")
+
+    def test_analyzer_types(self):
+        analyzer = analyze("a = array.new_float(3)\nx = a[0] * 2\nfor i = 0 to 3\n    y = i\n")
+        symbols = analyzer.global_scope.symbols
+        self.assertIs(symbols["x"].type, PineType.of("series float"))
+        self.assertIs(analyzer.all_scopes[1].symbols["i"].type, PineType.of("simple int"))
+
+    def test_rule_cache_counters(self):
+        TypeSystem.cache_clear()
+        self.assertEqual(TypeSystem.cache_info()["infer_binary_op"].currsize, 0)
+        analyze("a = close * 2\nb = close * 2\nc = a + b\n")
+        info = TypeSystem.cache_info()["infer_binary_op"]
+        self.assertEqual((info.hits, info.misses), (1, 2))
+        self.assertTrue(TypeSystem.is_compatible("series float", "const int"))
+        self.assertTrue(TypeSystem.is_compatible("series float", "const int"))
+        self.assertGreaterEqual(TypeSystem.cache_info()["is_compatible"].hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
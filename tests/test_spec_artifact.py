@@ -0,0 +1,61 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+
+from pinelint import _spec_data, pine_spec
+from pinelint.spec_artifact import (
+    ARTIFACT_PATH, ArtifactError, SpecArtifact, load_artifact, write_artifact,
+)
+
+FUNCTIONS = [
+    ("f", ("float", "Does f.", (("x", "series float", True), ("y", "int", False)), None)),
+    ("g", ("void", "", (), "6")),
+]
+VARIABLES = [("close", ("series float", "Close price.", None)), ("ε", ("float", "Épsilon.", "6"))]
+TYPES = ["float", "int"]
+
+
+class TestSpecArtifact(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "spec.bin")
+
+    def test_round_trip(self):
+        write_artifact(self.path, FUNCTIONS, VARIABLES, TYPES)
+        artifact = SpecArtifact.open(self.path)
+        self.assertEqual(list(artifact.functions.items()), FUNCTIONS)
+        self.assertEqual(list(artifact.variables.items()), VARIABLES)
+        self.assertEqual(artifact.types(), TYPES)
+        self.assertIsNone(artifact.functions.get("h"))
+        self.assertNotIn("h", artifact.functions)
+
+    def test_rejects_bad_artifacts(self):
+        write_artifact(self.path, FUNCTIONS, VARIABLES, TYPES)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        with self.assertRaises(ArtifactError):
+            SpecArtifact(b"NOTASPEC" + data[8:])
+        with self.assertRaises(ArtifactError):
+            SpecArtifact(data[:8] + b"\xff\xff" + data[10:])
+        with self.assertRaises(ArtifactError):
+            SpecArtifact(data[: len(data) // 2])
+        with self.assertRaises(ArtifactError):
+            SpecArtifact.open(os.path.join(self.tmp.name, "missing.bin"))
+
+    def test_packaged_artifact_matches_python_tables(self):
+        self.assertTrue(os.path.exists(ARTIFACT_PATH))
+        artifact = load_artifact()
+        self.assertEqual(dict(artifact.functions), _spec_data.FUNCTIONS)
+        self.assertEqual(dict(artifact.variables), _spec_data.VARIABLES)
+        self.assertEqual(artifact.types(), pine_spec.PINE_TYPES)
+
+    def test_falls_back_to_python_tables(self):
+        with mock.patch("pinelint.spec_artifact.load_artifact", return_value=None):
+            table = pine_spec.SpecTable(pine_spec._load_functions, pine_spec._build_function)
+            self.assertEqual(table["ta.sma"], pine_spec.PINE_FUNCTIONS["ta.sma"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import contextlib
+import io
+import json
+import os
+import pstats
+import tempfile
+import tracemalloc
+
+from pinelint.cache import ResultCache
+from pinelint.cli import check_paths
+from pinelint.engine import lint_source
+from pinelint.timings import Timings
+
+VALID = """//@version=5
+indicator("Test")
+var int x = 10
+plot(x)
+"""
+
+RULES = ["rule:VersionCheckRule", "rule:SecurityRule", "rule:SemanticCheckRule"]
+
+
+class TestTimings(unittest.TestCase):
+    def test_stages(self):
+        with Timings() as timings:
+            self.assertEqual(lint_source(VALID, "a.pine", timings=timings), lint_source(VALID, "a.pine"))
+            lint_source("x = (1 +\n", "b.pine", timings=timings)
+            lint_source("x = `\n", "c.pine", timings=timings)
+        self.assertEqual(list(timings.stages), ["lex", "parse", "semantic", *RULES])
+        self.assertEqual([s.calls for s in timings.stages.values()], [3, 2, 1, 1, 1, 1])
+        self.assertGreater(timings.seconds, 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        data = timings.to_dict()
+        self.assertEqual(set(data["stages"]["lex"]), {"calls", "seconds"})
+
+    def test_allocations(self):
+        with Timings(allocations=True) as timings:
+            self.assertTrue(tracemalloc.is_tracing())
+            with timings.stage("build"):
+                data = [str(i) for i in range(1000)]
+            with timings.stage("build"):
+                pass
+        self.assertFalse(tracemalloc.is_tracing())
+        stats = timings.to_dict()["stages"]["build"]
+        self.assertEqual(stats["calls"], 2)
+        self.assertGreater(stats["retained_bytes"], 1000)
+        self.assertGreaterEqual(stats["peak_bytes"], stats["retained_bytes"])
+        del data
+
+    def test_check_paths(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "a.pine")
+            with open(path, "w") as f:
+                f.write(VALID)
+            profile = os.path.join(root, "run.pstats")
+
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out), self.assertRaises(SystemExit):
+                check_paths([path], "json", jobs=2, timings=True, profile=profile)
+            report = json.loads(out.getvalue())
+            self.assertEqual(report["timings"]["files"], 1)
+            self.assertEqual(list(report["timings"]["stages"])[:2], ["lex", "parse"])
+            self.assertIn("diagnostics", report)
+            stats = pstats.Stats(profile)
+            self.assertTrue(any(func[2] == "lint_file" for func in stats.stats))
+
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out), self.assertRaises(SystemExit):
+                check_paths([path], "json")
+            self.assertNotIn("timings", json.loads(out.getvalue()))
+
+    def test_cache_lookups(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "a.pine")
+            with open(path, "w") as f:
+                f.write(VALID)
+            cache = ResultCache(os.path.join(root, "cache"))
+            stages = []
+            for _ in range(2):
+                out = io.StringIO()
+                with contextlib.redirect_stdout(out), self.assertRaises(SystemExit):
+                    check_paths([path], "json", cache=cache, timings=True)
+                stages.append(json.loads(out.getvalue())["timings"]["stages"])
+            self.assertEqual(list(stages[0])[:3], ["cache:miss", "ast:miss", "lex"])
+            self.assertEqual(list(stages[1]), ["cache:hit"])
+            self.assertEqual(stages[1]["cache:hit"]["calls"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
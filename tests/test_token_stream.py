@@ -0,0 +1,109 @@
+import unittest
+from pinelint.lexer import Lexer, LexerError, TokenType
+from pinelint.parser import Parser, RELEASE_INTERVAL
+from pinelint.token_stream import FILL_CHUNK, TokenStream
+
+SOURCE = """//@version=5
+indicator("Test")
+/* block
+   comment */ x = 1
+if x > 0
+    y = x +
+      2
+plot(y)
+"""
+
+
+def as_tuples(tokens):
+    return [(t.type, t.value, t.line, t.column, t.position) for t in tokens]
+
+
+class TestTokenStream(unittest.TestCase):
+    def test_stream_matches_tokenize(self):
+        self.assertEqual(
+            as_tuples(Lexer(SOURCE).iter_tokens()),
+            as_tuples(Lexer(SOURCE).tokenize()),
+        )
+
+    def test_lexer_errors_are_lazy(self):
+        tokens = Lexer("x = 1\ny = 2 $\n").iter_tokens()
+        self.assertEqual(next(tokens).value, "x")
+        with self.assertRaises(LexerError):
+            list(tokens)
+
+    def test_indexing_past_end_returns_eof(self):
+        stream = TokenStream(Lexer("x").iter_tokens())
+        self.assertEqual(stream[0].value, "x")
+        self.assertEqual(stream[50].type, TokenType.EOF)
+
+    def test_release(self):
+        stream = TokenStream(Lexer("a b c d").iter_tokens())
+        self.assertEqual(stream[2].value, "c")
+        stream.release(2)
+        self.assertEqual(stream[2].value, "c")
+        with self.assertRaises(IndexError):
+            stream[1]
+
+    def test_continuation(self):
+        stream = TokenStream(Lexer("a +\n    b\nc\nd\n").iter_tokens())
+        kinds = [stream[i].type for i in range(9)]
+        self.assertEqual(kinds[2:5], [TokenType.NEWLINE, TokenType.INDENT, TokenType.IDENTIFIER])
+        self.assertEqual(stream.continuation(1), 1)
+        self.assertEqual(stream.continuation(2), 4)
+        self.assertEqual(stream.continuation(3), 4)
+        # The line break after `b` closes the indented line
+        self.assertEqual(stream.continuation(5), -1)
+        self.assertEqual(stream.continuation(5), -1)
+        stream.release(5)
+        self.assertEqual(stream.continuation(40), 40)
+
+    def test_matching(self):
+        stream = TokenStream(Lexer("f(a, (b), g(c)) => 1\nplot((x)\n").iter_tokens())
+        self.assertEqual(stream.matching(1), 12)
+        self.assertEqual(stream._matches, {1: 12, 4: 6, 9: 11})
+        self.assertEqual(stream.matching(4), 6)
+        # Unclosed parentheses match nothing, nested ones still do
+        self.assertEqual(stream.matching(17), -1)
+        self.assertEqual(stream.matching(18), 20)
+
+    def test_matching_stops_at_statement_end(self):
+        source = "f(a,\n    b) => a\nplot(f(close\n" + "x = 1\n" * 5000 + "y = (2)\n"
+        stream = TokenStream(Lexer(source).iter_tokens())
+        self.assertEqual(stream.matching(1), 7)
+        self.assertEqual(stream.matching(13), -1)
+        self.assertEqual(stream._matches[15], -1)
+        # The scan ended at the line break, not at the far `)`
+        self.assertLessEqual(stream.buffered, FILL_CHUNK)
+
+    def test_unclosed_calls(self):
+        source = "".join(f"plot(f(close, {i})\n" for i in range(3000))
+        parser = Parser(Lexer(source).iter_tokens())
+        # Each statement used to rescan the rest of the file for its `)`
+        parser.parse()
+        self.assertTrue(parser.errors)
+
+    def test_multiline_expression(self):
+        terms = 2000
+        line = " + ".join(f"b{i}" for i in range(terms))
+        source = f"x = {line} +\n    c\nplot(x)\n"
+        parser = Parser(Lexer(source).iter_tokens())
+        statements = parser.parse()
+        self.assertEqual(parser.errors, [])
+        self.assertEqual(len(statements), 2)
+        self.assertEqual(statements[0].value.right.name, "c")
+
+    def test_parser_memory_is_bounded(self):
+        lines = ["//@version=5", 'indicator("Big")']
+        for i in range(20000):
+            lines.append(f"v{i} = close + {i}")
+        source = "\n".join(lines)
+
+        parser = Parser(Lexer(source).iter_tokens())
+        statements = parser.parse()
+        self.assertEqual(len(statements), 20001)
+        self.assertEqual(parser.errors, [])
+        self.assertLess(parser.tokens.buffered, RELEASE_INTERVAL + 512)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+from pinelint.lexer import Lexer
+from pinelint.parser import Parser
+from pinelint.ast_nodes import BinaryOp, Identifier, Literal, VarDecl
+from pinelint.semantic import SemanticAnalyzer
+from pinelint.traversal import Done, Traversal, children, walk
+
+
+def parse(source):
+    return Parser(Lexer(source).tokenize()).parse()
+
+
+class Evaluator(Traversal):
+    """Evaluates integer arithmetic and logs the hooks it runs."""
+
+    def __init__(self):
+        self.log = []
+
+    def leave_literal(self, node, values):
+        return node.value
+
+    def enter_binary_op(self, node):
+        self.log.append(("enter", node.operator))
+        if node.operator == "*" and isinstance(node.left, Literal) and node.left.value == 0:
+            return Done(0)
+        return [node.left, lambda: self.log.append(("between", node.operator)), node.right]
+
+    def leave_binary_op(self, node, values):
+        left, right = values
+        return left + right if node.operator == "+" else left * right
+
+    def leave_var_decl(self, node, values):
+        return values[0]
+
+
+class TestWalk(unittest.TestCase):
+    def test_pre_order(self):
+        stmt = parse("x = a + (b * 2)\n")[0]
+        self.assertEqual(
+            [type(n).__name__ for n in walk(stmt)],
+            ["VarDecl", "BinaryOp", "Identifier", "BinaryOp", "Identifier", "Literal"],
+        )
+        names = [n.name for n in walk(parse("a = b\nc = d\n")) if isinstance(n, Identifier)]
+        self.assertEqual(names, ["b", "d"])
+
+    def test_children(self):
+        stmt = parse("if c\n    x = 1\nelse\n    y = 2\n")[0]
+        self.assertEqual([type(n).__name__ for n in children(stmt)], ["Identifier", "Block", "Block"])
+        self.assertEqual(children(Identifier(1, 1, "x")), ())
+
+    def test_deep_tree(self):
+        stmt = parse("x = " + " + ".join(["a"] * 5000) + "\n")[0]
+        self.assertEqual(sum(1 for _ in walk(stmt)), 2 * 5000)
+
+
+class TestTraversal(unittest.TestCase):
+    def test_hooks(self):
+        evaluator = Evaluator()
+        self.assertEqual(evaluator.run(parse("x = 1 + (2 * 3)\n")[0]), 7)
+        self.assertEqual(
+            evaluator.log,
+            [("enter", "+"), ("between", "+"), ("enter", "*"), ("between", "*")],
+        )
+
+    def test_done_skips_children(self):
+        evaluator = Evaluator()
+        self.assertEqual(parse("x = 0 * (1 + 2)\n")[0].accept(evaluator), 0)
+        self.assertEqual(evaluator.log, [("enter", "*")])
+
+    def test_nodes_without_hooks(self):
+        self.assertIsNone(Traversal().run(parse("x = a\n")[0]))
+
+    def test_deep_tree(self):
+        depth = 20000
+        tree = Literal(1, 1, 1, "int")
+        for _ in range(depth):
+            tree = BinaryOp(1, 1, tree, "+", Literal(1, 1, 1, "int"))
+        self.assertEqual(Evaluator().run(VarDecl(1, 1, "x", tree)), depth + 1)
+
+    def test_analyzer_handles_long_chains(self):
+        analyzer = SemanticAnalyzer()
+        for stmt in parse("x = " + " + ".join(["close"] * 5000) + "\ny = x\n"):
+            stmt.accept(analyzer)
+        self.assertEqual(analyzer.errors, [])
+        self.assertEqual(str(analyzer.global_scope.symbols["x"].type), "series float")
+        self.assertEqual(analyzer.builtin_usage["close"], 5000)
+
+
+if __name__ == '__main__':
+    unittest.main()
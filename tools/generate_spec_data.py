@@ -1,17 +1,35 @@
+import argparse
 import json
 import os
+import sys
 from typing import List, Dict, Any
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pinelint.spec_artifact import write_artifact
+
 INPUT_FILE = 'resources/pineDocs.json'
 OUTPUT_FILE = 'pinelint/pine_spec.py'
+DATA_FILE = 'pinelint/_spec_data.py'
+ARTIFACT_FILE = 'pinelint/pine_spec.bin'
+
+# Parts of compound statements that pineDocs does not list as controls
+EXTRA_KEYWORDS = ['else', 'to', 'by', 'in']
 
 HEADER = '''"""
 Pine Script Language Specification.
 Auto-generated from pineDocs.json.
+
+PINE_FUNCTIONS and PINE_VARIABLES are read-only mappings over the compact
+builtin tables: the memory-mapped pine_spec.bin artifact when it is present
+and readable, otherwise _spec_data. The tables are loaded on first use and
+each entry is built the first time it is looked up, so importing this
+module is cheap.
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
 from enum import Enum
 
 class TypeQualifier(Enum):
@@ -40,6 +58,96 @@ class BuiltinVariable:
     name: str
     type: str
     description: str = ""
+    version_added: Optional[str] = None
+
+
+class SpecTable(Mapping):
+    """
+    Read-only name -> spec entry mapping that builds entries on demand.
+
+    `load` returns the raw table (name -> compact record) and is called on
+    first use; `build` turns one record into its entry, which is then kept.
+    """
+
+    def __init__(self, load: Callable[[], Mapping], build: Callable[[str, Any], Any]):
+        self._load = load
+        self._build = build
+        self._raw: Optional[Mapping] = None
+        self._entries: Dict[str, Any] = {}
+
+    def _records(self) -> Mapping:
+        if self._raw is None:
+            self._raw = self._load()
+        return self._raw
+
+    def __getitem__(self, name: str):
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = self._entries[name] = self._build(name, self._records()[name])
+        return entry
+
+    def get(self, name: str, default=None):
+        entry = self._entries.get(name)
+        if entry is None:
+            record = self._records().get(name)
+            if record is None:
+                return default
+            entry = self._entries[name] = self._build(name, record)
+        return entry
+
+    def __contains__(self, name) -> bool:
+        return name in self._records()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records())
+
+    def __len__(self) -> int:
+        return len(self._records())
+
+
+def _load_functions() -> Mapping:
+    from .spec_artifact import load_artifact
+
+    artifact = load_artifact()
+    if artifact is not None:
+        return artifact.functions
+    from ._spec_data import FUNCTIONS
+    return FUNCTIONS
+
+
+def _load_variables() -> Mapping:
+    from .spec_artifact import load_artifact
+
+    artifact = load_artifact()
+    if artifact is not None:
+        return artifact.variables
+    from ._spec_data import VARIABLES
+    return VARIABLES
+
+
+def _build_function(name: str, record) -> BuiltinFunction:
+    return_type, description, params, version_added = record
+    return BuiltinFunction(
+        name=name,
+        params=[Param(name=p, type=t, required=r) for p, t, r in params],
+        return_type=return_type,
+        description=description,
+        version_added=version_added,
+    )
+
+
+def _build_variable(name: str, record) -> BuiltinVariable:
+    type_, description, version_added = record
+    return BuiltinVariable(
+        name=name, type=type_, description=description, version_added=version_added
+    )
+
+'''
+
+DATA_HEADER = '''"""
+Compact Pine Script builtin tables.
+Auto-generated from pineDocs.json; read through the mappings in pine_spec.
+"""
 
 '''
 
@@ -61,10 +169,11 @@ def clean_desc(desc):
         desc = " ".join([str(s) for s in desc])
     return desc.split('\n')[0][:200]
 
-def generate_spec():
+def generate_spec(output_format='all'):
     data = load_data()
     
-    # Patch data with Manual v6 Additions
+    # Patch data with Manual v6 Additions. pineDocs has no per-version
+    # information, so everything else counts as available in all versions.
     # Manual Functions
     v6_functions = [
         {"name": "str.repeat", "returnedType": "string", "desc": "Repeats string.", "args": [{"name": "source", "displayType": "string"}, {"name": "count", "displayType": "int"}, {"name": "separator", "displayType": "string", "required": False}]},
@@ -75,6 +184,8 @@ def generate_spec():
         {"name": "label.set_text_formatting", "returnedType": "void", "desc": "Sets text formatting.", "args": [{"name": "id", "displayType": "label"}, {"name": "formatting", "displayType": "string"}]},
         {"name": "table.cell_set_text_formatting", "returnedType": "void", "desc": "Sets text formatting.", "args": [{"name": "table_id", "displayType": "table"}, {"name": "column", "displayType": "int"}, {"name": "row", "displayType": "int"}, {"name": "formatting", "displayType": "string"}]},
     ]
+    for item in v6_functions:
+        item["versionAdded"] = "6"
     if 'functions' not in data: data['functions'] = []
     data['functions'].append({"docs": v6_functions})
 
@@ -92,6 +203,8 @@ def generate_spec():
         {"name": "text.format_italic", "type": "const string", "desc": "Italic format."},
         {"name": "text.format_none", "type": "const string", "desc": "No format."},
     ]
+    for item in v6_vars:
+        item["versionAdded"] = "6"
     if 'variables' not in data: data['variables'] = []
     data['variables'].append({"docs": v6_vars})
 
@@ -128,7 +241,8 @@ def generate_spec():
             "name": name,
             "params": args,
             "return_type": rt,
-            "description": clean_desc(item.get('desc'))
+            "description": clean_desc(item.get('desc')),
+            "version_added": item.get('versionAdded'),
         }
 
     # Variables & Constants
@@ -146,7 +260,8 @@ def generate_spec():
         variables[name] = {
             "name": name,
             "type": v_type,
-            "description": clean_desc(item.get('desc'))
+            "description": clean_desc(item.get('desc')),
+            "version_added": item.get('versionAdded'),
         }
 
     # Controls (Keywords)
@@ -157,38 +272,62 @@ def generate_spec():
             if item.get('name'):
                 keywords.add(item['name'])
 
+    keywords.update(EXTRA_KEYWORDS)
+
+    # name: (return_type, description, ((param, type, required), ...), version_added)
+    function_records = [
+        (name, (
+            func["return_type"],
+            func["description"],
+            tuple((p["name"], p["type"], bool(p["required"])) for p in func["params"]),
+            func["version_added"],
+        ))
+        for name, func in sorted(functions.items())
+    ]
+    # name: (type, description, version_added)
+    variable_records = [
+        (name, (var["type"], var["description"], var["version_added"]))
+        for name, var in sorted(variables.items())
+    ]
+    types = sorted(pine_types)
+
+    if output_format in ('all', 'python'):
+        write_python(types, sorted(keywords), function_records, variable_records)
+    if output_format in ('all', 'binary'):
+        write_artifact(ARTIFACT_FILE, function_records, variable_records, types)
+
+def write_python(types, keywords, function_records, variable_records):
     with open(OUTPUT_FILE, 'w') as f:
         f.write(HEADER)
-        
+
         # PINE_TYPES
-        f.write(f"PINE_TYPES = {json.dumps(sorted(list(pine_types)), indent=4)}\n\n")
-        
-        # PINE_FUNCTIONS
-        f.write("PINE_FUNCTIONS: Dict[str, BuiltinFunction] = {\n")
-        for name, func in sorted(functions.items()):
-            f.write(f'    "{name}": BuiltinFunction(\n')
-            f.write(f'        name={json.dumps(func["name"])},\n')
-            f.write(f'        return_type={json.dumps(func["return_type"])},\n')
-            f.write(f'        description={json.dumps(func["description"])},\n')
-            f.write(f'        params=[\n')
-            for param in func['params']:
-                f.write(f'            Param(name={json.dumps(param["name"])}, type={json.dumps(param["type"])}, required={param["required"]}),\n')
-            f.write(f'        ]\n')
-            f.write(f'    ),\n')
-        f.write("}\n\n")
-        
-        # PINE_VARIABLES
-        f.write("PINE_VARIABLES: Dict[str, BuiltinVariable] = {\n")
-        for name, var in sorted(variables.items()):
-            f.write(f'    "{name}": BuiltinVariable(\n')
-            f.write(f'        name={json.dumps(var["name"])},\n')
-            f.write(f'        type={json.dumps(var["type"])},\n')
-            f.write(f'        description={json.dumps(var["description"])}\n')
-            f.write(f'    ),\n')
-        f.write("}\n\n")
+        f.write(f"PINE_TYPES = {json.dumps(types, indent=4)}\n\n")
 
         # PINE_KEYWORDS
-        f.write(f"PINE_KEYWORDS = {json.dumps(sorted(list(keywords)), indent=4)}\n")
+        f.write(f"PINE_KEYWORDS = {json.dumps(keywords, indent=4)}\n\n")
+
+        # Lazy tables
+        f.write("PINE_FUNCTIONS: Mapping[str, BuiltinFunction] = SpecTable(_load_functions, _build_function)\n")
+        f.write("PINE_VARIABLES: Mapping[str, BuiltinVariable] = SpecTable(_load_variables, _build_variable)\n")
+
+    with open(DATA_FILE, 'w') as f:
+        f.write(DATA_HEADER)
+
+        f.write("FUNCTIONS = {\n")
+        for name, record in function_records:
+            f.write(f"    {json.dumps(name)}: {record!r},\n")
+        f.write("}\n\n")
+
+        f.write("VARIABLES = {\n")
+        for name, record in variable_records:
+            f.write(f"    {json.dumps(name)}: {record!r},\n")
+        f.write("}\n")
 
 if __name__ == '__main__':
-    generate_spec()
+    parser = argparse.ArgumentParser(description="Generate the Pine spec tables from pineDocs.json.")
+    parser.add_argument(
+        '--format', choices=['all', 'python', 'binary'], default='all',
+        help="python: pine_spec.py and _spec_data.py; binary: the mmap artifact "
+             "pine_spec.bin, which takes precedence at runtime; all: both (default)",
+    )
+    generate_spec(parser.parse_args().format)